@@ -0,0 +1,23 @@
+"""
+Benchmark Suite
+
+End-to-end performance benchmarks run against a local fake Reddit
+listing server and media CDN, reporting throughput, per-post latency
+and peak memory as machine-readable JSON.
+"""
+
+from .server import FakeRedditServer, FakeRedditCatalog, ServerProfile
+from .runner import (
+    BenchmarkRunner, Scenario, ScenarioResult, STANDARD_SCENARIOS, compare_reports
+)
+
+__all__ = [
+    'FakeRedditServer',
+    'FakeRedditCatalog',
+    'ServerProfile',
+    'BenchmarkRunner',
+    'Scenario',
+    'ScenarioResult',
+    'STANDARD_SCENARIOS',
+    'compare_reports'
+]
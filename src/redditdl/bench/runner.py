@@ -0,0 +1,516 @@
+"""
+Benchmark Runner
+
+Standard end-to-end scenarios run against FakeRedditServer. Each scenario
+publishes listings and media on the fake server, pages through the
+listings the way the public JSON API is paged, runs the filter,
+processing and export stages on the posts, and reports posts/sec, MB/s,
+per-post latency percentiles and peak RSS.
+
+The production scrapers are bound to reddit.com, so listings are fetched
+by ListingClient instead of AcquisitionStage. Everything after
+acquisition is the real pipeline.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import platform
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple, Callable
+
+import psutil
+import requests
+
+from redditdl import __version__
+from redditdl.bench.server import FakeRedditServer, ServerProfile, MAX_PAGE_SIZE
+from redditdl.core.monitoring.tracing import Tracer, POST_SPAN_NAME, set_tracer
+from redditdl.core.pipeline.executor import PipelineExecutor
+from redditdl.core.pipeline.interfaces import PipelineContext
+from redditdl.scrapers import PostMetadata
+from redditdl.targets.resolver import TargetResolver, TargetType
+
+
+logger = logging.getLogger(__name__)
+
+# Report format version, bumped when fields change meaning
+REPORT_SCHEMA = 1
+
+# Result fields compared against a baseline and whether higher is better
+COMPARED_METRICS = {
+    'posts_per_sec': True,
+    'mb_per_sec': True,
+    'latency_p95': False,
+    'peak_rss_mb': False,
+}
+
+
+@dataclass
+class Scenario:
+    """
+    A benchmark workload.
+
+    Attributes:
+        name: Scenario name used on the command line and in reports
+        description: One-line summary
+        targets: Targets as "r/<name>" or "u/<name>" strings
+        posts_per_target: Posts published in each target's listing
+        post_kind: "image", "gallery", "video" or "mixed"
+        file_size: Size in bytes of each media file
+        gallery_size: Images per gallery post
+        targets_file: Read targets from a file, as `scrape targets --targets-file` does
+        concurrent_targets: Listings fetched in parallel
+    """
+    name: str
+    description: str
+    targets: List[str]
+    posts_per_target: int
+    post_kind: str = "image"
+    file_size: int = 16 * 1024
+    gallery_size: int = 3
+    targets_file: bool = False
+    concurrent_targets: int = 1
+    
+    def scaled(self, scale: float) -> 'Scenario':
+        """Copy with the post count multiplied by scale (at least one post)."""
+        return replace(self, posts_per_target=max(1, int(round(self.posts_per_target * scale))))
+    
+    @property
+    def total_posts(self) -> int:
+        return self.posts_per_target * len(self.targets)
+
+
+STANDARD_SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario for scenario in [
+        Scenario(
+            name="subreddit-10k",
+            description="One subreddit with 10,000 small image posts",
+            targets=["r/benchpics"],
+            posts_per_target=10000,
+            post_kind="image",
+            file_size=8 * 1024,
+        ),
+        Scenario(
+            name="large-galleries",
+            description="100 gallery posts of 25 images each",
+            targets=["r/benchgalleries"],
+            posts_per_target=100,
+            post_kind="gallery",
+            file_size=64 * 1024,
+            gallery_size=25,
+        ),
+        Scenario(
+            name="video-users",
+            description="Three users posting 1 MiB videos",
+            targets=["u/benchvideo1", "u/benchvideo2", "u/benchvideo3"],
+            posts_per_target=40,
+            post_kind="video",
+            file_size=1024 * 1024,
+        ),
+        Scenario(
+            name="multi-target",
+            description="Targets file of 6 users and 4 subreddits with mixed content",
+            targets=[f"u/benchuser{i}" for i in range(1, 7)] + [f"r/benchmixed{i}" for i in range(1, 5)],
+            posts_per_target=200,
+            post_kind="mixed",
+            targets_file=True,
+            concurrent_targets=4,
+        ),
+    ]
+}
+
+
+@dataclass
+class ScenarioResult:
+    """Measurements from one scenario run."""
+    name: str
+    posts: int
+    targets: int
+    elapsed: float
+    posts_per_sec: float
+    mb_per_sec: float
+    bytes_downloaded: int
+    latency_p50: float
+    latency_p95: float
+    peak_rss_mb: float
+    errors: int
+    requests: int
+    stage_times: Dict[str, float] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ListingClient:
+    """
+    Pages through Reddit JSON listings (limit/after pagination).
+
+    Each fetched post gets a "scraper.fetch" span covering the page it
+    arrived in, so per-post latency includes listing time.
+    """
+    
+    def __init__(self, base_url: str, tracer: Optional[Tracer] = None,
+                 retries: int = 3, retry_delay: float = 0.05):
+        self.base_url = base_url.rstrip("/")
+        self.tracer = tracer
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.failed_requests = 0
+        self._session = requests.Session()
+        self._lock = threading.Lock()
+    
+    def fetch(self, target_type: TargetType, name: str, limit: int) -> List[PostMetadata]:
+        """
+        Fetch up to limit posts from a user or subreddit listing.
+
+        Raises:
+            requests.RequestException: If a page still fails after retries
+        """
+        if target_type == TargetType.USER:
+            path = f"/user/{name}/submitted.json"
+        else:
+            path = f"/r/{name}/new.json"
+        
+        posts: List[PostMetadata] = []
+        after: Optional[str] = None
+        while len(posts) < limit:
+            params = {"limit": min(MAX_PAGE_SIZE, limit - len(posts)), "raw_json": 1}
+            if after:
+                params["after"] = after
+            
+            started = time.time()
+            listing = self._get_json(path, params)
+            finished = time.time()
+            
+            page = [PostMetadata.from_raw(child["data"]) for child in listing["data"]["children"]]
+            if self.tracer is not None:
+                for post in page:
+                    self.tracer.record_post_span(post.id, "scraper.fetch", started, finished,
+                                                 target=name, page_size=len(page))
+            posts.extend(page)
+            
+            after = listing["data"].get("after")
+            if not after or not page:
+                break
+        return posts
+    
+    def _get_json(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        for attempt in range(self.retries + 1):
+            response = self._session.get(f"{self.base_url}{path}", params=params, timeout=30)
+            if response.status_code < 500 or attempt == self.retries:
+                response.raise_for_status()
+                return response.json()
+            with self._lock:
+                self.failed_requests += 1
+            time.sleep(self.retry_delay * (2 ** attempt))
+        raise AssertionError("unreachable")
+    
+    def close(self) -> None:
+        self._session.close()
+
+
+class _PeakRssSampler:
+    """Samples process RSS on a background thread and keeps the peak."""
+    
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak = 0
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        self.peak = self._process.memory_info().rss
+        self._thread = threading.Thread(target=self._run, name="bench-rss", daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> float:
+        """Stop sampling and return the peak RSS in MiB."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5.0)
+        self.peak = max(self.peak, self._process.memory_info().rss)
+        return self.peak / (1024 * 1024)
+    
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            rss = self._process.memory_info().rss
+            if rss > self.peak:
+                self.peak = rss
+
+
+def _percentile(values: List[float], quantile: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(quantile * (len(ordered) - 1))))]
+
+
+def _post_latencies(tracer: Tracer) -> List[float]:
+    """Time each traced post spent in its own work (direct children of its root)."""
+    spans = tracer.get_spans()
+    roots = {span.span_id for span in spans if span.name == POST_SPAN_NAME and not span.parent_span_id}
+    latencies: Dict[str, float] = {}
+    for span in spans:
+        if span.parent_span_id in roots:
+            latencies[span.trace_id] = latencies.get(span.trace_id, 0.0) + span.duration
+    return list(latencies.values())
+
+
+def populate_catalog(scenario: Scenario, server: FakeRedditServer) -> None:
+    """Publish a scenario's listings and media files on a fake server."""
+    kinds = ["image", "gallery", "video", "text"]
+    counter = 0
+    for target in scenario.targets:
+        prefix, name = target.split("/", 1)
+        listing = f"/user/{name}/submitted" if prefix == "u" else f"/r/{name}/new"
+        subreddit = f"u_{name}" if prefix == "u" else name
+        
+        posts = []
+        for i in range(scenario.posts_per_target):
+            counter += 1
+            post_id = f"b{counter:06x}"
+            kind = kinds[i % len(kinds)] if scenario.post_kind == "mixed" else scenario.post_kind
+            posts.append(_raw_post(server, post_id, kind, subreddit, name if prefix == "u" else "benchauthor",
+                                   scenario, created_utc=1700000000 - counter * 60))
+        server.catalog.add_listing(listing, posts)
+
+
+def _raw_post(server: FakeRedditServer, post_id: str, kind: str, subreddit: str, author: str,
+              scenario: Scenario, created_utc: int) -> Dict[str, Any]:
+    permalink = f"/r/{subreddit}/comments/{post_id}/bench_post/"
+    raw: Dict[str, Any] = {
+        "id": post_id,
+        "name": f"t3_{post_id}",
+        "title": f"Benchmark {kind} post {post_id}",
+        "author": author,
+        "subreddit": subreddit,
+        "permalink": permalink,
+        "created_utc": created_utc,
+        "score": 100,
+        "num_comments": 10,
+        "over_18": False,
+        "is_self": False,
+        "domain": server.host,
+    }
+    
+    if kind == "image":
+        path = f"/media/{post_id}.jpg"
+        server.catalog.add_media(path, scenario.file_size)
+        raw["url"] = server.url(path)
+    elif kind == "gallery":
+        raw["is_gallery"] = True
+        raw["url"] = server.url(f"/gallery/{post_id}")
+        raw["media_metadata"] = {}
+        for j in range(scenario.gallery_size):
+            path = f"/media/{post_id}_{j}.jpg"
+            server.catalog.add_media(path, scenario.file_size)
+            raw["media_metadata"][f"{post_id}m{j}"] = {
+                "status": "valid", "e": "Image", "m": "image/jpg",
+                "s": {"u": server.url(path), "x": 1920, "y": 1080}
+            }
+    elif kind == "video":
+        path = f"/media/{post_id}.mp4"
+        server.catalog.add_media(path, scenario.file_size)
+        raw["is_video"] = True
+        raw["url"] = server.url(path)
+        raw["media"] = {"reddit_video": {"fallback_url": server.url(path), "duration": 30}}
+    else:
+        raw["is_self"] = True
+        raw["domain"] = f"self.{subreddit}"
+        raw["url"] = server.url(permalink)
+        raw["selftext"] = "Benchmark text post. " * 50
+    return raw
+
+
+class BenchmarkRunner:
+    """
+    Runs benchmark scenarios against a local fake Reddit server.
+
+    Example:
+        runner = BenchmarkRunner(ServerProfile(latency=0.02), scale=0.1)
+        report = runner.run([STANDARD_SCENARIOS["video-users"]])
+        print(report["scenarios"][0]["posts_per_sec"])
+    """
+    
+    def __init__(self, profile: Optional[ServerProfile] = None, scale: float = 1.0,
+                 work_dir: Optional[Path] = None, keep_files: bool = False,
+                 progress: Optional[Callable[[str], None]] = None):
+        """
+        Initialize runner.
+
+        Args:
+            profile: Simulated network conditions for the fake server
+            scale: Multiplier applied to each scenario's post count
+            work_dir: Directory for downloads and exports (a temporary one if None)
+            keep_files: Keep downloaded files after each scenario
+            progress: Called with a message as each scenario starts
+        """
+        if scale <= 0:
+            raise ValueError(f"scale must be positive, got {scale}")
+        
+        self.profile = profile or ServerProfile()
+        self.scale = scale
+        self.work_dir = Path(work_dir) if work_dir else None
+        self.keep_files = keep_files
+        self.progress = progress
+    
+    def run(self, scenarios: List[Scenario]) -> Dict[str, Any]:
+        """
+        Run scenarios in order on one fake server.
+
+        Returns:
+            Machine-readable report with one entry per scenario
+        """
+        results = []
+        with FakeRedditServer(self.profile) as server:
+            for scenario in scenarios:
+                scenario = scenario.scaled(self.scale)
+                if self.progress:
+                    self.progress(f"{scenario.name}: {scenario.total_posts} posts")
+                result = asyncio.run(self.run_scenario(scenario, server))
+                results.append(result.to_dict())
+        
+        return {
+            "schema": REPORT_SCHEMA,
+            "suite": "redditdl-bench",
+            "version": __version__,
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "scale": self.scale,
+            "server": self.profile.to_dict(),
+            "scenarios": results,
+        }
+    
+    async def run_scenario(self, scenario: Scenario, server: FakeRedditServer) -> ScenarioResult:
+        """Run one scenario and measure it."""
+        from redditdl.pipeline.stages.filter import FilterStage
+        from redditdl.pipeline.stages.processing import ProcessingStage
+        from redditdl.pipeline.stages.export import ExportStage
+        
+        server.catalog = type(server.catalog)()
+        populate_catalog(scenario, server)
+        server.reset_stats()
+        
+        base_dir = Path(tempfile.mkdtemp(prefix=f"redditdl-bench-{scenario.name}-", dir=self.work_dir))
+        tracer = Tracer(sample_rate=1.0)
+        previous_tracer = set_tracer(tracer)
+        client = ListingClient(server.base_url, tracer=tracer)
+        sampler = _PeakRssSampler()
+        
+        try:
+            targets = self._resolve_targets(scenario, base_dir)
+            executor = PipelineExecutor([FilterStage(), ProcessingStage(), ExportStage()], tracer=tracer)
+            
+            sampler.start()
+            started = time.perf_counter()
+            
+            # Acquisition
+            with ThreadPoolExecutor(max_workers=scenario.concurrent_targets) as pool:
+                batches = list(pool.map(
+                    lambda target: client.fetch(target[0], target[1], scenario.posts_per_target),
+                    targets
+                ))
+            acquisition_time = time.perf_counter() - started
+            
+            context = PipelineContext(
+                posts=[post for batch in batches for post in batch],
+                config={
+                    "output_dir": str(base_dir / "downloads"),
+                    "export_dir": str(base_dir / "exports"),
+                    "export_formats": ["json"],
+                    "sleep_interval": 0.0,
+                    "embed_metadata": True,
+                    "enable_plugins": False,
+                }
+            )
+            
+            # The downloader reports every file on stdout
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                metrics = await executor.execute(context)
+            
+            elapsed = time.perf_counter() - started
+            peak_rss_mb = sampler.stop()
+        finally:
+            sampler.stop()
+            client.close()
+            set_tracer(previous_tracer)
+            if not self.keep_files:
+                shutil.rmtree(base_dir, ignore_errors=True)
+        
+        stats = server.stats
+        latencies = _post_latencies(tracer)
+        stage_errors = sum(result.error_count for result in executor.get_stage_results())
+        posts = len(context.posts)
+        stage_times = {"acquisition": acquisition_time}
+        stage_times.update(metrics.stage_times)
+        
+        return ScenarioResult(
+            name=scenario.name,
+            posts=posts,
+            targets=len(targets),
+            elapsed=elapsed,
+            posts_per_sec=posts / elapsed if elapsed > 0 else 0.0,
+            mb_per_sec=stats.media_bytes / (1024 * 1024) / elapsed if elapsed > 0 else 0.0,
+            bytes_downloaded=stats.media_bytes,
+            latency_p50=_percentile(latencies, 0.5),
+            latency_p95=_percentile(latencies, 0.95),
+            peak_rss_mb=peak_rss_mb,
+            errors=stage_errors + stats.errors_injected + stats.not_found,
+            requests=stats.listing_requests + stats.media_requests,
+            stage_times=stage_times,
+        )
+    
+    def _resolve_targets(self, scenario: Scenario, base_dir: Path) -> List[Tuple[TargetType, str]]:
+        target_inputs = list(scenario.targets)
+        if scenario.targets_file:
+            targets_file = base_dir / "targets.txt"
+            targets_file.write_text("# benchmark targets\n\n" + "\n".join(target_inputs) + "\n", encoding="utf-8")
+            target_inputs = [
+                line.strip() for line in targets_file.read_text(encoding="utf-8").splitlines()
+                if line.strip() and not line.strip().startswith("#")
+            ]
+        
+        resolved = TargetResolver().resolve_multiple_targets(target_inputs)
+        return [(info.target_type, info.target_value) for info in resolved]
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any],
+                    tolerance: float = 0.15) -> List[str]:
+    """
+    Find scenarios that got worse than a baseline report.
+
+    Args:
+        baseline: Earlier report from BenchmarkRunner.run()
+        current: New report
+        tolerance: Allowed relative change before a metric counts as regressed
+
+    Returns:
+        One message per regressed metric (empty if none)
+    """
+    previous = {scenario["name"]: scenario for scenario in baseline.get("scenarios", [])}
+    regressions = []
+    for scenario in current.get("scenarios", []):
+        before = previous.get(scenario["name"])
+        if before is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = before.get(metric), scenario.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if (higher_is_better and change < -tolerance) or (not higher_is_better and change > tolerance):
+                regressions.append(
+                    f"{scenario['name']}: {metric} {old:.4g} -> {new:.4g} ({change:+.1%})"
+                )
+    return regressions
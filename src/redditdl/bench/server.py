@@ -0,0 +1,322 @@
+"""
+Fake Reddit Server
+
+Local stand-ins for the Reddit JSON listing API and a media CDN, used by
+the benchmark suite so runs are repeatable and never touch the network.
+Latency, bandwidth and error rate are configurable per server, and file
+sizes per media file.
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Any, Optional
+from urllib.parse import urlsplit, parse_qs
+
+
+logger = logging.getLogger(__name__)
+
+# Largest page the listing API returns, as on Reddit
+MAX_PAGE_SIZE = 100
+
+# Bytes written per chunk when streaming media
+CHUNK_SIZE = 64 * 1024
+
+# Filler for media bodies; files are slices of this pattern
+_PATTERN = bytes(range(256)) * (CHUNK_SIZE // 256)
+
+_CONTENT_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.mp4': 'video/mp4',
+}
+
+
+@dataclass
+class ServerProfile:
+    """
+    Network conditions simulated by FakeRedditServer.
+
+    Attributes:
+        latency: Seconds to wait before answering each request
+        bandwidth: Bytes per second per response (None for unlimited)
+        error_rate: Fraction of requests answered with 503
+        seed: Seed for the error injection sequence
+    """
+    latency: float = 0.0
+    bandwidth: Optional[float] = None
+    error_rate: float = 0.0
+    seed: int = 1234
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class ServerStats:
+    """Request counters for a FakeRedditServer."""
+    listing_requests: int = 0
+    media_requests: int = 0
+    errors_injected: int = 0
+    not_found: int = 0
+    bytes_sent: int = 0
+    media_bytes: int = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class FakeRedditCatalog:
+    """
+    Listings and media files served by FakeRedditServer.
+
+    Listings are keyed by their path without the .json suffix, e.g.
+    "/r/pics/new" or "/user/alice/submitted", and hold raw post data
+    dictionaries in the shape Reddit returns.
+    """
+    
+    def __init__(self):
+        self._listings: Dict[str, List[Dict[str, Any]]] = {}
+        self._positions: Dict[str, Dict[str, int]] = {}
+        self._media: Dict[str, int] = {}
+        self._lock = threading.Lock()
+    
+    def add_listing(self, path: str, posts: List[Dict[str, Any]]) -> None:
+        """Add posts to the end of a listing."""
+        with self._lock:
+            listing = self._listings.setdefault(path, [])
+            positions = self._positions.setdefault(path, {})
+            for post in posts:
+                positions[post['name']] = len(listing)
+                listing.append(post)
+    
+    def add_media(self, path: str, size: int) -> None:
+        """Serve size bytes at path."""
+        with self._lock:
+            self._media[path] = size
+    
+    def media_size(self, path: str) -> Optional[int]:
+        return self._media.get(path)
+    
+    @property
+    def media_bytes(self) -> int:
+        """Total size of all media files."""
+        return sum(self._media.values())
+    
+    def get_page(self, path: str, after: Optional[str], limit: int) -> Optional[Dict[str, Any]]:
+        """
+        Render one page of a listing.
+
+        Args:
+            path: Listing path
+            after: Fullname of the last post on the previous page
+            limit: Requested page size (capped at MAX_PAGE_SIZE)
+
+        Returns:
+            Reddit Listing document, or None if the listing does not exist
+        """
+        listing = self._listings.get(path)
+        if listing is None:
+            return None
+        
+        start = 0
+        if after:
+            position = self._positions[path].get(after)
+            if position is None:
+                start = len(listing)
+            else:
+                start = position + 1
+        
+        page = listing[start:start + max(1, min(limit, MAX_PAGE_SIZE))]
+        next_after = page[-1]['name'] if page and start + len(page) < len(listing) else None
+        return {
+            "kind": "Listing",
+            "data": {
+                "after": next_after,
+                "before": None,
+                "dist": len(page),
+                "children": [{"kind": "t3", "data": post} for post in page]
+            }
+        }
+
+
+class _FakeRedditRequestHandler(BaseHTTPRequestHandler):
+    """Serves listing JSON and media bytes from the server's catalog."""
+    
+    protocol_version = "HTTP/1.1"
+    server_ref: 'FakeRedditServer' = None
+    
+    def do_GET(self) -> None:
+        server = self.server_ref
+        parts = urlsplit(self.path)
+        is_media = parts.path.startswith("/media/")
+        
+        server._count("media_requests" if is_media else "listing_requests")
+        if server.profile.latency > 0:
+            time.sleep(server.profile.latency)
+        
+        if server._should_fail():
+            server._count("errors_injected")
+            self._send_body(503, b'{"message": "Service Unavailable", "error": 503}', "application/json")
+            return
+        
+        if is_media:
+            self._send_media(parts.path)
+        elif parts.path.endswith(".json"):
+            query = parse_qs(parts.query)
+            try:
+                limit = int(query.get("limit", ["25"])[0])
+            except ValueError:
+                limit = 25
+            page = server.catalog.get_page(parts.path[:-len(".json")], query.get("after", [None])[0], limit)
+            if page is None:
+                self._not_found()
+            else:
+                self._send_body(200, json.dumps(page).encode("utf-8"), "application/json")
+        else:
+            self._not_found()
+    
+    def _send_media(self, path: str) -> None:
+        size = self.server_ref.catalog.media_size(path)
+        if size is None:
+            self._not_found()
+            return
+        
+        extension = path[path.rfind("."):].lower() if "." in path else ""
+        self.send_response(200)
+        self.send_header("Content-Type", _CONTENT_TYPES.get(extension, "application/octet-stream"))
+        self.send_header("Content-Length", str(size))
+        self.end_headers()
+        
+        bandwidth = self.server_ref.profile.bandwidth
+        remaining = size
+        while remaining > 0:
+            chunk = _PATTERN[:min(remaining, CHUNK_SIZE)]
+            self.wfile.write(chunk)
+            remaining -= len(chunk)
+            if bandwidth:
+                time.sleep(len(chunk) / bandwidth)
+        self.server_ref._count("bytes_sent", size)
+        self.server_ref._count("media_bytes", size)
+    
+    def _not_found(self) -> None:
+        self.server_ref._count("not_found")
+        self._send_body(404, b'{"message": "Not Found", "error": 404}', "application/json")
+    
+    def _send_body(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.server_ref._count("bytes_sent", len(body))
+    
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"Fake Reddit server: {format % args}")
+
+
+class FakeRedditServer:
+    """
+    Background HTTP server impersonating Reddit listings and its CDN.
+
+    Listing pages are served at /r/<name>/new.json and
+    /user/<name>/submitted.json with Reddit's limit/after pagination;
+    media files are served under /media/. Port 0 picks a free port,
+    available from base_url after start().
+
+    Example:
+        with FakeRedditServer(ServerProfile(latency=0.05)) as server:
+            server.catalog.add_media("/media/a.jpg", 2048)
+            requests.get(server.url("/media/a.jpg"))
+    """
+    
+    def __init__(self, profile: Optional[ServerProfile] = None,
+                 catalog: Optional[FakeRedditCatalog] = None,
+                 host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize server.
+
+        Args:
+            profile: Simulated network conditions
+            catalog: Listings and media to serve (empty if None)
+            host: Interface to bind
+            port: Port to bind (0 for any free port)
+        """
+        self.profile = profile or ServerProfile()
+        self.catalog = catalog or FakeRedditCatalog()
+        self.host = host
+        self.port = port
+        self.stats = ServerStats()
+        
+        self._random = random.Random(self.profile.seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+    
+    def url(self, path: str) -> str:
+        """Absolute URL for a path on this server."""
+        return f"{self.base_url}{path}"
+    
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+    
+    def start(self) -> None:
+        """Start serving in a daemon thread."""
+        if self._server is not None:
+            return
+        
+        handler = type("FakeRedditRequestHandler", (_FakeRedditRequestHandler,),
+                       {"server_ref": self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name="fake-reddit-http", daemon=True)
+        self._thread.start()
+        logger.info(f"Serving fake Reddit at {self.base_url}")
+    
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._server is None:
+            return
+        
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join(timeout=5.0)
+        self._server = None
+        self._thread = None
+    
+    def reset_stats(self) -> ServerStats:
+        """Reset request counters, returning the previous ones."""
+        with self._lock:
+            previous, self.stats = self.stats, ServerStats()
+        return previous
+    
+    def _should_fail(self) -> bool:
+        if self.profile.error_rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < self.profile.error_rate
+    
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + amount)
+    
+    def __enter__(self) -> 'FakeRedditServer':
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
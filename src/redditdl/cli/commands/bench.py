@@ -0,0 +1,152 @@
+"""
+Bench Command
+
+Commands for running the performance benchmark suite against a local fake
+Reddit server and comparing results with a saved baseline.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Optional, List, Annotated, Dict, Any
+
+import typer
+from rich.table import Table
+
+from redditdl.cli.utils import print_header, console
+from redditdl.bench import (
+    BenchmarkRunner,
+    ServerProfile,
+    STANDARD_SCENARIOS,
+    compare_reports,
+)
+
+
+# Create the bench sub-application
+app = typer.Typer(
+    name="bench",
+    help="Run performance benchmarks against a local fake Reddit",
+    rich_markup_mode="rich",
+    no_args_is_help=True,
+)
+
+
+@app.command("run")
+def bench_run(
+    scenarios: Annotated[Optional[List[str]], typer.Option("--scenario", "-s", help="Scenario to run (repeatable, default all)")] = None,
+    scale: Annotated[float, typer.Option("--scale", help="Multiplier for each scenario's post count")] = 1.0,
+    
+    # Simulated network
+    latency: Annotated[float, typer.Option("--latency", help="Seconds of latency per request")] = 0.0,
+    bandwidth: Annotated[Optional[float], typer.Option("--bandwidth", help="Bytes per second per response (default unlimited)")] = None,
+    error_rate: Annotated[float, typer.Option("--error-rate", help="Fraction of requests answered with 503")] = 0.0,
+    seed: Annotated[int, typer.Option("--seed", help="Seed for error injection")] = 1234,
+    
+    # Output
+    output: Annotated[Optional[Path], typer.Option("--output", "-o", help="Write the JSON report to this file")] = None,
+    json_output: Annotated[bool, typer.Option("--json", help="Print the JSON report instead of a table")] = False,
+    baseline: Annotated[Optional[Path], typer.Option("--baseline", help="Fail if results regressed against this report")] = None,
+    tolerance: Annotated[float, typer.Option("--tolerance", help="Allowed relative change before a metric counts as regressed")] = 0.15,
+):
+    """
+    Run benchmark scenarios and report throughput, latency and memory.
+
+    [bold cyan]Examples:[/bold cyan]
+
+    • All scenarios: [green]redditdl bench run[/green]
+    • Quick check: [green]redditdl bench run --scale 0.1 -s video-users[/green]
+    • Slow network: [green]redditdl bench run --latency 0.05 --bandwidth 1000000 --error-rate 0.01[/green]
+    • CI gate: [green]redditdl bench run -o report.json --baseline baseline.json[/green]
+    """
+    names = scenarios or list(STANDARD_SCENARIOS)
+    unknown = [name for name in names if name not in STANDARD_SCENARIOS]
+    if unknown:
+        console.print(f"[red]Error: Unknown scenario(s): {', '.join(unknown)}[/red]")
+        console.print(f"Available: {', '.join(STANDARD_SCENARIOS)}")
+        raise typer.Exit(1)
+    
+    if scale <= 0 or not 0.0 <= error_rate < 1.0:
+        console.print("[red]Error: --scale must be positive and --error-rate in [0, 1)[/red]")
+        raise typer.Exit(1)
+    
+    baseline_report = None
+    if baseline:
+        try:
+            baseline_report = json.loads(baseline.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            console.print(f"[red]Error: Cannot read baseline {baseline}: {e}[/red]")
+            raise typer.Exit(1)
+    
+    # Keep pipeline logging from interleaving with the report
+    logging.getLogger().setLevel(logging.WARNING)
+    
+    if not json_output:
+        print_header("Benchmark", f"{len(names)} scenario(s) at scale {scale}")
+    
+    profile = ServerProfile(latency=latency, bandwidth=bandwidth, error_rate=error_rate, seed=seed)
+    runner = BenchmarkRunner(
+        profile,
+        scale=scale,
+        progress=None if json_output else lambda message: console.print(f"[cyan]Running {message}[/cyan]"),
+    )
+    report = runner.run([STANDARD_SCENARIOS[name] for name in names])
+    
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    
+    if json_output:
+        typer.echo(json.dumps(report, indent=2))
+    else:
+        _display_report(report)
+        if output:
+            console.print(f"[green]Report written to {output}[/green]")
+    
+    if baseline_report is not None:
+        regressions = compare_reports(baseline_report, report, tolerance=tolerance)
+        if regressions:
+            console.print(f"[red]{len(regressions)} regression(s) against {baseline}:[/red]")
+            for regression in regressions:
+                console.print(f"  [red]• {regression}[/red]")
+            raise typer.Exit(1)
+        if not json_output:
+            console.print(f"[green]✓ No regressions against {baseline}[/green]")
+
+
+@app.command("list")
+def bench_list():
+    """List the standard benchmark scenarios."""
+    table = Table(title="Benchmark Scenarios")
+    table.add_column("Scenario", style="cyan")
+    table.add_column("Posts", justify="right")
+    table.add_column("Description")
+    
+    for scenario in STANDARD_SCENARIOS.values():
+        table.add_row(scenario.name, f"{scenario.total_posts:,}", scenario.description)
+    
+    console.print(table)
+
+
+def _display_report(report: Dict[str, Any]) -> None:
+    """Display scenario results as a table."""
+    table = Table(title="Benchmark Results")
+    table.add_column("Scenario", style="cyan")
+    table.add_column("Posts", justify="right")
+    table.add_column("Posts/s", justify="right")
+    table.add_column("MB/s", justify="right")
+    table.add_column("p95 latency", justify="right")
+    table.add_column("Peak RSS", justify="right")
+    table.add_column("Errors", justify="right")
+    
+    for result in report["scenarios"]:
+        table.add_row(
+            result["name"],
+            f"{result['posts']:,}",
+            f"{result['posts_per_sec']:.1f}",
+            f"{result['mb_per_sec']:.2f}",
+            f"{result['latency_p95'] * 1000:.1f} ms",
+            f"{result['peak_rss_mb']:.1f} MiB",
+            str(result["errors"]),
+        )
+    
+    console.print(table)
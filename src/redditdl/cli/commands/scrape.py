@@ -75,6 +75,7 @@ def scrape_user(
     dry_run: Annotated[Optional[bool], typer.Option("--dry-run", help="Execute without downloading files")] = None,
     verbose: Annotated[Optional[bool], typer.Option("--verbose", "-v", help="Enable verbose output")] = None,
     use_pipeline: Annotated[Optional[bool], typer.Option("--pipeline/--no-pipeline", help="Use modern pipeline architecture")] = None,
+    skip_archived: Annotated[Optional[bool], typer.Option("--skip-archived", help="Skip posts already archived by earlier runs")] = None,
     
     # Scraping settings  
     limit: Annotated[Optional[int], typer.Option("--limit", "-l", callback=validate_positive_int, help="Maximum posts to process")] = -1,
@@ -184,6 +185,7 @@ def scrape_user(
             dry_run=dry_run,
             verbose=verbose,
             use_pipeline=use_pipeline,
+            skip_archived=skip_archived,
             api=api,
             client_id=client_id,
             client_secret=client_secret,
@@ -441,6 +443,8 @@ async def _scrape_user_pipeline(config: AppConfig, username: str, event_emitter:
         username: Reddit username to scrape
         event_emitter: Event emitter for progress tracking
     """
+    state_manager = None
+    plugin_manager = None
     try:
         # Import pipeline components
         from redditdl.core.pipeline.interfaces import PipelineContext
@@ -450,6 +454,9 @@ async def _scrape_user_pipeline(config: AppConfig, username: str, event_emitter:
         from redditdl.pipeline.stages.processing import ProcessingStage
         from redditdl.pipeline.stages.organization import OrganizationStage
         from redditdl.pipeline.stages.export import ExportStage
+        from redditdl.core.monitoring.openmetrics import metrics_endpoint
+        from redditdl.core.monitoring.profiler import sampling_session
+        from redditdl.core.monitoring.tracing import tracing_session
         
         # Create pipeline context
         context = PipelineContext()
@@ -495,6 +502,30 @@ async def _scrape_user_pipeline(config: AppConfig, username: str, event_emitter:
                 context.set_config("username", config.scraping.username)
                 context.set_config("password", config.scraping.password)
         
+        # Persistent cache for listing responses
+        http_cache_dir = config.get_http_cache_dir()
+        if http_cache_dir:
+            context.set_config("http_cache_dir", str(http_cache_dir))
+            context.set_config("http_cache_size_mb", config.http_cache_size_mb)
+        
+        # Drop posts archived by earlier runs, including existing JSON sidecars
+        if config.skip_archived:
+            from redditdl.core.state.manager import StateManager
+            
+            state_manager = StateManager(config.session_dir / "state.db")
+            context.state_manager = state_manager
+            state_manager.index_sidecars([config.output.output_dir],
+                                         exclude=[config.get_export_dir()])
+            context.set_config("skip_archived", True)
+        
+        # Register plugins once for the run; their components load on first use
+        if config.enable_plugins:
+            from redditdl.core.plugins.manager import PluginManager
+            
+            plugin_manager = PluginManager(plugin_dirs=[str(d) for d in config.plugin_dirs],
+                                           index_path=config.get_plugin_index_path())
+            plugin_manager.load_all_plugins(lazy=True)
+        
         # Create pipeline executor
         executor = PipelineExecutor(error_handling="continue")
         
@@ -540,7 +571,7 @@ async def _scrape_user_pipeline(config: AppConfig, username: str, event_emitter:
         
         # Skip processing stage in dry-run mode
         if not config.dry_run:
-            executor.add_stage(ProcessingStage(processing_config))
+            executor.add_stage(ProcessingStage(processing_config, plugin_manager=plugin_manager))
         else:
             console.print("[yellow]Dry-run mode: Skipping content processing/download[/yellow]")
         
@@ -550,13 +581,22 @@ async def _scrape_user_pipeline(config: AppConfig, username: str, event_emitter:
         # Execute pipeline
         console.print("[cyan]Starting pipeline execution...[/cyan]")
         
-        metrics = await executor.execute(context)
+        with metrics_endpoint(config.metrics_port, config.metrics_host), \
+                sampling_session(config.profile_output), \
+                tracing_session(config.trace_output, config.trace_sample_rate):
+            metrics = await executor.execute(context)
         
         # Log execution results
         console.print("[bold green]Pipeline execution completed![/bold green]")
         console.print(f"Total execution time: {metrics.total_execution_time:.2f}s")
         console.print(f"Successful stages: {metrics.successful_stages}/{metrics.total_stages}")
         console.print(f"Total posts processed: {len(context.posts)}")
+        if metrics.trace_summary:
+            slowest = metrics.trace_summary['slowest_posts'][:1]
+            console.print(
+                f"Traced posts: {metrics.trace_summary['traced_posts']}"
+                + (f" (slowest: {slowest[0]['post_id']} in {slowest[0]['duration']:.2f}s)" if slowest else "")
+            )
         
         if metrics.failed_stages > 0:
             console.print(f"[yellow]Pipeline completed with {metrics.failed_stages} failed stages[/yellow]")
@@ -567,6 +607,11 @@ async def _scrape_user_pipeline(config: AppConfig, username: str, event_emitter:
     except Exception as e:
         console.print(f"[red]Pipeline execution failed: {e}[/red]")
         raise
+    finally:
+        if state_manager is not None:
+            state_manager.close()
+        if plugin_manager is not None:
+            plugin_manager.cleanup()
 
 
 @app.command("targets")
@@ -953,6 +998,9 @@ async def _scrape_targets_pipeline(config: AppConfig, targets: List[str], target
     from redditdl.core.events.emitter import EventEmitter
     from redditdl.core.state.manager import StateManager
     from redditdl.cli.config_utils import create_cli_args_for_targets
+    from redditdl.core.monitoring.openmetrics import metrics_endpoint
+    from redditdl.core.monitoring.profiler import sampling_session
+    from redditdl.core.monitoring.tracing import tracing_session
     
     console.print("[cyan]Initializing multi-target pipeline...[/cyan]")
     
@@ -989,7 +1037,10 @@ async def _scrape_targets_pipeline(config: AppConfig, targets: List[str], target
         
         # Execute the complete pipeline
         console.print("[cyan]Starting multi-target pipeline execution...[/cyan]")
-        result = await executor.execute(context)
+        with metrics_endpoint(config.metrics_port, config.metrics_host), \
+                sampling_session(config.profile_output), \
+                tracing_session(config.trace_output, config.trace_sample_rate):
+            result = await executor.execute(context)
         
         # Report results
         if result.success:
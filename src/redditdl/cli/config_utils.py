@@ -165,6 +165,7 @@ def build_cli_args(
     dry_run: Optional[bool] = None,
     verbose: Optional[bool] = None,
     use_pipeline: Optional[bool] = None,
+    skip_archived: Optional[bool] = None,
     
     # Scraping arguments
     api: Optional[bool] = None,
@@ -261,6 +262,8 @@ def build_cli_args(
         args['verbose'] = verbose
     if use_pipeline is not None:
         args['use_pipeline'] = use_pipeline
+    if skip_archived is not None:
+        args['skip_archived'] = skip_archived
     
     # Scraping settings
     if api is not None:
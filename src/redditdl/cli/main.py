@@ -6,16 +6,82 @@ Modern Typer-based command-line interface providing multi-command structure,
 rich formatting, and enhanced user experience.
 """
 
+import importlib
+from typing import Dict, List, Optional, Tuple
+
 import typer
-from rich import print as rprint
+from typer.core import TyperCommand, TyperGroup
 from rich.console import Console
-from typing import Optional
 
 from redditdl.cli import __version__
-from redditdl.cli.commands import scrape, audit, interactive
 
 console = Console()
 
+
+class LazyCommandGroup(TyperGroup):
+    """
+    Typer group whose subcommands are imported on first use.
+    
+    Subcommand modules pull in PRAW, Pillow, pydantic models, the plugin
+    manager and every content handler, so they are only imported when a
+    command actually runs (or its own help/completion is requested).
+    Listing commands for top-level help or shell completion uses the
+    registered help text instead.
+    """
+    
+    # name -> (module path, Typer attribute, help text, hidden)
+    lazy_subcommands: Dict[str, Tuple[str, str, str, bool]] = {}
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._resolving = False
+    
+    def list_commands(self, ctx) -> List[str]:
+        names = list(super().list_commands(ctx))
+        return names + [name for name in self.lazy_subcommands if name not in names]
+    
+    def resolve_command(self, ctx, args):
+        # Resolving a command (to run it or complete its arguments) needs the real one
+        self._resolving = True
+        try:
+            return super().resolve_command(ctx, args)
+        finally:
+            self._resolving = False
+    
+    def get_command(self, ctx, cmd_name):
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy_subcommands:
+            return command
+        
+        module_path, attribute, help_text, hidden = self.lazy_subcommands[cmd_name]
+        if not self._resolving:
+            # Listing only (help output, completion of command names)
+            return TyperCommand(name=cmd_name, help=help_text, short_help=help_text, hidden=hidden)
+        
+        module = importlib.import_module(module_path)
+        command = typer.main.get_group(getattr(module, attribute))
+        command.name = cmd_name
+        command.help = help_text or command.help
+        command.hidden = hidden
+        self.commands[cmd_name] = command
+        return command
+
+
+def register_lazy_command(name: str, module_path: str, attribute: str = "app",
+                          help: str = "", hidden: bool = False) -> None:
+    """
+    Register a subcommand that is imported only when it is used.
+    
+    Args:
+        name: Command name on the command line
+        module_path: Module defining the command's Typer app
+        attribute: Name of the Typer app in that module
+        help: Help text shown in the command list
+        hidden: Hide the command from help output
+    """
+    LazyCommandGroup.lazy_subcommands[name] = (module_path, attribute, help, hidden)
+
+
 # Create main Typer application
 app = typer.Typer(
     name="redditdl",
@@ -24,18 +90,18 @@ app = typer.Typer(
     context_settings={"help_option_names": ["-h", "--help"]},
     rich_markup_mode="rich",
     no_args_is_help=True,
+    cls=LazyCommandGroup,
 )
 
-# Add subcommands
-app.add_typer(scrape.app, name="scrape", help="Download media from Reddit users/subreddits")
-app.add_typer(audit.app, name="audit", help="Audit and repair downloaded archives")
-app.add_typer(interactive.app, name="interactive", help="Launch interactive REPL mode")
+# Add subcommands (imported on first use)
+register_lazy_command("scrape", "redditdl.cli.commands.scrape", help="Download media from Reddit users/subreddits")
+register_lazy_command("audit", "redditdl.cli.commands.audit", help="Audit and repair downloaded archives")
+register_lazy_command("interactive", "redditdl.cli.commands.interactive", help="Launch interactive REPL mode")
+register_lazy_command("bench", "redditdl.cli.commands.bench", help="Run performance benchmarks against a local fake Reddit")
 
 # Add completion support (hidden from main help)
-try:
-    from redditdl.cli import completion
-except ImportError:
-    pass  # Completion support is optional
+register_lazy_command("completion", "redditdl.cli.completion", "completion_app",
+                      help="Shell completion helpers", hidden=True)
 
 
 def version_callback(value: bool):
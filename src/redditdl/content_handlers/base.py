@@ -10,7 +10,7 @@ import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Set, Type, Union
+from typing import Callable, Dict, Any, List, Optional, Set, Type, Union
 from urllib.parse import urlparse
 
 from redditdl.scrapers import PostMetadata
@@ -415,6 +415,14 @@ class ContentTypeDetector:
         return content_type in {'image', 'video', 'audio', 'gallery'}
 
 
+@dataclass
+class LazyHandlerStub:
+    """Placeholder for a plugin handler that is created on first use."""
+    name: str
+    content_types: Set[str]
+    factory: Callable[[], BaseContentHandler]
+
+
 class ContentHandlerRegistry:
     """
     Registry for managing content handlers.
@@ -426,6 +434,8 @@ class ContentHandlerRegistry:
     def __init__(self):
         self._handlers: List[BaseContentHandler] = []
         self._handlers_by_type: Dict[str, List[BaseContentHandler]] = {}
+        self._lazy_handlers: List[LazyHandlerStub] = []
+        self._resolved_lazy_handlers: Dict[str, BaseContentHandler] = {}
         self.logger = logging.getLogger("redditdl.registry")
     
     def register_handler(self, handler: BaseContentHandler) -> None:
@@ -454,6 +464,55 @@ class ContentHandlerRegistry:
         
         self.logger.debug(f"Registered handler: {handler.name} (priority: {handler.priority})")
     
+    def register_lazy_handler(
+        self,
+        name: str,
+        content_types: List[str],
+        factory: Callable[[], BaseContentHandler]
+    ) -> bool:
+        """
+        Register a handler that is created the first time a post needs it.
+        
+        Args:
+            name: Handler name for logging
+            content_types: Content types the handler declares ('*' for any)
+            factory: Callable that imports and instantiates the handler
+            
+        Returns:
+            False if a lazy handler with this name is already registered
+        """
+        if name in self._resolved_lazy_handlers or any(stub.name == name for stub in self._lazy_handlers):
+            return False
+        self._lazy_handlers.append(LazyHandlerStub(name, set(content_types), factory))
+        self.logger.debug(f"Registered lazy handler: {name} for types {content_types}")
+        return True
+    
+    def _resolve_lazy_handlers(self, content_type: str) -> None:
+        """Create and register lazy handlers declaring a content type."""
+        pending = [stub for stub in self._lazy_handlers
+                   if content_type in stub.content_types or '*' in stub.content_types]
+        for stub in pending:
+            self._lazy_handlers.remove(stub)
+            try:
+                handler = stub.factory()
+            except Exception as e:
+                self.logger.error(f"Failed to load content handler {stub.name}: {e}")
+                continue
+            self._resolved_lazy_handlers[stub.name] = handler
+            self.register_handler(handler)
+    
+    def unregister_lazy_handler(self, name: str) -> None:
+        """
+        Unregister a lazily registered handler, whether or not it was created.
+        
+        Args:
+            name: Handler name given at registration
+        """
+        self._lazy_handlers = [stub for stub in self._lazy_handlers if stub.name != name]
+        handler = self._resolved_lazy_handlers.pop(name, None)
+        if handler is not None:
+            self.unregister_handler(handler)
+    
     def unregister_handler(self, handler: BaseContentHandler) -> None:
         """
         Unregister a content handler.
@@ -490,6 +549,9 @@ class ContentHandlerRegistry:
         if content_type is None:
             content_type = ContentTypeDetector.detect_content_type(post)
         
+        if self._lazy_handlers:
+            self._resolve_lazy_handlers(content_type)
+        
         # First try handlers registered for this specific content type
         if content_type in self._handlers_by_type:
             for handler in self._handlers_by_type[content_type]:
@@ -513,6 +575,8 @@ class ContentHandlerRegistry:
         Returns:
             List of handlers supporting the content type
         """
+        if self._lazy_handlers:
+            self._resolve_lazy_handlers(content_type)
         return self._handlers_by_type.get(content_type, []).copy()
     
     def list_all_handlers(self) -> List[BaseContentHandler]:
@@ -265,12 +265,16 @@ class GalleryContentHandler(BaseContentHandler):
         if embed_metadata and not self._embedder:
             self._embedder = MetadataEmbedder()
         
-        # Create downloader if needed
-        if not self._downloader:
+        # Create downloader if needed or if configuration changed
+        embedder = self._embedder if embed_metadata else None
+        if (not self._downloader
+                or self._downloader.outdir != Path(output_dir)
+                or self._downloader.sleep_interval != sleep_interval
+                or self._downloader.embedder is not embedder):
             self._downloader = MediaDownloader(
                 outdir=output_dir,
                 sleep_interval=sleep_interval,
-                embedder=self._embedder if embed_metadata else None
+                embedder=embedder
             )
         
         return self._downloader
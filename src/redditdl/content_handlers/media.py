@@ -25,13 +25,23 @@ from redditdl.core.exceptions import (
 )
 from redditdl.core.error_recovery import get_recovery_manager
 from redditdl.core.error_context import report_error
+from redditdl.core.concurrency.pools import get_pool_manager
 
 try:
     from redditdl.processing import ProcessorFactory, ProcessingError, VIDEO_PROCESSING_AVAILABLE
+    from redditdl.processing.image_processor import ImageProcessor, ImageOutput, render_image_outputs
+    from redditdl.processing.video_processor import VideoProcessor
+    from redditdl.processing.video_runner import VideoOutput, get_video_runner
     PROCESSING_AVAILABLE = True
 except ImportError:
     ProcessorFactory = None
     ProcessingError = None
+    ImageProcessor = None
+    ImageOutput = None
+    render_image_outputs = None
+    VideoProcessor = None
+    VideoOutput = None
+    get_video_runner = None
     VIDEO_PROCESSING_AVAILABLE = False
     PROCESSING_AVAILABLE = False
 
@@ -247,7 +257,7 @@ class MediaContentHandler(BaseContentHandler):
                     result.add_operation("sidecar_creation")
                 
                 # Apply post-download processing if enabled
-                processing_result = self._apply_processing(output_path, config)
+                processing_result = await self._apply_processing(output_path, config)
                 if processing_result:
                     for file in processing_result.get('processed_files', []):
                         result.add_file(file)
@@ -291,11 +301,15 @@ class MediaContentHandler(BaseContentHandler):
             self._embedder = MetadataEmbedder()
         
         # Create downloader if needed or if configuration changed
-        if not self._downloader:
+        embedder = self._embedder if embed_metadata else None
+        if (not self._downloader
+                or self._downloader.outdir != Path(output_dir)
+                or self._downloader.sleep_interval != sleep_interval
+                or self._downloader.embedder is not embedder):
             self._downloader = MediaDownloader(
                 outdir=output_dir,
                 sleep_interval=sleep_interval,
-                embedder=self._embedder if embed_metadata else None
+                embedder=embedder
             )
         
         return self._downloader
@@ -519,10 +533,14 @@ class MediaContentHandler(BaseContentHandler):
         
         return errors
     
-    def _apply_processing(self, file_path: Path, config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def _apply_processing(self, file_path: Path, config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Apply post-download processing to media file.
         
+        Image operations run in the shared worker process pool unless
+        ``worker_backend`` is ``'inline'``, so Pillow work uses every core
+        and never blocks the event loop.
+        
         Args:
             file_path: Path to downloaded file
             config: Handler configuration
@@ -549,8 +567,6 @@ class MediaContentHandler(BaseContentHandler):
                 self.logger.debug(f"Unknown content type for {file_path}, skipping processing")
                 return None
             
-            processor = self._processor_factory.create_processor(content_type, file_path, processing_config)
-            
             # Apply processing operations based on configuration
             results = {
                 'processed_files': [],
@@ -559,11 +575,15 @@ class MediaContentHandler(BaseContentHandler):
             
             # Image processing
             if content_type == 'image':
-                results.update(self._process_image(processor, file_path, processing_config))
+                if processing_config.get('worker_backend', 'process') == 'process':
+                    results.update(await self._process_image_in_pool(file_path, processing_config))
+                else:
+                    processor = self._processor_factory.create_processor(content_type, file_path, processing_config)
+                    results.update(self._process_image(processor, file_path, processing_config))
             
             # Video processing
-            elif content_type == 'video' and VIDEO_PROCESSING_AVAILABLE:
-                results.update(self._process_video(processor, file_path, processing_config))
+            elif content_type == 'video':
+                results.update(await self._process_video(file_path, processing_config))
             
             return results if results['processed_files'] or results['operations'] else None
             
@@ -571,9 +591,86 @@ class MediaContentHandler(BaseContentHandler):
             self.logger.warning(f"Processing failed for {file_path}: {e}")
             return None
     
+    def _plan_image_operations(self, file_path: Path, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Work out which image outputs the configuration asks for.
+        
+        Args:
+            file_path: Path to image file
+            config: Processing configuration
+            
+        Returns:
+            List of operations, each with the result 'operation' name and
+            the ImageOutput it writes
+        """
+        plan = []
+        preserve_metadata = config.get('preserve_original_metadata', True)
+        quality = config.get('image_quality', 85)
+        
+        # Format conversion
+        if config.get('image_format_conversion', False):
+            target_format = config.get('target_image_format', 'jpeg')
+            if target_format != file_path.suffix[1:].lower():
+                plan.append({
+                    'operation': 'image_format_conversion',
+                    'output': ImageOutput(
+                        path=file_path.with_suffix(f'.{target_format}'),
+                        format=target_format,
+                        quality=quality,
+                        preserve_metadata=preserve_metadata
+                    )
+                })
+        
+        # Quality adjustment
+        elif config.get('image_quality_adjustment', False):
+            if quality != 100:  # Only process if quality is reduced
+                output_format = file_path.suffix[1:].lower()
+                if output_format not in ImageProcessor.QUALITY_FORMATS:
+                    output_format = 'jpeg'  # Default to JPEG for quality adjustment
+                plan.append({
+                    'operation': 'image_quality_adjustment',
+                    'output': ImageOutput(
+                        path=file_path.with_name(f"{file_path.stem}_q{quality}{file_path.suffix}"),
+                        format=output_format,
+                        quality=quality,
+                        preserve_metadata=preserve_metadata
+                    )
+                })
+        
+        # Resolution limiting
+        max_resolution = config.get('max_image_resolution')
+        if max_resolution:
+            plan.append({
+                'operation': 'image_resize',
+                'output': ImageOutput(
+                    path=file_path.with_name(f"{file_path.stem}_resized{file_path.suffix}"),
+                    max_dimension=max_resolution,
+                    preserve_metadata=preserve_metadata
+                )
+            })
+        
+        # Thumbnail generation
+        if config.get('generate_thumbnails', False):
+            thumbnail_size = config.get('thumbnail_size', 256)
+            plan.append({
+                'operation': 'thumbnail_generation',
+                'output': ImageOutput(
+                    path=file_path.with_name(f"{file_path.stem}_thumb{file_path.suffix}"),
+                    quality=85,  # Good quality for thumbnails
+                    max_dimension=thumbnail_size,
+                    # Thumbnails typically don't need metadata
+                    preserve_metadata=False,
+                    auto_orient=True
+                )
+            })
+        
+        return plan
+    
     def _process_image(self, processor, file_path: Path, config: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Apply image processing operations.
+        Apply image processing operations inline.
+        
+        All outputs are rendered from a single decode of the source image.
         
         Args:
             processor: ImageProcessor instance
@@ -584,75 +681,72 @@ class MediaContentHandler(BaseContentHandler):
             Dictionary with processing results
         """
         results = {'processed_files': [], 'operations': []}
+        plan = self._plan_image_operations(file_path, config)
+        if not plan:
+            return results
         
         try:
-            # Format conversion
-            if config.get('image_format_conversion', False):
-                target_format = config.get('target_image_format', 'jpeg')
-                if target_format != file_path.suffix[1:].lower():
-                    converted_path = file_path.with_suffix(f'.{target_format}')
-                    processor.convert_format(
-                        file_path, 
-                        converted_path, 
-                        target_format,
-                        quality=config.get('image_quality', 85),
-                        preserve_metadata=config.get('preserve_original_metadata', True)
-                    )
-                    results['processed_files'].append(converted_path)
-                    results['operations'].append('image_format_conversion')
-            
-            # Quality adjustment
-            elif config.get('image_quality_adjustment', False):
-                quality = config.get('image_quality', 85)
-                if quality != 100:  # Only process if quality is reduced
-                    quality_path = file_path.with_name(f"{file_path.stem}_q{quality}{file_path.suffix}")
-                    processor.adjust_quality(
-                        file_path,
-                        quality_path,
-                        quality,
-                        preserve_metadata=config.get('preserve_original_metadata', True)
-                    )
-                    results['processed_files'].append(quality_path)
-                    results['operations'].append('image_quality_adjustment')
-            
-            # Resolution limiting
-            max_resolution = config.get('max_image_resolution')
-            if max_resolution:
-                resized_path = file_path.with_name(f"{file_path.stem}_resized{file_path.suffix}")
-                processor.resize_image(
-                    file_path,
-                    resized_path,
-                    max_resolution,
-                    preserve_aspect_ratio=True,
-                    preserve_metadata=config.get('preserve_original_metadata', True)
-                )
-                results['processed_files'].append(resized_path)
-                results['operations'].append('image_resize')
-            
-            # Thumbnail generation
-            if config.get('generate_thumbnails', False):
-                thumbnail_size = config.get('thumbnail_size', 256)
-                thumbnail_path = file_path.with_name(f"{file_path.stem}_thumb{file_path.suffix}")
-                processor.generate_thumbnail(
-                    file_path,
-                    thumbnail_path,
-                    thumbnail_size,
-                    preserve_metadata=False  # Thumbnails typically don't need metadata
-                )
-                results['processed_files'].append(thumbnail_path)
-                results['operations'].append('thumbnail_generation')
+            results['processed_files'] = processor.render_outputs(file_path, [step['output'] for step in plan])
+            results['operations'] = [step['operation'] for step in plan]
+            
+        except Exception as e:
+            self.logger.warning(f"Image processing failed: {e}")
+        
+        return results
+    
+    async def _process_image_in_pool(self, file_path: Path, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Apply image processing operations in the worker process pool.
+        
+        Args:
+            file_path: Path to image file
+            config: Processing configuration
             
+        Returns:
+            Dictionary with processing results
+        """
+        results = {'processed_files': [], 'operations': []}
+        plan = self._plan_image_operations(file_path, config)
+        if not plan:
+            return results
+        
+        pool_manager = get_pool_manager()
+        pool_manager.configure_process_pool(
+            max_workers=config.get('processing_workers'),
+            queue_size_limit=config.get('processing_queue_size')
+        )
+        
+        try:
+            outcome = await pool_manager.submit_process(
+                render_image_outputs,
+                config,
+                file_path,
+                [step['output'] for step in plan]
+            )
         except Exception as e:
             self.logger.warning(f"Image processing failed: {e}")
+            return results
         
+        if outcome['error']:
+            self.logger.warning(f"Image processing failed: {outcome['error']}")
+            return results
+        
+        results['processed_files'] = outcome['outputs']
+        results['operations'] = [step['operation'] for step in plan]
         return results
     
-    def _process_video(self, processor, file_path: Path, config: Dict[str, Any]) -> Dict[str, Any]:
+    async def _process_video(self, file_path: Path, config: Dict[str, Any]) -> Dict[str, Any]:
         """
         Apply video processing operations.
         
+        Every output (converted copy, resized copy, thumbnail) is written by
+        a single ffmpeg subprocess run through the shared video job runner.
+        When resizing or thumbnails are requested the video is probed first
+        (cached by file content), so videos already within the resolution
+        limit are not resized and thumbnails of short clips are taken from
+        within the clip.
+        
         Args:
-            processor: VideoProcessor instance
             file_path: Path to video file
             config: Processing configuration
             
@@ -660,65 +754,93 @@ class MediaContentHandler(BaseContentHandler):
             Dictionary with processing results
         """
         results = {'processed_files': [], 'operations': []}
+        plan = []
+        preserve_metadata = config.get('preserve_original_metadata', True)
+        crf = config.get('video_quality_crf', 23)
+        max_resolution = config.get('max_video_resolution')
+        runner = get_video_runner(config)
+        
+        info: Dict[str, Any] = {}
+        if max_resolution or config.get('generate_thumbnails', False):
+            try:
+                info = await runner.probe(file_path)
+            except Exception as e:
+                self.logger.debug(f"Video probe failed, planning without stream info: {e}")
+        
+        # Format conversion
+        if config.get('video_format_conversion', False):
+            target_format = config.get('target_video_format', 'mp4')
+            if target_format != file_path.suffix[1:].lower():
+                plan.append(('video_format_conversion', VideoOutput(
+                    path=file_path.with_suffix(f'.{target_format}'),
+                    format=target_format,
+                    quality_crf=crf,
+                    preserve_metadata=preserve_metadata
+                )))
+        
+        # Quality adjustment
+        elif config.get('video_quality_adjustment', False):
+            if crf != 23:  # Only process if quality is different from default
+                plan.append(('video_quality_adjustment', VideoOutput(
+                    path=file_path.with_name(f"{file_path.stem}_crf{crf}{file_path.suffix}"),
+                    quality_crf=crf,
+                    preserve_metadata=preserve_metadata
+                )))
+        
+        # Resolution limiting
+        if max_resolution and self._exceeds_resolution(info, max_resolution):
+            plan.append(('video_resize', VideoOutput(
+                path=file_path.with_name(f"{file_path.stem}_resized{file_path.suffix}"),
+                max_resolution=max_resolution,
+                preserve_metadata=preserve_metadata
+            )))
+        
+        # Thumbnail extraction
+        if config.get('generate_thumbnails', False):
+            plan.append(('video_thumbnail_extraction', VideoOutput(
+                path=file_path.with_name(f"{file_path.stem}_thumb.jpg"),
+                kind='thumbnail',
+                timestamp=self._thumbnail_timestamp(config.get('thumbnail_timestamp', '00:00:01'),
+                                                    info.get('duration', 0.0)),
+                max_resolution=config.get('thumbnail_size')
+            )))
+        
+        if not plan:
+            return results
         
         try:
-            # Format conversion
-            if config.get('video_format_conversion', False):
-                target_format = config.get('target_video_format', 'mp4')
-                if target_format != file_path.suffix[1:].lower():
-                    converted_path = file_path.with_suffix(f'.{target_format}')
-                    processor.convert_format(
-                        file_path,
-                        converted_path,
-                        target_format,
-                        quality_crf=config.get('video_quality_crf', 23),
-                        preserve_metadata=config.get('preserve_original_metadata', True)
-                    )
-                    results['processed_files'].append(converted_path)
-                    results['operations'].append('video_format_conversion')
-            
-            # Quality adjustment
-            elif config.get('video_quality_adjustment', False):
-                crf = config.get('video_quality_crf', 23)
-                if crf != 23:  # Only process if quality is different from default
-                    quality_path = file_path.with_name(f"{file_path.stem}_crf{crf}{file_path.suffix}")
-                    processor.adjust_quality(
-                        file_path,
-                        quality_path,
-                        crf,
-                        preserve_metadata=config.get('preserve_original_metadata', True)
-                    )
-                    results['processed_files'].append(quality_path)
-                    results['operations'].append('video_quality_adjustment')
-            
-            # Resolution limiting
-            max_resolution = config.get('max_video_resolution')
-            if max_resolution:
-                resized_path = file_path.with_name(f"{file_path.stem}_resized{file_path.suffix}")
-                processor.limit_resolution(
-                    file_path,
-                    resized_path,
-                    max_resolution,
-                    preserve_aspect_ratio=True,
-                    preserve_metadata=config.get('preserve_original_metadata', True)
-                )
-                results['processed_files'].append(resized_path)
-                results['operations'].append('video_resize')
-            
-            # Thumbnail extraction
-            if config.get('generate_thumbnails', False):
-                thumbnail_path = file_path.with_suffix('.jpg')
-                thumbnail_path = thumbnail_path.with_name(f"{file_path.stem}_thumb.jpg")
-                processor.extract_thumbnail(
-                    file_path,
-                    thumbnail_path,
-                    timestamp=config.get('thumbnail_timestamp', '00:00:01'),
-                    thumbnail_size=config.get('thumbnail_size')
-                )
-                results['processed_files'].append(thumbnail_path)
-                results['operations'].append('video_thumbnail_extraction')
+            written = await runner.process(file_path, [output for _, output in plan])
+            results['processed_files'] = written
+            results['operations'] = [operation for operation, output in plan if output.path in written]
             
         except Exception as e:
             self.logger.warning(f"Video processing failed: {e}")
         
-        return results
\ No newline at end of file
+        return results
+    
+    @staticmethod
+    def _exceeds_resolution(info: Dict[str, Any], max_resolution: Any) -> bool:
+        """Check whether probed video dimensions exceed a resolution limit (True if unknown)."""
+        width, height = info.get('width'), info.get('height')
+        if not width or not height:
+            return True
+        try:
+            max_width, max_height = VideoProcessor._parse_resolution(max_resolution)
+        except Exception:
+            return True
+        return width > max_width or height > max_height
+    
+    @staticmethod
+    def _thumbnail_timestamp(timestamp: str, duration: float) -> str:
+        """Move a thumbnail timestamp past the end of a clip to its midpoint."""
+        if not duration:
+            return timestamp
+        try:
+            seconds = 0.0
+            for part in str(timestamp).split(':'):
+                seconds = seconds * 60 + float(part)
+        except ValueError:
+            return timestamp
+        if seconds < duration:
+            return timestamp
+        return f"{duration / 2:.3f}"
\ No newline at end of file
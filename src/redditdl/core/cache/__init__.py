@@ -5,11 +5,20 @@ Provides intelligent caching capabilities for RedditDL including:
 - Multi-level caching (memory, disk)
 - TTL-based expiration
 - LRU eviction policies
+- Size-bounded disk cache with compact serialization
+- HTTP response caching for Reddit listing pages
 - Cache warming and preloading
 """
 
-from .manager import CacheManager
+from .manager import CacheManager, CacheConfig
+from .disk import DiskCache
+from .http import CachingHTTPAdapter, get_http_cache, install_http_cache
 
 __all__ = [
-    'CacheManager'
+    'CacheManager',
+    'CacheConfig',
+    'DiskCache',
+    'CachingHTTPAdapter',
+    'get_http_cache',
+    'install_http_cache'
 ]
\ No newline at end of file
@@ -0,0 +1,626 @@
+"""
+Disk Cache
+
+Size-bounded on-disk tier for CacheManager. Entries are evicted with a
+segmented LRU accounted in bytes: new entries start in a probationary
+segment and move to a protected segment on their first hit, so a burst of
+one-off writes cannot flush the entries that are actually reused.
+
+Plain data (dicts, lists, strings, numbers) is stored as JSON and only
+other objects are pickled. Payloads above a small threshold are
+compressed with zstd when installed, zlib otherwise. An append-only index
+file records every write and delete so the cache starts without reading
+or even listing its entry files; after an unclean shutdown the index is
+reconciled with the files on disk instead.
+
+One process at a time writes a cache directory, holding a lock file for
+as long as the cache is open. Others get a private subdirectory, which
+the next process to take the lock deletes once its owner has exited. A
+second concurrent process therefore starts empty and gets no hits from
+the shared entries; what it caches is discarded after it exits.
+"""
+
+import json
+import logging
+import os
+import pickle
+import shutil
+import struct
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, TextIO
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: no advisory locks, every process writes the shared directory
+    fcntl = None
+
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "index.jsonl"
+LOCK_FILENAME = "writer.lock"
+ENTRY_SUFFIX = ".cache"
+
+# Private directories of processes that found the cache locked
+PRIVATE_DIR_PREFIX = "proc-"
+
+# Last index record written by close(); without it the index may be stale
+_CLEAN_RECORD = '{"c":1}\n'
+
+# Payloads smaller than this are stored uncompressed
+COMPRESSION_THRESHOLD = 1024
+
+# Share of the byte budget reserved for entries that have been hit
+PROTECTED_FRACTION = 0.8
+
+# The index is rewritten once it holds this many more lines than entries
+COMPACT_MIN_LINES = 1000
+
+SERIALIZER_JSON = 1
+SERIALIZER_PICKLE = 2
+
+CODEC_NONE = 0
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+
+PROBATION = "p"
+PROTECTED = "s"
+
+# Entry file header: magic, serializer, codec, expiry timestamp (0 for none)
+_MAGIC = b"RDC1"
+_HEADER = struct.Struct("<4sBBd")
+
+_PLAIN_SCALARS = (str, int, float, bool, type(None))
+_MISSING = object()
+
+
+def is_plain_data(value: Any, _depth: int = 0) -> bool:
+    """
+    Check whether a value survives a JSON round trip unchanged.
+
+    Only exact dicts with string keys, lists and JSON scalars qualify;
+    tuples, subclasses such as enums and deeply nested values do not.
+    """
+    value_type = type(value)
+    if value_type in _PLAIN_SCALARS:
+        return True
+    if _depth > 64:
+        return False
+    if value_type is list:
+        return all(is_plain_data(item, _depth + 1) for item in value)
+    if value_type is dict:
+        return all(type(key) is str and is_plain_data(item, _depth + 1) for key, item in value.items())
+    return False
+
+
+def _try_lock(handle) -> bool:
+    """Take an exclusive non-blocking lock on an open file."""
+    if fcntl is None:
+        return True
+    try:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _compress(codec: int, payload: bytes) -> bytes:
+    if codec == CODEC_ZSTD:
+        return zstandard.ZstdCompressor(level=3).compress(payload)
+    return zlib.compress(payload, 6)
+
+
+def _decompress(codec: int, payload: bytes) -> bytes:
+    if codec == CODEC_NONE:
+        return payload
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(payload)
+    if codec == CODEC_ZSTD:
+        if not ZSTD_AVAILABLE:
+            raise ValueError("Entry is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(payload)
+    raise ValueError(f"Unknown cache codec {codec}")
+
+
+@dataclass
+class DiskEntry:
+    """Index record for one entry file."""
+    size: int
+    expires_at: Optional[float] = None
+    
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        return self.expires_at is not None and (now or time.time()) > self.expires_at
+
+
+class DiskCache:
+    """
+    Byte-bounded segmented LRU store of entry files.
+
+    Keys must be usable as file names (CacheManager passes SHA-256 hex
+    digests). Entry files live in two-character subdirectories, created
+    the first time a write into them fails.
+
+    Thread-safe. The first process to open a directory locks it until
+    close(); a process that finds it locked caches into its own
+    ``proc-<pid>`` subdirectory instead, so no two processes ever evict
+    from the same set of files. The private directory starts empty and
+    does not read the shared one.
+    """
+    
+    def __init__(self, directory: Path, max_bytes: int, compression: bool = True,
+                 protected_fraction: float = PROTECTED_FRACTION):
+        """
+        Initialize disk cache.
+
+        Args:
+            directory: Directory holding the index and entry files
+            max_bytes: Total size of entry files to keep
+            compression: Compress payloads (zstd if installed, else zlib)
+            protected_fraction: Share of max_bytes for entries hit at least once
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        
+        self.directory = Path(directory)
+        self.max_bytes = int(max_bytes)
+        self.protected_max_bytes = int(self.max_bytes * protected_fraction)
+        if compression:
+            self.codec = CODEC_ZSTD if ZSTD_AVAILABLE else CODEC_ZLIB
+        else:
+            self.codec = CODEC_NONE
+        
+        self.evictions = 0
+        self._probation: "OrderedDict[str, DiskEntry]" = OrderedDict()
+        self._protected: "OrderedDict[str, DiskEntry]" = OrderedDict()
+        self._size = 0
+        self._protected_size = 0
+        self._index_lines = 0
+        self._index_file: Optional[TextIO] = None
+        self._lock_file: Optional[TextIO] = None
+        self._lock = threading.RLock()
+        
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.directory = self._acquire_directory(self.directory)
+        self._load()
+    
+    @property
+    def index_path(self) -> Path:
+        return self.directory / INDEX_FILENAME
+    
+    @property
+    def size_bytes(self) -> int:
+        """Total size of indexed entry files."""
+        return self._size
+    
+    def __len__(self) -> int:
+        return len(self._probation) + len(self._protected)
+    
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            entry, _ = self._lookup(key)
+            return entry is not None and not entry.is_expired()
+    
+    def path_for(self, key: str) -> Path:
+        """Entry file path for a key (the directory may not exist yet)."""
+        return self.directory / key[:2] / f"{key}{ENTRY_SUFFIX}"
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Read an entry, promoting it to the protected segment.
+
+        Args:
+            key: Entry key
+            default: Returned for missing, expired or unreadable entries
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry, segment = self._lookup(key)
+            if entry is None:
+                return default
+            if entry.is_expired():
+                self._discard(key)
+                return default
+            
+            try:
+                blob = self.path_for(key).read_bytes()
+                value = self._decode(blob)
+            except FileNotFoundError:
+                self._forget(key)
+                return default
+            except Exception as e:
+                logger.warning(f"Discarding unreadable cache entry {key}: {e}")
+                self._discard(key)
+                return default
+            
+            if segment == PROBATION:
+                del self._probation[key]
+                self._protected[key] = entry
+                self._protected_size += entry.size
+                self._append_index(key, entry, PROTECTED)
+                self._demote_protected()
+            else:
+                self._protected.move_to_end(key)
+            
+            return value
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        """
+        Write an entry, evicting least recently used entries to fit.
+
+        Args:
+            key: Entry key
+            value: Value to store
+            ttl: Time-to-live in seconds (None for no expiry)
+
+        Returns:
+            False if the encoded value is larger than the whole cache
+        """
+        expires_at = time.time() + ttl if ttl else None
+        blob = self._encode(value, expires_at)
+        
+        with self._lock:
+            if len(blob) > self.max_bytes:
+                logger.debug(f"Not caching {key} on disk: {len(blob)} bytes exceeds the cache size")
+                self._discard(key)
+                return False
+            
+            self._write_file(key, blob)
+            previous, segment = self._remove(key)
+            entry = DiskEntry(size=len(blob), expires_at=expires_at)
+            self._insert(key, entry, segment if previous else PROBATION)
+            self._append_index(key, entry, segment if previous else PROBATION)
+            self._demote_protected()
+            self._evict()
+            return True
+    
+    def delete(self, key: str) -> bool:
+        """
+        Delete an entry.
+
+        Returns:
+            True if the entry existed
+        """
+        with self._lock:
+            entry, _ = self._lookup(key)
+            removed_file = self._unlink(key)
+            if entry is not None:
+                self._forget(key)
+            return entry is not None or removed_file
+    
+    def clear(self) -> None:
+        """Delete every entry and the index."""
+        with self._lock:
+            self._close_index()
+            self.directory.mkdir(parents=True, exist_ok=True)
+            for path in self.directory.iterdir():
+                # Keep the writer lock and other processes' private directories
+                if path.name == LOCK_FILENAME or path.name.startswith(PRIVATE_DIR_PREFIX):
+                    continue
+                if path.is_dir():
+                    shutil.rmtree(path, ignore_errors=True)
+                else:
+                    path.unlink(missing_ok=True)
+            self._probation.clear()
+            self._protected.clear()
+            self._size = 0
+            self._protected_size = 0
+            self._index_lines = 0
+    
+    def cleanup_expired(self) -> int:
+        """
+        Delete expired entries.
+
+        Returns:
+            Number of entries deleted
+        """
+        with self._lock:
+            now = time.time()
+            expired = [
+                key for segment in (self._probation, self._protected)
+                for key, entry in segment.items() if entry.is_expired(now)
+            ]
+            for key in expired:
+                self._discard(key)
+            return len(expired)
+    
+    def compact(self) -> None:
+        """Rewrite the index with one line per entry in LRU order."""
+        with self._lock:
+            self._close_index()
+            temp_path = self.index_path.with_name(f"{INDEX_FILENAME}.{os.getpid()}.tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                for segment_name, segment in ((PROBATION, self._probation), (PROTECTED, self._protected)):
+                    for key, entry in segment.items():
+                        f.write(self._index_record(key, entry, segment_name))
+            os.replace(temp_path, self.index_path)
+            self._index_lines = len(self)
+    
+    def close(self) -> None:
+        """Persist recency order, close the index and release the directory lock."""
+        with self._lock:
+            if self._index_lines > len(self):
+                self.compact()
+            self._close_index()
+            try:
+                with open(self.index_path, "a", encoding="utf-8") as f:
+                    f.write(_CLEAN_RECORD)
+            except OSError as e:
+                logger.warning(f"Failed to update disk cache index: {e}")
+            if self._lock_file is not None:
+                self._lock_file.close()
+                self._lock_file = None
+    
+    def info(self) -> Dict[str, Any]:
+        """Size, occupancy and eviction counts."""
+        with self._lock:
+            return {
+                "file_count": len(self),
+                "total_size_mb": self._size / 1024 / 1024,
+                "max_size_mb": self.max_bytes / 1024 / 1024,
+                "protected_count": len(self._protected),
+                "protected_size_mb": self._protected_size / 1024 / 1024,
+                "utilization": self._size / self.max_bytes,
+                "evictions": self.evictions,
+                "compression": {CODEC_NONE: None, CODEC_ZLIB: "zlib", CODEC_ZSTD: "zstd"}[self.codec],
+            }
+    
+    # Index bookkeeping
+    
+    def _lookup(self, key: str) -> Tuple[Optional[DiskEntry], Optional[str]]:
+        entry = self._probation.get(key)
+        if entry is not None:
+            return entry, PROBATION
+        entry = self._protected.get(key)
+        if entry is not None:
+            return entry, PROTECTED
+        return None, None
+    
+    def _insert(self, key: str, entry: DiskEntry, segment: str) -> None:
+        if segment == PROTECTED:
+            self._protected[key] = entry
+            self._protected_size += entry.size
+        else:
+            self._probation[key] = entry
+        self._size += entry.size
+    
+    def _remove(self, key: str) -> Tuple[Optional[DiskEntry], Optional[str]]:
+        entry = self._probation.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+            return entry, PROBATION
+        entry = self._protected.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+            self._protected_size -= entry.size
+            return entry, PROTECTED
+        return None, None
+    
+    def _forget(self, key: str) -> None:
+        """Drop a key from the index without touching its file."""
+        entry, _ = self._remove(key)
+        if entry is not None:
+            self._append_record({"k": key, "d": 1})
+    
+    def _discard(self, key: str) -> None:
+        """Drop a key from the index and delete its file."""
+        self._forget(key)
+        self._unlink(key)
+    
+    def _demote_protected(self) -> None:
+        while self._protected_size > self.protected_max_bytes and self._protected:
+            key, entry = self._protected.popitem(last=False)
+            self._protected_size -= entry.size
+            self._probation[key] = entry
+    
+    def _evict(self) -> None:
+        while self._size > self.max_bytes:
+            segment = self._probation if self._probation else self._protected
+            key = next(iter(segment))
+            self._discard(key)
+            self.evictions += 1
+    
+    # Index file
+    
+    @staticmethod
+    def _index_record(key: str, entry: DiskEntry, segment: str) -> str:
+        record = {"k": key, "s": entry.size, "g": segment}
+        if entry.expires_at is not None:
+            record["e"] = entry.expires_at
+        return json.dumps(record, separators=(",", ":")) + "\n"
+    
+    def _append_index(self, key: str, entry: DiskEntry, segment: str) -> None:
+        self._write_index_line(self._index_record(key, entry, segment))
+    
+    def _append_record(self, record: Dict[str, Any]) -> None:
+        self._write_index_line(json.dumps(record, separators=(",", ":")) + "\n")
+    
+    def _write_index_line(self, line: str) -> None:
+        try:
+            if self._index_file is None:
+                self._index_file = open(self.index_path, "a", encoding="utf-8")
+            self._index_file.write(line)
+            self._index_file.flush()
+            self._index_lines += 1
+        except OSError as e:
+            logger.warning(f"Failed to update disk cache index: {e}")
+            return
+        
+        if self._index_lines > max(COMPACT_MIN_LINES, 2 * len(self)):
+            self.compact()
+    
+    def _close_index(self) -> None:
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
+    
+    # Directory ownership
+    
+    def _acquire_directory(self, root: Path) -> Path:
+        """Lock the shared directory, or fall back to a private one if it is taken."""
+        handle = open(root / LOCK_FILENAME, "a+")
+        if _try_lock(handle):
+            self._lock_file = handle
+            self._reclaim_private_directories(root)
+            return root
+        handle.close()
+        
+        private = root / f"{PRIVATE_DIR_PREFIX}{os.getpid()}"
+        # Left over from an earlier process that had the same pid
+        shutil.rmtree(private, ignore_errors=True)
+        private.mkdir()
+        handle = open(private / LOCK_FILENAME, "a+")
+        _try_lock(handle)
+        self._lock_file = handle
+        logger.info(f"Disk cache {root} is in use by another process; caching in {private}")
+        return private
+    
+    @staticmethod
+    def _reclaim_private_directories(root: Path) -> None:
+        """Delete private directories whose owning process has exited."""
+        for path in root.glob(f"{PRIVATE_DIR_PREFIX}*"):
+            try:
+                with open(path / LOCK_FILENAME, "a+") as handle:
+                    if not _try_lock(handle):
+                        continue
+                shutil.rmtree(path, ignore_errors=True)
+            except OSError:
+                continue
+    
+    def _load(self) -> None:
+        if self.index_path.exists():
+            if not self._replay_index():
+                # The last writer did not close cleanly: files it wrote
+                # after its final index line would never be evicted
+                self._rebuild_index()
+        else:
+            self._rebuild_index()
+        
+        self._demote_protected()
+        self._evict()
+    
+    def _replay_index(self) -> bool:
+        """Load the index; True if it ends with a clean close."""
+        clean = False
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                self._index_lines += 1
+                clean = False
+                try:
+                    record = json.loads(line)
+                    if record.get("c"):
+                        clean = True
+                        continue
+                    key = record["k"]
+                    self._remove(key)
+                    if not record.get("d"):
+                        self._insert(key, DiskEntry(size=int(record["s"]), expires_at=record.get("e")),
+                                     record.get("g", PROBATION))
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    # A torn final line from an interrupted write
+                    continue
+        return clean
+    
+    def _rebuild_index(self) -> None:
+        """
+        Reconcile the index with the entry files on disk.
+
+        Files the index does not know are indexed as the least recently
+        used entries, entries whose file is gone are dropped, and files in
+        an unknown format or abandoned temporary files are deleted.
+        """
+        found = []
+        present = set()
+        for path in self.directory.glob("*/*.tmp"):
+            path.unlink(missing_ok=True)
+        for path in self.directory.glob(f"*/*{ENTRY_SUFFIX}"):
+            present.add(path.stem)
+            if self._lookup(path.stem)[0] is not None:
+                continue
+            try:
+                with open(path, "rb") as f:
+                    magic, _, _, expires_at = _HEADER.unpack(f.read(_HEADER.size))
+                if magic != _MAGIC:
+                    raise ValueError("unknown entry format")
+                stat = path.stat()
+                found.append((stat.st_mtime, path.stem, DiskEntry(size=stat.st_size, expires_at=expires_at or None)))
+            except (OSError, ValueError, struct.error):
+                path.unlink(missing_ok=True)
+        
+        missing = [key for segment in (self._probation, self._protected) for key in segment if key not in present]
+        for key in missing:
+            self._remove(key)
+        
+        # Newest first, each moved to the front: unknown files are evicted first, oldest first
+        for _, key, entry in sorted(found, key=lambda item: item[0], reverse=True):
+            self._insert(key, entry, PROBATION)
+            self._probation.move_to_end(key, last=False)
+        self.compact()
+        if found or missing:
+            logger.info(f"Reconciled disk cache index: {len(found)} entry files added, "
+                        f"{len(missing)} missing entries dropped")
+    
+    # Entry files
+    
+    def _encode(self, value: Any, expires_at: Optional[float]) -> bytes:
+        if is_plain_data(value):
+            serializer = SERIALIZER_JSON
+            payload = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        else:
+            serializer = SERIALIZER_PICKLE
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        
+        codec = CODEC_NONE
+        if self.codec != CODEC_NONE and len(payload) >= COMPRESSION_THRESHOLD:
+            compressed = _compress(self.codec, payload)
+            if len(compressed) < len(payload):
+                payload, codec = compressed, self.codec
+        
+        return _HEADER.pack(_MAGIC, serializer, codec, expires_at or 0.0) + payload
+    
+    @staticmethod
+    def _decode(blob: bytes) -> Any:
+        magic, serializer, codec, _ = _HEADER.unpack_from(blob)
+        if magic != _MAGIC:
+            raise ValueError("unknown entry format")
+        
+        payload = _decompress(codec, blob[_HEADER.size:])
+        if serializer == SERIALIZER_JSON:
+            return json.loads(payload)
+        if serializer == SERIALIZER_PICKLE:
+            return pickle.loads(payload)
+        raise ValueError(f"Unknown cache serializer {serializer}")
+    
+    def _write_file(self, key: str, blob: bytes) -> None:
+        path = self.path_for(key)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            temp_path.write_bytes(blob)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(blob)
+        os.replace(temp_path, path)
+    
+    def _unlink(self, key: str) -> bool:
+        try:
+            self.path_for(key).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning(f"Failed to delete cache entry {key}: {e}")
+            return False
@@ -0,0 +1,340 @@
+"""
+HTTP Response Cache
+
+Persistent cache for Reddit listing pages fetched by the PRAW and YARS
+scrapers. A transport adapter mounted on the scraper's requests session
+stores GET responses for listing URLs in a CacheManager with a TTL chosen
+by listing type: a minute for /new and /rising, up to a week for
+/top?t=all. Expired entries that carried an ETag or Last-Modified header
+are revalidated with a conditional request instead of being refetched.
+
+Cache keys are built from the URL and the logged-in account, so listings
+that differ per account (saved, upvoted) are never served to another
+account using the same cache directory. The adapter keeps the retry and
+connection pool settings of the adapter it replaces.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from redditdl.core.cache.manager import CacheConfig, CacheManager
+from redditdl.core.monitoring.metrics import get_metrics_collector
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds a listing page is served from cache without contacting Reddit
+LISTING_TTLS: Dict[str, float] = {
+    "new": 60.0,
+    "rising": 60.0,
+    "hot": 300.0,
+    "best": 300.0,
+    "comments": 300.0,
+    "overview": 300.0,
+    "submitted": 300.0,
+    "saved": 300.0,
+    "upvoted": 300.0,
+    "top": 900.0,
+    "controversial": 900.0,
+    "about": 3600.0,
+}
+
+# TTLs for top/controversial listings by their t= period
+PERIOD_TTLS: Dict[str, float] = {
+    "hour": 300.0,
+    "day": 900.0,
+    "week": 3600.0,
+    "month": 6 * 3600.0,
+    "year": 86400.0,
+    "all": 7 * 86400.0,
+}
+
+# How long an expired entry with validators is kept for revalidation
+REVALIDATE_WINDOW = 7 * 86400.0
+
+# Response header marking cached responses (HIT or REVALIDATED)
+CACHE_STATUS_HEADER = "X-RedditDL-Cache"
+
+# Headers kept with cached bodies; rate-limit headers describe the original request only
+_STORED_HEADERS = ("content-type", "etag", "last-modified", "cache-control", "date")
+
+_SUBREDDIT_LISTINGS = {"hot", "new", "rising", "top", "controversial", "best", "comments", "about"}
+_USER_LISTINGS = {"overview", "submitted", "comments", "saved", "upvoted", "about"}
+_PERIOD_LISTINGS = {"top", "controversial"}
+
+
+def listing_type(url: str) -> Optional[str]:
+    """
+    Classify a Reddit URL by listing type.
+
+    Recognizes subreddit listings (/r/{name}, /r/{name}/{sort}) and user
+    listings (/user/{name}, /user/{name}/{where}) with or without a
+    .json suffix.
+
+    Args:
+        url: Request URL
+
+    Returns:
+        Listing type such as "new" or "top", or None for other URLs
+    """
+    parts = [part for part in urlsplit(url).path.split("/") if part]
+    if parts and parts[-1].endswith(".json"):
+        parts[-1] = parts[-1][:-len(".json")]
+        if not parts[-1]:
+            parts.pop()
+    
+    if len(parts) < 2 or len(parts) > 3:
+        return None
+    if parts[0] == "r":
+        if len(parts) == 2:
+            return "hot"
+        return parts[2] if parts[2] in _SUBREDDIT_LISTINGS else None
+    if parts[0] in ("user", "u"):
+        if len(parts) == 2:
+            return "overview"
+        return parts[2] if parts[2] in _USER_LISTINGS else None
+    return None
+
+
+def cache_key(url: str, identity: Optional[str] = None) -> str:
+    """
+    Build a cache key from a URL with its query parameters sorted.
+
+    Args:
+        url: Request URL
+        identity: Account the request is authenticated as, if any
+
+    Returns:
+        Cache key, distinct per account for authenticated requests
+    """
+    scheme, netloc, path, query, _ = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+    prefix = f"http:{identity.lower()}:" if identity else "http:"
+    return prefix + urlunsplit((scheme.lower(), netloc.lower(), path.rstrip("/"), query, ""))
+
+
+@dataclass
+class HTTPCacheStats:
+    """HTTP cache statistics."""
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    stores: int = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cacheable requests answered without a full download."""
+        total = self.hits + self.revalidated + self.misses
+        return (self.hits + self.revalidated) / total if total > 0 else 0.0
+
+
+class CachingHTTPAdapter(HTTPAdapter):
+    """
+    Transport adapter that serves Reddit listing pages from a CacheManager.
+
+    Only GET requests for recognized listing URLs are cached; everything
+    else, including OAuth token requests and media downloads, passes
+    straight through.
+    """
+    
+    def __init__(self, cache: CacheManager, ttls: Optional[Dict[str, float]] = None,
+                 period_ttls: Optional[Dict[str, float]] = None, identity: Optional[str] = None,
+                 **kwargs):
+        """
+        Initialize the adapter.
+
+        Args:
+            cache: Cache manager holding responses
+            ttls: Overrides for LISTING_TTLS; a TTL of 0 disables caching
+            period_ttls: Overrides for PERIOD_TTLS
+            identity: Account the session is logged in as, kept in cache keys
+            **kwargs: Passed to HTTPAdapter
+        """
+        super().__init__(**kwargs)
+        self.cache = cache
+        self.identity = identity
+        self.ttls = {**LISTING_TTLS, **(ttls or {})}
+        self.period_ttls = {**PERIOD_TTLS, **(period_ttls or {})}
+        self.stats = HTTPCacheStats()
+        self._lock = threading.Lock()
+        
+        self._metrics = get_metrics_collector()
+        self._metrics.counter("http_cache.hits", "Listing requests served from the HTTP cache")
+        self._metrics.counter("http_cache.misses", "Listing requests downloaded in full")
+        self._metrics.counter("http_cache.revalidated", "Expired listings confirmed unchanged with a 304")
+        self._metrics.gauge("http_cache.hit_rate", "Fraction of listing requests answered from the HTTP cache")
+    
+    def ttl_for(self, url: str) -> float:
+        """
+        Get the cache TTL for a URL.
+
+        Returns:
+            Seconds the response stays fresh, or 0 if it is not cacheable
+        """
+        kind = listing_type(url)
+        if kind is None:
+            return 0.0
+        if kind in _PERIOD_LISTINGS:
+            # Reddit defaults top and controversial listings to the past day
+            period = dict(parse_qsl(urlsplit(url).query)).get("t", "day")
+            return self.period_ttls.get(period, self.ttls.get(kind, 0.0))
+        return self.ttls.get(kind, 0.0)
+    
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """Send a request, answering cacheable listing requests from the cache."""
+        ttl = self.ttl_for(request.url) if request.method == "GET" else 0.0
+        if ttl <= 0:
+            return super().send(request, **kwargs)
+        
+        key = cache_key(request.url, self.identity)
+        entry = self.cache.get(key)
+        now = time.time()
+        
+        if entry is not None and now < entry["stored_at"] + ttl:
+            self._record("hits")
+            return self._cached_response(request, entry, "HIT")
+        
+        if entry is not None:
+            headers = entry["headers"]
+            if "etag" in headers:
+                request.headers["If-None-Match"] = headers["etag"]
+            if "last-modified" in headers:
+                request.headers["If-Modified-Since"] = headers["last-modified"]
+        
+        response = super().send(request, **kwargs)
+        
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            entry["stored_at"] = now
+            self._store(key, entry, ttl)
+            self._record("revalidated")
+            return self._cached_response(request, entry, "REVALIDATED")
+        
+        self._record("misses")
+        if response.status_code == 200:
+            entry = self._make_entry(response, now)
+            if entry is not None:
+                self._store(key, entry, ttl)
+        return response
+    
+    def _make_entry(self, response: requests.Response, now: float) -> Optional[Dict[str, Any]]:
+        """Build a cache entry from a response, or None if it must not be stored."""
+        headers = {name: response.headers[name] for name in _STORED_HEADERS if name in response.headers}
+        if "no-store" in headers.get("cache-control", ""):
+            return None
+        if "json" not in headers.get("content-type", ""):
+            return None
+        
+        try:
+            body = response.content.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+        
+        return {
+            "url": response.url,
+            "status": response.status_code,
+            "headers": headers,
+            "body": body,
+            "stored_at": now,
+        }
+    
+    def _store(self, key: str, entry: Dict[str, Any], ttl: float) -> None:
+        """Store an entry, keeping it past its TTL if it can be revalidated."""
+        if "etag" in entry["headers"] or "last-modified" in entry["headers"]:
+            ttl += REVALIDATE_WINDOW
+        self.cache.set(key, entry, ttl=ttl)
+        with self._lock:
+            self.stats.stores += 1
+    
+    def _cached_response(self, request: requests.PreparedRequest, entry: Dict[str, Any],
+                         status: str) -> requests.Response:
+        """Build a response from a cache entry."""
+        body = entry["body"].encode("utf-8")
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.headers["Content-Length"] = str(len(body))
+        response.headers[CACHE_STATUS_HEADER] = status
+        response._content = body
+        response._content_consumed = True
+        response.encoding = "utf-8"
+        response.url = entry["url"]
+        response.request = request
+        response.connection = self
+        return response
+    
+    def _record(self, outcome: str) -> None:
+        """Count a lookup outcome and publish it to metrics."""
+        with self._lock:
+            setattr(self.stats, outcome, getattr(self.stats, outcome) + 1)
+            hit_rate = self.stats.hit_rate
+        self._metrics.increment(f"http_cache.{outcome}")
+        self._metrics.set_gauge("http_cache.hit_rate", hit_rate)
+
+
+# One cache manager per directory: a DiskCache directory has a single writer
+_http_caches: Dict[Path, CacheManager] = {}
+_http_caches_lock = threading.Lock()
+
+
+def get_http_cache(cache_dir: Path, size_mb: float = 200) -> CacheManager:
+    """
+    Get the shared HTTP response cache for a directory.
+
+    Args:
+        cache_dir: Directory holding cached responses
+        size_mb: Disk size limit, applied when the cache is first opened
+
+    Returns:
+        Cache manager for the directory
+    """
+    cache_dir = Path(cache_dir).resolve()
+    with _http_caches_lock:
+        cache = _http_caches.get(cache_dir)
+        if cache is None:
+            cache = CacheManager(CacheConfig(
+                memory_cache_size=256,
+                disk_cache_size_mb=size_mb,
+                cache_dir=cache_dir,
+            ))
+            _http_caches[cache_dir] = cache
+        return cache
+
+
+def install_http_cache(session: requests.Session, cache: CacheManager, **adapter_kwargs) -> CachingHTTPAdapter:
+    """
+    Mount a caching adapter on a requests session.
+
+    Retry and connection pool settings not given in adapter_kwargs are
+    copied from the session's current https:// adapter, so the session
+    keeps retrying failed requests as it did before.
+
+    Args:
+        session: Session used by a scraper
+        cache: Cache manager holding responses
+        **adapter_kwargs: Passed to CachingHTTPAdapter
+
+    Returns:
+        The mounted adapter, whose stats track the session's cache use
+    """
+    current = session.get_adapter("https://")
+    if isinstance(current, HTTPAdapter):
+        adapter_kwargs.setdefault("max_retries", current.max_retries)
+        adapter_kwargs.setdefault("pool_connections", current._pool_connections)
+        adapter_kwargs.setdefault("pool_maxsize", current._pool_maxsize)
+        adapter_kwargs.setdefault("pool_block", current._pool_block)
+    
+    adapter = CachingHTTPAdapter(cache, **adapter_kwargs)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return adapter
@@ -7,23 +7,48 @@ and performance optimization for frequently accessed data.
 
 import asyncio
 import hashlib
-import json
+import inspect
 import logging
-import pickle
 import time
+import weakref
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Callable, TypeVar
+from typing import Any, Dict, List, Optional, Union, Callable, TypeVar, Tuple, Type, Awaitable, Set
 from dataclasses import dataclass, field
 import threading
 import tempfile
 from cachetools import TTLCache, LRUCache
 
+from redditdl.core.cache.disk import DiskCache
 from redditdl.core.monitoring.metrics import get_metrics_collector, time_operation
 
 
 T = TypeVar('T')
 logger = logging.getLogger(__name__)
 
+# Marks values stored by get_or_compute, which carry their freshness window
+_COMPUTED_MARKER = "__redditdl_computed__"
+
+# get_or_compute lookup states
+_FRESH = "fresh"
+_STALE = "stale"
+_NEGATIVE = "negative"
+_MISS = "miss"
+
+
+def is_not_found_error(error: BaseException) -> bool:
+    """
+    Check whether an error means the requested resource does not exist.
+    
+    Recognizes HTTP 404 responses from requests, prawcore and aiohttp style
+    exceptions by their status code.
+    """
+    response = getattr(error, 'response', None)
+    for status in (getattr(error, 'status_code', None), getattr(error, 'status', None),
+                   getattr(response, 'status_code', None), getattr(response, 'status', None)):
+        if status == 404:
+            return True
+    return False
+
 
 @dataclass
 class CacheConfig:
@@ -35,6 +60,7 @@ class CacheConfig:
     cache_dir: Optional[Path] = None
     compression_enabled: bool = True
     metrics_enabled: bool = True
+    negative_ttl: float = 300.0  # How long get_or_compute remembers a 404
 
 
 @dataclass
@@ -46,6 +72,9 @@ class CacheStats:
     disk_reads: int = 0
     disk_writes: int = 0
     total_size_mb: float = 0.0
+    coalesced: int = 0
+    stale_hits: int = 0
+    negative_hits: int = 0
     
     @property
     def hit_rate(self) -> float:
@@ -91,17 +120,38 @@ class CacheEntry:
         return self.data
 
 
+class _NegativeResult:
+    """Memory-only record of a not-found error cached by get_or_compute."""
+    
+    __slots__ = ('error',)
+    
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class _Flight:
+    """One in-progress synchronous computation that other callers wait on."""
+    
+    __slots__ = ('event', 'value', 'error')
+    
+    def __init__(self):
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
 class CacheManager:
     """
     Multi-level cache manager with intelligent eviction and performance optimization.
     
     Features:
     - Memory cache with LRU eviction
-    - Persistent disk cache
+    - Persistent disk cache bounded by disk_cache_size_mb (see DiskCache)
     - TTL-based expiration
     - Automatic cache warming
     - Performance metrics
     - Thread-safe operations
+    - Single-flight computation with stale-while-revalidate (get_or_compute)
     """
     
     def __init__(self, config: Optional[CacheConfig] = None):
@@ -125,6 +175,8 @@ class CacheManager:
         
         # Disk cache setup
         self._disk_cache_dir: Optional[Path] = None
+        self._disk_cache: Optional[DiskCache] = None
+        self._disk_cache_finalizer: Optional[weakref.finalize] = None
         if self.config.enable_disk_cache:
             self._setup_disk_cache()
         
@@ -136,6 +188,11 @@ class CacheManager:
         # Cache warming task
         self._warm_task: Optional[asyncio.Task] = None
         self._warming_enabled = False
+        
+        # In-progress get_or_compute calls by cache key (async ones per event loop)
+        self._flights: Dict[str, _Flight] = {}
+        self._async_flights: Dict[Tuple[int, str], asyncio.Future] = {}
+        self._refresh_tasks: Set[asyncio.Task] = set()
     
     def _setup_disk_cache(self) -> None:
         """Setup disk cache directory."""
@@ -144,8 +201,17 @@ class CacheManager:
         else:
             self._disk_cache_dir = Path(tempfile.gettempdir()) / "redditdl_cache"
         
-        self._disk_cache_dir.mkdir(parents=True, exist_ok=True)
+        self._disk_cache = DiskCache(
+            self._disk_cache_dir,
+            max_bytes=int(self.config.disk_cache_size_mb * 1024 * 1024),
+            compression=self.config.compression_enabled
+        )
+        self.stats.total_size_mb = self._disk_cache.size_bytes / 1024 / 1024
         logger.info(f"Disk cache directory: {self._disk_cache_dir}")
+        
+        # Close at interpreter exit too, so the next start replays the index
+        # instead of listing every entry file
+        self._disk_cache_finalizer = weakref.finalize(self, self._disk_cache.close)
     
     def _setup_metrics(self) -> None:
         """Setup cache metrics."""
@@ -163,15 +229,10 @@ class CacheManager:
     
     def _get_disk_path(self, cache_key: str) -> Path:
         """Get disk cache file path."""
-        if not self._disk_cache_dir:
+        if self._disk_cache is None:
             raise ValueError("Disk cache not enabled")
         
-        # Organize files in subdirectories based on first 2 chars of hash
-        subdir = cache_key[:2]
-        cache_subdir = self._disk_cache_dir / subdir
-        cache_subdir.mkdir(exist_ok=True)
-        
-        return cache_subdir / f"{cache_key}.cache"
+        return self._disk_cache.path_for(cache_key)
     
     def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
         """
@@ -268,11 +329,9 @@ class CacheManager:
                 found = True
             
             # Remove from disk cache
-            if self.config.enable_disk_cache:
-                disk_path = self._get_disk_path(cache_key)
-                if disk_path.exists():
-                    disk_path.unlink()
-                    found = True
+            if self._disk_cache is not None and self._disk_cache.delete(cache_key):
+                found = True
+                self.stats.total_size_mb = self._disk_cache.size_bytes / 1024 / 1024
             
             return found
     
@@ -283,11 +342,8 @@ class CacheManager:
             self._memory_cache.clear()
             
             # Clear disk cache
-            if self.config.enable_disk_cache and self._disk_cache_dir:
-                import shutil
-                if self._disk_cache_dir.exists():
-                    shutil.rmtree(self._disk_cache_dir)
-                    self._disk_cache_dir.mkdir(parents=True, exist_ok=True)
+            if self._disk_cache is not None:
+                self._disk_cache.clear()
             
             # Reset stats
             self.stats = CacheStats()
@@ -296,25 +352,16 @@ class CacheManager:
     
     def _get_from_disk(self, cache_key: str) -> Optional[Any]:
         """Get value from disk cache."""
-        if not self._disk_cache_dir:
+        # The index answers misses without touching the filesystem
+        if self._disk_cache is None or cache_key not in self._disk_cache:
             return None
         
         try:
-            disk_path = self._get_disk_path(cache_key)
-            if not disk_path.exists():
-                return None
-            
             with time_operation("cache.disk_read"):
-                with open(disk_path, 'rb') as f:
-                    cache_data = pickle.load(f)
-                
-                # Check expiration
-                if cache_data.get('expires_at') and time.time() > cache_data['expires_at']:
-                    disk_path.unlink()
-                    return None
-                
-                self.stats.disk_reads += 1
-                return cache_data['data']
+                data = self._disk_cache.get(cache_key)
+            
+            self.stats.disk_reads += 1
+            return data
         
         except Exception as e:
             logger.warning(f"Failed to read from disk cache: {e}")
@@ -322,24 +369,23 @@ class CacheManager:
     
     def _set_to_disk(self, cache_key: str, value: Any, ttl: float) -> None:
         """Set value to disk cache."""
-        if not self._disk_cache_dir:
+        if self._disk_cache is None:
             return
         
         try:
-            disk_path = self._get_disk_path(cache_key)
-            
-            cache_data = {
-                'data': value,
-                'created_at': time.time(),
-                'expires_at': time.time() + ttl,
-                'ttl': ttl
-            }
+            evictions_before = self._disk_cache.evictions
             
             with time_operation("cache.disk_write"):
-                with open(disk_path, 'wb') as f:
-                    pickle.dump(cache_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                self._disk_cache.set(cache_key, value, ttl)
             
             self.stats.disk_writes += 1
+            self.stats.total_size_mb = self._disk_cache.size_bytes / 1024 / 1024
+            
+            evicted = self._disk_cache.evictions - evictions_before
+            if evicted:
+                self.stats.evictions += evicted
+                if self._metrics_collector:
+                    self._metrics_collector.increment("cache.evictions", evicted)
         
         except Exception as e:
             logger.warning(f"Failed to write to disk cache: {e}")
@@ -415,6 +461,227 @@ class CacheManager:
             return wrapper
         return decorator
     
+    def get_or_compute(self, key: str, compute: Callable[[], T], ttl: Optional[float] = None,
+                       stale_ttl: float = 0.0, negative_ttl: Optional[float] = None,
+                       negative_errors: Tuple[Type[BaseException], ...] = ()) -> T:
+        """
+        Get a value, computing it at most once at a time per key.
+        
+        Concurrent callers that miss the same key wait for one computation
+        instead of each doing the work. For stale_ttl seconds after ttl
+        runs out the old value is still returned while a single background
+        refresh replaces it. Not-found errors are cached for negative_ttl
+        and re-raised to later callers without calling compute.
+        
+        Args:
+            key: Cache key
+            compute: Function producing the value
+            ttl: Seconds the value is fresh (default_ttl if None)
+            stale_ttl: Seconds after ttl a stale value may still be served
+            negative_ttl: Seconds to cache not-found errors (config.negative_ttl
+                if None, 0 to disable)
+            negative_errors: Exception types treated as not found in addition
+                to HTTP 404 errors
+            
+        Returns:
+            Cached or computed value
+            
+        Raises:
+            Exception: Whatever compute raised, or a cached not-found error
+        """
+        with self._lock:
+            state, cached = self._lookup_computed(key)
+            if state == _FRESH:
+                return cached
+            if state == _NEGATIVE:
+                raise cached.with_traceback(None)
+            
+            flight = self._flights.get(key)
+            if state == _STALE:
+                if flight is None:
+                    flight = self._flights[key] = _Flight()
+                    threading.Thread(
+                        target=self._refresh, name="cache-refresh", daemon=True,
+                        args=(key, flight, compute, ttl, stale_ttl, negative_ttl, negative_errors)
+                    ).start()
+                return cached
+            
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.stats.coalesced += 1
+        
+        if leader:
+            return self._run_flight(key, flight, compute, ttl, stale_ttl, negative_ttl, negative_errors)
+        
+        flight.event.wait()
+        if flight.error is not None:
+            raise flight.error.with_traceback(None)
+        return flight.value
+    
+    async def get_or_compute_async(self, key: str, compute: Callable[[], Union[Awaitable[T], T]],
+                                   ttl: Optional[float] = None, stale_ttl: float = 0.0,
+                                   negative_ttl: Optional[float] = None,
+                                   negative_errors: Tuple[Type[BaseException], ...] = ()) -> T:
+        """
+        Async variant of get_or_compute.
+        
+        compute may return an awaitable (e.g. an async function or
+        asyncio.to_thread) or a plain value. Callers waiting on another
+        task's computation are not affected if that task is cancelled;
+        one of them computes instead.
+        
+        Args:
+            key: Cache key
+            compute: Function producing the value or an awaitable of it
+            ttl: Seconds the value is fresh (default_ttl if None)
+            stale_ttl: Seconds after ttl a stale value may still be served
+            negative_ttl: Seconds to cache not-found errors (config.negative_ttl
+                if None, 0 to disable)
+            negative_errors: Exception types treated as not found in addition
+                to HTTP 404 errors
+            
+        Returns:
+            Cached or computed value
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        args = (compute, ttl, stale_ttl, negative_ttl, negative_errors)
+        
+        while True:
+            with self._lock:
+                state, cached = self._lookup_computed(key)
+                if state == _FRESH:
+                    return cached
+                if state == _NEGATIVE:
+                    raise cached.with_traceback(None)
+                
+                future = self._async_flights.get(flight_key)
+                if state == _STALE:
+                    if future is None:
+                        future = self._async_flights[flight_key] = loop.create_future()
+                        task = loop.create_task(self._refresh_async(flight_key, future, *args))
+                        self._refresh_tasks.add(task)
+                        task.add_done_callback(self._refresh_tasks.discard)
+                    return cached
+                
+                leader = future is None
+                if leader:
+                    future = self._async_flights[flight_key] = loop.create_future()
+                else:
+                    self.stats.coalesced += 1
+            
+            if leader:
+                return await self._run_async_flight(flight_key, future, *args)
+            
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The computing task was cancelled, not this one: take over
+                if future.cancelled():
+                    continue
+                raise
+    
+    def _lookup_computed(self, key: str) -> Tuple[str, Any]:
+        """Classify a get_or_compute entry (caller holds the lock)."""
+        cached = self.get(key)
+        if isinstance(cached, _NegativeResult):
+            self.stats.negative_hits += 1
+            return _NEGATIVE, cached.error
+        if not isinstance(cached, dict) or _COMPUTED_MARKER not in cached:
+            return _MISS, None
+        
+        now = time.time()
+        if now < cached['fresh_until']:
+            return _FRESH, cached['value']
+        if now < cached['stale_until']:
+            self.stats.stale_hits += 1
+            return _STALE, cached['value']
+        return _MISS, None
+    
+    def _store_computed(self, key: str, value: Any, ttl: Optional[float], stale_ttl: float) -> None:
+        ttl = ttl or self.config.default_ttl
+        now = time.time()
+        self.set(key, {
+            _COMPUTED_MARKER: 1,
+            'value': value,
+            'fresh_until': now + ttl,
+            'stale_until': now + ttl + stale_ttl,
+        }, ttl=ttl + stale_ttl)
+    
+    def _store_failure(self, key: str, error: BaseException, negative_ttl: Optional[float],
+                       negative_errors: Tuple[Type[BaseException], ...]) -> None:
+        """Cache a not-found error in memory; other errors are not cached."""
+        if negative_ttl is None:
+            negative_ttl = self.config.negative_ttl
+        if negative_ttl <= 0:
+            return
+        if not (isinstance(error, negative_errors) or is_not_found_error(error)):
+            return
+        
+        with self._lock:
+            self.delete(key)
+            self._memory_cache[self._get_cache_key(key)] = CacheEntry(_NegativeResult(error), negative_ttl)
+    
+    def _run_flight(self, key: str, flight: _Flight, compute: Callable[[], T], ttl: Optional[float],
+                    stale_ttl: float, negative_ttl: Optional[float],
+                    negative_errors: Tuple[Type[BaseException], ...]) -> T:
+        try:
+            flight.value = compute()
+            self._store_computed(key, flight.value, ttl, stale_ttl)
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            self._store_failure(key, e, negative_ttl, negative_errors)
+            raise
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            flight.event.set()
+    
+    def _refresh(self, *args: Any) -> None:
+        """Background refresh of a stale value; failures keep the stale value."""
+        try:
+            self._run_flight(*args)
+        except Exception as e:
+            logger.warning(f"Background cache refresh failed for {args[0]}: {e}")
+    
+    async def _run_async_flight(self, flight_key: Tuple[int, str], future: asyncio.Future,
+                                compute: Callable[[], Any], ttl: Optional[float], stale_ttl: float,
+                                negative_ttl: Optional[float],
+                                negative_errors: Tuple[Type[BaseException], ...]) -> Any:
+        key = flight_key[1]
+        try:
+            value = compute()
+            if inspect.isawaitable(value):
+                value = await value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            self._store_failure(key, e, negative_ttl, negative_errors)
+            future.set_exception(e)
+            # Waiters re-raise it; don't warn when there are none
+            future.exception()
+            raise
+        else:
+            self._store_computed(key, value, ttl, stale_ttl)
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                if self._async_flights.get(flight_key) is future:
+                    del self._async_flights[flight_key]
+    
+    async def _refresh_async(self, *args: Any) -> None:
+        """Background refresh of a stale value; failures keep the stale value."""
+        try:
+            await self._run_async_flight(*args)
+        except Exception as e:
+            logger.warning(f"Background cache refresh failed for {args[0][1]}: {e}")
+    
     async def warm_cache(self, warm_functions: List[Callable] = None) -> None:
         """
         Warm cache with frequently accessed data.
@@ -469,20 +736,9 @@ class CacheManager:
             
             # Memory cache cleanup (TTLCache handles this automatically)
             # But we'll check disk cache
-            if self.config.enable_disk_cache and self._disk_cache_dir:
-                for cache_file in self._disk_cache_dir.rglob("*.cache"):
-                    try:
-                        with open(cache_file, 'rb') as f:
-                            cache_data = pickle.load(f)
-                        
-                        if cache_data.get('expires_at') and time.time() > cache_data['expires_at']:
-                            cache_file.unlink()
-                            cleaned_count += 1
-                    
-                    except Exception:
-                        # Remove corrupted cache files
-                        cache_file.unlink()
-                        cleaned_count += 1
+            if self._disk_cache is not None:
+                cleaned_count += self._disk_cache.cleanup_expired()
+                self.stats.total_size_mb = self._disk_cache.size_bytes / 1024 / 1024
             
             if cleaned_count > 0:
                 logger.info(f"Cleaned up {cleaned_count} expired cache entries")
@@ -505,7 +761,10 @@ class CacheManager:
                     "hit_rate": self.stats.hit_rate,
                     "evictions": self.stats.evictions,
                     "disk_reads": self.stats.disk_reads,
-                    "disk_writes": self.stats.disk_writes
+                    "disk_writes": self.stats.disk_writes,
+                    "coalesced": self.stats.coalesced,
+                    "stale_hits": self.stats.stale_hits,
+                    "negative_hits": self.stats.negative_hits
                 },
                 "memory_cache": {
                     "current_size": len(self._memory_cache),
@@ -515,20 +774,16 @@ class CacheManager:
             }
             
             # Disk cache info
-            if self.config.enable_disk_cache and self._disk_cache_dir:
-                try:
-                    disk_files = list(self._disk_cache_dir.rglob("*.cache"))
-                    total_size = sum(f.stat().st_size for f in disk_files if f.exists())
-                    
-                    info["disk_cache"] = {
-                        "file_count": len(disk_files),
-                        "total_size_mb": total_size / 1024 / 1024,
-                        "max_size_mb": self.config.disk_cache_size_mb
-                    }
-                except Exception:
-                    info["disk_cache"] = {"error": "Unable to calculate disk cache size"}
+            if self._disk_cache is not None:
+                info["disk_cache"] = self._disk_cache.info()
             
             return info
+    
+    def close(self) -> None:
+        """Flush the disk cache index. Runs automatically at interpreter exit."""
+        with self._lock:
+            if self._disk_cache_finalizer is not None:
+                self._disk_cache_finalizer()
 
 
 # Global cache manager instance
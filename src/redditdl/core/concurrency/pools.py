@@ -6,13 +6,15 @@ adaptive scaling, resource monitoring, and load balancing.
 """
 
 import asyncio
+import functools
 import logging
 import time
 from typing import Dict, List, Optional, Callable, Any, TypeVar, Coroutine
 from dataclasses import dataclass, field
 from enum import Enum
 import psutil
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import threading
 from redditdl.core.monitoring.metrics import get_metrics_collector, time_operation
 
@@ -27,6 +29,7 @@ class PoolType(Enum):
     THREAD = "thread"       # Thread-based processing
     DOWNLOAD = "download"   # Media download operations
     PROCESSING = "processing"  # CPU-intensive tasks
+    CPU = "cpu"             # CPU-bound functions in worker processes
 
 
 @dataclass
@@ -319,6 +322,120 @@ class AsyncWorkerPool:
         return self.metrics
 
 
+class ProcessWorkerPool:
+    """
+    Process pool for CPU-bound functions with bounded queueing.
+    
+    Features:
+    - Worker processes started lazily on first submission
+    - At most max_workers + queue_size_limit tasks in flight; further
+      submissions wait for a slot instead of piling up in the executor
+    - Results awaited asynchronously without blocking the event loop
+    - Automatic executor replacement if a worker process dies
+    """
+    
+    def __init__(self, config: Optional[PoolConfig] = None):
+        """
+        Initialize process worker pool.
+        
+        Args:
+            config: Pool configuration; max_workers sets the process count
+                and queue_size_limit the number of tasks allowed to wait
+        """
+        self.config = config or PoolConfig(
+            min_workers=1,
+            max_workers=psutil.cpu_count() or 1,
+            queue_size_limit=(psutil.cpu_count() or 1) * 2
+        )
+        self.metrics = PoolMetrics()
+        
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_flight = 0
+        self._task_times: List[float] = []
+        self._lock = threading.Lock()
+    
+    @property
+    def started(self) -> bool:
+        """Whether worker processes have been created."""
+        return self._executor is not None
+    
+    async def submit(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run a picklable function in a worker process.
+        
+        Args:
+            func: Module-level function to execute
+            *args: Function arguments (must be picklable)
+            **kwargs: Function keyword arguments (must be picklable)
+            
+        Returns:
+            Result from function execution
+        """
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.config.max_workers + self.config.queue_size_limit)
+            self._slots_loop = loop
+        
+        async with self._slots:
+            executor = self._get_executor()
+            self._update_in_flight(1)
+            start_time = time.time()
+            try:
+                result = await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+            except BrokenProcessPool:
+                # A worker died (e.g. crashed in a native library); start fresh next time
+                with self._lock:
+                    if self._executor is executor:
+                        self._executor = None
+                    self.metrics.failed_tasks += 1
+                executor.shutdown(wait=False)
+                raise
+            except Exception:
+                with self._lock:
+                    self.metrics.failed_tasks += 1
+                raise
+            else:
+                with self._lock:
+                    self.metrics.completed_tasks += 1
+                return result
+            finally:
+                self._update_in_flight(-1)
+                self._record_task_time(time.time() - start_time)
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.config.max_workers)
+                logger.info(f"Started process pool with {self.config.max_workers} workers")
+            return self._executor
+    
+    def _update_in_flight(self, delta: int) -> None:
+        with self._lock:
+            self._in_flight += delta
+            self.metrics.active_workers = min(self._in_flight, self.config.max_workers)
+            self.metrics.queued_tasks = max(0, self._in_flight - self.config.max_workers)
+    
+    def _record_task_time(self, task_time: float) -> None:
+        with self._lock:
+            self._task_times.append(task_time)
+            if len(self._task_times) > 100:
+                self._task_times = self._task_times[-100:]
+            self.metrics.average_task_time = sum(self._task_times) / len(self._task_times)
+    
+    def get_metrics(self) -> PoolMetrics:
+        """Get current pool metrics."""
+        return self.metrics
+
+
 class WorkerPoolManager:
     """
     Manages multiple worker pools for different operation types.
@@ -369,6 +486,10 @@ class WorkerPoolManager:
             )
         )
         
+        # Process pool for CPU-bound work; processes start on first use
+        if PoolType.CPU not in self._pools:
+            self._pools[PoolType.CPU] = ProcessWorkerPool()
+        
         # Initialize thread pool
         max_threads = min(32, (psutil.cpu_count() or 4) * 4)
         self._thread_executor = ThreadPoolExecutor(
@@ -387,6 +508,11 @@ class WorkerPoolManager:
     
     async def stop(self) -> None:
         """Stop all worker pools."""
+        # The process pool can run without start(), so always shut it down
+        process_pool = self._pools.get(PoolType.CPU)
+        if isinstance(process_pool, ProcessWorkerPool):
+            process_pool.shutdown(wait=True)
+        
         if not self._started:
             return
         
@@ -446,22 +572,70 @@ class WorkerPoolManager:
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(self._thread_executor, func, *args, **kwargs)
     
+    async def submit_process(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Submit a CPU-bound function to the process pool.
+        
+        The function and its arguments must be picklable. When the pool's
+        queue is full the call waits for a free slot (backpressure).
+        
+        Args:
+            func: Module-level function to execute
+            *args: Function arguments
+            **kwargs: Function keyword arguments
+            
+        Returns:
+            Result from function execution
+        """
+        # The process pool does not need the async pools, so it is not tied to start()
+        pool = self._pools.get(PoolType.CPU)
+        if pool is None:
+            pool = self._pools[PoolType.CPU] = ProcessWorkerPool()
+        
+        return await pool.submit(func, *args, **kwargs)
+    
+    def configure_process_pool(self, max_workers: Optional[int] = None,
+                               queue_size_limit: Optional[int] = None) -> None:
+        """
+        Set the process pool size before its worker processes start.
+        
+        Args:
+            max_workers: Number of worker processes (default: CPU count)
+            queue_size_limit: Tasks allowed to wait for a worker (default: 2 x workers)
+        """
+        pool = self._pools.get(PoolType.CPU)
+        if isinstance(pool, ProcessWorkerPool) and pool.started:
+            logger.debug("Process pool already running; keeping its configuration")
+            return
+        
+        workers = max_workers or psutil.cpu_count() or 1
+        queue_limit = queue_size_limit if queue_size_limit is not None else workers * 2
+        if (isinstance(pool, ProcessWorkerPool) and pool.config.max_workers == workers
+                and pool.config.queue_size_limit == queue_limit):
+            return
+        
+        self._pools[PoolType.CPU] = ProcessWorkerPool(PoolConfig(
+            min_workers=1,
+            max_workers=workers,
+            queue_size_limit=queue_limit
+        ))
+    
     def get_pool_metrics(self, pool_type: PoolType) -> Optional[PoolMetrics]:
         """Get metrics for specific pool type."""
         if pool_type not in self._pools:
             return None
         
         pool = self._pools[pool_type]
-        if isinstance(pool, AsyncWorkerPool):
+        if isinstance(pool, (AsyncWorkerPool, ProcessWorkerPool)):
             return pool.get_metrics()
         
         return None
     
     def get_all_metrics(self) -> Dict[str, PoolMetrics]:
-        """Get metrics for all async pools."""
+        """Get metrics for all async and process pools."""
         metrics = {}
         for pool_type, pool in self._pools.items():
-            if isinstance(pool, AsyncWorkerPool):
+            if isinstance(pool, (AsyncWorkerPool, ProcessWorkerPool)):
                 metrics[pool_type.value] = pool.get_metrics()
         return metrics
 
@@ -500,6 +674,21 @@ async def submit_thread_task(func: Callable[..., T], *args, **kwargs) -> T:
     return await _global_pool_manager.submit_thread(func, *args, **kwargs)
 
 
+async def submit_process_task(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Convenience function for submitting CPU-bound functions to worker processes.
+    
+    Args:
+        func: Module-level function to execute
+        *args: Function arguments
+        **kwargs: Function keyword arguments
+        
+    Returns:
+        Result from function execution
+    """
+    return await _global_pool_manager.submit_process(func, *args, **kwargs)
+
+
 def get_pool_manager() -> WorkerPoolManager:
     """Get global worker pool manager."""
     return _global_pool_manager
\ No newline at end of file
@@ -171,6 +171,14 @@ class ConfigManager:
             f"{prefix}VERBOSE": ("verbose", None, self._parse_bool),
             f"{prefix}DEBUG": ("debug", None, self._parse_bool),
             f"{prefix}USE_PIPELINE": ("use_pipeline", None, self._parse_bool),
+            f"{prefix}METRICS_PORT": ("metrics_port", None, int),
+            f"{prefix}PROFILE_OUTPUT": ("profile_output", None, str),
+            f"{prefix}TRACE_SAMPLE_RATE": ("trace_sample_rate", None, float),
+            f"{prefix}TRACE_OUTPUT": ("trace_output", None, str),
+            f"{prefix}HTTP_CACHE": ("http_cache", None, self._parse_bool),
+            f"{prefix}HTTP_CACHE_DIR": ("http_cache_dir", None, str),
+            f"{prefix}HTTP_CACHE_SIZE_MB": ("http_cache_size_mb", None, int),
+            f"{prefix}SKIP_ARCHIVED": ("skip_archived", None, self._parse_bool),
         }
         
         for env_var, (section, key, parser) in env_mappings.items():
@@ -202,6 +210,7 @@ class ConfigManager:
             'verbose': 'verbose', 
             'debug': 'debug',
             'use_pipeline': 'use_pipeline',
+            'skip_archived': 'skip_archived',
             
             # Scraping section
             'api': ('scraping', 'api_mode'),
@@ -139,6 +139,29 @@ class ProcessingConfig(BaseModel):
         description="Maximum concurrent downloads"
     )
     
+    # Worker Settings
+    worker_backend: str = Field(
+        default="process",
+        description="Where CPU-bound image processing runs (process, inline)"
+    )
+    processing_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=256,
+        description="Worker processes for image processing (defaults to CPU count)"
+    )
+    processing_queue_size: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Jobs allowed to wait for a worker process (defaults to twice the CPU count)"
+    )
+    video_jobs: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=64,
+        description="Concurrent FFmpeg processes (defaults to half the CPU count)"
+    )
+    
     # Image Processing
     image_format_conversion: bool = Field(
         default=False,
@@ -227,6 +250,15 @@ class ProcessingConfig(BaseModel):
             raise ValueError(f"Unsupported image format: {v}")
         return v.lower()
     
+    @field_validator('worker_backend')
+    @classmethod
+    def validate_worker_backend(cls, v):
+        """Validate processing worker backend is supported."""
+        supported_backends = {'process', 'inline'}
+        if v.lower() not in supported_backends:
+            raise ValueError(f"Unsupported worker backend: {v}. Supported: {', '.join(sorted(supported_backends))}")
+        return v.lower()
+    
     @field_validator('target_video_format')
     @classmethod
     def validate_video_format(cls, v):
@@ -804,6 +836,53 @@ class AppConfig(BaseModel):
         description="Event observer configuration"
     )
     
+    # Monitoring Settings
+    metrics_port: Optional[int] = Field(
+        default=None,
+        ge=0,
+        le=65535,
+        description="Serve OpenMetrics on this port while scraping (disabled if unset)"
+    )
+    metrics_host: str = Field(
+        default="127.0.0.1",
+        description="Interface the metrics endpoint binds to"
+    )
+    profile_output: Optional[Path] = Field(
+        default=None,
+        description="Sample stacks at 100 Hz while scraping and write a profile report here (disabled if unset)"
+    )
+    trace_sample_rate: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of posts to trace through pipeline stages and handlers (0 disables tracing)"
+    )
+    trace_output: Optional[Path] = Field(
+        default=None,
+        description="Write sampled post traces here as OTLP JSON"
+    )
+    
+    # HTTP Cache
+    http_cache: bool = Field(
+        default=False,
+        description="Cache Reddit listing responses between runs to save rate-limit budget"
+    )
+    http_cache_dir: Optional[Path] = Field(
+        default=None,
+        description="Directory for cached listing responses (default: session_dir/http_cache)"
+    )
+    http_cache_size_mb: int = Field(
+        default=200,
+        ge=1,
+        description="Disk size limit for cached listing responses in MB"
+    )
+    
+    # Archive
+    skip_archived: bool = Field(
+        default=False,
+        description="Skip posts already archived in earlier sessions or as JSON sidecars in the output directory"
+    )
+    
     # Session Management
     session_dir: Path = Field(
         default=Path(".redditdl"),
@@ -843,6 +922,16 @@ class AppConfig(BaseModel):
         else:
             return max(self.scraping.sleep_interval, self.scraping.public_rate_limit)
     
+    def get_http_cache_dir(self) -> Optional[Path]:
+        """Get the HTTP cache directory, or None if the cache is disabled."""
+        if not self.http_cache:
+            return None
+        return self.http_cache_dir or self.session_dir / "http_cache"
+    
+    def get_plugin_index_path(self) -> Path:
+        """Get the file caching plugin discovery and security scan results."""
+        return self.session_dir / "plugin_index.json"
+    
     def get_export_dir(self) -> Path:
         """Get the effective export directory."""
         if self.output.export_dir:
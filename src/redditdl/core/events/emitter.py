@@ -20,6 +20,49 @@ from redditdl.core.events.types import BaseEvent, EventType
 logger = logging.getLogger(__name__)
 
 
+class _BatchSubscription:
+    """Buffers events for an observer that receives them as lists."""
+    
+    def __init__(self, observer: Any, max_batch_size: int, max_delay: float):
+        self.observer = observer
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._buffer: List[EventType] = []
+        self._first_buffered = 0.0
+        self._lock = threading.Lock()
+    
+    def resolve(self) -> Optional[Callable]:
+        """Return the batch handler, or None if a weak reference expired."""
+        observer = self.observer() if isinstance(self.observer, weakref.ref) else self.observer
+        if observer is None:
+            return None
+        return getattr(observer, 'handle_batch', observer)
+    
+    def matches(self, observer: Any) -> bool:
+        """Check whether this subscription belongs to an observer."""
+        target = self.observer() if isinstance(self.observer, weakref.ref) else self.observer
+        return target is observer
+    
+    def add(self, event: EventType) -> Optional[List[EventType]]:
+        """Buffer an event, returning the batch once it is due for delivery."""
+        now = time.monotonic()
+        with self._lock:
+            if not self._buffer:
+                self._first_buffered = now
+            self._buffer.append(event)
+            if (len(self._buffer) >= self.max_batch_size
+                    or now - self._first_buffered >= self.max_delay):
+                batch, self._buffer = self._buffer, []
+                return batch
+        return None
+    
+    def drain(self) -> List[EventType]:
+        """Remove and return all buffered events."""
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+            return batch
+
+
 class EventEmitter:
     """
     Thread-safe event emitter with async support and observer management.
@@ -32,12 +75,20 @@ class EventEmitter:
     - Event history for replay capability
     - Observer error isolation
     - Weak references to prevent memory leaks
+    - Lock-free skip of event types nobody subscribes to
+    - Per-download coalescing of high-frequency progress events
+    - Batched delivery for observers that prefer lists
     """
     
+    # Event types that are coalesced per download when emitted faster
+    # than the coalescing interval
+    COALESCED_EVENT_TYPES = frozenset({'DownloadProgressEvent'})
+    
     def __init__(self, 
                  max_history: int = 1000,
                  max_queue_size: int = 10000,
-                 enable_history: bool = True):
+                 enable_history: bool = True,
+                 coalesce_interval: float = 0.1):
         """
         Initialize the event emitter.
         
@@ -45,10 +96,13 @@ class EventEmitter:
             max_history: Maximum number of events to keep in history
             max_queue_size: Maximum size of event queue before blocking
             enable_history: Whether to store event history
+            coalesce_interval: Minimum seconds between delivered progress
+                events for the same download (0 disables coalescing)
         """
         self.max_history = max_history
         self.max_queue_size = max_queue_size
         self.enable_history = enable_history
+        self.coalesce_interval = coalesce_interval
         
         # Thread synchronization
         self._lock = threading.RLock()
@@ -57,6 +111,17 @@ class EventEmitter:
         # Observer storage: event_type -> set of observers
         self._observers: Dict[str, Set[Any]] = defaultdict(set)
         self._wildcard_observers: Set[Any] = set()
+        self._batch_observers: Dict[str, List[_BatchSubscription]] = {}
+        
+        # Immutable snapshots read without locking on every emit; replaced
+        # under self._lock whenever subscriptions change
+        self._active_types: frozenset = frozenset()
+        self._wildcard_active = False
+        
+        # Latest undelivered progress event and last delivery time per download
+        self._coalesce_lock = threading.Lock()
+        self._pending_coalesced: Dict[tuple, EventType] = {}
+        self._last_delivered: Dict[tuple, float] = {}
         
         # Event history and queuing
         self._event_history: deque = deque(maxlen=max_history if enable_history else 0)
@@ -68,7 +133,10 @@ class EventEmitter:
             'events_processed': 0,
             'observers_notified': 0,
             'observer_errors': 0,
-            'queue_overflows': 0
+            'queue_overflows': 0,
+            'events_skipped': 0,
+            'events_coalesced': 0,
+            'batches_delivered': 0
         }
         
         # Async processing
@@ -111,9 +179,10 @@ class EventEmitter:
                     else:
                         self._observers[event_type_str].add(observer)
                 
+                self._refresh_active_types()
                 logger.debug(f"Subscribed observer to {event_type_str} events")
                 return True
-                
+        
         except Exception as e:
             logger.error(f"Failed to subscribe observer: {e}")
             return False
@@ -161,13 +230,203 @@ class EventEmitter:
                             to_remove.add(obs)
                     self._observers[event_type_str] -= to_remove
                 
+                self._refresh_active_types()
                 logger.debug(f"Unsubscribed observer from {event_type_str} events")
                 return True
-                
+        
         except Exception as e:
             logger.error(f"Failed to unsubscribe observer: {e}")
             return False
     
+    def subscribe_batch(self,
+                        event_type: Union[str, type],
+                        observer: Any,
+                        max_batch_size: int = 100,
+                        max_delay: float = 0.5,
+                        weak: bool = True) -> bool:
+        """
+        Subscribe an observer that receives events as lists.
+        
+        Events are buffered per subscription and delivered once
+        max_batch_size events are waiting or the oldest buffered event is
+        older than max_delay seconds; flush() delivers whatever remains.
+        The observer's handle_batch method is called if it has one,
+        otherwise the observer itself is called with the list.
+        
+        Args:
+            event_type: Event type to subscribe to (class, string name or '*')
+            observer: Callable or object with handle_batch(events)
+            max_batch_size: Number of events that triggers delivery
+            max_delay: Maximum age in seconds of a buffered event when the
+                next event arrives before the batch is delivered
+            weak: Use weak references to prevent memory leaks
+            
+        Returns:
+            True if subscription was successful
+        """
+        try:
+            with self._lock:
+                event_type_str = event_type.__name__ if isinstance(event_type, type) else str(event_type)
+                if event_type_str == 'all':
+                    event_type_str = '*'
+                
+                subscription = _BatchSubscription(
+                    weakref.ref(observer) if weak else observer,
+                    max(1, max_batch_size),
+                    max_delay
+                )
+                # Copy-on-write so emitters can iterate without the lock
+                self._batch_observers[event_type_str] = (
+                    self._batch_observers.get(event_type_str, []) + [subscription]
+                )
+                
+                self._refresh_active_types()
+                logger.debug(f"Subscribed batch observer to {event_type_str} events")
+                return True
+        
+        except Exception as e:
+            logger.error(f"Failed to subscribe batch observer: {e}")
+            return False
+    
+    def unsubscribe_batch(self, event_type: Union[str, type], observer: Any) -> bool:
+        """
+        Unsubscribe a batch observer, delivering its buffered events first.
+        
+        Args:
+            event_type: Event type to unsubscribe from
+            observer: Observer to remove
+            
+        Returns:
+            True if unsubscription was successful
+        """
+        try:
+            with self._lock:
+                event_type_str = event_type.__name__ if isinstance(event_type, type) else str(event_type)
+                if event_type_str == 'all':
+                    event_type_str = '*'
+                
+                subscriptions = self._batch_observers.get(event_type_str, [])
+                removed = [sub for sub in subscriptions if sub.matches(observer)]
+                self._batch_observers[event_type_str] = [
+                    sub for sub in subscriptions if sub not in removed
+                ]
+                self._refresh_active_types()
+            
+            for subscription in removed:
+                self._deliver_batch_sync(subscription, subscription.drain())
+            return True
+        
+        except Exception as e:
+            logger.error(f"Failed to unsubscribe batch observer: {e}")
+            return False
+    
+    def _refresh_active_types(self) -> None:
+        """Rebuild the subscribed-type snapshot. Caller must hold self._lock."""
+        active = {et for et, obs in self._observers.items() if obs}
+        active.update(et for et, subs in self._batch_observers.items() if subs and et != '*')
+        self._active_types = frozenset(active)
+        self._wildcard_active = bool(self._wildcard_observers or self._batch_observers.get('*'))
+    
+    def has_subscribers(self, event_type: Union[str, type]) -> bool:
+        """
+        Check whether any observer would receive events of a type.
+        
+        Lock-free, so emitters can use it to skip building events nobody
+        listens to.
+        """
+        if isinstance(event_type, type):
+            event_type = event_type.__name__
+        return self._wildcard_active or event_type in self._active_types
+    
+    def _prepare_event(self, event: EventType) -> List[EventType]:
+        """
+        Record an emitted event and decide what needs delivering.
+        
+        Returns an empty list when nobody subscribes to the event type or
+        the event was coalesced; otherwise the events to deliver in order.
+        """
+        self._stats['events_emitted'] += 1
+        
+        # Store in history if enabled
+        if self.enable_history:
+            self._event_history.append(event)
+        
+        event_type = event.event_type
+        released: List[EventType] = []
+        if event_type not in self.COALESCED_EVENT_TYPES and (self._pending_coalesced or self._last_delivered):
+            # Any other event for a download (completion, failure) ends its
+            # progress stream: the pending update must not be overtaken by
+            # it, and the download's coalescing state is dropped
+            download_key = self._download_key(event)
+            if download_key is not None:
+                released = self._take_pending(download_key)
+        
+        if not self._wildcard_active and event_type not in self._active_types:
+            self._stats['events_skipped'] += 1
+            return released
+        
+        if self.coalesce_interval > 0 and event_type in self.COALESCED_EVENT_TYPES:
+            return self._coalesce(event)
+        
+        return released + [event]
+    
+    @staticmethod
+    def _download_key(event: EventType) -> Optional[tuple]:
+        """Identify the download an event belongs to, if any."""
+        if not hasattr(event, 'url'):
+            return None
+        return (getattr(event, 'post_id', ''), event.url, getattr(event, 'filename', ''))
+    
+    def _coalesce(self, event: EventType) -> List[EventType]:
+        """Keep only the latest progress event per download within the interval."""
+        key = (event.event_type, self._download_key(event))
+        total = getattr(event, 'total_bytes', None)
+        finished = bool(total) and getattr(event, 'bytes_downloaded', 0) >= total
+        now = time.monotonic()
+        
+        with self._coalesce_lock:
+            superseded = self._pending_coalesced.pop(key, None)
+            if superseded is not None:
+                self._stats['events_coalesced'] += 1
+            
+            if finished or now - self._last_delivered.get(key, 0.0) >= self.coalesce_interval:
+                if finished:
+                    self._last_delivered.pop(key, None)
+                else:
+                    self._last_delivered[key] = now
+                return [event]
+            
+            self._pending_coalesced[key] = event
+            return []
+    
+    def _take_pending(self, download_key: Optional[tuple] = None) -> List[EventType]:
+        """Remove coalesced events for one download, or all when key is None."""
+        with self._coalesce_lock:
+            if download_key is None:
+                events = list(self._pending_coalesced.values())
+                self._pending_coalesced.clear()
+                self._last_delivered.clear()
+                return events
+            
+            for key in [key for key in self._last_delivered if key[1] == download_key]:
+                del self._last_delivered[key]
+            keys = [key for key in self._pending_coalesced if key[1] == download_key]
+            return [self._pending_coalesced.pop(key) for key in keys]
+    
+    def _collect_batches(self, event: EventType) -> List[tuple]:
+        """Buffer an event for batch observers and return batches now due."""
+        ready = []
+        for event_type in (event.event_type, '*'):
+            for subscription in self._batch_observers.get(event_type, ()):
+                batch = subscription.add(event)
+                if batch:
+                    ready.append((subscription, batch))
+        return ready
+    
+    def _has_direct_observers(self, event_type: str) -> bool:
+        """Check for per-event (non-batch) observers of a type."""
+        return bool(self._wildcard_observers or self._observers.get(event_type))
+    
     def emit(self, event: EventType) -> bool:
         """
         Emit an event to all subscribed observers.
@@ -179,23 +438,35 @@ class EventEmitter:
             True if event was successfully queued for processing
         """
         try:
-            # Update statistics
-            self._stats['events_emitted'] += 1
+            to_deliver = self._prepare_event(event)
+            if not to_deliver:
+                return True
             
-            # Store in history if enabled
-            if self.enable_history:
-                self._event_history.append(event)
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
             
-            # Queue event for async processing
-            if asyncio.get_running_loop():
-                # We're in an async context
-                asyncio.create_task(self._process_event_async(event))
-            else:
-                # We're in a sync context, use thread pool
-                self._thread_pool.submit(self._process_event_sync, event)
+            for item in to_deliver:
+                for subscription, batch in self._collect_batches(item):
+                    if loop:
+                        loop.create_task(self._deliver_batch_async(subscription, batch))
+                    else:
+                        self._thread_pool.submit(self._deliver_batch_sync, subscription, batch)
+                
+                if not self._has_direct_observers(item.event_type):
+                    continue
+                
+                # Queue event for processing
+                if loop:
+                    # We're in an async context
+                    loop.create_task(self._process_event_async(item))
+                else:
+                    # We're in a sync context, use thread pool
+                    self._thread_pool.submit(self._process_event_sync, item)
             
             return True
-            
+        
         except Exception as e:
             logger.error(f"Failed to emit event {event.event_type}: {e}")
             return False
@@ -211,21 +482,82 @@ class EventEmitter:
             True if event was successfully processed
         """
         try:
-            # Update statistics
-            self._stats['events_emitted'] += 1
-            
-            # Store in history if enabled
-            if self.enable_history:
-                self._event_history.append(event)
-            
-            # Process event immediately
-            await self._process_event_async(event)
+            # Process events immediately
+            for item in self._prepare_event(event):
+                for subscription, batch in self._collect_batches(item):
+                    await self._deliver_batch_async(subscription, batch)
+                
+                if self._has_direct_observers(item.event_type):
+                    await self._process_event_async(item)
             return True
-            
+        
         except Exception as e:
             logger.error(f"Failed to emit event {event.event_type}: {e}")
             return False
     
+    def flush(self) -> None:
+        """
+        Deliver coalesced progress events and buffered batches now.
+        
+        Runs in the calling thread, so observers have seen every emitted
+        event once this returns.
+        """
+        for event in self._take_pending():
+            for subscription, batch in self._collect_batches(event):
+                self._deliver_batch_sync(subscription, batch)
+            if self._has_direct_observers(event.event_type):
+                self._process_event_sync(event)
+        
+        for subscriptions in list(self._batch_observers.values()):
+            for subscription in subscriptions:
+                self._deliver_batch_sync(subscription, subscription.drain())
+    
+    async def flush_async(self) -> None:
+        """Asynchronous counterpart of flush()."""
+        for event in self._take_pending():
+            for subscription, batch in self._collect_batches(event):
+                await self._deliver_batch_async(subscription, batch)
+            if self._has_direct_observers(event.event_type):
+                await self._process_event_async(event)
+        
+        for subscriptions in list(self._batch_observers.values()):
+            for subscription in subscriptions:
+                await self._deliver_batch_async(subscription, subscription.drain())
+    
+    def _deliver_batch_sync(self, subscription: _BatchSubscription, batch: List[EventType]) -> None:
+        """Deliver a batch synchronously with error isolation."""
+        handler = subscription.resolve()
+        if not batch or handler is None:
+            return
+        
+        try:
+            handler(batch)
+            self._stats['batches_delivered'] += 1
+            self._stats['observers_notified'] += len(batch)
+            
+        except Exception as e:
+            self._stats['observer_errors'] += 1
+            logger.warning(f"Batch observer error for {len(batch)} events: {e}")
+    
+    async def _deliver_batch_async(self, subscription: _BatchSubscription, batch: List[EventType]) -> None:
+        """Deliver a batch asynchronously with error isolation."""
+        handler = subscription.resolve()
+        if not batch or handler is None:
+            return
+        
+        try:
+            if asyncio.iscoroutinefunction(handler):
+                await handler(batch)
+            else:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self._thread_pool, handler, batch)
+            self._stats['batches_delivered'] += 1
+            self._stats['observers_notified'] += len(batch)
+        
+        except Exception as e:
+            self._stats['observer_errors'] += 1
+            logger.warning(f"Batch observer error for {len(batch)} events: {e}")
+    
     async def _process_event_async(self, event: EventType) -> None:
         """Process an event asynchronously, notifying all observers."""
         try:
@@ -245,7 +577,7 @@ class EventEmitter:
             await self._notify_observers_async(event, observers_to_notify)
             
             self._stats['events_processed'] += 1
-            
+        
         except Exception as e:
             logger.error(f"Error processing event {event.event_type}: {e}")
     
@@ -268,7 +600,7 @@ class EventEmitter:
             self._notify_observers_sync(event, observers_to_notify)
             
             self._stats['events_processed'] += 1
-            
+        
         except Exception as e:
             logger.error(f"Error processing event {event.event_type}: {e}")
     
@@ -320,7 +652,7 @@ class EventEmitter:
                 await loop.run_in_executor(self._thread_pool, observer, event)
             
             self._stats['observers_notified'] += 1
-            
+        
         except Exception as e:
             self._stats['observer_errors'] += 1
             logger.warning(f"Observer error for {event.event_type}: {e}")
@@ -330,7 +662,7 @@ class EventEmitter:
         try:
             observer(event)
             self._stats['observers_notified'] += 1
-            
+        
         except Exception as e:
             self._stats['observer_errors'] += 1
             logger.warning(f"Observer error for {event.event_type}: {e}")
@@ -390,6 +722,7 @@ class EventEmitter:
             **self._stats,
             'total_observers': sum(len(obs) for obs in self._observers.values()),
             'wildcard_observers': len(self._wildcard_observers),
+            'batch_observers': sum(len(subs) for subs in self._batch_observers.values()),
             'event_types': list(self._observers.keys()),
             'history_size': len(self._event_history) if self.enable_history else 0,
             'history_enabled': self.enable_history
@@ -405,10 +738,13 @@ class EventEmitter:
         with self._lock:
             self._observers.clear()
             self._wildcard_observers.clear()
+            self._batch_observers.clear()
+            self._refresh_active_types()
     
     def shutdown(self) -> None:
         """Shutdown the event emitter and cleanup resources."""
         try:
+            self.flush()
             self._shutdown_event.set()
             if self._processing_task:
                 self._processing_task.cancel()
@@ -81,7 +81,20 @@ class Observer(ABC):
         except Exception as e:
             self.statistics['events_errored'] += 1
             logging.error(f"Observer {self.name} error: {e}")
-    
+
+    def handle_batch(self, events: List[EventType]) -> None:
+        """
+        Handle a list of events delivered via EventEmitter.subscribe_batch.
+
+        The default hands each event to __call__; observers that can
+        process lists more cheaply override this.
+
+        Args:
+            events: Events in emission order
+        """
+        for event in events:
+            self(event)
+
     def enable(self) -> None:
         """Enable this observer."""
         self.enabled = True
@@ -5,12 +5,25 @@ Provides performance monitoring, resource tracking, and profiling
 capabilities for RedditDL optimization and bottleneck identification.
 """
 
-from .metrics import MetricsCollector
-from .profiler import ResourceProfiler
+from .metrics import MetricsCollector, StreamingHistogram
+from .profiler import ResourceProfiler, SamplingProfiler, sampling_scope
 from .dashboard import PerformanceDashboard
+from .openmetrics import OpenMetricsExporter, MetricsHTTPServer, metrics_endpoint
+from .tracing import Tracer, get_tracer, trace_post, trace_span, tracing_session
 
 __all__ = [
     'MetricsCollector',
+    'StreamingHistogram',
     'ResourceProfiler',
-    'PerformanceDashboard'
+    'SamplingProfiler',
+    'sampling_scope',
+    'PerformanceDashboard',
+    'OpenMetricsExporter',
+    'MetricsHTTPServer',
+    'metrics_endpoint',
+    'Tracer',
+    'get_tracer',
+    'trace_post',
+    'trace_span',
+    'tracing_session'
 ]
\ No newline at end of file
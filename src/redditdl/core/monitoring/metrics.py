@@ -6,7 +6,9 @@ resource usage, and bottleneck identification across all RedditDL components.
 """
 
 import asyncio
+import itertools
 import logging
+import math
 import time
 import threading
 from typing import Dict, List, Any, Optional, Callable
@@ -50,6 +52,241 @@ class MetricSummary:
     p99: float = 0.0
 
 
+class _HistogramShard:
+    """One independently locked stripe of a StreamingHistogram."""
+    
+    __slots__ = ('lock', 'positive', 'negative', 'zero', 'count', 'sum', 'min', 'max')
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+    
+    def add(self, other: '_HistogramShard') -> None:
+        """Fold another shard's counts into this one (caller holds locks)."""
+        for index, count in other.positive.items():
+            self.positive[index] = self.positive.get(index, 0) + count
+        for index, count in other.negative.items():
+            self.negative[index] = self.negative.get(index, 0) + count
+        self.zero += other.zero
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+
+class StreamingHistogram:
+    """
+    Mergeable log-bucketed histogram for high-frequency distributions.
+    
+    Values fall into buckets whose bounds grow geometrically, so every
+    reported quantile is within relative_accuracy of a recorded value
+    (HDR/DDSketch-style). Recording is O(1), quantile queries are
+    O(buckets), and memory depends on the range of values rather than
+    their number. Each recording thread is pinned to one of several
+    independently locked stripes, so concurrent recorders rarely contend;
+    queries merge the stripes.
+    """
+    
+    # Magnitudes below this are counted in the zero bucket
+    MIN_TRACKED_VALUE = 1e-9
+    
+    def __init__(self, relative_accuracy: float = 0.01, stripes: int = 8):
+        """
+        Initialize histogram.
+        
+        Args:
+            relative_accuracy: Maximum relative error of reported quantiles
+            stripes: Number of independently locked recording stripes
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        
+        self._shards = [_HistogramShard() for _ in range(max(1, stripes))]
+        self._local = threading.local()
+        self._next_stripe = itertools.count()
+    
+    def _shard(self) -> _HistogramShard:
+        """Stripe owned by the calling thread, assigned round-robin."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._shards[next(self._next_stripe) % len(self._shards)]
+            self._local.shard = shard
+            return shard
+    
+    def _index(self, magnitude: float) -> int:
+        """Bucket index covering (gamma**(i-1), gamma**i]."""
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+    
+    def _bucket_value(self, index: int) -> float:
+        """Representative value of a bucket, within the relative accuracy of its members."""
+        return 2 * self._gamma ** index / (self._gamma + 1)
+    
+    def record(self, value: float, count: int = 1) -> None:
+        """
+        Record a value.
+        
+        Args:
+            value: Value to record
+            count: Number of occurrences of the value
+        """
+        magnitude = abs(value)
+        index = self._index(magnitude) if magnitude > self.MIN_TRACKED_VALUE else None
+        
+        shard = self._shard()
+        with shard.lock:
+            if index is None:
+                shard.zero += count
+            elif value > 0:
+                shard.positive[index] = shard.positive.get(index, 0) + count
+            else:
+                shard.negative[index] = shard.negative.get(index, 0) + count
+            shard.count += count
+            shard.sum += value * count
+            if value < shard.min:
+                shard.min = value
+            if value > shard.max:
+                shard.max = value
+    
+    def _snapshot(self) -> _HistogramShard:
+        """Merge all stripes into a single consistent-per-stripe view."""
+        merged = _HistogramShard()
+        for shard in self._shards:
+            with shard.lock:
+                merged.add(shard)
+        return merged
+    
+    def merge(self, other: 'StreamingHistogram') -> None:
+        """
+        Add another histogram's contents into this one.
+        
+        Args:
+            other: Histogram built with the same relative accuracy
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge histograms with different relative accuracy")
+        
+        snapshot = other._snapshot()
+        shard = self._shard()
+        with shard.lock:
+            shard.add(snapshot)
+    
+    @property
+    def count(self) -> int:
+        """Total number of recorded values."""
+        return sum(shard.count for shard in self._shards)
+    
+    def quantiles(self, quantiles: List[float]) -> List[float]:
+        """
+        Estimate several quantiles in a single pass over the buckets.
+        
+        Args:
+            quantiles: Quantiles between 0 and 1
+            
+        Returns:
+            Estimated values in the same order as quantiles
+        """
+        return self._quantiles(self._snapshot(), quantiles)
+    
+    def quantile(self, quantile: float) -> float:
+        """Estimate a single quantile between 0 and 1."""
+        return self.quantiles([quantile])[0]
+    
+    def _quantiles(self, snapshot: _HistogramShard, quantiles: List[float]) -> List[float]:
+        if snapshot.count == 0:
+            return [0.0 for _ in quantiles]
+        
+        # Buckets in ascending value order: negatives by descending
+        # magnitude, then zero, then positives
+        buckets = [(-self._bucket_value(i), snapshot.negative[i])
+                   for i in sorted(snapshot.negative, reverse=True)]
+        if snapshot.zero:
+            buckets.append((0.0, snapshot.zero))
+        buckets.extend((self._bucket_value(i), snapshot.positive[i])
+                       for i in sorted(snapshot.positive))
+        
+        order = sorted(range(len(quantiles)), key=lambda k: quantiles[k])
+        results = [0.0] * len(quantiles)
+        position = 0
+        cumulative = buckets[0][1]
+        for k in order:
+            if quantiles[k] <= 0.0:
+                results[k] = snapshot.min
+                continue
+            if quantiles[k] >= 1.0:
+                results[k] = snapshot.max
+                continue
+            rank = quantiles[k] * (snapshot.count - 1)
+            while cumulative <= rank and position < len(buckets) - 1:
+                position += 1
+                cumulative += buckets[position][1]
+            # Exact extremes keep the estimate inside the observed range
+            results[k] = min(max(buckets[position][0], snapshot.min), snapshot.max)
+        return results
+    
+    def buckets(self) -> List[tuple]:
+        """
+        Cumulative bucket counts for export.
+        
+        Returns:
+            Ascending (upper_bound, cumulative_count) pairs
+        """
+        snapshot = self._snapshot()
+        bounds = [(-self._gamma ** (i - 1), snapshot.negative[i])
+                  for i in sorted(snapshot.negative, reverse=True)]
+        if snapshot.zero:
+            bounds.append((0.0, snapshot.zero))
+        bounds.extend((self._gamma ** i, snapshot.positive[i])
+                      for i in sorted(snapshot.positive))
+        
+        cumulative = 0
+        result = []
+        for bound, count in bounds:
+            cumulative += count
+            result.append((bound, cumulative))
+        return result
+    
+    def summary(self) -> MetricSummary:
+        """Summary statistics with sketch-estimated percentiles."""
+        snapshot = self._snapshot()
+        if snapshot.count == 0:
+            return MetricSummary()
+        
+        p50, p95, p99 = self._quantiles(snapshot, [0.5, 0.95, 0.99])
+        return MetricSummary(
+            count=snapshot.count,
+            sum=snapshot.sum,
+            min=snapshot.min,
+            max=snapshot.max,
+            avg=snapshot.sum / snapshot.count,
+            p50=p50,
+            p95=p95,
+            p99=p99
+        )
+    
+    def clear(self) -> None:
+        """Remove all recorded values."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.positive.clear()
+                shard.negative.clear()
+                shard.zero = 0
+                shard.count = 0
+                shard.sum = 0.0
+                shard.min = float('inf')
+                shard.max = float('-inf')
+
+
 class Metric:
     """
     Base metric class for collecting and aggregating performance data.
@@ -75,6 +312,14 @@ class Metric:
         self._values = deque(maxlen=max_samples)
         self._lock = threading.Lock()
         
+        # Distributions are summarized from a sketch over all recorded
+        # values; the deque only keeps recent samples for inspection
+        self._histogram: Optional[StreamingHistogram] = (
+            StreamingHistogram()
+            if metric_type in (MetricType.HISTOGRAM, MetricType.TIMER)
+            else None
+        )
+        
         # Cached summary (invalidated on new values)
         self._cached_summary: Optional[MetricSummary] = None
         self._summary_dirty = True
@@ -87,6 +332,14 @@ class Metric:
             value: Metric value to record
             tags: Optional tags for the metric
         """
+        if self._histogram is not None:
+            # The sketch stripes its own locking and deque appends are
+            # atomic, so distributions skip the metric-wide lock
+            self._histogram.record(value)
+            self._values.append(MetricValue(value=value, tags=tags or {}))
+            self._summary_dirty = True
+            return
+        
         with self._lock:
             metric_value = MetricValue(
                 value=value,
@@ -150,13 +403,17 @@ class Metric:
         """
         with self._lock:
             if self._summary_dirty or force_refresh or self._cached_summary is None:
-                self._cached_summary = self._calculate_summary()
+                # Clear the flag first so a concurrent record re-dirties it
                 self._summary_dirty = False
+                self._cached_summary = self._calculate_summary()
             
             return self._cached_summary
     
     def _calculate_summary(self) -> MetricSummary:
         """Calculate summary statistics from current values."""
+        if self._histogram is not None:
+            return self._histogram.summary()
+        
         if not self._values:
             return MetricSummary()
         
@@ -199,6 +456,11 @@ class Metric:
         return (sorted_values[lower_index] * (1 - weight) + 
                 sorted_values[upper_index] * weight)
     
+    @property
+    def histogram(self) -> Optional[StreamingHistogram]:
+        """Distribution sketch for HISTOGRAM and TIMER metrics."""
+        return self._histogram
+    
     def get_recent_values(self, count: int = 100) -> List[MetricValue]:
         """Get recent metric values."""
         with self._lock:
@@ -208,6 +470,8 @@ class Metric:
         """Clear all metric values."""
         with self._lock:
             self._values.clear()
+            if self._histogram is not None:
+                self._histogram.clear()
             self._cached_summary = None
             self._summary_dirty = True
 
@@ -321,6 +585,10 @@ class MetricsCollector:
         """Get metric by name."""
         return self._metrics.get(name)
     
+    def get_metrics(self) -> Dict[str, Metric]:
+        """Get all registered metrics by name."""
+        return dict(self._metrics)
+    
     def counter(self, name: str, description: str = "") -> Metric:
         """Create or get a counter metric."""
         return self.create_metric(name, MetricType.COUNTER, description)
@@ -475,7 +743,7 @@ class MetricsCollector:
                     self.set_gauge("system.network_io_sent_mb", net_io.bytes_sent / 1024 / 1024)
             except Exception:
                 pass
-            
+        
         except Exception as e:
             logger.warning(f"Failed to collect system metrics: {e}")
     
@@ -0,0 +1,366 @@
+"""
+OpenMetrics Exposition
+
+Optional HTTP endpoint serving RedditDL metrics in the OpenMetrics text
+format so external schedulers can scrape throughput and latency of
+long-running archival jobs. Uses only the standard library and is
+disabled unless a metrics port is configured.
+"""
+
+import logging
+import math
+import re
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .metrics import MetricType, MetricsCollector, get_metrics_collector
+
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+METRIC_PREFIX = "redditdl"
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_:]")
+
+
+def _metric_name(name: str) -> str:
+    """Convert a dotted metric name into a valid OpenMetrics name."""
+    sanitized = _INVALID_NAME_CHARS.sub("_", name)
+    return f"{METRIC_PREFIX}_{sanitized}"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value or HELP text."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value, including the special float values."""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+class _MetricFamily:
+    """Samples of one metric family, kept together as the format requires."""
+    
+    def __init__(self, name: str, metric_type: str, help_text: str = ""):
+        self.name = name
+        self.type = metric_type
+        self.help = help_text
+        self.samples: List[Tuple[str, Dict[str, str], float]] = []
+    
+    def add(self, value: float, labels: Optional[Dict[str, str]] = None, suffix: str = "") -> None:
+        self.samples.append((self.name + suffix, labels or {}, value))
+    
+    def render(self) -> List[str]:
+        lines = [f"# TYPE {self.name} {self.type}"]
+        if self.help:
+            lines.append(f"# HELP {self.name} {_escape(self.help)}")
+        for sample_name, labels, value in self.samples:
+            if labels:
+                label_text = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+                lines.append(f"{sample_name}{{{label_text}}} {_format_value(value)}")
+            else:
+                lines.append(f"{sample_name} {_format_value(value)}")
+        return lines
+
+
+class OpenMetricsExporter:
+    """
+    Renders collector metrics, worker pool metrics, rate limiter statistics
+    and cache hit rates as an OpenMetrics text exposition.
+
+    Sources default to the process-wide instances and are resolved on each
+    render, so the exporter can be created before any pools or caches exist.
+    """
+    
+    def __init__(self,
+                 collector: Optional[MetricsCollector] = None,
+                 pool_manager: Optional[Any] = None,
+                 cache_managers: Optional[Dict[str, Any]] = None,
+                 include_rate_limits: bool = True):
+        """
+        Initialize exporter.
+
+        Args:
+            collector: Metrics collector (global collector if None)
+            pool_manager: WorkerPoolManager (global manager if None)
+            cache_managers: Named CacheManagers (global cache as "default" if None)
+            include_rate_limits: Export global rate limiter statistics
+        """
+        self.collector = collector
+        self.pool_manager = pool_manager
+        self.cache_managers = cache_managers
+        self.include_rate_limits = include_rate_limits
+    
+    def render(self) -> str:
+        """
+        Render all metrics.
+
+        Returns:
+            OpenMetrics text exposition terminated by "# EOF"
+        """
+        families: List[_MetricFamily] = []
+        for collect in (self._collect_metrics, self._collect_pools,
+                        self._collect_rate_limits, self._collect_caches):
+            try:
+                families.extend(collect())
+            except Exception as e:
+                # One failing source must not break the whole scrape
+                logger.warning(f"Failed to collect metrics in {collect.__name__}: {e}")
+        
+        lines: List[str] = []
+        seen = set()
+        for family in families:
+            if family.name in seen:
+                logger.warning(f"Skipping duplicate metric family {family.name}")
+                continue
+            seen.add(family.name)
+            lines.extend(family.render())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+    
+    def _collect_metrics(self) -> List[_MetricFamily]:
+        """Collector counters, gauges, histograms and timers."""
+        collector = self.collector or get_metrics_collector()
+        families = []
+        
+        for name, metric in sorted(collector.get_metrics().items()):
+            family_name = _metric_name(name)
+            
+            if metric.type == MetricType.COUNTER:
+                if family_name.endswith("_total"):
+                    family_name = family_name[:-len("_total")]
+                recent = metric.get_recent_values(1)
+                family = _MetricFamily(family_name, "counter", metric.description)
+                family.add(recent[-1].value if recent else 0.0, suffix="_total")
+                families.append(family)
+            
+            elif metric.type == MetricType.GAUGE:
+                recent = metric.get_recent_values(1)
+                if not recent:
+                    continue
+                family = _MetricFamily(family_name, "gauge", metric.description)
+                family.add(recent[-1].value)
+                families.append(family)
+            
+            else:
+                histogram = metric.histogram
+                if histogram is None:
+                    continue
+                family = _MetricFamily(family_name, "histogram", metric.description)
+                buckets = histogram.buckets()
+                for bound, cumulative in buckets:
+                    family.add(cumulative, {"le": _format_value(bound)}, "_bucket")
+                total = buckets[-1][1] if buckets else 0
+                family.add(total, {"le": "+Inf"}, "_bucket")
+                family.add(total, suffix="_count")
+                # OpenMetrics only allows _sum for non-negative observations
+                summary = metric.get_summary()
+                if summary.count == 0 or summary.min >= 0:
+                    family.add(summary.sum, suffix="_sum")
+                families.append(family)
+        
+        return families
+    
+    def _collect_pools(self) -> List[_MetricFamily]:
+        """Worker pool metrics from WorkerPoolManager.get_all_metrics."""
+        pool_manager = self.pool_manager
+        if pool_manager is None:
+            from redditdl.core.concurrency.pools import get_pool_manager
+            pool_manager = get_pool_manager()
+        
+        all_metrics = pool_manager.get_all_metrics()
+        if not all_metrics:
+            return []
+        
+        fields = [
+            ("active_workers", "gauge", "Workers currently running tasks"),
+            ("queued_tasks", "gauge", "Tasks waiting for a worker"),
+            ("completed_tasks", "counter", "Tasks completed"),
+            ("failed_tasks", "counter", "Tasks that raised"),
+            ("average_task_time", "gauge", "Average task duration in seconds"),
+            ("cpu_usage", "gauge", "CPU usage percentage seen by the pool"),
+            ("memory_usage", "gauge", "Memory usage percentage seen by the pool"),
+        ]
+        families = []
+        for field_name, metric_type, help_text in fields:
+            family = _MetricFamily(f"{METRIC_PREFIX}_pool_{field_name}", metric_type, help_text)
+            for pool_name, metrics in sorted(all_metrics.items()):
+                family.add(getattr(metrics, field_name),
+                           {"pool": pool_name},
+                           "_total" if metric_type == "counter" else "")
+            families.append(family)
+        return families
+    
+    def _collect_rate_limits(self) -> List[_MetricFamily]:
+        """Rate limiter statistics from get_rate_limit_stats."""
+        if not self.include_rate_limits:
+            return []
+        
+        from redditdl.core.concurrency.limiters import get_rate_limit_stats
+        all_stats = get_rate_limit_stats()
+        
+        fields = [
+            ("total_requests", "requests", "counter", "Requests admitted by the limiter"),
+            ("violations", "violations", "counter", "Rate limit violations"),
+            ("total_wait_time", "wait_seconds", "counter", "Time spent waiting for tokens"),
+            ("current_tokens", "tokens", "gauge", "Tokens currently available"),
+            ("is_in_backoff", "in_backoff", "gauge", "Whether the limiter is backing off"),
+        ]
+        families = []
+        for key, name, metric_type, help_text in fields:
+            family = _MetricFamily(f"{METRIC_PREFIX}_rate_limit_{name}", metric_type, help_text)
+            for limiter_name, stats in sorted(all_stats.items()):
+                if key in stats:
+                    family.add(float(stats[key]),
+                               {"limiter": limiter_name},
+                               "_total" if metric_type == "counter" else "")
+            families.append(family)
+        return families
+    
+    def _collect_caches(self) -> List[_MetricFamily]:
+        """Hit, miss and eviction counts plus hit rate per cache."""
+        caches = self.cache_managers
+        if caches is None:
+            from redditdl.core.cache.manager import get_cache_manager
+            caches = {"default": get_cache_manager()}
+        
+        hits = _MetricFamily(f"{METRIC_PREFIX}_cache_manager_hits", "counter", "Cache hits")
+        misses = _MetricFamily(f"{METRIC_PREFIX}_cache_manager_misses", "counter", "Cache misses")
+        evictions = _MetricFamily(f"{METRIC_PREFIX}_cache_manager_evictions", "counter", "Cache evictions")
+        hit_rate = _MetricFamily(f"{METRIC_PREFIX}_cache_manager_hit_ratio", "gauge", "Cache hit ratio")
+        
+        for cache_name, cache in sorted(caches.items()):
+            labels = {"cache": cache_name}
+            stats = cache.stats
+            hits.add(stats.hits, labels, "_total")
+            misses.add(stats.misses, labels, "_total")
+            evictions.add(stats.evictions, labels, "_total")
+            hit_rate.add(stats.hit_rate, labels)
+        
+        return [hits, misses, evictions, hit_rate]
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    """Serves the exposition on /metrics."""
+    
+    exporter: OpenMetricsExporter = None
+    
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] not in ("/metrics", "/metrics/"):
+            self.send_error(404, "Only /metrics is served")
+            return
+        
+        try:
+            body = self.exporter.render().encode("utf-8")
+        except Exception as e:
+            logger.error(f"Failed to render metrics: {e}")
+            self.send_error(500, "Failed to render metrics")
+            return
+        
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"Metrics endpoint: {format % args}")
+
+
+class MetricsHTTPServer:
+    """
+    Background HTTP server exposing metrics for scraping.
+
+    Binds to localhost by default; port 0 picks a free port, available
+    from the port attribute after start().
+    """
+    
+    def __init__(self,
+                 exporter: Optional[OpenMetricsExporter] = None,
+                 host: str = "127.0.0.1",
+                 port: int = 9464):
+        """
+        Initialize server.
+
+        Args:
+            exporter: Exporter to serve (default sources if None)
+            host: Interface to bind
+            port: Port to bind (0 for any free port)
+        """
+        self.exporter = exporter or OpenMetricsExporter()
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def url(self) -> str:
+        """URL of the metrics endpoint."""
+        return f"http://{self.host}:{self.port}/metrics"
+    
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+    
+    def start(self) -> None:
+        """Start serving in a daemon thread."""
+        if self._server is not None:
+            return
+        
+        handler = type("MetricsRequestHandler", (_MetricsRequestHandler,),
+                       {"exporter": self.exporter})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name="metrics-http", daemon=True)
+        self._thread.start()
+        logger.info(f"Serving metrics at {self.url}")
+    
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._server is None:
+            return
+        
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join(timeout=5.0)
+        self._server = None
+        self._thread = None
+        logger.info("Stopped metrics endpoint")
+
+
+@contextmanager
+def metrics_endpoint(port: Optional[int], host: str = "127.0.0.1") -> Iterator[Optional[MetricsHTTPServer]]:
+    """
+    Serve metrics for the duration of a block when a port is configured.
+
+    Args:
+        port: Port to serve on, or None to leave the endpoint disabled
+        host: Interface to bind
+
+    Yields:
+        The running server, or None when disabled
+    """
+    if port is None:
+        yield None
+        return
+    
+    server = MetricsHTTPServer(host=host, port=port)
+    server.start()
+    try:
+        yield server
+    finally:
+        server.stop()
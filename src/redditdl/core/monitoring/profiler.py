@@ -9,11 +9,15 @@ import asyncio
 import cProfile
 import io
 import logging
+import os
 import pstats
+import signal
+import sys
 import time
 import tracemalloc
 from typing import Dict, List, Any, Optional, Callable, TypeVar
 from dataclasses import dataclass, field
+from collections import Counter, defaultdict
 from contextlib import contextmanager
 from pathlib import Path
 import psutil
@@ -51,6 +55,292 @@ class BottleneckInfo:
     percentage_of_total: float
 
 
+# Frames currently inside a sampling_scope, mapped to the labels entered
+# there. Samplers look frames up while walking a stack, so attribution
+# follows the coroutine actually running rather than the thread.
+_scope_frames: Dict[Any, List[Dict[str, str]]] = {}
+
+# Label keys rendered first in collapsed stacks, in this order
+SCOPE_LABEL_ORDER = ('stage', 'handler')
+
+# (file name, function) pairs where idle threads park
+_IDLE_FRAMES = {
+    ('threading.py', 'wait'),
+    ('threading.py', '_wait_for_tstate_lock'),
+    ('selectors.py', 'select'),
+    ('queue.py', 'get'),
+    ('thread.py', '_worker'),
+}
+
+
+class _SamplingScope:
+    """Registers the calling frame with attribution labels."""
+    
+    __slots__ = ('labels', 'frame')
+    
+    def __init__(self, labels: Dict[str, str]):
+        self.labels = labels
+        self.frame = None
+    
+    def __enter__(self) -> '_SamplingScope':
+        self.frame = sys._getframe(1)
+        _scope_frames.setdefault(self.frame, []).append(self.labels)
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        scopes = _scope_frames.get(self.frame)
+        if scopes is not None:
+            try:
+                scopes.remove(self.labels)
+            except ValueError:
+                pass
+            if not scopes:
+                _scope_frames.pop(self.frame, None)
+        self.frame = None
+
+
+def sampling_scope(**labels: str) -> _SamplingScope:
+    """
+    Attribute samples taken inside a block to labels such as a pipeline
+    stage or content handler.
+    
+    Cheap enough to leave in hot paths: entering registers the calling
+    frame in a dict, and no work happens per sample unless a
+    SamplingProfiler is running.
+    
+    Args:
+        **labels: Attribution labels, e.g. stage="processing"
+    """
+    return _SamplingScope({key: str(value) for key, value in labels.items()})
+
+
+class SamplingProfiler:
+    """
+    Statistical stack-sampling profiler for production runs.
+    
+    Instead of tracing every call like cProfile, it snapshots stacks at a
+    fixed rate (100 Hz by default), so overhead stays small and constant.
+    
+    - "signal" mode uses a SIGPROF interval timer. It samples the main
+      thread, where the asyncio pipeline runs, whenever it is using CPU.
+      This mode is Unix only and must be started from the main thread.
+    - "thread" mode samples every thread from a background thread via
+      sys._current_frames(). The sampler needs the GIL to take a sample,
+      so samples cluster where threads release it, such as I/O waits.
+      This mode suits thread-pool work better than asyncio steps.
+    - "auto" uses signal mode when possible, otherwise thread mode.
+    
+    Samples are attributed to the labels of enclosing sampling_scope
+    blocks. They can be exported as collapsed stacks for flamegraph tools.
+    """
+    
+    def __init__(self, interval: float = 0.01, mode: str = "auto",
+                 max_depth: int = 128, include_idle: bool = False):
+        """
+        Initialize sampling profiler.
+        
+        Args:
+            interval: Seconds between samples (0.01 = 100 Hz)
+            mode: "auto", "signal" or "thread"
+            max_depth: Maximum frames recorded per sample
+            include_idle: Keep samples of threads parked in stdlib waits
+        """
+        signal_available = (
+            hasattr(signal, "setitimer")
+            and threading.current_thread() is threading.main_thread()
+        )
+        if mode == "auto":
+            mode = "signal" if signal_available else "thread"
+        if mode not in ("thread", "signal"):
+            raise ValueError(f"Unknown sampling mode: {mode}")
+        if mode == "signal" and not signal_available:
+            raise ValueError("Signal sampling requires setitimer and the main thread")
+        
+        self.interval = interval
+        self.mode = mode
+        self.max_depth = max_depth
+        self.include_idle = include_idle
+        
+        self._stacks: Counter = Counter()
+        self._attribution: Dict[str, Counter] = defaultdict(Counter)
+        self._sample_count = 0
+        self._code_names: Dict[Any, str] = {}
+        # Re-entrant: in signal mode samples are recorded on the main
+        # thread, possibly while it is reading results under the lock
+        self._lock = threading.RLock()
+        
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._previous_handler = None
+        self._started_at: Optional[float] = None
+        self.duration = 0.0
+    
+    @property
+    def running(self) -> bool:
+        return self._started_at is not None
+    
+    @property
+    def sample_count(self) -> int:
+        return self._sample_count
+    
+    def start(self) -> None:
+        """Start sampling."""
+        if self.running:
+            return
+        
+        self._started_at = time.perf_counter()
+        if self.mode == "signal":
+            self._previous_handler = signal.signal(signal.SIGPROF, self._on_signal)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        else:
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+            self._thread.start()
+        
+        logger.info(f"Started {self.mode} sampling profiler at {1 / self.interval:.0f} Hz")
+    
+    def stop(self) -> None:
+        """Stop sampling; collected samples are kept."""
+        if not self.running:
+            return
+        
+        if self.mode == "signal":
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        else:
+            self._stop_event.set()
+            if self._thread:
+                self._thread.join(timeout=5.0)
+            self._thread = None
+        
+        self.duration += time.perf_counter() - self._started_at
+        self._started_at = None
+        logger.info(f"Stopped sampling profiler after {self._sample_count} samples")
+    
+    def __enter__(self) -> 'SamplingProfiler':
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+    
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            try:
+                for thread_id, frame in sys._current_frames().items():
+                    if thread_id != own_id:
+                        self._record(frame)
+            except Exception as e:
+                logger.debug(f"Sampling failed: {e}")
+    
+    def _on_signal(self, signum: int, frame: Any) -> None:
+        if frame is not None:
+            self._record(frame)
+    
+    def _frame_name(self, frame: Any) -> str:
+        code = frame.f_code
+        name = self._code_names.get(code)
+        if name is None:
+            module = frame.f_globals.get('__name__', os.path.basename(code.co_filename))
+            qualname = getattr(code, 'co_qualname', code.co_name)
+            name = f"{module}:{qualname}".replace(';', ':').replace(' ', '_')
+            self._code_names[code] = name
+        return name
+    
+    def _record(self, frame: Any) -> None:
+        """Walk one stack, innermost frame first, and count it."""
+        if not self.include_idle:
+            code = frame.f_code
+            if (os.path.basename(code.co_filename), code.co_name) in _IDLE_FRAMES:
+                return
+        
+        names = []
+        labels: Dict[str, str] = {}
+        depth = 0
+        while frame is not None and depth < self.max_depth:
+            scopes = _scope_frames.get(frame)
+            if scopes:
+                for scope_labels in reversed(scopes):
+                    for key, value in scope_labels.items():
+                        labels.setdefault(key, value)
+            names.append(self._frame_name(frame))
+            frame = frame.f_back
+            depth += 1
+        names.reverse()
+        
+        ordered = [key for key in SCOPE_LABEL_ORDER if key in labels]
+        ordered.extend(sorted(key for key in labels if key not in SCOPE_LABEL_ORDER))
+        stack = tuple(f"{key}={labels[key]}" for key in ordered) + tuple(names)
+        
+        with self._lock:
+            self._stacks[stack] += 1
+            self._sample_count += 1
+            for key in ordered:
+                self._attribution[key][labels[key]] += 1
+    
+    def get_attribution(self) -> Dict[str, Dict[str, int]]:
+        """
+        Sample counts per label value.
+        
+        Returns:
+            Mapping of label key (e.g. "stage") to {value: samples}
+        """
+        with self._lock:
+            return {key: dict(counts) for key, counts in self._attribution.items()}
+    
+    def collapsed_stacks(self) -> List[str]:
+        """
+        Samples in collapsed-stack format ("frame;frame;frame count").
+        
+        Attribution labels appear as the outermost frames, so flamegraphs
+        group by stage and handler first.
+        """
+        with self._lock:
+            items = sorted(self._stacks.items())
+        return [f"{';'.join(stack)} {count}" for stack, count in items]
+    
+    def export_collapsed_stacks(self, output_file: Path) -> Path:
+        """
+        Write collapsed stacks for flamegraph.pl, speedscope or inferno.
+        
+        Args:
+            output_file: Output file path
+            
+        Returns:
+            Path written
+        """
+        output_file = Path(output_file)
+        lines = self.collapsed_stacks()
+        with open(output_file, 'w') as f:
+            f.write("\n".join(lines))
+            if lines:
+                f.write("\n")
+        
+        logger.info(f"Exported {self._sample_count} stack samples to {output_file}")
+        return output_file
+    
+    def get_summary(self) -> Dict[str, Any]:
+        """Sampling statistics for reports."""
+        return {
+            "mode": self.mode,
+            "interval": self.interval,
+            "samples": self._sample_count,
+            "duration": self.duration + (
+                time.perf_counter() - self._started_at if self._started_at else 0.0
+            ),
+            "attribution": self.get_attribution()
+        }
+    
+    def clear(self) -> None:
+        """Discard collected samples."""
+        with self._lock:
+            self._stacks.clear()
+            self._attribution.clear()
+            self._sample_count = 0
+        self.duration = 0.0
+
+
 class ResourceProfiler:
     """
     Advanced resource profiler for performance analysis.
@@ -71,6 +361,9 @@ class ResourceProfiler:
         # Memory tracking state
         self._memory_tracking = False
         self._memory_snapshots: Dict[str, Any] = {}
+        
+        # Statistical sampling state
+        self._sampler: Optional[SamplingProfiler] = None
     
     def profile_function(self, name: Optional[str] = None):
         """
@@ -196,6 +489,35 @@ class ResourceProfiler:
             self._memory_tracking = False
             logger.info("Stopped memory tracking")
     
+    def start_sampling(self, interval: float = 0.01, mode: str = "auto") -> SamplingProfiler:
+        """
+        Start low-overhead statistical sampling.
+        
+        Args:
+            interval: Seconds between samples (0.01 = 100 Hz)
+            mode: "auto", "signal" (main thread CPU time) or "thread" (all threads)
+            
+        Returns:
+            The running sampler
+        """
+        with self._lock:
+            if self._sampler is None or not self._sampler.running:
+                self._sampler = SamplingProfiler(interval=interval, mode=mode)
+                self._sampler.start()
+            return self._sampler
+    
+    def stop_sampling(self) -> Optional[SamplingProfiler]:
+        """Stop statistical sampling, keeping samples for export."""
+        with self._lock:
+            if self._sampler is not None:
+                self._sampler.stop()
+            return self._sampler
+    
+    @property
+    def sampler(self) -> Optional[SamplingProfiler]:
+        """Most recent sampling profiler, if sampling was started."""
+        return self._sampler
+    
     def _get_memory_usage(self) -> float:
         """Get current memory usage in MB."""
         try:
@@ -402,6 +724,9 @@ class ResourceProfiler:
         """
         Export detailed profile report to file.
         
+        When sampling has collected stacks, they are also written in
+        collapsed-stack format next to the report (same name, .collapsed).
+        
         Args:
             output_file: Output file path
             name: Optional specific profile name (exports all if None)
@@ -461,6 +786,16 @@ class ResourceProfiler:
             
             report_data["profiles"][profile_name] = profile_data
         
+        # Add statistical sampling results
+        sampler = self._sampler
+        if sampler is not None and sampler.sample_count:
+            collapsed_file = Path(output_file).with_suffix('.collapsed')
+            sampler.export_collapsed_stacks(collapsed_file)
+            report_data["sampling"] = {
+                **sampler.get_summary(),
+                "collapsed_stacks_file": str(collapsed_file)
+            }
+        
         # Write report
         with open(output_file, 'w') as f:
             json.dump(report_data, f, indent=2)
@@ -480,6 +815,8 @@ class ResourceProfiler:
                 logger.info(f"Cleared profiles for '{name}'")
             else:
                 self._profiles.clear()
+                if self._sampler is not None:
+                    self._sampler.clear()
                 logger.info("Cleared all profiles")
 
 
@@ -499,4 +836,29 @@ def profile_function(name: Optional[str] = None):
 
 def profile_context(name: str):
     """Convenience context manager for profiling code blocks."""
-    return _global_profiler.profile_context(name)
\ No newline at end of file
+    return _global_profiler.profile_context(name)
+
+
+@contextmanager
+def sampling_session(output_file: Optional[Path], interval: float = 0.01):
+    """
+    Sample the global profiler for the duration of a block when an output
+    file is configured, then write the report and collapsed stacks.
+    
+    Args:
+        output_file: Profile report path, or None to leave sampling off
+        interval: Seconds between samples
+    """
+    if output_file is None:
+        yield None
+        return
+    
+    sampler = _global_profiler.start_sampling(interval=interval)
+    try:
+        yield sampler
+    finally:
+        _global_profiler.stop_sampling()
+        try:
+            _global_profiler.export_profile_report(Path(output_file))
+        except Exception as e:
+            logger.warning(f"Failed to export sampling profile: {e}")
\ No newline at end of file
@@ -0,0 +1,576 @@
+"""
+Pipeline Tracing
+
+Span trees showing where each post spends its time as it moves through
+pipeline stages and content handlers. Every sampled post gets its own
+trace, rooted at a "post" span, with child spans for filtering, handler
+dispatch, downloads, template rendering and metadata embedding. Traces
+are exported as OTLP JSON and summarized into ExecutionMetrics.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Union
+from urllib.parse import urlparse
+
+from redditdl.core.monitoring.metrics import StreamingHistogram
+
+
+logger = logging.getLogger(__name__)
+
+# OTLP span kinds and status codes
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# Name of the span at the root of every per-post trace
+POST_SPAN_NAME = "post"
+
+_current_span: ContextVar[Optional[Any]] = ContextVar('redditdl_current_span', default=None)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """Encode an attribute value as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # OTLP JSON carries 64-bit integers as strings
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+class Span:
+    """
+    A timed operation within a trace.
+
+    Creating a span makes it the current span for the running task or
+    thread, so spans opened underneath become its children. Ending it
+    restores the previous current span.
+    """
+    
+    __slots__ = (
+        'tracer', 'name', 'trace_id', 'span_id', 'parent_span_id', 'kind',
+        'start_time_ns', 'end_time_ns', 'attributes', 'status_code',
+        'status_message', 'root', 'last_child_end_ns', '_token'
+    )
+    
+    is_recording = True
+    
+    def __init__(self, tracer: 'Tracer', name: str, trace_id: str,
+                 parent: Optional['Span'] = None, root: Optional['Span'] = None,
+                 kind: int = SPAN_KIND_INTERNAL, attributes: Optional[Dict[str, Any]] = None,
+                 start_time_ns: Optional[int] = None, activate: bool = True):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent.span_id if parent is not None else ""
+        self.kind = kind
+        self.start_time_ns = start_time_ns if start_time_ns is not None else time.time_ns()
+        self.end_time_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = {}
+        self.status_code = STATUS_UNSET
+        self.status_message = ""
+        self.root = root
+        self.last_child_end_ns = self.start_time_ns
+        self._token = _current_span.set(self) if activate else None
+        if attributes:
+            self.set_attributes(**attributes)
+    
+    @property
+    def duration(self) -> float:
+        """Span duration in seconds (up to now while still open)."""
+        end = self.end_time_ns if self.end_time_ns is not None else time.time_ns()
+        return (end - self.start_time_ns) / 1e9
+    
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute, ignoring None values."""
+        if value is not None:
+            self.attributes[key] = value
+    
+    def set_attributes(self, **attributes: Any) -> None:
+        """Set several attributes at once."""
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+    
+    def record_error(self, error: BaseException) -> None:
+        """Mark the span as failed by an exception."""
+        self.status_code = STATUS_ERROR
+        self.status_message = str(error)
+        self.attributes["exception.type"] = type(error).__name__
+    
+    def end(self, end_time_ns: Optional[int] = None) -> None:
+        """End the span and hand it to the tracer. Ending twice is a no-op."""
+        if self.end_time_ns is not None:
+            return
+        self.end_time_ns = end_time_ns if end_time_ns is not None else time.time_ns()
+        
+        if self._token is not None:
+            try:
+                _current_span.reset(self._token)
+            except ValueError:
+                # Ended from a different context than it was started in
+                pass
+            self._token = None
+        
+        root = self.root
+        if root is not None and root.last_child_end_ns < self.end_time_ns:
+            root.last_child_end_ns = self.end_time_ns
+        
+        self.tracer._finish(self)
+    
+    def to_otlp(self) -> Dict[str, Any]:
+        """Encode the span as an OTLP JSON span."""
+        status: Dict[str, Any] = {"code": self.status_code}
+        if self.status_message:
+            status["message"] = self.status_message
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_time_ns),
+            "endTimeUnixNano": str(self.end_time_ns if self.end_time_ns is not None else self.start_time_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": status
+        }
+    
+    def __enter__(self) -> 'Span':
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_val is not None:
+            self.record_error(exc_val)
+        self.end()
+
+
+class _NoopSpan:
+    """
+    Stand-in for spans that are not sampled.
+
+    A suppressing instance becomes the current span, so work nested under
+    an unsampled post is not recorded against another trace.
+    """
+    
+    __slots__ = ('_token',)
+    
+    is_recording = False
+    attributes: Dict[str, Any] = {}
+    
+    def __init__(self, suppress: bool = False):
+        self._token = _current_span.set(self) if suppress else None
+    
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+    
+    def set_attributes(self, **attributes: Any) -> None:
+        pass
+    
+    def record_error(self, error: BaseException) -> None:
+        pass
+    
+    def end(self, end_time_ns: Optional[int] = None) -> None:
+        if self._token is not None:
+            try:
+                _current_span.reset(self._token)
+            except ValueError:
+                pass
+            self._token = None
+    
+    def __enter__(self) -> '_NoopSpan':
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.end()
+
+
+NOOP_SPAN = _NoopSpan()
+
+SpanLike = Union[Span, _NoopSpan]
+
+
+class Tracer:
+    """
+    Records per-post span trees for sampled posts.
+
+    Sampling is decided per post from a hash of its ID, so a post is
+    either traced through every stage or not at all. With a sample rate
+    of 0 every entry point returns a shared no-op span.
+
+    Example:
+        tracer = Tracer(sample_rate=0.1)
+        with tracer.post_span(post.id, "handler.process", handler="media"):
+            with trace_span("download", host="i.redd.it") as span:
+                span.set_attribute("bytes", size)
+        tracer.export_otlp_json("trace.json")
+    """
+    
+    def __init__(self, sample_rate: float = 0.0, service_name: str = "redditdl",
+                 max_spans: int = 100000):
+        """
+        Initialize tracer.
+
+        Args:
+            sample_rate: Fraction of posts to trace, from 0.0 (off) to 1.0
+            service_name: service.name resource attribute in exports
+            max_spans: Finished spans kept in memory; later spans are dropped
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate}")
+        
+        self.sample_rate = sample_rate
+        self.service_name = service_name
+        self.max_spans = max_spans
+        self.dropped_spans = 0
+        
+        self._threshold = int(sample_rate * 0x100000000)
+        self._spans: List[Span] = []
+        self._post_roots: Dict[str, Span] = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether any post can be sampled."""
+        return self.sample_rate > 0.0
+    
+    def is_sampled(self, post_id: str) -> bool:
+        """Deterministic sampling decision for a post."""
+        if self.sample_rate >= 1.0:
+            return True
+        if self.sample_rate <= 0.0:
+            return False
+        return zlib.crc32(str(post_id).encode('utf-8')) < self._threshold
+    
+    def start_trace(self, name: str, **attributes: Any) -> SpanLike:
+        """
+        Start a new trace that is not tied to a post, such as a pipeline run.
+
+        The span becomes current until it is ended.
+        """
+        if not self.enabled:
+            return NOOP_SPAN
+        return Span(self, name, os.urandom(16).hex(), attributes=attributes)
+    
+    def span(self, name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any) -> SpanLike:
+        """
+        Start a child of the current span.
+
+        Returns a no-op span when there is no current recording span.
+        """
+        parent = _current_span.get()
+        if parent is None or not parent.is_recording:
+            return NOOP_SPAN
+        return Span(self, name, parent.trace_id, parent=parent,
+                    root=parent.root or parent, kind=kind, attributes=attributes)
+    
+    def post_span(self, post_id: str, name: str, kind: int = SPAN_KIND_INTERNAL,
+                  **attributes: Any) -> SpanLike:
+        """
+        Start a span in a post's trace, directly under its root span.
+
+        The enclosing pipeline stage, if any, is recorded as the
+        "pipeline.stage" attribute.
+        """
+        if not self.enabled:
+            return NOOP_SPAN
+        if not self.is_sampled(post_id):
+            return _NoopSpan(suppress=True)
+        
+        start_time_ns = time.time_ns()
+        root = self._get_post_root(str(post_id), start_time_ns)
+        return Span(self, name, root.trace_id, parent=root, root=root, kind=kind,
+                    attributes=self._with_stage(attributes), start_time_ns=start_time_ns)
+    
+    def record_post_span(self, post_id: str, name: str, start_time: float, end_time: float,
+                         **attributes: Any) -> None:
+        """
+        Record a finished span in a post's trace after the fact.
+
+        Used for work that happens before individual posts exist, such as
+        fetching the listing page a post arrived in.
+
+        Args:
+            post_id: Post the span belongs to
+            name: Span name
+            start_time: Start as a time.time() timestamp
+            end_time: End as a time.time() timestamp
+            **attributes: Span attributes
+        """
+        if not self.enabled or not self.is_sampled(post_id):
+            return
+        
+        start_time_ns = int(start_time * 1e9)
+        root = self._get_post_root(str(post_id), start_time_ns)
+        span = Span(self, name, root.trace_id, parent=root, root=root,
+                    attributes=self._with_stage(attributes),
+                    start_time_ns=start_time_ns, activate=False)
+        span.end(int(end_time * 1e9))
+    
+    def start_run(self) -> int:
+        """
+        Begin a pipeline run.
+
+        Returns:
+            Marker to pass to finish_run() to summarize only this run
+        """
+        with self._lock:
+            self._post_roots.clear()
+            return len(self._spans)
+    
+    def finish_run(self, marker: int = 0) -> Dict[str, Any]:
+        """
+        End the post traces opened during a run and summarize the run.
+
+        Args:
+            marker: Value returned by start_run()
+        """
+        with self._lock:
+            roots = list(self._post_roots.values())
+            self._post_roots.clear()
+        
+        for root in roots:
+            root.end(root.last_child_end_ns)
+        
+        return self.summary(since=marker)
+    
+    def get_spans(self) -> List[Span]:
+        """Finished spans, oldest first."""
+        with self._lock:
+            return list(self._spans)
+    
+    def summary(self, since: int = 0, top: int = 5) -> Dict[str, Any]:
+        """
+        Summarize finished spans.
+
+        Args:
+            since: Marker from start_run(); spans finished earlier are skipped
+            top: Number of slowest posts to report
+
+        Returns:
+            Dictionary with per-operation timings and the slowest posts
+        """
+        with self._lock:
+            spans = self._spans[since:]
+        
+        operations: Dict[str, StreamingHistogram] = {}
+        breakdowns: Dict[str, Dict[str, float]] = {}
+        roots = []
+        for span in spans:
+            duration = span.duration
+            histogram = operations.get(span.name)
+            if histogram is None:
+                histogram = operations[span.name] = StreamingHistogram()
+            histogram.record(duration)
+            
+            if span.name == POST_SPAN_NAME and not span.parent_span_id:
+                roots.append(span)
+            else:
+                breakdown = breakdowns.setdefault(span.trace_id, {})
+                breakdown[span.name] = breakdown.get(span.name, 0.0) + duration
+        
+        operation_summaries = {}
+        for name, histogram in sorted(operations.items()):
+            summary = histogram.summary()
+            operation_summaries[name] = {
+                'count': summary.count,
+                'total_time': summary.sum,
+                'mean_time': summary.avg,
+                'p95_time': summary.p95,
+                'max_time': summary.max
+            }
+        
+        roots.sort(key=lambda span: span.duration, reverse=True)
+        slowest_posts = [
+            {
+                'post_id': root.attributes.get('post_id'),
+                'trace_id': root.trace_id,
+                'duration': root.duration,
+                'breakdown': breakdowns.get(root.trace_id, {})
+            }
+            for root in roots[:top]
+        ]
+        
+        return {
+            'sample_rate': self.sample_rate,
+            'traced_posts': len(roots),
+            'span_count': len(spans),
+            'dropped_spans': self.dropped_spans,
+            'operations': operation_summaries,
+            'slowest_posts': slowest_posts
+        }
+    
+    def to_otlp(self) -> Dict[str, Any]:
+        """Encode finished spans as an OTLP ExportTraceServiceRequest."""
+        return {
+            "resourceSpans": [{
+                "resource": {
+                    "attributes": _otlp_attributes({"service.name": self.service_name})
+                },
+                "scopeSpans": [{
+                    "scope": {"name": "redditdl.pipeline"},
+                    "spans": [span.to_otlp() for span in self.get_spans()]
+                }]
+            }]
+        }
+    
+    def export_otlp_json(self, output_file: Union[str, Path]) -> int:
+        """
+        Write finished spans as an OTLP JSON file.
+
+        Args:
+            output_file: Path to write the JSON document to
+
+        Returns:
+            Number of spans written
+        """
+        document = self.to_otlp()
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(document, f)
+        
+        count = len(document["resourceSpans"][0]["scopeSpans"][0]["spans"])
+        logger.info(f"Exported {count} spans to {output_path}")
+        return count
+    
+    def clear(self) -> None:
+        """Discard all recorded spans."""
+        with self._lock:
+            self._spans.clear()
+            self._post_roots.clear()
+            self.dropped_spans = 0
+    
+    def _get_post_root(self, post_id: str, start_time_ns: int) -> Span:
+        root = self._post_roots.get(post_id)
+        if root is None:
+            with self._lock:
+                root = self._post_roots.get(post_id)
+                if root is None:
+                    root = Span(self, POST_SPAN_NAME, os.urandom(16).hex(),
+                                attributes={'post_id': post_id},
+                                start_time_ns=start_time_ns, activate=False)
+                    self._post_roots[post_id] = root
+        if start_time_ns < root.start_time_ns:
+            root.start_time_ns = start_time_ns
+        return root
+    
+    def _with_stage(self, attributes: Dict[str, Any]) -> Dict[str, Any]:
+        # Post spans live in their own trace; keep the pipeline stage they ran in
+        current = _current_span.get()
+        if current is not None and current.is_recording and 'pipeline.stage' not in attributes:
+            stage = current.attributes.get('pipeline.stage')
+            if stage is not None:
+                attributes['pipeline.stage'] = stage
+        return attributes
+    
+    def _finish(self, span: Span) -> None:
+        with self._lock:
+            if len(self._spans) >= self.max_spans:
+                self.dropped_spans += 1
+            else:
+                self._spans.append(span)
+
+
+def url_host(url: Optional[str]) -> Optional[str]:
+    """Host part of a URL for span attributes, or None."""
+    if not url:
+        return None
+    return urlparse(url).netloc or None
+
+
+def total_bytes(paths: List[Union[str, Path]]) -> int:
+    """Combined size of the files that exist among paths."""
+    size = 0
+    for path in paths:
+        try:
+            size += os.path.getsize(path)
+        except OSError:
+            pass
+    return size
+
+
+_global_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the global tracer (disabled unless configured)."""
+    return _global_tracer
+
+
+def set_tracer(tracer: Tracer) -> Tracer:
+    """
+    Replace the global tracer.
+
+    Returns:
+        The previous global tracer
+    """
+    global _global_tracer
+    previous = _global_tracer
+    _global_tracer = tracer
+    return previous
+
+
+def current_span() -> Optional[SpanLike]:
+    """The span current in this task or thread, if any."""
+    return _current_span.get()
+
+
+def trace_post(post_id: str, name: str, **attributes: Any) -> SpanLike:
+    """Start a span in a post's trace using the global tracer."""
+    return _global_tracer.post_span(post_id, name, **attributes)
+
+
+def trace_span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any) -> SpanLike:
+    """
+    Start a child of the current span.
+
+    Costs one context variable lookup when nothing is being traced, so it
+    can wrap hot operations such as downloads unconditionally.
+    """
+    parent = _current_span.get()
+    if parent is None or not parent.is_recording:
+        return NOOP_SPAN
+    return parent.tracer.span(name, kind=kind, **attributes)
+
+
+@contextmanager
+def tracing_session(output_file: Optional[Path], sample_rate: float = 1.0):
+    """
+    Install a sampling tracer for the duration of a block and write its
+    spans as OTLP JSON when an output file is configured.
+
+    Args:
+        output_file: OTLP JSON path, or None to only summarize
+        sample_rate: Fraction of posts to trace; 0 leaves tracing off
+    """
+    if sample_rate <= 0.0:
+        yield None
+        return
+    
+    tracer = Tracer(sample_rate=sample_rate)
+    previous = set_tracer(tracer)
+    try:
+        yield tracer
+    finally:
+        set_tracer(previous)
+        if output_file is not None:
+            try:
+                tracer.export_otlp_json(output_file)
+            except Exception as e:
+                logger.warning(f"Failed to export traces: {e}")
@@ -14,6 +14,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 from .interfaces import PipelineStage, PipelineContext, PipelineResult
+from redditdl.core.monitoring.profiler import sampling_scope
+from redditdl.core.monitoring.tracing import Tracer, get_tracer
 
 # Import event types for pipeline event emission
 try:
@@ -50,6 +52,7 @@ class ExecutionMetrics:
         total_posts_processed: Total number of posts processed
         start_time: Pipeline execution start time
         end_time: Pipeline execution end time
+        trace_summary: Span timings of sampled posts (empty when tracing is off)
     """
     total_stages: int = 0
     successful_stages: int = 0
@@ -59,6 +62,7 @@ class ExecutionMetrics:
     total_posts_processed: int = 0
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
+    trace_summary: Dict[str, Any] = field(default_factory=dict)
     
     def add_stage_result(self, stage_name: str, result: PipelineResult) -> None:
         """Add results from a stage execution."""
@@ -90,7 +94,8 @@ class PipelineExecutor:
     
     def __init__(self, stages: Optional[List[PipelineStage]] = None, 
                  error_handling: str = "continue",
-                 max_concurrent_stages: int = 1):
+                 max_concurrent_stages: int = 1,
+                 tracer: Optional[Tracer] = None):
         """
         Initialize the pipeline executor.
         
@@ -98,10 +103,12 @@ class PipelineExecutor:
             stages: Initial list of pipeline stages
             error_handling: Error handling strategy ("halt", "continue", "skip")
             max_concurrent_stages: Maximum number of stages to run concurrently
+            tracer: Tracer for stage and per-post spans (defaults to the global tracer)
         """
         self.stages: List[PipelineStage] = stages or []
         self.error_handling = error_handling
         self.max_concurrent_stages = max_concurrent_stages
+        self.tracer = tracer
         self.logger = logging.getLogger("pipeline.executor")
         
         # Execution state
@@ -214,6 +221,11 @@ class PipelineExecutor:
         self._execution_metrics = ExecutionMetrics()
         self._stage_results = []
         
+        tracer = self.tracer or get_tracer()
+        trace_marker = tracer.start_run()
+        pipeline_span = tracer.start_trace("pipeline.execute", stages=len(self.stages),
+                                           initial_posts=len(context.posts))
+        
         try:
             # Initialize metrics
             self._execution_metrics.start_time = datetime.now()
@@ -254,7 +266,10 @@ class PipelineExecutor:
                     await stage.pre_process(context)
                     
                     # Execute main stage processing
-                    result = await stage.process(context)
+                    with sampling_scope(stage=stage.name), \
+                            tracer.span(f"stage.{stage.name}", **{'pipeline.stage': stage.name}) as stage_span:
+                        result = await stage.process(context)
+                        stage_span.set_attributes(posts=result.processed_count, errors=result.error_count)
                     result.stage_name = stage.name
                     result.execution_time = time.time() - stage_start_time
                     
@@ -350,7 +365,9 @@ class PipelineExecutor:
                             self.logger.info(f"Attempting to retry stage '{stage.name}' after recovery")
                             try:
                                 # Execute stage again
-                                result = await stage.process(context)
+                                with sampling_scope(stage=stage.name), \
+                                        tracer.span(f"stage.{stage.name}", **{'pipeline.stage': stage.name}):
+                                    result = await stage.process(context)
                                 result.stage_name = stage.name
                                 result.execution_time = time.time() - stage_start_time
                                 
@@ -415,6 +432,12 @@ class PipelineExecutor:
             self._execution_metrics.total_execution_time = time.time() - pipeline_start_time
             self._execution_metrics.end_time = datetime.now()
             
+            # Close the run's traces and summarize where sampled posts spent their time
+            pipeline_span.set_attribute("posts", len(context.posts))
+            pipeline_span.end()
+            if tracer.enabled:
+                self._execution_metrics.trace_summary = tracer.finish_run(trace_marker)
+            
             # Run post-execution hooks
             await self._run_post_execution_hooks(context, self._execution_metrics)
             
@@ -428,6 +451,7 @@ class PipelineExecutor:
             return self._execution_metrics
             
         finally:
+            pipeline_span.end()
             self._is_running = False
     
     async def _handle_stage_error(self, stage: PipelineStage, result: PipelineResult, 
@@ -13,10 +13,12 @@ Key Components:
 - PluginManager: Central plugin management and lifecycle
 - Hook specifications: Interfaces for plugin types
 - Plugin discovery: Automatic loading and validation
+- PluginIndex: Cached discovery and scan results for unchanged files
 - Sandboxing: Safe execution environment
 """
 
 from .manager import PluginManager
+from .index import PluginIndex
 from .hooks import (
     ContentHandlerHooks,
     FilterHooks, 
@@ -26,6 +28,7 @@ from .hooks import (
 
 __all__ = [
     'PluginManager',
+    'PluginIndex',
     'ContentHandlerHooks',
     'FilterHooks',
     'ExporterHooks', 
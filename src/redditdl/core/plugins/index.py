@@ -0,0 +1,210 @@
+"""
+Plugin Index
+
+Persistent cache of per-file plugin discovery results. Extracting plugin
+info executes the plugin module and security scanning parses and walks
+its AST, so both are remembered per file and reused while the file is
+unchanged.
+
+Files are identified by path, mtime, size and SHA-256 of their content.
+A matching mtime and size is trusted without reading the file unless the
+entry was recorded within RACY_WINDOW_NS of the file's mtime, in which case
+a same-size edit could share the mtime and the content hash is checked.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from redditdl.core.cache.disk import is_plain_data
+
+
+INDEX_VERSION = 1
+
+# Filesystem timestamp granularity treated as ambiguous (FAT rounds to 2s)
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def _hash_file(path: Path) -> str:
+    """Hash a file's content with SHA-256."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PluginIndex:
+    """
+    Cache of discovery and scan results keyed by plugin file fingerprint.
+
+    Each file has one entry holding its fingerprint and a value per kind
+    (such as "info" or a security scan). Values must be plain JSON data.
+    Without an index path the cache lives only as long as the object.
+    """
+    
+    def __init__(self, index_path: Optional[Path] = None):
+        """
+        Initialize the index.
+
+        Args:
+            index_path: JSON file to load from and save to (in-memory if None)
+        """
+        self.logger = logging.getLogger("plugins.index")
+        self.index_path = Path(index_path) if index_path is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def fingerprint(self, plugin_file: Path) -> Optional[Dict[str, Any]]:
+        """
+        Fingerprint a plugin file.
+
+        Take the fingerprint before reading the file for the value to
+        store, so an edit made in between invalidates the entry.
+
+        Returns:
+            Fingerprint dict, or None if the file cannot be read
+        """
+        try:
+            stat = plugin_file.stat()
+            return {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'sha256': _hash_file(plugin_file),
+            }
+        except OSError:
+            return None
+    
+    def get(self, plugin_file: Path, kind: str) -> Optional[Any]:
+        """
+        Get a cached value for a file if the file is unchanged.
+
+        Args:
+            plugin_file: Plugin file path
+            kind: Value kind
+
+        Returns:
+            A copy of the cached value, or None on a miss
+        """
+        key = str(Path(plugin_file).resolve())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or kind not in entry['values'] or not self._is_current(key, entry):
+                self.misses += 1
+                return None
+            self.hits += 1
+            return copy.deepcopy(entry['values'][kind])
+    
+    def put(self, plugin_file: Path, kind: str, value: Any, fingerprint: Optional[Dict[str, Any]]) -> bool:
+        """
+        Cache a value for a file.
+
+        Args:
+            plugin_file: Plugin file path
+            kind: Value kind
+            value: Plain JSON data to cache
+            fingerprint: Result of fingerprint() taken before computing value
+
+        Returns:
+            True if the value was cached
+        """
+        if fingerprint is None or not is_plain_data(value):
+            return False
+        
+        key = str(Path(plugin_file).resolve())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry['sha256'] != fingerprint['sha256']:
+                entry = {**fingerprint, 'values': {}}
+                self._entries[key] = entry
+            else:
+                entry.update(fingerprint)
+            entry['recorded_ns'] = time.time_ns()
+            entry['values'][kind] = copy.deepcopy(value)
+            self._dirty = True
+        return True
+    
+    def save(self) -> None:
+        """Write the index if it changed, dropping entries for deleted files."""
+        if self.index_path is None:
+            return
+        
+        with self._lock:
+            for key in [key for key in self._entries if not os.path.exists(key)]:
+                del self._entries[key]
+                self._dirty = True
+            if not self._dirty:
+                return
+            data = json.dumps({'version': INDEX_VERSION, 'entries': self._entries}, separators=(',', ':'))
+            self._dirty = False
+        
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.index_path.parent, prefix='.plugin_index.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(temp_path, self.index_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            self.logger.warning(f"Failed to save plugin index {self.index_path}: {e}")
+    
+    def _is_current(self, key: str, entry: Dict[str, Any]) -> bool:
+        """Check an entry against the file on disk, refreshing its stat fields."""
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return False
+        
+        racy = stat.st_mtime_ns + RACY_WINDOW_NS >= entry['recorded_ns']
+        if stat.st_mtime_ns == entry['mtime_ns'] and stat.st_size == entry['size'] and not racy:
+            return True
+        
+        # Stat changed (or is ambiguous): fall back to the content hash
+        if stat.st_size != entry['size']:
+            del self._entries[key]
+            self._dirty = True
+            return False
+        try:
+            sha256 = _hash_file(Path(key))
+        except OSError:
+            return False
+        if sha256 != entry['sha256']:
+            del self._entries[key]
+            self._dirty = True
+            return False
+        
+        # Unchanged content: re-record so later lookups can trust the stat alone
+        entry['mtime_ns'] = stat.st_mtime_ns
+        entry['recorded_ns'] = time.time_ns()
+        self._dirty = True
+        return True
+    
+    def _load(self) -> None:
+        """Load entries from the index file, starting empty if it is missing or unreadable."""
+        if self.index_path is None or not self.index_path.exists():
+            return
+        
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION:
+                self._entries = data['entries']
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            self.logger.warning(f"Ignoring unreadable plugin index {self.index_path}: {e}")
@@ -5,8 +5,10 @@ Central management system for RedditDL plugins, providing discovery, loading,
 validation, lifecycle management, and sandboxing capabilities.
 """
 
+import ast
 import logging
 import sys
+import threading
 import importlib
 import importlib.util
 import inspect
@@ -21,6 +23,8 @@ from .hooks import (
     ContentHandlerHooks, FilterHooks, ExporterHooks, ScraperHooks,
     BaseContentHandler, BaseFilter, BaseExporter, BaseScraper
 )
+from .index import PluginIndex
+from redditdl.core.security.plugin_security import PluginSecurityScanner
 
 
 class PluginValidationError(Exception):
@@ -78,18 +82,40 @@ class PluginManager:
     - Lifecycle management (load, initialize, cleanup)
     - Conflict detection and resolution
     - Plugin enable/disable functionality
+    - Lazy loading of plugins that declare what they provide
+    
+    A plugin supports lazy loading by listing its components under
+    "provides" in __plugin_info__ or plugin.json::
+    
+        "provides": {
+            "content_handlers": [{"class": "ImgurHandler", "content_types": ["image"]}],
+            "filters": [{"class": "FlairFilter", "type": "flair"}],
+            "exporters": [{"class": "XmlExporter", "format": "xml", "aliases": ["x"]}],
+            "scrapers": [{"class": "ArchiveScraper", "sources": ["user"], "priority": 50}]
+        }
+    
+    Declared classes implement the application interfaces
+    (redditdl.content_handlers.base.BaseContentHandler, redditdl.filters.base.Filter,
+    redditdl.exporters.base.BaseExporter and redditdl.targets.base_scraper.BaseScraper)
+    and are registered with the matching registry as stubs.
     """
     
-    def __init__(self, plugin_dirs: Optional[List[str]] = None):
+    def __init__(self, plugin_dirs: Optional[List[str]] = None,
+                 index_path: Optional[Path] = None):
         """
         Initialize the plugin manager.
         
         Args:
             plugin_dirs: List of directories to search for plugins
+            index_path: File caching discovery and security scan results
+                between runs, normally AppConfig.get_plugin_index_path()
+                (in-memory if None)
         """
         self.logger = logging.getLogger("plugins.manager")
         self.plugin_dirs = plugin_dirs or []
         self.registry = PluginRegistry()
+        self.index = PluginIndex(index_path)
+        self.security_scanner = PluginSecurityScanner(index=self.index)
         
         # Create pluggy plugin manager
         self.pm = pluggy.PluginManager("redditdl")
@@ -102,6 +128,9 @@ class PluginManager:
         self._loaded_plugins: Dict[str, Any] = {}
         self._plugin_modules: Dict[str, Any] = {}
         self._initialization_order: List[str] = []
+        self._lazy_plugins: Dict[str, Dict[str, Any]] = {}
+        self._installed_stubs: Dict[str, Dict[str, List[str]]] = {}
+        self._load_lock = threading.RLock()
         
         # Security settings
         self._sandbox_enabled = True
@@ -129,7 +158,10 @@ class PluginManager:
         # Discover from entry points (if available)
         discovered.extend(self._discover_from_entry_points())
         
+        self.index.save()
+        
         self.logger.info(f"Discovered {len(discovered)} plugins")
+        self.logger.debug(f"Plugin index: {self.index.hits} hits, {self.index.misses} misses")
         return discovered
     
     def _discover_from_directory(self, plugin_dir: str) -> List[Dict[str, Any]]:
@@ -202,7 +234,19 @@ class PluginManager:
         return plugins
     
     def _extract_plugin_info(self, plugin_file: Path) -> Optional[Dict[str, Any]]:
-        """Extract plugin information from a Python file."""
+        """
+        Extract plugin information from a Python file.
+        
+        Executing the module to read __plugin_info__ is costly, so results
+        are cached in the plugin index until the file changes.
+        """
+        cached = self.index.get(plugin_file, 'info')
+        if cached is not None:
+            cached['path'] = str(plugin_file)
+            return cached
+        
+        fingerprint = self.index.fingerprint(plugin_file)
+        
         try:
             # Read the file and look for plugin metadata
             with open(plugin_file, 'r', encoding='utf-8') as f:
@@ -218,27 +262,67 @@ class PluginManager:
                 'type': 'file'
             }
             
-            # Try to extract metadata from module docstring
-            try:
-                spec = importlib.util.spec_from_file_location(plugin_file.stem, plugin_file)
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                    
-                    if hasattr(module, '__plugin_info__'):
-                        plugin_info.update(module.__plugin_info__)
-                    elif module.__doc__:
-                        plugin_info['description'] = module.__doc__.strip().split('\n')[0]
-            
-            except Exception as e:
-                self.logger.debug(f"Could not extract detailed info from {plugin_file}: {e}")
+            # Read literal metadata without importing the plugin where possible
+            static_info = self._read_static_plugin_info(content, plugin_file)
+            if static_info is not None:
+                plugin_info.update(static_info)
+            else:
+                # Try to extract metadata from module docstring
+                try:
+                    spec = importlib.util.spec_from_file_location(plugin_file.stem, plugin_file)
+                    if spec and spec.loader:
+                        module = importlib.util.module_from_spec(spec)
+                        spec.loader.exec_module(module)
+                        
+                        if hasattr(module, '__plugin_info__'):
+                            plugin_info.update(module.__plugin_info__)
+                        elif module.__doc__:
+                            plugin_info['description'] = module.__doc__.strip().split('\n')[0]
+                
+                except Exception as e:
+                    self.logger.debug(f"Could not extract detailed info from {plugin_file}: {e}")
             
+            self.index.put(plugin_file, 'info', plugin_info, fingerprint)
             return plugin_info
             
         except Exception as e:
             self.logger.error(f"Failed to extract plugin info from {plugin_file}: {e}")
             return None
     
+    def _read_static_plugin_info(self, content: str, plugin_file: Path) -> Optional[Dict[str, Any]]:
+        """
+        Read plugin metadata from source without executing it.
+        
+        Returns:
+            Metadata updates, or None if __plugin_info__ is not a literal
+            and the module has to be executed
+        """
+        try:
+            tree = ast.parse(content, filename=str(plugin_file))
+        except SyntaxError:
+            return None
+        
+        info_node = None
+        for node in tree.body:
+            if isinstance(node, ast.Assign):
+                targets = node.targets
+            elif isinstance(node, ast.AnnAssign) and node.value is not None:
+                targets = [node.target]
+            else:
+                continue
+            if any(isinstance(target, ast.Name) and target.id == '__plugin_info__' for target in targets):
+                info_node = node.value
+        
+        if info_node is not None:
+            try:
+                info = ast.literal_eval(info_node)
+            except ValueError:
+                return None
+            return info if isinstance(info, dict) else None
+        
+        docstring = ast.get_docstring(tree)
+        return {'description': docstring.strip().split('\n')[0]} if docstring else {}
+    
     def load_plugin(self, plugin_info: Dict[str, Any]) -> bool:
         """
         Load a single plugin with validation and sandboxing.
@@ -552,6 +636,7 @@ class PluginManager:
             
             # Remove from registries
             self._remove_plugin_from_registries(plugin_name)
+            self._remove_stubs(plugin_name)
             
             # Clean up references
             del self._loaded_plugins[plugin_name]
@@ -598,12 +683,16 @@ class PluginManager:
         for key in to_remove:
             del self.registry.scrapers[key]
     
-    def load_all_plugins(self) -> int:
+    def load_all_plugins(self, lazy: bool = False) -> int:
         """
         Load all discovered plugins.
         
+        Args:
+            lazy: Register plugins that declare "provides" metadata as stubs
+                and import them on first use; other plugins load immediately
+        
         Returns:
-            Number of successfully loaded plugins
+            Number of successfully loaded or lazily registered plugins
         """
         discovered = self.discover_plugins()
         loaded_count = 0
@@ -612,12 +701,183 @@ class PluginManager:
         sorted_plugins = self._sort_plugins_by_dependencies(discovered)
         
         for plugin_info in sorted_plugins:
-            if self.load_plugin(plugin_info):
+            if lazy and self._get_provides(plugin_info):
+                registered = self.register_lazy_plugin(plugin_info)
+            else:
+                registered = self.load_plugin(plugin_info)
+            if registered:
                 loaded_count += 1
         
-        self.logger.info(f"Loaded {loaded_count} of {len(discovered)} discovered plugins")
+        self.index.save()
+        
+        self.logger.info(f"Loaded {loaded_count} of {len(discovered)} discovered plugins"
+                         f" ({len(self._lazy_plugins)} deferred)")
         return loaded_count
     
+    def _get_provides(self, plugin_info: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the components a plugin declares in its metadata."""
+        provides = plugin_info.get('provides') or plugin_info.get('manifest', {}).get('provides')
+        return provides if isinstance(provides, dict) else {}
+    
+    def register_lazy_plugin(self, plugin_info: Dict[str, Any]) -> bool:
+        """
+        Register a plugin's declared components without importing it.
+        
+        Content handlers, filters, exporters and scrapers listed under
+        "provides" are registered as stubs with the application registries;
+        the plugin module is imported when one of them is first needed.
+        
+        Args:
+            plugin_info: Plugin metadata dictionary with "provides"
+            
+        Returns:
+            True if the plugin was registered
+        """
+        plugin_name = plugin_info['name']
+        
+        with self._load_lock:
+            if plugin_name in self._loaded_plugins or plugin_name in self._lazy_plugins:
+                self.logger.warning(f"Plugin '{plugin_name}' is already loaded")
+                return False
+            
+            if 'path' in plugin_info and not Path(plugin_info['path']).exists():
+                self.logger.error(f"Plugin path does not exist: {plugin_info['path']}")
+                return False
+            
+            try:
+                self._install_stubs(plugin_name, self._get_provides(plugin_info))
+            except Exception as e:
+                self._remove_stubs(plugin_name)
+                self.logger.error(f"Failed to register lazy plugin '{plugin_name}': {e}")
+                return False
+            
+            self._lazy_plugins[plugin_name] = plugin_info
+            self.registry.plugin_metadata[plugin_name] = plugin_info
+        
+        self.logger.debug(f"Registered lazy plugin: {plugin_name}")
+        return True
+    
+    def ensure_loaded(self, plugin_name: str) -> Optional[Any]:
+        """
+        Import a lazily registered plugin, loading its dependencies first.
+        
+        Args:
+            plugin_name: Name of the plugin
+            
+        Returns:
+            The plugin module, or None if it could not be loaded
+        """
+        with self._load_lock:
+            if plugin_name in self._plugin_modules:
+                return self._plugin_modules[plugin_name]
+            
+            plugin_info = self._lazy_plugins.pop(plugin_name, None)
+            if plugin_info is None:
+                return None
+            
+            for dependency in plugin_info.get('manifest', {}).get('dependencies', []):
+                self.ensure_loaded(dependency)
+            
+            self.logger.debug(f"Loading deferred plugin on first use: {plugin_name}")
+            if not self.load_plugin(plugin_info):
+                return None
+            return self._plugin_modules[plugin_name]
+    
+    def _load_component(self, plugin_name: str, class_name: str) -> Type:
+        """Import a plugin on demand and return one of its declared classes."""
+        module = self.ensure_loaded(plugin_name)
+        if module is None:
+            raise ImportError(f"Plugin '{plugin_name}' could not be loaded")
+        
+        component = getattr(module, class_name, None)
+        if not inspect.isclass(component):
+            raise ImportError(f"Plugin '{plugin_name}' does not define class '{class_name}'")
+        return component
+    
+    def _install_stubs(self, plugin_name: str, provides: Dict[str, List[Dict[str, Any]]]) -> None:
+        """
+        Register stubs for a plugin's declared components with the application registries.
+        
+        Names that are already taken, by built-ins or other plugins, are skipped,
+        and only the entries actually installed are recorded for removal.
+        """
+        def loader(class_name: str) -> Callable[[], Type]:
+            return lambda: self._load_component(plugin_name, class_name)
+        
+        installed: Dict[str, List[str]] = {
+            'content_handlers': [], 'filters': [], 'exporters': [], 'scrapers': []
+        }
+        self._installed_stubs[plugin_name] = installed
+        
+        if provides.get('content_handlers'):
+            from redditdl.content_handlers.base import handler_registry
+            for spec in provides['content_handlers']:
+                load = loader(spec['class'])
+                handler_name = f"{plugin_name}.{spec['class']}"
+                if handler_registry.register_lazy_handler(
+                    handler_name,
+                    spec.get('content_types', ['*']),
+                    lambda load=load: load()()
+                ):
+                    installed['content_handlers'].append(handler_name)
+        
+        if provides.get('filters'):
+            from redditdl.filters.factory import FilterFactory
+            for spec in provides['filters']:
+                if FilterFactory.register_lazy_filter(spec['type'], loader(spec['class'])):
+                    installed['filters'].append(spec['type'])
+        
+        if provides.get('exporters'):
+            from redditdl.exporters.base import registry as exporter_registry
+            for spec in provides['exporters']:
+                if exporter_registry.register_lazy_exporter(
+                    spec['format'], loader(spec['class']), aliases=spec.get('aliases')
+                ):
+                    installed['exporters'].append(spec['format'])
+        
+        if provides.get('scrapers'):
+            from redditdl.targets.scrapers import ScraperFactory
+            for spec in provides['scrapers']:
+                scraper_name = f"{plugin_name}.{spec['class']}"
+                if ScraperFactory.register_lazy_scraper(
+                    scraper_name,
+                    spec.get('sources', []),
+                    loader(spec['class']),
+                    priority=spec.get('priority', 100)
+                ):
+                    installed['scrapers'].append(scraper_name)
+        
+        skipped = sum(len(provides.get(kind, [])) - len(names) for kind, names in installed.items())
+        if skipped:
+            self.logger.warning(f"Plugin {plugin_name}: skipped {skipped} component(s) "
+                                f"whose names are already registered")
+    
+    def _remove_stubs(self, plugin_name: str) -> None:
+        """Unregister the stubs a plugin installed, and any components created from them."""
+        installed = self._installed_stubs.pop(plugin_name, None)
+        if not installed:
+            return
+        
+        if installed['content_handlers']:
+            from redditdl.content_handlers.base import handler_registry
+            for handler_name in installed['content_handlers']:
+                handler_registry.unregister_lazy_handler(handler_name)
+        
+        if installed['filters']:
+            from redditdl.filters.factory import FilterFactory
+            for filter_type in installed['filters']:
+                FilterFactory.unregister_filter(filter_type)
+        
+        if installed['exporters']:
+            from redditdl.exporters.base import registry as exporter_registry
+            for format_name in installed['exporters']:
+                exporter_registry.unregister_exporter(format_name)
+        
+        if installed['scrapers']:
+            from redditdl.targets.scrapers import ScraperFactory
+            for scraper_name in installed['scrapers']:
+                ScraperFactory.unregister_scraper(scraper_name)
+    
     def _sort_plugins_by_dependencies(self, plugins: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Sort plugins by dependencies to ensure proper loading order."""
         # Simple topological sort for now
@@ -711,6 +971,18 @@ class PluginManager:
                                if s['plugin_name'] == plugin_name])
             }
         
+        for plugin_name, plugin_info in self._lazy_plugins.items():
+            provides = self._get_provides(plugin_info)
+            status[plugin_name] = {
+                'loaded': False,
+                'enabled': True,
+                'info': plugin_info,
+                'content_handlers': len(provides.get('content_handlers', [])),
+                'filters': len(provides.get('filters', [])),
+                'exporters': len(provides.get('exporters', [])),
+                'scrapers': len(provides.get('scrapers', []))
+            }
+        
         return status
     
     def detect_conflicts(self) -> List[Dict[str, Any]]:
@@ -757,10 +1029,15 @@ class PluginManager:
         for plugin_name in reversed(self._initialization_order):
             self.unload_plugin(plugin_name)
         
+        # Remove stubs of plugins that were never imported
+        for plugin_name in list(self._installed_stubs):
+            self._remove_stubs(plugin_name)
+        
         # Clear all registries
         self.registry = PluginRegistry()
         self._loaded_plugins.clear()
         self._plugin_modules.clear()
         self._initialization_order.clear()
+        self._lazy_plugins.clear()
         
         self.logger.info("Plugin manager cleanup complete")
\ No newline at end of file
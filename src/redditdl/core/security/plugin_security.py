@@ -6,15 +6,24 @@ malicious code patterns and enforce security policies.
 """
 
 import ast
+import hashlib
 import inspect
 import importlib.util
+import json
 from pathlib import Path
-from typing import List, Dict, Any, Set, Optional, Tuple
+from typing import List, Dict, Any, Set, Optional, Tuple, TYPE_CHECKING
 import logging
 
 from .validation import SecurityValidationError
 from .audit import get_auditor, EventType, Severity, SecurityError
 
+if TYPE_CHECKING:
+    from ..plugins.index import PluginIndex
+
+
+# Bump when the scanning logic changes so cached verdicts are discarded
+SCAN_RULES_VERSION = 1
+
 
 class PluginSecurityScanner:
     """
@@ -24,9 +33,16 @@ class PluginSecurityScanner:
     validates plugin structure, and enforces security policies.
     """
     
-    def __init__(self):
+    def __init__(self, index: Optional['PluginIndex'] = None):
+        """
+        Initialize the scanner.
+        
+        Args:
+            index: Plugin index caching scan results for unchanged files
+        """
         self.logger = logging.getLogger(__name__)
         self.auditor = get_auditor()
+        self.index = index
         
         # Dangerous function/module patterns
         self.dangerous_imports = {
@@ -76,6 +92,20 @@ class PluginSecurityScanner:
         Returns:
             Security scan results with issues and metadata
         """
+        fingerprint = None
+        if self.index is not None:
+            cached = self.index.get(plugin_path, self._cache_kind())
+            if cached is not None:
+                self.auditor.log_plugin_event(
+                    action="security_scan_cached",
+                    plugin_name=plugin_path.name,
+                    success=True,
+                    error_message=None
+                )
+                cached['plugin_path'] = str(plugin_path)
+                return cached
+            fingerprint = self.index.fingerprint(plugin_path)
+        
         results = {
             'plugin_path': str(plugin_path),
             'issues': [],
@@ -112,6 +142,9 @@ class PluginSecurityScanner:
                 error_message=None
             )
             
+            if self.index is not None:
+                self.index.put(plugin_path, self._cache_kind(), results, fingerprint)
+        
         except Exception as e:
             self.logger.error(f"Security scan failed for {plugin_path}: {e}")
             results['issues'].append({
@@ -131,6 +164,15 @@ class PluginSecurityScanner:
         
         return results
     
+    def _cache_kind(self) -> str:
+        """Get the plugin index kind for scans under the current rule sets."""
+        rules = [sorted(rule_set) for rule_set in (
+            self.dangerous_imports, self.suspicious_modules, self.allowed_modules,
+            self.file_ops, self.network_ops
+        )]
+        digest = hashlib.sha256(json.dumps(rules).encode()).hexdigest()[:16]
+        return f"security_scan:{SCAN_RULES_VERSION}:{digest}"
+    
     def _analyze_ast(self, tree: ast.AST, results: Dict[str, Any]) -> None:
         """Analyze AST for security issues."""
         for node in ast.walk(tree):
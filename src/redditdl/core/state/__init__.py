@@ -5,7 +5,8 @@ Provides SQLite-based state persistence for RedditDL sessions,
 replacing the previous JSON-based state management.
 """
 
+from .bloom import ArchiveBloomFilter
 from .manager import StateManager
 from .migrations import migrate_json_to_sqlite
 
-__all__ = ["StateManager", "migrate_json_to_sqlite"]
\ No newline at end of file
+__all__ = ["ArchiveBloomFilter", "StateManager", "migrate_json_to_sqlite"]
\ No newline at end of file
@@ -0,0 +1,215 @@
+"""
+Archive Bloom Filter
+
+Persistent, memory-mapped Bloom filter used as a fast probabilistic
+"already archived" check for post IDs. Negative answers are exact; positive
+answers must be confirmed by an exact lookup (see StateManager.is_archived).
+"""
+
+import hashlib
+import math
+import mmap
+import struct
+import threading
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+
+class ArchiveBloomFilter:
+    """
+    Memory-mapped Bloom filter over archived post IDs.
+
+    The bit array lives in a file so it can be shared across runs without
+    rebuilding and without loading the archive into memory. Only the pages
+    touched by lookups are paged in by the OS.
+
+    File layout: a fixed header (magic, version, bit count, hash count, item
+    count, capacity) followed by the bit array.
+    """
+
+    MAGIC = b'RDLBLOOM'
+    VERSION = 1
+    _HEADER = struct.Struct('<8sIQIQQ')
+
+    def __init__(self, path: Union[str, Path], capacity: int = 10_000_000,
+                 error_rate: float = 0.001):
+        """
+        Open an existing filter file or create a new one.
+
+        Args:
+            path: Location of the filter file
+            capacity: Expected number of IDs (used only when creating)
+            error_rate: Target false positive rate (used only when creating)
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+
+        if self.path.exists() and self.path.stat().st_size >= self._HEADER.size:
+            self._open_existing()
+        else:
+            self._create(capacity, error_rate)
+
+    @staticmethod
+    def optimal_parameters(capacity: int, error_rate: float) -> tuple:
+        """
+        Compute bit and hash counts for a capacity and false positive rate.
+
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false positive rate
+
+        Returns:
+            Tuple of (num_bits, num_hashes)
+        """
+        num_bits = int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        num_hashes = max(1, int(round(num_bits / capacity * math.log(2))))
+        return num_bits, num_hashes
+
+    def _create(self, capacity: int, error_rate: float) -> None:
+        """Create a zeroed filter file sized for the given capacity."""
+        self.num_bits, self.num_hashes = self.optimal_parameters(capacity, error_rate)
+        self.capacity = capacity
+        self.count = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        total_size = self._HEADER.size + (self.num_bits + 7) // 8
+        with open(self.path, 'wb') as f:
+            f.write(self._pack_header())
+            f.truncate(total_size)
+
+        self._map_file()
+
+    def _open_existing(self) -> None:
+        """Open and validate an existing filter file."""
+        with open(self.path, 'rb') as f:
+            header = f.read(self._HEADER.size)
+
+        magic, version, num_bits, num_hashes, count, capacity = self._HEADER.unpack(header)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError(f"Not a RedditDL archive filter: {self.path}")
+
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.count = count
+        self.capacity = capacity
+        self._map_file()
+
+    def _map_file(self) -> None:
+        """Memory-map the filter file for reading and writing."""
+        self._file = open(self.path, 'r+b')
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+
+    def _pack_header(self) -> bytes:
+        return self._HEADER.pack(
+            self.MAGIC, self.VERSION, self.num_bits, self.num_hashes, self.count, self.capacity
+        )
+
+    def _bit_positions(self, item: str):
+        """Yield bit positions for an item using double hashing."""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> bool:
+        """
+        Add an item to the filter.
+
+        Args:
+            item: Post ID to add
+
+        Returns:
+            True if the item was not already (probably) present
+        """
+        offset = self._HEADER.size
+        buffer = self._mmap
+        added = False
+        with self._lock:
+            for position in self._bit_positions(item):
+                index = offset + (position >> 3)
+                mask = 1 << (position & 7)
+                value = buffer[index]
+                if not value & mask:
+                    buffer[index] = value | mask
+                    added = True
+            if added:
+                self.count += 1
+        return added
+
+    def update(self, items: Iterable[str]) -> int:
+        """
+        Add many items to the filter.
+
+        Args:
+            items: Post IDs to add
+
+        Returns:
+            Number of items that were newly added
+        """
+        return sum(1 for item in items if self.add(item))
+
+    def __contains__(self, item: str) -> bool:
+        offset = self._HEADER.size
+        buffer = self._mmap
+        for position in self._bit_positions(item):
+            if not buffer[offset + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+
+    def might_contain(self, item: str) -> bool:
+        """
+        Check whether an item may have been added.
+
+        Args:
+            item: Post ID to check
+
+        Returns:
+            False if the item was definitely never added, True otherwise
+        """
+        return item in self
+
+    @property
+    def saturated(self) -> bool:
+        """Whether more items were added than the filter was sized for."""
+        return self.count > self.capacity
+
+    def clear(self) -> None:
+        """Reset every bit and the item count."""
+        with self._lock:
+            self._mmap[self._HEADER.size:] = bytes(len(self._mmap) - self._HEADER.size)
+            self.count = 0
+
+    def flush(self) -> None:
+        """Write the header and flush the bit array to disk."""
+        if self._mmap is None:
+            return
+        with self._lock:
+            self._mmap[:self._HEADER.size] = self._pack_header()
+            self._mmap.flush()
+
+    def close(self) -> None:
+        """Flush and release the memory map."""
+        if self._mmap is None:
+            return
+        self.flush()
+        self._mmap.close()
+        self._file.close()
+        self._mmap = None
+        self._file = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __enter__(self) -> 'ArchiveBloomFilter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -6,6 +6,8 @@ atomic operations, session recovery, and integrity checking.
 """
 
 import json
+import logging
+import os
 import sqlite3
 import hashlib
 import threading
@@ -20,6 +22,9 @@ import time
 
 from ..config.models import AppConfig
 from ..monitoring.metrics import get_metrics_collector, time_operation
+from .bloom import ArchiveBloomFilter
+
+logger = logging.getLogger(__name__)
 
 
 class ConnectionPool:
@@ -113,14 +118,25 @@ class StateManager:
     Enhanced with connection pooling for improved concurrent performance.
     """
     
+    # Number of IDs confirmed per exact lookup query
+    ARCHIVE_LOOKUP_CHUNK = 500
+    
+    # Smallest archive filter created when sizing from the database (~180KB)
+    ARCHIVE_FILTER_MIN_CAPACITY = 100_000
+    
     def __init__(self, db_path: Optional[Union[str, Path]] = None, 
-                 max_connections: int = 10):
+                 max_connections: int = 10,
+                 archive_filter_capacity: Optional[int] = None,
+                 archive_filter_error_rate: float = 0.001):
         """
         Initialize state manager with database path and connection pooling.
         
         Args:
             db_path: Path to SQLite database file (default: .redditdl/state.db)
             max_connections: Maximum number of database connections
+            archive_filter_capacity: Expected archived IDs when creating the
+                archive Bloom filter (default: sized from the archived post count)
+            archive_filter_error_rate: Target false positive rate of the filter
         """
         if db_path is None:
             db_path = Path.cwd() / ".redditdl" / "state.db"
@@ -139,10 +155,15 @@ class StateManager:
         
         # Initialize database schema
         self._initialize_database()
-    
-    def close(self):
-        """Close all database connections."""
-        self._connection_pool.close_all()
+        
+        # Archive Bloom filter is opened lazily next to the database
+        self.archive_filter_path = self.db_path.with_suffix('.bloom')
+        self._archive_filter_capacity = archive_filter_capacity
+        self._archive_filter_error_rate = archive_filter_error_rate
+        self._archive_filter: Optional[ArchiveBloomFilter] = None
+        self._archive_filter_lock = threading.Lock()
+        self._archive_filter_enabled = self.archive_filter_path.exists()
+        self._archive_saturation_warned = False
     
     @contextmanager
     def _transaction(self):
@@ -285,6 +306,11 @@ class StateManager:
         if not post_id:
             raise ValueError("Post data must include 'id' field")
         
+        # Add to the filter first: a crash before the commit then only leaves
+        # a false positive, which filter_archived() confirms against the DB
+        if self._archive_filter_enabled:
+            self.get_archive_filter().add(post_id)
+        
         with self._transaction() as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO posts (
@@ -698,6 +724,222 @@ class StateManager:
             
             return cursor.rowcount
     
+    def get_archive_filter(self) -> ArchiveBloomFilter:
+        """
+        Get the persistent archive Bloom filter, building it on first use.
+        
+        Returns:
+            ArchiveBloomFilter covering every post ID known to the database
+        """
+        if self._archive_filter is None:
+            with self._archive_filter_lock:
+                if self._archive_filter is None:
+                    exists = self.archive_filter_path.exists()
+                    capacity = self._archive_filter_capacity
+                    if capacity is None and not exists:
+                        capacity = max(self.ARCHIVE_FILTER_MIN_CAPACITY, 2 * self._count_archived_ids())
+                    archive_filter = ArchiveBloomFilter(
+                        self.archive_filter_path,
+                        capacity=capacity or self.ARCHIVE_FILTER_MIN_CAPACITY,
+                        error_rate=self._archive_filter_error_rate
+                    )
+                    if not exists:
+                        self._populate_archive_filter(archive_filter)
+                    self._archive_filter = archive_filter
+                    self._archive_filter_enabled = True
+        return self._archive_filter
+    
+    def _count_archived_ids(self) -> int:
+        """Count rows in the posts and archive_index tables."""
+        with self._connection_pool.get_connection() as conn:
+            cursor = conn.execute(
+                "SELECT (SELECT COUNT(*) FROM posts) + (SELECT COUNT(*) FROM archive_index)"
+            )
+            return cursor.fetchone()[0]
+    
+    def _iter_archived_ids(self, batch_size: int = 10000):
+        """
+        Stream archived post IDs from the database without materializing them.
+        
+        Args:
+            batch_size: Rows fetched per round trip
+            
+        Yields:
+            Post IDs from the posts and archive_index tables
+        """
+        with self._connection_pool.get_connection() as conn:
+            for table in ('posts', 'archive_index'):
+                cursor = conn.execute(f"SELECT id FROM {table}")
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield row[0]
+    
+    def _populate_archive_filter(self, archive_filter: ArchiveBloomFilter) -> int:
+        """Add every ID stored in the database to the filter."""
+        added = archive_filter.update(self._iter_archived_ids())
+        archive_filter.flush()
+        return added
+    
+    def index_sidecars(self, directories: List[Union[str, Path]],
+                       exclude: Optional[List[Union[str, Path]]] = None) -> int:
+        """
+        Record post IDs found in JSON sidecar files as archived.
+        
+        The modification time and size of every file read are stored, so
+        later calls only open files that are new or have changed since.
+        
+        Args:
+            directories: Directories to scan recursively for ``*.json`` sidecars
+            exclude: Directories to skip, such as the export output directory
+            
+        Returns:
+            Number of sidecar IDs indexed by this call
+        """
+        archive_filter = self.get_archive_filter()
+        excluded = {Path(path).resolve() for path in exclude or []}
+        with self._connection_pool.get_connection() as conn:
+            known = {row[0]: (row[1], row[2])
+                     for row in conn.execute("SELECT path, mtime_ns, size FROM sidecar_files")}
+        
+        ids: List[Tuple[str]] = []
+        files: List[Tuple[str, int, int]] = []
+        indexed = 0
+        
+        def flush_batch() -> None:
+            with self._transaction() as conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO archive_index (id, source) VALUES (?, 'sidecar')",
+                    ids
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO sidecar_files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                    files
+                )
+            ids.clear()
+            files.clear()
+        
+        for directory in directories:
+            for root, dirnames, filenames in os.walk(Path(directory).resolve()):
+                dirnames[:] = [name for name in dirnames
+                               if Path(root, name) not in excluded]
+                for filename in filenames:
+                    if not filename.endswith('.json'):
+                        continue
+                    sidecar_path = os.path.join(root, filename)
+                    try:
+                        stat = os.stat(sidecar_path)
+                    except OSError:
+                        continue
+                    if known.get(sidecar_path) == (stat.st_mtime_ns, stat.st_size):
+                        continue
+                    files.append((sidecar_path, stat.st_mtime_ns, stat.st_size))
+                    
+                    try:
+                        with open(sidecar_path, 'r', encoding='utf-8') as f:
+                            data = json.load(f)
+                    except (OSError, ValueError):
+                        data = None
+                    
+                    post_id = data.get('id') if isinstance(data, dict) else None
+                    if isinstance(post_id, str) and post_id:
+                        archive_filter.add(post_id)
+                        ids.append((post_id,))
+                        indexed += 1
+                    if len(files) >= self.ARCHIVE_LOOKUP_CHUNK:
+                        flush_batch()
+        
+        if files:
+            flush_batch()
+        archive_filter.flush()
+        return indexed
+    
+    def rebuild_archive_filter(self, sidecar_dirs: Optional[List[Union[str, Path]]] = None,
+                               capacity: Optional[int] = None) -> int:
+        """
+        Recreate the archive filter from the database and optional sidecars.
+        
+        Use this after bulk imports or when the filter has become saturated.
+        
+        Args:
+            sidecar_dirs: Optional directories of JSON sidecars to index
+            capacity: New expected capacity (default: twice the current count,
+                and at least the configured capacity)
+            
+        Returns:
+            Number of IDs in the rebuilt filter
+        """
+        with self._archive_filter_lock:
+            if self._archive_filter is not None:
+                if capacity is None:
+                    capacity = max(self._archive_filter_capacity or 0, self._archive_filter.count * 2,
+                                   self.ARCHIVE_FILTER_MIN_CAPACITY)
+                self._archive_filter.close()
+                self._archive_filter = None
+            if self.archive_filter_path.exists():
+                self.archive_filter_path.unlink()
+            if capacity is not None:
+                self._archive_filter_capacity = capacity
+            self._archive_saturation_warned = False
+        
+        archive_filter = self.get_archive_filter()
+        if sidecar_dirs:
+            self.index_sidecars(sidecar_dirs)
+        return archive_filter.count
+    
+    def filter_archived(self, post_ids: List[str]) -> set:
+        """
+        Determine which post IDs have already been archived.
+        
+        The Bloom filter rejects unseen IDs without touching SQLite; possible
+        hits are confirmed with primary key lookups so the result is exact.
+        
+        Args:
+            post_ids: Post IDs to check
+            
+        Returns:
+            Set of IDs that are archived
+        """
+        archive_filter = self.get_archive_filter()
+        if archive_filter.saturated and not self._archive_saturation_warned:
+            self._archive_saturation_warned = True
+            logger.warning(
+                f"Archive filter holds {archive_filter.count} IDs beyond its capacity "
+                f"of {archive_filter.capacity}; consider rebuild_archive_filter()"
+            )
+        
+        candidates = [post_id for post_id in post_ids if post_id in archive_filter]
+        archived = set()
+        if not candidates:
+            return archived
+        
+        with self._connection_pool.get_connection() as conn:
+            for start in range(0, len(candidates), self.ARCHIVE_LOOKUP_CHUNK):
+                chunk = candidates[start:start + self.ARCHIVE_LOOKUP_CHUNK]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = conn.execute(f"""
+                    SELECT id FROM posts WHERE id IN ({placeholders})
+                    UNION
+                    SELECT id FROM archive_index WHERE id IN ({placeholders})
+                """, chunk + chunk)
+                archived.update(row[0] for row in cursor.fetchall())
+        
+        return archived
+    
+    def is_archived(self, post_id: str) -> bool:
+        """
+        Check whether a single post ID has already been archived.
+        
+        Args:
+            post_id: Post ID to check
+            
+        Returns:
+            True if the post exists in any session or the archive index
+        """
+        return bool(self.filter_archived([post_id]))
+    
     def check_integrity(self) -> Dict[str, Any]:
         """
         Check database integrity and return report.
@@ -751,10 +993,11 @@ class StateManager:
         return report
     
     def close(self) -> None:
-        """Close database connections."""
-        if hasattr(self._local, 'connection'):
-            self._local.connection.close()
-            delattr(self._local, 'connection')
+        """Close the archive filter and all database connections."""
+        if self._archive_filter is not None:
+            self._archive_filter.close()
+            self._archive_filter = None
+        self._connection_pool.close_all()
 
 
 class StateManagerError(Exception):
@@ -65,6 +65,21 @@ CREATE TABLE IF NOT EXISTS metadata (
     UNIQUE(session_id, key)
 );
 
+-- Archive index holds post IDs known from outside the posts table
+-- (e.g. JSON sidecars on disk) so archived checks can be confirmed exactly
+CREATE TABLE IF NOT EXISTS archive_index (
+    id TEXT PRIMARY KEY, -- Reddit post ID
+    source TEXT NOT NULL DEFAULT 'sidecar', -- where the ID was found
+    added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Sidecar files already read into archive_index, so unchanged files are skipped
+CREATE TABLE IF NOT EXISTS sidecar_files (
+    path TEXT PRIMARY KEY, -- resolved file path
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+
 -- Indexes for performance optimization
 CREATE INDEX IF NOT EXISTS idx_sessions_status ON sessions(status);
 CREATE INDEX IF NOT EXISTS idx_sessions_target ON sessions(target_type, target_value);
@@ -8,14 +8,79 @@ with custom filters and comprehensive validation.
 import re
 import time
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Callable, Dict, Any, List, Optional, Union
 from datetime import datetime
 
 import jinja2
+from markupsafe import escape
 from jinja2 import Environment, BaseLoader, select_autoescape, TemplateSyntaxError
 
 from redditdl.utils import sanitize_filename
+from redditdl.core.monitoring.tracing import trace_span
+
+
+# Plain {variable} placeholder (optionally padded with spaces)
+_PLAIN_PLACEHOLDER = re.compile(r'\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}')
+
+# Anything Jinja would treat specially
+_JINJA_MARKERS = ('{{', '{%', '{#', '}}', '%}', '#}')
+
+
+def _compile_plain_template(template: str,
+                            autoescape: bool = False) -> Optional[Callable[[Dict[str, Any]], str]]:
+    """
+    Compile a template made only of literal text and plain {var} placeholders.
+    
+    The result renders exactly like the Jinja2 equivalent (values passed
+    through str(), or HTML-escaped when autoescaping, missing variables
+    raise UndefinedError, a single trailing newline dropped) without going
+    through Jinja2.
+    
+    Args:
+        template: Template string
+        autoescape: Escape values as Jinja2 does for autoescaped templates
+        
+    Returns:
+        Render function, or None if the template needs Jinja2
+    """
+    # Jinja2 markup, or line endings Jinja2 would normalize
+    if '\r' in template or any(marker in template for marker in _JINJA_MARKERS):
+        return None
+    
+    literals: List[str] = []
+    names: List[str] = []
+    position = 0
+    for match in _PLAIN_PLACEHOLDER.finditer(template):
+        literals.append(template[position:match.start()])
+        names.append(match.group(1))
+        position = match.end()
+    tail = template[position:]
+    
+    # Braces left over mean filters, expressions or unbalanced text: use Jinja2
+    if any('{' in part or '}' in part for part in literals + [tail]):
+        return None
+    
+    # Jinja2 drops a single trailing newline (keep_trailing_newline=False)
+    if tail.endswith('\n'):
+        tail = tail[:-1]
+    
+    pairs = list(zip(literals, names, strict=True))
+    to_text = (lambda value: str(escape(value))) if autoescape else str
+    
+    def render(variables: Dict[str, Any]) -> str:
+        parts = []
+        for literal, name in pairs:
+            parts.append(literal)
+            try:
+                parts.append(to_text(variables[name]))
+            except KeyError:
+                raise jinja2.UndefinedError(f"'{name}' is undefined") from None
+        parts.append(tail)
+        return ''.join(parts)
+    
+    return render
 
 
 class FilenameTemplateEngine:
@@ -24,12 +89,21 @@ class FilenameTemplateEngine:
     
     Provides flexible filename templating with custom filters and comprehensive
     validation. Supports backward compatibility with simple {variable} patterns.
+    
+    Compiled templates are cached by template string. Templates made only of
+    plain {variable} placeholders are rendered without Jinja2.
     """
     
+    # Number of compiled templates kept per engine
+    TEMPLATE_CACHE_SIZE = 128
+    
     def __init__(self):
         """Initialize the template engine with custom filters."""
         self.logger = logging.getLogger(__name__)
         
+        # Compiled render functions keyed by template string
+        self._template_cache: "OrderedDict[str, Callable[[Dict[str, Any]], str]]" = OrderedDict()
+        
         # Create Jinja2 environment with safe defaults
         self.env = Environment(
             loader=BaseLoader(),
@@ -141,15 +215,15 @@ class FilenameTemplateEngine:
             jinja2.UndefinedError: If required variables are missing
         """
         try:
-            # Check if this is a simple {variable} template and convert to Jinja2
-            converted_template = self._convert_simple_template(template)
+            # Compile once per template string
+            render_template = self._get_compiled_template(template)
             
             # Add default variables
             template_vars = self._prepare_template_variables(variables)
             
             # Render the template
-            jinja_template = self.env.from_string(converted_template)
-            rendered = jinja_template.render(**template_vars)
+            with trace_span("template.render"):
+                rendered = render_template(template_vars)
             
             # Post-process the result
             result = self._post_process_filename(rendered, max_length)
@@ -208,6 +282,45 @@ class FilenameTemplateEngine:
         
         return errors
     
+    def clear_cache(self) -> None:
+        """Drop all compiled templates."""
+        self._template_cache.clear()
+    
+    def _get_compiled_template(self, template: str) -> Callable[[Dict[str, Any]], str]:
+        """
+        Get the render function for a template, compiling it on first use.
+        
+        Args:
+            template: Template string (Jinja2 or simple {variable} format)
+            
+        Returns:
+            Function rendering the template from a variables dict
+            
+        Raises:
+            TemplateSyntaxError: If template syntax is invalid
+        """
+        compiled = self._template_cache.get(template)
+        if compiled is not None:
+            self._template_cache.move_to_end(template)
+            return compiled
+        
+        # select_autoescape() decides per template name; string templates have none
+        autoescape = self.env.autoescape
+        if callable(autoescape):
+            autoescape = autoescape(None)
+        
+        compiled = _compile_plain_template(template, autoescape=bool(autoescape))
+        if compiled is None:
+            # Check if this is a simple {variable} template and convert to Jinja2
+            converted_template = self._convert_simple_template(template)
+            jinja_template = self.env.from_string(converted_template)
+            compiled = lambda template_vars: jinja_template.render(**template_vars)
+        
+        self._template_cache[template] = compiled
+        if len(self._template_cache) > self.TEMPLATE_CACHE_SIZE:
+            self._template_cache.popitem(last=False)
+        return compiled
+    
     def get_preset(self, preset_name: str) -> Optional[str]:
         """
         Get a predefined template preset.
@@ -265,7 +378,7 @@ class FilenameTemplateEngine:
             'post_id': 'unknown',
             'title': 'untitled',
             'author': 'unknown',
-            'date': datetime.now().isoformat(),
+            'date': None,  # Current time, filled in below only when needed
             'ext': 'unknown',
             'content_type': 'unknown',
             'score': 0,
@@ -277,6 +390,8 @@ class FilenameTemplateEngine:
         for key, default_value in defaults.items():
             if key not in template_vars or template_vars[key] is None:
                 template_vars[key] = default_value
+        if template_vars['date'] is None:
+            template_vars['date'] = datetime.now().isoformat()
         
         # Ensure strings are properly encoded
         for key, value in template_vars.items():
@@ -16,6 +16,7 @@ import requests
 from urllib.parse import urlparse
 
 from redditdl.metadata import MetadataEmbedder
+from redditdl.core.monitoring.tracing import trace_span, url_host, SPAN_KIND_CLIENT
 from redditdl.utils import sanitize_filename, api_retry
 
 
@@ -94,9 +95,11 @@ class MediaDownloader:
             'User-Agent': 'RedditDL/1.0 (Media Downloader Bot)'
         }
         
+        span = trace_span("download", kind=SPAN_KIND_CLIENT, host=url_host(media_url))
         try:
             # Download the file with streaming
             response = requests.get(media_url, stream=True, headers=headers, timeout=30)
+            span.set_attribute("http.status_code", response.status_code)
             
             # Handle different HTTP status codes
             if response.status_code == 404:
@@ -111,22 +114,28 @@ class MediaDownloader:
             
             # Write file content in chunks with OSError handling
             self._write_file_safely(output_path, response)
+            if span.is_recording:
+                span.set_attribute("bytes", output_path.stat().st_size)
             
             # Determine file type and handle metadata embedding
-            self._process_metadata(output_path, metadata)
+            with trace_span("metadata.embed", format=output_path.suffix.lower()):
+                self._process_metadata(output_path, metadata)
             
             print(f"[INFO] Successfully downloaded: {output_path.name}")
             return output_path
             
         except requests.RequestException as e:
+            span.record_error(e)
             print(f"[ERROR] Network error downloading {media_url}: {e}")
             # Re-raise to let the retry decorator handle it
             raise
         except OSError as e:
+            span.record_error(e)
             print(f"[ERROR] File system error writing {output_path}: {e}")
             # Re-raise to let the retry decorator handle it if applicable
             raise
         finally:
+            span.end()
             # Apply rate limiting in all cases
             time.sleep(self.sleep_interval)
     
@@ -9,7 +9,7 @@ registration and discovery mechanisms.
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Type, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Type, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 import json
@@ -85,7 +85,28 @@ class BaseExporter(ABC):
         """
         pass
     
-    @abstractmethod
+    def export_stream(self, posts: Iterable[Dict[str, Any]], metadata: Dict[str, Any],
+                      output_path: str, config: Dict[str, Any]) -> ExportResult:
+        """
+        Export posts supplied by an iterator.
+        
+        Exporters that report ``supports_streaming`` override this to write
+        each post as it is produced. The default implementation materializes
+        the iterator and delegates to ``export``.
+        
+        Args:
+            posts: Iterable of post dictionaries
+            metadata: Non-post export data (export_info, pipeline metadata)
+            output_path: Path where the export file should be created
+            config: Export configuration options
+            
+        Returns:
+            ExportResult: Details about the export operation
+        """
+        data = dict(metadata)
+        data['posts'] = list(posts)
+        return self.export(data, output_path, config)
+    
     def get_format_info(self) -> FormatInfo:
         """
         Get information about this export format.
@@ -93,7 +114,7 @@ class BaseExporter(ABC):
         Returns:
             FormatInfo: Format metadata and capabilities
         """
-        pass
+        return self._format_info
     
     @abstractmethod
     def _create_format_info(self) -> FormatInfo:
@@ -203,8 +224,9 @@ class BaseExporter(ABC):
         # Create parent directory if needed
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Check for overwrites
-        if path.exists() and not config.get('overwrite', True):
+        # Check for overwrites (incremental exports always reuse the same file)
+        incremental = config.get('incremental', False) and self.supports_incremental(config)
+        if path.exists() and not config.get('overwrite', True) and not incremental:
             # Generate unique filename
             counter = 1
             base_path = path.with_suffix('')
@@ -218,8 +240,14 @@ class BaseExporter(ABC):
         """Get the configuration schema for this exporter."""
         return self._config_schema.copy()
     
-    def supports_incremental(self) -> bool:
-        """Check if this exporter supports incremental exports."""
+    def supports_incremental(self, config: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Check if this exporter supports incremental exports.
+        
+        Args:
+            config: Export configuration, for exporters that can only append
+                in some output modes
+        """
         return self.get_format_info().supports_incremental
     
     def supports_streaming(self) -> bool:
@@ -277,6 +305,7 @@ class ExporterRegistry:
         self._exporters: Dict[str, Type[BaseExporter]] = {}
         self._instances: Dict[str, BaseExporter] = {}
         self._format_aliases: Dict[str, str] = {}
+        self._lazy_exporters: Dict[str, Callable[[], Type[BaseExporter]]] = {}
     
     def register_exporter(self, exporter_class: Type[BaseExporter], 
                          format_name: Optional[str] = None,
@@ -309,6 +338,56 @@ class ExporterRegistry:
         except Exception as e:
             self.logger.error(f"Failed to register exporter {exporter_class.__name__}: {e}")
     
+    def register_lazy_exporter(self, format_name: str, loader: Callable[[], Type[BaseExporter]],
+                               aliases: Optional[List[str]] = None) -> bool:
+        """
+        Register an exporter whose class is imported the first time it is requested.
+        
+        Formats and aliases that are already taken are left untouched.
+        
+        Args:
+            format_name: Export format name
+            loader: Callable that imports and returns the exporter class
+            aliases: Optional list of format name aliases
+            
+        Returns:
+            False if the format name is already registered
+        """
+        if self.is_format_supported(format_name):
+            return False
+        self._lazy_exporters[format_name] = loader
+        for alias in aliases or []:
+            if self.is_format_supported(alias):
+                self.logger.debug(f"Skipping taken alias {alias} for lazy exporter {format_name}")
+                continue
+            self._format_aliases[alias] = format_name
+        self.logger.debug(f"Registered lazy exporter: {format_name}")
+        return True
+    
+    def _resolve_lazy_exporter(self, format_name: str) -> None:
+        """Import a lazily registered exporter class and register it."""
+        loader = self._lazy_exporters.pop(format_name)
+        try:
+            exporter_class = loader()
+        except Exception as e:
+            self.logger.error(f"Failed to load exporter {format_name}: {e}")
+            return
+        self.register_exporter(exporter_class, format_name=format_name)
+    
+    def unregister_exporter(self, format_name: str) -> None:
+        """
+        Unregister an exporter, its aliases and any cached instance.
+        
+        Args:
+            format_name: Export format name
+        """
+        self._exporters.pop(format_name, None)
+        self._instances.pop(format_name, None)
+        self._lazy_exporters.pop(format_name, None)
+        for alias in [alias for alias, target in self._format_aliases.items() if target == format_name]:
+            del self._format_aliases[alias]
+        self.logger.debug(f"Unregistered exporter: {format_name}")
+    
     def get_exporter(self, format_name: str) -> Optional[BaseExporter]:
         """
         Get an exporter instance for the specified format.
@@ -322,6 +401,9 @@ class ExporterRegistry:
         # Resolve alias if needed
         actual_format = self._format_aliases.get(format_name, format_name)
         
+        if actual_format not in self._exporters and actual_format in self._lazy_exporters:
+            self._resolve_lazy_exporter(actual_format)
+        
         # Return cached instance if available
         if actual_format in self._instances:
             return self._instances[actual_format]
@@ -340,7 +422,8 @@ class ExporterRegistry:
     
     def list_formats(self) -> List[str]:
         """Get list of available export formats."""
-        return list(self._exporters.keys())
+        return list(self._exporters.keys()) + [name for name in self._lazy_exporters
+                                               if name not in self._exporters]
     
     def list_format_info(self) -> Dict[str, FormatInfo]:
         """Get format information for all registered exporters."""
@@ -354,7 +437,7 @@ class ExporterRegistry:
     def is_format_supported(self, format_name: str) -> bool:
         """Check if a format is supported."""
         actual_format = self._format_aliases.get(format_name, format_name)
-        return actual_format in self._exporters
+        return actual_format in self._exporters or actual_format in self._lazy_exporters
     
     def validate_format_config(self, format_name: str, config: Dict[str, Any]) -> List[str]:
         """
@@ -385,6 +468,7 @@ class ExporterRegistry:
         self._exporters.clear()
         self._instances.clear()
         self._format_aliases.clear()
+        self._lazy_exporters.clear()
         self.logger.debug("Cleared exporter registry")
 
 
@@ -398,11 +482,13 @@ def register_core_exporters() -> None:
     from .csv import CsvExporter
     from .sqlite import SqliteExporter
     from .markdown import MarkdownExporter
+    from .parquet import ParquetExporter
     
     registry.register_exporter(JsonExporter, aliases=['json'])
     registry.register_exporter(CsvExporter, aliases=['csv'])
     registry.register_exporter(SqliteExporter, aliases=['sqlite', 'db'])
     registry.register_exporter(MarkdownExporter, aliases=['markdown', 'md'])
+    registry.register_exporter(ParquetExporter, aliases=['parquet'])
 
 
 def get_exporter(format_name: str) -> Optional[BaseExporter]:
@@ -10,9 +10,10 @@ import json
 import gzip
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
 from datetime import datetime
 from io import StringIO
+from itertools import chain, islice
 
 from .base import BaseExporter, ExportResult, FormatInfo
 
@@ -27,8 +28,13 @@ class CsvExporter(BaseExporter):
     - Data type conversion and formatting
     - Multiple CSV dialects support
     - Optional compression
-    - Streaming support for large datasets
+    - Streaming export with a declared or sampled schema; fields outside
+      the schema are spilled into a JSON overflow column
     - Excel compatibility mode
+    
+    CSV exports are always written in full: the column set comes from the
+    posts of each run, so rows appended by a later run could not be aligned
+    with an existing header, and incremental export is not supported.
     """
     
     def _create_format_info(self) -> FormatInfo:
@@ -40,7 +46,7 @@ class CsvExporter(BaseExporter):
             mime_type="text/csv",
             supports_compression=True,
             supports_streaming=True,
-            supports_incremental=True,
+            supports_incremental=False,
             max_records=1000000,  # Excel limit
             schema_required=False
         )
@@ -118,6 +124,23 @@ class CsvExporter(BaseExporter):
                 'default': False,
                 'description': 'Compress output with gzip'
             },
+            'columns': {
+                'type': 'array',
+                'default': [],
+                'description': 'Declared output columns for streaming export (empty = sample)'
+            },
+            'schema_sample_size': {
+                'type': 'integer',
+                'default': 1000,
+                'minimum': 1,
+                'maximum': 1000000,
+                'description': 'Rows buffered to discover columns when streaming without declared columns'
+            },
+            'overflow_column': {
+                'type': 'string',
+                'default': '_extra',
+                'description': 'Column holding JSON for fields outside the streaming schema'
+            },
             'field_mapping': {
                 'type': 'object',
                 'default': {},
@@ -201,25 +224,135 @@ class CsvExporter(BaseExporter):
         
         return result
     
+    def export_stream(self, posts: Iterable[Dict[str, Any]], metadata: Dict[str, Any],
+                      output_path: str, config: Dict[str, Any]) -> ExportResult:
+        """
+        Export posts from an iterator, writing each row as it is flattened.
+        
+        Columns come from the declared ``columns`` list or, if none are
+        declared, from the first ``schema_sample_size`` rows, which are
+        buffered. When the stream ends within the sample the output is
+        identical to ``export``. Otherwise later fields that are not in the
+        header are written as a JSON object to ``overflow_column``, so memory
+        stays bounded by the sample size regardless of the number of rows.
+        """
+        start_time = time.time()
+        result = ExportResult(format_name="csv")
+        
+        try:
+            if 'export_info' not in metadata:
+                result.add_error("Data missing export_info")
+                return result
+            
+            output_file = self.prepare_output_path(output_path, config)
+            rows = (
+                row for row in (
+                    self._process_post_fields(self._flatten_post(post, config), config)
+                    for post in posts if isinstance(post, dict)
+                ) if row
+            )
+            
+            field_mapping = config.get('field_mapping', {})
+            declared = [field_mapping.get(column, column) for column in config.get('columns', [])]
+            buffered: List[Dict[str, Any]] = []
+            if declared:
+                columns = list(declared)
+                exhausted = False
+            else:
+                buffered = list(islice(rows, config.get('schema_sample_size', 1000)))
+                if not buffered:
+                    result.add_warning("No posts to export")
+                    self._write_empty_csv(output_file, config)
+                    result.output_path = str(output_file)
+                    return result
+                
+                all_columns = set()
+                for row in buffered:
+                    all_columns.update(row.keys())
+                columns = sorted(all_columns)
+                # Peek one row ahead: an overflow column is only needed if the
+                # stream continues past the sample
+                lookahead = list(islice(rows, 1))
+                exhausted = not lookahead
+                rows = chain(lookahead, rows)
+            
+            overflow_column = config.get('overflow_column', '_extra')
+            header = list(columns)
+            if not exhausted and overflow_column and overflow_column not in header:
+                header.append(overflow_column)
+            
+            if config.get('compress', False):
+                output_file = output_file.with_suffix(output_file.suffix + '.gz')
+            
+            known = set(columns)
+            written = 0
+            overflow_rows = 0
+            csv_params = self._get_csv_params(config)
+            
+            with self._open_csv(output_file, 'w', config) as f:
+                writer = csv.DictWriter(f, fieldnames=header, **csv_params)
+                if config.get('include_header', True):
+                    writer.writeheader()
+                
+                self._write_csv_rows(writer, buffered, header, config)
+                written += len(buffered)
+                
+                for row in rows:
+                    extras = {key: row[key] for key in row if key not in known}
+                    if extras and overflow_column in header:
+                        row = {key: value for key, value in row.items() if key in known}
+                        row[overflow_column] = json.dumps(extras, default=str, ensure_ascii=False,
+                                                          sort_keys=True)
+                        overflow_rows += 1
+                    self._write_csv_rows(writer, [row], header, config)
+                    written += 1
+            
+            result.output_path = str(output_file)
+            result.records_exported = written
+            result.execution_time = time.time() - start_time
+            result.metadata['compressed'] = config.get('compress', False)
+            result.metadata['columns'] = header
+            result.metadata['column_count'] = len(header)
+            result.metadata['csv_params'] = csv_params
+            result.metadata['streamed'] = True
+            result.metadata['overflow_rows'] = overflow_rows
+            
+            if output_file.exists():
+                result.file_size = output_file.stat().st_size
+            
+            self.logger.info(f"CSV streaming export completed: {written} records to {output_file}")
+            
+        except Exception as e:
+            result.add_error(f"CSV export failed: {e}")
+            self.logger.error(f"CSV export error: {e}")
+        
+        return result
+    
+    def _open_csv(self, path: Path, mode: str, config: Dict[str, Any]):
+        """Open a CSV file for text I/O, transparently handling gzip output."""
+        encoding = config.get('encoding', 'utf-8')
+        if config.get('compress', False):
+            return gzip.open(path, mode + 't', encoding=encoding, newline='')
+        return open(path, mode, encoding=encoding, newline='')
+    
     def _flatten_posts(self, posts: List[Dict[str, Any]], config: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Flatten post metadata for tabular format."""
-        flattened = []
+        return [self._flatten_post(post, config) for post in posts]
+    
+    def _flatten_post(self, post: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten a single post into column/value pairs."""
         flatten_nested = config.get('flatten_nested', True)
         flatten_arrays = config.get('flatten_arrays', True)
         max_text_length = config.get('max_text_length', 1000)
         
-        for post in posts:
-            flattened_post = {}
-            
-            for key, value in post.items():
-                processed_values = self._flatten_value(
-                    key, value, flatten_nested, flatten_arrays, max_text_length, config
-                )
-                flattened_post.update(processed_values)
-            
-            flattened.append(flattened_post)
+        flattened_post = {}
+        for key, value in post.items():
+            processed_values = self._flatten_value(
+                key, value, flatten_nested, flatten_arrays, max_text_length, config
+            )
+            flattened_post.update(processed_values)
         
-        return flattened
+        return flattened_post
     
     def _flatten_value(self, key: str, value: Any, flatten_nested: bool, 
                       flatten_arrays: bool, max_text_length: int, 
@@ -318,28 +451,32 @@ class CsvExporter(BaseExporter):
     def _apply_field_processing(self, posts: List[Dict[str, Any]], 
                                config: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Apply field filtering and mapping to processed posts."""
-        field_mapping = config.get('field_mapping', {})
-        include_fields = config.get('include_fields', [])
-        exclude_fields = config.get('exclude_fields', [])
-        
         processed = []
         
         for post in posts:
-            processed_post = {}
-            
-            for key, value in post.items():
-                # Apply field mapping
-                mapped_key = field_mapping.get(key, key)
-                
-                # Apply field filtering
-                if self._should_include_field(key, include_fields, exclude_fields):
-                    processed_post[mapped_key] = value
-            
+            processed_post = self._process_post_fields(post, config)
             if processed_post:  # Only include non-empty posts
                 processed.append(processed_post)
         
         return processed
     
+    def _process_post_fields(self, post: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply field filtering and mapping to a single flattened post."""
+        field_mapping = config.get('field_mapping', {})
+        include_fields = config.get('include_fields', [])
+        exclude_fields = config.get('exclude_fields', [])
+        
+        processed_post = {}
+        for key, value in post.items():
+            # Apply field mapping
+            mapped_key = field_mapping.get(key, key)
+            
+            # Apply field filtering
+            if self._should_include_field(key, include_fields, exclude_fields):
+                processed_post[mapped_key] = value
+        
+        return processed_post
+    
     def _should_include_field(self, field_name: str, include_fields: List[str], 
                              exclude_fields: List[str]) -> bool:
         """Determine if a field should be included in output."""
@@ -406,6 +543,11 @@ class CsvExporter(BaseExporter):
             writer.writeheader()
         
         # Write data rows
+        self._write_csv_rows(writer, posts, columns, config)
+    
+    def _write_csv_rows(self, writer: csv.DictWriter, posts: Iterable[Dict[str, Any]],
+                        columns: List[str], config: Dict[str, Any]) -> None:
+        """Write rows, filling columns a post lacks with the null value."""
         null_value = config.get('null_value', '')
         
         for post in posts:
@@ -0,0 +1,182 @@
+"""
+Incremental Export Support
+
+Tracks which posts an export already contains so that repeated runs against
+the same output can append only new and changed posts instead of
+regenerating the whole file. NDJSON and Markdown exports keep a manifest
+next to the output; the SQLite exporter keeps the same fingerprints inside
+the database. CSV files and JSON documents are always written in full.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_SUFFIX = '.manifest.json'
+MANIFEST_VERSION = 1
+
+POST_NEW = 'new'
+POST_CHANGED = 'changed'
+POST_UNCHANGED = 'unchanged'
+
+
+def post_fingerprint(post: Dict[str, Any]) -> str:
+    """
+    Compute a stable content hash for a post dictionary.
+
+    Args:
+        post: Serialized post
+
+    Returns:
+        Hex digest that changes whenever any field of the post changes
+    """
+    payload = json.dumps(post, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def post_key(post: Dict[str, Any], fingerprint: Optional[str] = None) -> str:
+    """Key a post by its ID, falling back to its fingerprint when it has none."""
+    post_id = post.get('id')
+    if post_id:
+        return str(post_id)
+    return fingerprint or post_fingerprint(post)
+
+
+def manifest_path(output_file: Path) -> Path:
+    """Location of the manifest that accompanies an export file."""
+    output_file = Path(output_file)
+    return output_file.with_name(output_file.name + MANIFEST_SUFFIX)
+
+
+class ExportManifest:
+    """
+    Sidecar record of the posts already written to an export file.
+
+    Each entry maps a post key to its content fingerprint plus any extra
+    fields an exporter needs to maintain aggregate sections (for example the
+    Markdown statistics) without re-reading the export itself. The manifest
+    also keeps a high-water mark of the newest ``created_utc`` written and a
+    free-form ``attributes`` dict for per-file state.
+    """
+
+    def __init__(self, output_file: Path, format_name: str):
+        """
+        Load the manifest for an export file, if one exists.
+
+        Args:
+            output_file: Export file the manifest describes
+            format_name: Exporter format name; a manifest written by a
+                different format is ignored
+        """
+        self.output_file = Path(output_file)
+        self.path = manifest_path(self.output_file)
+        self.format_name = format_name
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.attributes: Dict[str, Any] = {}
+        self.high_water_mark = 0.0
+        self.runs = 0
+        self.loaded = False
+        self._load()
+
+    def _load(self) -> None:
+        """Read the manifest file, discarding it if it is unusable."""
+        if not self.path.exists() or not self.output_file.exists():
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable export manifest {self.path}: {e}")
+            return
+
+        if data.get('version') != MANIFEST_VERSION or data.get('format') != self.format_name:
+            logger.warning(f"Ignoring incompatible export manifest {self.path}")
+            return
+
+        self.entries = data.get('entries', {})
+        self.attributes = data.get('attributes', {})
+        self.high_water_mark = float(data.get('high_water_mark', 0.0))
+        self.runs = int(data.get('runs', 0))
+        self.loaded = True
+
+    def classify(self, post: Dict[str, Any]) -> Tuple[str, str, str]:
+        """
+        Compare a post against what the export already contains.
+
+        Args:
+            post: Serialized post
+
+        Returns:
+            Tuple of (status, key, fingerprint) where status is one of
+            POST_NEW, POST_CHANGED or POST_UNCHANGED
+        """
+        fingerprint = post_fingerprint(post)
+        key = post_key(post, fingerprint)
+        entry = self.entries.get(key)
+        if entry is None:
+            return POST_NEW, key, fingerprint
+        if entry.get('fingerprint') != fingerprint:
+            return POST_CHANGED, key, fingerprint
+        return POST_UNCHANGED, key, fingerprint
+
+    def record(self, key: str, fingerprint: str, post: Dict[str, Any], **extra: Any) -> None:
+        """
+        Record that a post has been written.
+
+        Args:
+            key: Post key returned by ``classify``
+            fingerprint: Post fingerprint returned by ``classify``
+            post: Serialized post (used for the high-water mark)
+            **extra: Additional per-post fields to keep in the entry
+        """
+        entry = {'fingerprint': fingerprint}
+        entry.update(extra)
+        self.entries[key] = entry
+
+        created_utc = post.get('created_utc')
+        if isinstance(created_utc, (int, float)) and created_utc > self.high_water_mark:
+            self.high_water_mark = float(created_utc)
+
+    def values(self, field: str) -> Iterable[Any]:
+        """Iterate over an extra field stored in every entry."""
+        for entry in self.entries.values():
+            if field in entry:
+                yield entry[field]
+
+    def save(self) -> None:
+        """Atomically write the manifest next to the export file."""
+        self.runs += 1
+        data = {
+            'version': MANIFEST_VERSION,
+            'format': self.format_name,
+            'output_file': self.output_file.name,
+            'updated_at': time.time(),
+            'runs': self.runs,
+            'high_water_mark': self.high_water_mark,
+            'attributes': self.attributes,
+            'entries': self.entries,
+        }
+
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(temp_path, self.path)
+        self.loaded = True
+
+    def summary(self, added: int, updated: int, unchanged: int) -> Dict[str, Any]:
+        """Build the ``incremental`` block reported in ExportResult metadata."""
+        return {
+            'added': added,
+            'updated': updated,
+            'unchanged': unchanged,
+            'total': len(self.entries),
+            'high_water_mark': self.high_water_mark,
+            'manifest': str(self.path),
+        }
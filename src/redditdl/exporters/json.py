@@ -6,13 +6,18 @@ and compression support for Reddit post metadata.
 """
 
 import json
-import gzip
 import time
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from datetime import datetime
 
 from .base import BaseExporter, ExportResult, FormatInfo
+from .incremental import ExportManifest, POST_NEW, POST_CHANGED, POST_UNCHANGED
+from .streaming import (
+    COMPRESSION_SUFFIXES, compressed_path, indent_block, json_separators, open_text_output,
+    resolve_compression
+)
 
 
 class JsonExporter(BaseExporter):
@@ -22,10 +27,12 @@ class JsonExporter(BaseExporter):
     Features:
     - Schema validation for consistent output structure
     - Pretty printing with configurable indentation
-    - Optional compression support
+    - Optional gzip/zstd compression applied while writing
     - Custom date serialization
     - Field filtering and selection
     - Metadata inclusion controls
+    - Streaming output (JSON document or NDJSON) written post by post
+    - Incremental mode that merges new and changed posts into an existing export
     """
     
     def _create_format_info(self) -> FormatInfo:
@@ -36,7 +43,7 @@ class JsonExporter(BaseExporter):
             description="JavaScript Object Notation with schema validation",
             mime_type="application/json",
             supports_compression=True,
-            supports_streaming=False,
+            supports_streaming=True,
             supports_incremental=True,
             schema_required=False
         )
@@ -66,6 +73,23 @@ class JsonExporter(BaseExporter):
                 'default': False,
                 'description': 'Compress output with gzip'
             },
+            'compression': {
+                'type': 'string',
+                'default': None,
+                'choices': ['none', 'gzip', 'zstd'],
+                'description': 'Compression codec (overrides compress)'
+            },
+            'json_format': {
+                'type': 'string',
+                'default': 'document',
+                'choices': ['document', 'ndjson'],
+                'description': 'Single JSON document or one post per line (NDJSON)'
+            },
+            'incremental': {
+                'type': 'boolean',
+                'default': False,
+                'description': 'Append new and changed posts to an existing NDJSON export (documents are always rewritten)'
+            },
             'include_metadata': {
                 'type': 'boolean',
                 'default': True,
@@ -122,6 +146,10 @@ class JsonExporter(BaseExporter):
                     result.add_error(error)
                 return result
             
+            if config.get('json_format', 'document') == 'ndjson':
+                metadata = {key: value for key, value in data.items() if key != 'posts'}
+                return self.export_stream(data.get('posts', []), metadata, output_path, config)
+            
             # Prepare output path
             output_file = self.prepare_output_path(output_path, config)
             
@@ -145,7 +173,7 @@ class JsonExporter(BaseExporter):
             # Write output file
             self._write_json_file(processed_data, output_file, config, result)
             
-            result.output_path = str(output_file)
+            output_file = Path(result.output_path)
             result.records_exported = len(data.get('posts', []))
             result.execution_time = time.time() - start_time
             
@@ -161,6 +189,264 @@ class JsonExporter(BaseExporter):
         
         return result
     
+    def export_stream(self, posts: Iterable[Dict[str, Any]], metadata: Dict[str, Any],
+                      output_path: str, config: Dict[str, Any]) -> ExportResult:
+        """
+        Export posts from an iterator, serializing one post at a time.
+        
+        In ``document`` mode the output has the same structure and formatting
+        as ``export``; in ``ndjson`` mode each post is written as a compact JSON
+        line and metadata goes to a ``.meta.json`` companion file.
+        
+        Args:
+            posts: Iterable of post dictionaries
+            metadata: Non-post export data (export_info, pipeline metadata)
+            output_path: Path where the export file should be created
+            config: Export configuration options
+            
+        Returns:
+            ExportResult: Details about the export operation
+        """
+        if config.get('incremental', False) and self.supports_incremental(config):
+            return self._export_incremental(posts, metadata, output_path, config)
+        
+        start_time = time.time()
+        result = ExportResult(format_name="json")
+        
+        try:
+            output_file = self.prepare_output_path(output_path, config)
+            compression = resolve_compression(config)
+            
+            if config.get('json_format', 'document') == 'ndjson':
+                output_file = compressed_path(output_file.with_suffix('.ndjson'), compression)
+                records = self._write_ndjson_stream(posts, metadata, output_file, config, compression, result)
+            else:
+                output_file = compressed_path(output_file, compression)
+                records = self._write_document_stream(posts, metadata, output_file, config, compression, result)
+            
+            result.output_path = str(output_file)
+            result.records_exported = records
+            result.metadata['compressed'] = compression != 'none'
+            result.metadata['compression'] = compression
+            result.metadata['streamed'] = True
+            result.execution_time = time.time() - start_time
+            
+            if output_file.exists():
+                result.file_size = output_file.stat().st_size
+            
+            self.logger.info(f"JSON streaming export completed: {records} records to {output_file}")
+            
+        except Exception as e:
+            result.add_error(f"JSON export failed: {e}")
+            self.logger.error(f"JSON export error: {e}")
+        
+        return result
+    
+    def supports_incremental(self, config: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Check if this exporter supports incremental exports.
+        
+        Only NDJSON output can be appended to; a JSON document is always
+        written in full.
+        """
+        if config is not None and config.get('json_format', 'document') != 'ndjson':
+            return False
+        return super().supports_incremental(config)
+    
+    def _export_incremental(self, posts: Iterable[Dict[str, Any]], metadata: Dict[str, Any],
+                            output_path: str, config: Dict[str, Any]) -> ExportResult:
+        """
+        Append new and changed posts to an existing NDJSON export.
+        
+        Lines are never rewritten: a post that changed since it was exported
+        gets a new line with its current version, so when an id appears more
+        than once the last line for it wins. The metadata file's post_count
+        is the number of distinct posts.
+        
+        Args:
+            posts: Iterable of post dictionaries
+            metadata: Non-post export data (export_info, pipeline metadata)
+            output_path: Stable path of the export across runs
+            config: Export configuration options
+            
+        Returns:
+            ExportResult: Details about the export operation
+        """
+        start_time = time.time()
+        result = ExportResult(format_name="json")
+        
+        try:
+            output_file = self.prepare_output_path(output_path, config)
+            compression = resolve_compression(config)
+            output_file = compressed_path(output_file.with_suffix('.ndjson'), compression)
+            
+            manifest = ExportManifest(output_file, 'json')
+            counts = {POST_NEW: 0, POST_CHANGED: 0, POST_UNCHANGED: 0}
+            pending = []
+            
+            for post in posts:
+                if not isinstance(post, dict):
+                    continue
+                status, key, fingerprint = manifest.classify(post)
+                counts[status] += 1
+                if status != POST_UNCHANGED:
+                    manifest.record(key, fingerprint, post)
+                    pending.append(post)
+            
+            records = self._write_ndjson_stream(
+                pending, metadata, output_file, config, compression, result,
+                append=manifest.loaded, total_records=len(manifest.entries)
+            )
+            manifest.save()
+            
+            result.output_path = str(output_file)
+            result.records_exported = records
+            result.metadata['compressed'] = compression != 'none'
+            result.metadata['compression'] = compression
+            result.metadata['incremental'] = manifest.summary(
+                counts[POST_NEW], counts[POST_CHANGED], counts[POST_UNCHANGED]
+            )
+            result.execution_time = time.time() - start_time
+            
+            if output_file.exists():
+                result.file_size = output_file.stat().st_size
+            
+            self.logger.info(
+                f"JSON incremental export completed: {counts[POST_NEW]} new, "
+                f"{counts[POST_CHANGED]} updated, {counts[POST_UNCHANGED]} unchanged in {output_file}"
+            )
+            
+        except Exception as e:
+            result.add_error(f"JSON export failed: {e}")
+            self.logger.error(f"JSON export error: {e}")
+        
+        return result
+    
+    def _iter_processed_posts(self, posts: Iterable[Dict[str, Any]],
+                              config: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+        """Apply per-post processing and field filtering lazily."""
+        field_filter = config.get('field_filter', [])
+        exclude_fields = config.get('exclude_fields', [])
+        
+        for post in posts:
+            processed_post = self._process_post(post, config)
+            if not processed_post:
+                continue
+            if field_filter or exclude_fields:
+                processed_post = self._filter_post_fields(processed_post, field_filter, exclude_fields)
+                if not processed_post:
+                    continue
+            yield processed_post
+    
+    def _build_stream_header(self, metadata: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the non-post portion of a streamed document."""
+        header = self._process_data(metadata, config)
+        output_data = self._add_export_metadata(header, config)
+        
+        # Posts are not known yet; take the count announced by the caller
+        if not output_data['export_info'].get('post_count'):
+            output_data['export_info']['post_count'] = metadata.get('export_info', {}).get('post_count', 0)
+        return output_data
+    
+    def _write_document_stream(self, posts: Iterable[Dict[str, Any]], metadata: Dict[str, Any],
+                               output_file: Path, config: Dict[str, Any], compression: str,
+                               result: ExportResult) -> int:
+        """Write a single JSON document whose posts array is streamed."""
+        indent = config.get('indent', 2) or None
+        sort_keys = config.get('sort_keys', True)
+        dumps = partial(
+            json.dumps,
+            indent=indent,
+            ensure_ascii=config.get('ensure_ascii', False),
+            sort_keys=sort_keys,
+            separators=json_separators(indent),
+            default=self._json_serializer
+        )
+        
+        header = self._build_stream_header(metadata, config)
+        include_posts = config.get('include_posts', True)
+        # Match export(): export_info first, then posts, then remaining metadata
+        keys = list(header)
+        if include_posts:
+            keys.insert(1, 'posts')
+        if sort_keys:
+            keys.sort()
+        
+        newline = '\n' if indent else ''
+        outer_pad = ' ' * indent if indent else ''
+        inner_pad = ' ' * (indent * 2) if indent else ''
+        key_separator = json_separators(indent)[1]
+        written = 0
+        missing_ids = 0
+        
+        with open_text_output(output_file, compression) as f:
+            f.write('{')
+            for i, key in enumerate(keys):
+                if i:
+                    f.write(',')
+                f.write(f"{newline}{outer_pad}{json.dumps(key)}{key_separator}")
+                
+                if key != 'posts':
+                    f.write(indent_block(dumps(header[key]), indent, 1))
+                    continue
+                
+                f.write('[')
+                for post in self._iter_processed_posts(posts, config):
+                    if written:
+                        f.write(',')
+                    f.write(f"{newline}{inner_pad}{indent_block(dumps(post), indent, 2)}")
+                    if written < 5 and 'id' not in post:
+                        missing_ids += 1
+                    written += 1
+                f.write(f"{newline}{outer_pad}]" if written else ']')
+            f.write(f"{newline}}}" if keys else '}')
+        
+        if config.get('validate_output', True):
+            expected = header.get('export_info', {}).get('post_count')
+            if include_posts and expected is not None and expected != written:
+                result.add_warning(f"Schema validation: export_info.post_count is {expected} "
+                                   f"but {written} posts were written")
+            if missing_ids:
+                result.add_warning(f"Schema validation: {missing_ids} of the first posts missing 'id' field")
+        
+        return written
+    
+    def _write_ndjson_stream(self, posts: Iterable[Dict[str, Any]], metadata: Dict[str, Any],
+                             output_file: Path, config: Dict[str, Any], compression: str,
+                             result: ExportResult, append: bool = False,
+                             total_records: Optional[int] = None) -> int:
+        """Write one compact JSON object per line, plus a metadata companion file."""
+        dumps = partial(
+            json.dumps,
+            ensure_ascii=config.get('ensure_ascii', False),
+            sort_keys=config.get('sort_keys', True),
+            separators=(',', ':'),
+            default=self._json_serializer
+        )
+        
+        written = 0
+        with open_text_output(output_file, compression, append=append) as f:
+            if config.get('include_posts', True):
+                for post in self._iter_processed_posts(posts, config):
+                    f.write(dumps(post))
+                    f.write('\n')
+                    written += 1
+        
+        if config.get('include_metadata', True):
+            header = self._build_stream_header(metadata, config)
+            header['export_info']['post_count'] = written if total_records is None else total_records
+            header['export_info']['records_file'] = output_file.name
+            # Drop the compression and record suffixes only; dots in the stem are kept
+            records_file = output_file
+            if compression != 'none' and output_file.suffix == COMPRESSION_SUFFIXES[compression]:
+                records_file = output_file.with_suffix('')
+            meta_file = records_file.with_suffix('.meta.json')
+            with open(meta_file, 'w', encoding='utf-8') as f:
+                json.dump(header, f, indent=2, ensure_ascii=False, default=self._json_serializer)
+            result.metadata['metadata_file'] = str(meta_file)
+        
+        return written
+    
     def _process_data(self, data: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
         """Process data according to configuration options."""
         processed = {}
@@ -367,16 +653,14 @@ class JsonExporter(BaseExporter):
             json_str = json.dumps(data, **json_options)
             
             # Write to file (with optional compression)
-            if config.get('compress', False):
-                output_file = output_file.with_suffix(output_file.suffix + '.gz')
-                with gzip.open(output_file, 'wt', encoding='utf-8') as f:
-                    f.write(json_str)
-                result.metadata['compressed'] = True
-            else:
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(json_str)
-                result.metadata['compressed'] = False
+            compression = resolve_compression(config)
+            output_file = compressed_path(output_file, compression)
+            with open_text_output(output_file, compression) as f:
+                f.write(json_str)
+            result.metadata['compressed'] = compression != 'none'
+            result.metadata['compression'] = compression
             
+            result.output_path = str(output_file)
             result.metadata['json_options'] = json_options
             
         except Exception as e:
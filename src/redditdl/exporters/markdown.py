@@ -5,15 +5,258 @@ Template-based Markdown exporter for human-readable reports and documentation
 of Reddit post data with customizable formatting and structure.
 """
 
+import heapq
 import json
+import pickle
+import re
+import shutil
+import tempfile
 import time
 import gzip
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple, Union
 from datetime import datetime
 from textwrap import wrap, dedent
 
 from .base import BaseExporter, ExportResult, FormatInfo
+from .incremental import ExportManifest, POST_NEW, POST_CHANGED, POST_UNCHANGED
+
+
+class _PostStatistics:
+    """Running totals behind the statistics section, updated one post at a time."""
+    
+    def __init__(self):
+        self.total_posts = 0
+        self.total_score = 0
+        self.total_comments = 0
+        self.nsfw_count = 0
+        self.subreddit_counts: Dict[str, int] = {}
+        self.authors: Set[str] = set()
+        self.post_types: Dict[str, int] = {}
+    
+    def add(self, post: Dict[str, Any]) -> None:
+        """Fold one post into the totals."""
+        self.total_posts += 1
+        self.total_score += post.get('score', 0)
+        self.total_comments += post.get('num_comments', 0)
+        
+        subreddit = post.get('subreddit', '')
+        if subreddit:
+            self.subreddit_counts[subreddit] = self.subreddit_counts.get(subreddit, 0) + 1
+        author = post.get('author', '')
+        if author:
+            self.authors.add(author)
+        
+        post_type = post.get('post_type', 'unknown')
+        self.post_types[post_type] = self.post_types.get(post_type, 0) + 1
+        
+        if post.get('is_nsfw', False):
+            self.nsfw_count += 1
+    
+    def headings(self) -> List[Tuple[int, str]]:
+        """Headings the rendered statistics section contains."""
+        if not self.total_posts:
+            return [(2, "Statistics")]
+        headings = [(2, "Statistics"), (3, "Post Types")]
+        if len(self.subreddit_counts) > 1:
+            headings.append((3, "Top Subreddits"))
+        return headings
+    
+    def render(self) -> str:
+        """Render the statistics section."""
+        if not self.total_posts:
+            return "## Statistics\n\nNo posts to analyze.\n"
+        
+        total_posts = self.total_posts
+        nsfw_count = self.nsfw_count
+        stats = f"""## Statistics
+
+| Metric | Value |
+|--------|--------|
+| Total Posts | {total_posts:,} |
+| Total Score | {self.total_score:,} |
+| Total Comments | {self.total_comments:,} |
+| Unique Subreddits | {len(self.subreddit_counts):,} |
+| Unique Authors | {len(self.authors):,} |
+| NSFW Posts | {nsfw_count:,} ({nsfw_count/total_posts*100:.1f}%) |
+
+### Post Types
+
+| Type | Count | Percentage |
+|------|-------|-----------|"""
+
+        for post_type, count in sorted(self.post_types.items(), key=lambda x: x[1], reverse=True):
+            percentage = count / total_posts * 100
+            stats += f"\n| {post_type.title()} | {count:,} | {percentage:.1f}% |"
+        
+        # Top subreddits
+        if len(self.subreddit_counts) > 1:
+            stats += "\n\n### Top Subreddits\n\n| Subreddit | Posts |\n|-----------|-------|\n"
+            for sub, count in sorted(self.subreddit_counts.items(), key=lambda x: x[1], reverse=True)[:10]:
+                stats += f"| r/{sub} | {count:,} |\n"
+        
+        stats += "\n"
+        return stats
+
+
+class _MarkdownPager:
+    """
+    Page files of a paginated Markdown export.
+    
+    Sequential pages are written whole from a bounded buffer. Group pages are
+    appended to as posts arrive; at most MAX_OPEN_FILES of them stay open and
+    others are reopened in append mode when their group comes up again.
+    """
+    
+    MAX_OPEN_FILES = 64
+    
+    def __init__(self, exporter: 'MarkdownExporter', page_dir: Path, index_name: str,
+                 config: Dict[str, Any]):
+        self.exporter = exporter
+        self.page_dir = page_dir
+        self.index_link = f"../{index_name}"
+        self.config = config
+        self.page_size = max(1, config.get('page_size', 500))
+        self.suffix = '.md.gz' if config.get('compress', False) else '.md'
+        self.title = config.get('title', 'Reddit Data Export')
+        self.group_by = config.get('group_by', 'subreddit')
+        self.files: List[Path] = []
+        self._groups: Dict[str, Dict[str, Any]] = {}
+        self._slugs: Set[str] = set()
+        self._handles: 'OrderedDict[str, TextIO]' = OrderedDict()
+        
+        page_dir.mkdir(parents=True, exist_ok=True)
+        # Pages left over from an earlier export to the same path would be
+        # linked from nowhere, so start from an empty directory
+        for stale in page_dir.glob(f"*{self.suffix}"):
+            stale.unlink()
+    
+    def write_page(self, posts: List[Dict[str, Any]], index_entries: TextIO, has_next: bool) -> None:
+        """Write one sequential page of already ordered posts, and list it in the index."""
+        number = len(self.files) + 1
+        name = self._sequential_name(number)
+        navigation = self._navigation(
+            self._sequential_name(number - 1) if number > 1 else None,
+            self._sequential_name(number + 1) if has_next else None
+        )
+        include_toc = self.config.get('include_toc', True)
+        
+        with self._open(name, 'w') as f:
+            f.write(f"# {self.title} - Page {number}\n\n{navigation}\n\n---\n\n")
+            if include_toc:
+                f.write(self.exporter._render_toc(
+                    (2, self.exporter._post_heading(post)) for post in posts
+                ) + "\n")
+            f.write("## Posts\n")
+            for post in posts:
+                f.write('\n' + self.exporter._format_post(post, self.config))
+            f.write(f"\n{navigation}\n")
+        
+        link = f"{self.page_dir.name}/{name}"
+        index_entries.write(f"- [Page {number}]({link}) - {len(posts):,} posts\n")
+        if include_toc:
+            for post in posts:
+                heading = self.exporter._post_heading(post)
+                index_entries.write(f"  - [{heading}]({link}#{self.exporter._heading_anchor(heading)})\n")
+    
+    def add_grouped(self, group: str, post: Dict[str, Any]) -> None:
+        """Append a post to the current page of its group."""
+        state = self._groups.get(group)
+        if state is None:
+            state = self._groups[group] = {'slug': self._unique_slug(group), 'pages': [],
+                                           'count': 0, 'page_count': 0}
+            self._start_group_page(group, state)
+        elif state['page_count'] >= self.page_size:
+            next_name = self._group_page_name(state['slug'], len(state['pages']) + 1)
+            self._handle(state['pages'][-1]).write(f"\n{self._navigation(None, next_name)}\n")
+            self._close(state['pages'][-1])
+            self._start_group_page(group, state)
+        
+        self._handle(state['pages'][-1]).write('\n' + self.exporter._format_post(post, self.config))
+        state['count'] += 1
+        state['page_count'] += 1
+    
+    def write_group_entries(self, index_entries: TextIO) -> None:
+        """List every group and its pages in the index, largest group first."""
+        for group, state in sorted(self._groups.items(), key=lambda x: x[1]['count'], reverse=True):
+            title = self.exporter._group_title(group, self.group_by)[3:]
+            links = [f"{self.page_dir.name}/{name}" for name in state['pages']]
+            entry = f"- [{title}]({links[0]}) - {state['count']:,} posts"
+            if len(links) > 1:
+                pages = ', '.join(f"[{number}]({link})" for number, link in enumerate(links, 1))
+                entry += f" (pages: {pages})"
+            index_entries.write(entry + "\n")
+    
+    def close(self) -> None:
+        """Close all open page files."""
+        for name in list(self._handles):
+            self._close(name)
+    
+    def _start_group_page(self, group: str, state: Dict[str, Any]) -> None:
+        number = len(state['pages']) + 1
+        name = self._group_page_name(state['slug'], number)
+        previous = state['pages'][-1] if state['pages'] else None
+        heading = self.exporter._group_title(group, self.group_by)[3:]
+        if number > 1:
+            heading += f" (page {number})"
+        
+        state['pages'].append(name)
+        state['page_count'] = 0
+        handle = self._open(name, 'w')
+        self._remember(name, handle)
+        handle.write(f"# {self.title} - {heading}\n\n{self._navigation(previous, None)}\n\n---\n")
+    
+    def _sequential_name(self, number: int) -> str:
+        return f"page-{number:04d}{self.suffix}"
+    
+    def _group_page_name(self, slug: str, number: int) -> str:
+        return f"{slug}{self.suffix}" if number == 1 else f"{slug}-{number}{self.suffix}"
+    
+    def _unique_slug(self, group: str) -> str:
+        """File-system safe, case-insensitively unique name for a group."""
+        base = re.sub(r'[^a-z0-9_]+', '-', str(group).lower()).strip('-')[:80] or 'group'
+        slug = base
+        counter = 2
+        while slug in self._slugs:
+            slug = f"{base}-{counter}"
+            counter += 1
+        self._slugs.add(slug)
+        return slug
+    
+    def _navigation(self, previous: Optional[str], following: Optional[str]) -> str:
+        links = [f"[Index]({self.index_link})"]
+        if previous:
+            links.append(f"[Previous]({previous})")
+        if following:
+            links.append(f"[Next]({following})")
+        return " | ".join(links)
+    
+    def _open(self, name: str, mode: str) -> TextIO:
+        path = self.page_dir / name
+        if mode == 'w':
+            self.files.append(path)
+        return self.exporter._open_text(path, self.config, mode)
+    
+    def _handle(self, name: str) -> TextIO:
+        handle = self._handles.get(name)
+        if handle is None:
+            handle = self._open(name, 'a')
+            self._remember(name, handle)
+        else:
+            self._handles.move_to_end(name)
+        return handle
+    
+    def _remember(self, name: str, handle: TextIO) -> None:
+        self._handles[name] = handle
+        while len(self._handles) > self.MAX_OPEN_FILES:
+            _, oldest = self._handles.popitem(last=False)
+            oldest.close()
+    
+    def _close(self, name: str) -> None:
+        handle = self._handles.pop(name, None)
+        if handle is not None:
+            handle.close()
 
 
 class MarkdownExporter(BaseExporter):
@@ -29,8 +272,17 @@ class MarkdownExporter(BaseExporter):
     - Link validation and formatting
     - Export metadata inclusion
     - Multiple output styles (report, documentation, blog)
+    - Sections are written to the file as they are formatted; statistics and
+      the table of contents come from one aggregated pass over the posts
+    - Paginated mode for large archives: bounded-size page files (per N posts
+      or per group) plus an index document with statistics and page links
+    - Incremental mode: each run appends one update page of new and changed
+      posts, and only the small index with the statistics is rewritten
     """
     
+    # Post fields kept in the manifest to recompute statistics
+    STATISTICS_FIELDS = ('score', 'num_comments', 'subreddit', 'author', 'post_type', 'is_nsfw')
+    
     def _create_format_info(self) -> FormatInfo:
         """Create format information for Markdown export."""
         return FormatInfo(
@@ -39,8 +291,8 @@ class MarkdownExporter(BaseExporter):
             description="Markdown format with template-based rendering",
             mime_type="text/markdown",
             supports_compression=True,
-            supports_streaming=False,
-            supports_incremental=False,
+            supports_streaming=True,
+            supports_incremental=True,
             schema_required=False
         )
     
@@ -135,6 +387,26 @@ class MarkdownExporter(BaseExporter):
                 'default': False,
                 'description': 'Compress output with gzip'
             },
+            'incremental': {
+                'type': 'boolean',
+                'default': False,
+                'description': 'Append new and changed posts as an update page and refresh '
+                               'the index statistics (pagination is ignored)'
+            },
+            'paginate': {
+                'type': 'string',
+                'default': 'none',
+                'choices': ['none', 'posts', 'group'],
+                'description': 'Split posts into page files per page_size posts or per group, '
+                               'with the output file as an index'
+            },
+            'page_size': {
+                'type': 'integer',
+                'default': 500,
+                'minimum': 1,
+                'maximum': 100000,
+                'description': 'Maximum posts per page file when paginating'
+            },
             'custom_template_path': {
                 'type': 'string',
                 'default': '',
@@ -166,6 +438,16 @@ class MarkdownExporter(BaseExporter):
             
             # Extract and process posts
             posts = data.get('posts', [])
+            if config.get('incremental', False):
+                self._export_incremental(posts, data, output_file, config, result)
+                result.execution_time = time.time() - start_time
+                return result
+            
+            if config.get('paginate', 'none') != 'none':
+                self._export_paged(posts, data, output_file, config, result)
+                result.execution_time = time.time() - start_time
+                return result
+            
             if not posts:
                 result.add_warning("No posts to export")
                 # Create empty document
@@ -176,11 +458,8 @@ class MarkdownExporter(BaseExporter):
             # Process posts according to configuration
             processed_posts = self._process_posts(posts, config)
             
-            # Generate document sections
-            document_sections = self._generate_document(processed_posts, data, config)
-            
-            # Write markdown file
-            self._write_markdown_file(document_sections, output_file, config, result)
+            # Write markdown file, streaming sections as they are formatted
+            output_file = self._write_markdown_file(processed_posts, data, output_file, config, result)
             
             result.output_path = str(output_file)
             result.records_exported = len(processed_posts)
@@ -198,39 +477,235 @@ class MarkdownExporter(BaseExporter):
         
         return result
     
-    def _process_posts(self, posts: List[Dict[str, Any]], config: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Process and filter posts according to configuration."""
-        processed = []
+    def export_stream(self, posts: Iterable[Dict[str, Any]], metadata: Dict[str, Any],
+                      output_path: str, config: Dict[str, Any]) -> ExportResult:
+        """
+        Export posts from an iterator.
+
+        Paginated and incremental exports consume the iterator directly;
+        paginated ones hold at most one page of posts. A single sorted,
+        grouped document needs every post up front, so the other modes
+        materialize the iterator first.
+        """
+        incremental = config.get('incremental', False)
+        if config.get('paginate', 'none') == 'none' and not incremental:
+            return super().export_stream(posts, metadata, output_path, config)
         
-        for post in posts:
-            processed_post = post.copy()
+        start_time = time.time()
+        result = ExportResult(format_name="markdown")
+        try:
+            output_file = self.prepare_output_path(output_path, config)
+            if incremental:
+                self._export_incremental(posts, metadata, output_file, config, result)
+            else:
+                self._export_paged(posts, metadata, output_file, config, result)
+        except Exception as e:
+            result.add_error(f"Markdown export failed: {e}")
+            self.logger.error(f"Markdown export error: {e}")
+        result.execution_time = time.time() - start_time
+        return result
+    
+    def _export_paged(self, posts: Iterable[Dict[str, Any]], data: Dict[str, Any],
+                      output_file: Path, config: Dict[str, Any], result: ExportResult) -> None:
+        """
+        Write posts to paginated files plus an index document.
+
+        With ``paginate='posts'`` posts are ordered by ``sort_by`` across
+        all pages: page-sized runs are sorted and spilled to a temporary
+        file, then merged while pages are written, so memory stays bounded
+        by the page size. With ``'group'`` every group gets its own sequence
+        of pages that posts are appended to in arrival order. ``max_posts``
+        keeps the first posts received. The index (written to
+        ``output_file``) holds the statistics, gathered while pages are
+        written, and links to every page.
+        """
+        paginate = config.get('paginate', 'posts')
+        group_by = config.get('group_by', 'subreddit')
+        if group_by == 'none':
+            paginate = 'posts'
+        page_size = max(1, config.get('page_size', 500))
+        max_posts = config.get('max_posts', 0)
+        
+        index_file = output_file
+        if config.get('compress', False):
+            index_file = output_file.with_suffix(output_file.suffix + '.gz')
+        page_dir = output_file.with_name(output_file.stem + '_pages')
+        pager = _MarkdownPager(self, page_dir, index_file.name, config)
+        statistics = _PostStatistics()
+        
+        with tempfile.TemporaryFile('w+', encoding='utf-8') as index_entries, \
+                tempfile.TemporaryFile('w+b') as spill:
+            sort_key = self._sort_key(config)
+            runs: List[Tuple[int, int]] = []
+            buffer: List[Dict[str, Any]] = []
+            for post in posts:
+                if max_posts and statistics.total_posts >= max_posts:
+                    break
+                post = self._prepare_post(post, config)
+                statistics.add(post)
+                
+                if paginate == 'group':
+                    pager.add_grouped(self._group_key(post, group_by), post)
+                    continue
+                
+                if len(buffer) >= page_size:
+                    sort_key = self._spill_run(buffer, spill, runs, sort_key)
+                    buffer = []
+                buffer.append(post)
             
-            # Truncate content if needed
-            max_length = config.get('max_content_length', 500)
-            selftext = processed_post.get('selftext', '')
-            if selftext and len(selftext) > max_length:
-                processed_post['selftext'] = selftext[:max_length] + "..."
+            if paginate != 'group':
+                if runs:
+                    sort_key = self._spill_run(buffer, spill, runs, sort_key)
+                    streams = [self._read_run(spill, start, count) for start, count in runs]
+                    if sort_key is None:
+                        ordered = (post for stream in streams for post in stream)
+                    else:
+                        ordered = heapq.merge(*streams, key=sort_key[0], reverse=sort_key[1])
+                else:
+                    self._sort_posts(buffer, config)
+                    ordered = iter(buffer)
+                
+                page: List[Dict[str, Any]] = []
+                for post in ordered:
+                    if len(page) >= page_size:
+                        pager.write_page(page, index_entries, has_next=True)
+                        page = []
+                    page.append(post)
+                if page:
+                    pager.write_page(page, index_entries, has_next=False)
+            pager.close()
+            if paginate == 'group':
+                pager.write_group_entries(index_entries)
             
-            processed.append(processed_post)
+            with self._open_text(index_file, config) as f:
+                f.write(self._generate_header(config) + "\n\n")
+                if config.get('include_statistics', True):
+                    f.write(statistics.render())
+                f.write("## Groups\n\n" if paginate == 'group' else "## Pages\n\n")
+                index_entries.seek(0)
+                shutil.copyfileobj(index_entries, f)
+                if config.get('include_metadata', True):
+                    f.write("\n" + self._generate_metadata_section(
+                        data, config, post_count=statistics.total_posts))
         
-        # Sort posts
-        sort_by = config.get('sort_by', 'score')
-        sort_order = config.get('sort_order', 'desc')
-        reverse = sort_order == 'desc'
+        if statistics.total_posts == 0:
+            result.add_warning("No posts to export")
         
-        try:
-            if sort_by == 'date':
-                processed.sort(key=lambda p: p.get('created_utc', 0), reverse=reverse)
-            elif sort_by == 'score':
-                processed.sort(key=lambda p: p.get('score', 0), reverse=reverse)
-            elif sort_by == 'comments':
-                processed.sort(key=lambda p: p.get('num_comments', 0), reverse=reverse)
-            elif sort_by == 'title':
-                processed.sort(key=lambda p: p.get('title', '').lower(), reverse=reverse)
-            elif sort_by == 'author':
-                processed.sort(key=lambda p: p.get('author', '').lower(), reverse=reverse)
-        except Exception as e:
-            self.logger.warning(f"Failed to sort posts: {e}")
+        result.output_path = str(index_file)
+        result.records_exported = statistics.total_posts
+        result.file_size = index_file.stat().st_size + sum(
+            page.stat().st_size for page in pager.files
+        )
+        result.metadata['compressed'] = config.get('compress', False)
+        result.metadata['template'] = config.get('template', 'report')
+        result.metadata['paginate'] = paginate
+        result.metadata['pages'] = len(pager.files)
+        result.metadata['page_directory'] = str(page_dir)
+        
+        self.logger.info(
+            f"Markdown paginated export completed: {statistics.total_posts} posts in "
+            f"{len(pager.files)} pages, index {index_file}"
+        )
+    
+    def _export_incremental(self, posts: Iterable[Dict[str, Any]], data: Dict[str, Any],
+                            output_file: Path, config: Dict[str, Any], result: ExportResult) -> None:
+        """
+        Add the posts that are new or changed since the last run to an export.
+        
+        Each run writes one update page with a "New Posts" and an "Updated
+        Posts" section; pages from earlier runs are never touched, so a
+        changed post keeps its old section there. The output file is an
+        index with the statistics and links to every update page. Statistics
+        are recomputed from the per-post values kept in the manifest, so the
+        index is rewritten without reading the pages back. ``max_posts``
+        limits the posts written per run.
+        """
+        index_file = output_file
+        if config.get('compress', False):
+            index_file = output_file.with_suffix(output_file.suffix + '.gz')
+        page_dir = output_file.with_name(output_file.stem + '_pages')
+        suffix = '.md.gz' if config.get('compress', False) else '.md'
+        max_posts = config.get('max_posts', 0)
+        
+        manifest = ExportManifest(index_file, 'markdown')
+        if not manifest.loaded and page_dir.exists():
+            # Pages without a manifest belong to an earlier, unrelated export
+            for stale in page_dir.glob(f"*{suffix}"):
+                stale.unlink()
+        pages = manifest.attributes.setdefault('pages', [])
+        
+        counts = {POST_NEW: 0, POST_CHANGED: 0, POST_UNCHANGED: 0}
+        sections: Dict[str, List[Dict[str, Any]]] = {POST_NEW: [], POST_CHANGED: []}
+        for post in posts:
+            if not isinstance(post, dict):
+                continue
+            post = self._prepare_post(post, config)
+            status, key, fingerprint = manifest.classify(post)
+            counts[status] += 1
+            if status == POST_UNCHANGED:
+                continue
+            if max_posts and len(sections[POST_NEW]) + len(sections[POST_CHANGED]) >= max_posts:
+                continue
+            statistics = {field: post[field] for field in self.STATISTICS_FIELDS
+                          if post.get(field) is not None}
+            manifest.record(key, fingerprint, post, statistics=statistics)
+            sections[status].append(post)
+        
+        written = len(sections[POST_NEW]) + len(sections[POST_CHANGED])
+        if written:
+            page_dir.mkdir(parents=True, exist_ok=True)
+            number = len(pages) + 1
+            name = f"update-{number:04d}{suffix}"
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            with self._open_text(page_dir / name, config) as f:
+                f.write(f"# {config.get('title', 'Reddit Data Export')} - Update {number}\n\n"
+                        f"*Generated on {timestamp}* | [Index](../{index_file.name})\n\n---\n")
+                for status, title in ((POST_NEW, "New Posts"), (POST_CHANGED, "Updated Posts")):
+                    if not sections[status]:
+                        continue
+                    self._sort_posts(sections[status], config)
+                    f.write(f"\n## {title}\n")
+                    for post in sections[status]:
+                        f.write('\n' + self._format_post(post, config))
+            pages.append({'name': name, 'new': len(sections[POST_NEW]),
+                          'updated': len(sections[POST_CHANGED]), 'date': timestamp})
+        
+        if written or not manifest.loaded:
+            statistics = _PostStatistics()
+            for values in manifest.values('statistics'):
+                statistics.add(values)
+            with self._open_text(index_file, config) as f:
+                f.write(self._generate_header(config) + "\n\n")
+                if config.get('include_statistics', True):
+                    f.write(statistics.render())
+                f.write("## Updates\n\n")
+                for page in pages:
+                    f.write(f"- [{page['date']}]({page_dir.name}/{page['name']}) - "
+                            f"{page['new']:,} new, {page['updated']:,} updated\n")
+                if config.get('include_metadata', True):
+                    f.write("\n" + self._generate_metadata_section(
+                        data, config, post_count=statistics.total_posts))
+            manifest.save()
+        
+        result.output_path = str(index_file)
+        result.records_exported = written
+        result.file_size = index_file.stat().st_size
+        result.metadata['compressed'] = config.get('compress', False)
+        result.metadata['template'] = config.get('template', 'report')
+        result.metadata['page_directory'] = str(page_dir)
+        result.metadata['incremental'] = manifest.summary(
+            counts[POST_NEW], counts[POST_CHANGED], counts[POST_UNCHANGED]
+        )
+        
+        self.logger.info(
+            f"Markdown incremental export completed: {counts[POST_NEW]} new, "
+            f"{counts[POST_CHANGED]} updated, {counts[POST_UNCHANGED]} unchanged in {index_file}"
+        )
+    
+    def _process_posts(self, posts: List[Dict[str, Any]], config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Process and filter posts according to configuration."""
+        processed = [self._prepare_post(post, config) for post in posts]
+        self._sort_posts(processed, config)
         
         # Limit posts if requested
         max_posts = config.get('max_posts', 0)
@@ -239,42 +714,160 @@ class MarkdownExporter(BaseExporter):
         
         return processed
     
-    def _generate_document(self, posts: List[Dict[str, Any]], 
-                          data: Dict[str, Any], config: Dict[str, Any]) -> List[str]:
-        """Generate document sections based on template."""
-        sections = []
+    def _prepare_post(self, post: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a post and truncate its content for display."""
+        processed_post = post.copy()
         
-        # Document header
-        sections.append(self._generate_header(config))
+        # Truncate content if needed
+        max_length = config.get('max_content_length', 500)
+        selftext = processed_post.get('selftext', '')
+        if selftext and len(selftext) > max_length:
+            processed_post['selftext'] = selftext[:max_length] + "..."
         
-        # Table of contents (placeholder - will be updated after content generation)
-        if config.get('include_toc', True):
-            sections.append("<!-- TOC_PLACEHOLDER -->")
+        return processed_post
+    
+    def _sort_key(self, config: Dict[str, Any]) -> Optional[Tuple[Callable[[Dict[str, Any]], Any], bool]]:
+        """Get the (key, reverse) pair for ``sort_by``, or None to keep input order."""
+        sort_by = config.get('sort_by', 'score')
+        reverse = config.get('sort_order', 'desc') == 'desc'
         
-        # Statistics section
-        if config.get('include_statistics', True):
-            sections.append(self._generate_statistics(posts, config))
+        if sort_by == 'date':
+            return (lambda p: p.get('created_utc', 0)), reverse
+        elif sort_by == 'score':
+            return (lambda p: p.get('score', 0)), reverse
+        elif sort_by == 'comments':
+            return (lambda p: p.get('num_comments', 0)), reverse
+        elif sort_by == 'title':
+            return (lambda p: p.get('title', '').lower()), reverse
+        elif sort_by == 'author':
+            return (lambda p: p.get('author', '').lower()), reverse
+        return None
+    
+    def _sort_posts(self, posts: List[Dict[str, Any]], config: Dict[str, Any]) -> None:
+        """Sort posts in place according to configuration."""
+        sort_key = self._sort_key(config)
+        if sort_key is None:
+            return
+        
+        try:
+            posts.sort(key=sort_key[0], reverse=sort_key[1])
+        except Exception as e:
+            self.logger.warning(f"Failed to sort posts: {e}")
+    
+    def _spill_run(self, posts: List[Dict[str, Any]], spill: BinaryIO, runs: List[Tuple[int, int]],
+                   sort_key: Optional[Tuple[Callable[[Dict[str, Any]], Any], bool]]
+                   ) -> Optional[Tuple[Callable[[Dict[str, Any]], Any], bool]]:
+        """
+        Sort a run of posts and append it to the spill file.
+        
+        Returns the sort key to keep using; None once a run fails to sort,
+        after which runs are written in input order.
+        """
+        if sort_key is not None:
+            try:
+                posts.sort(key=sort_key[0], reverse=sort_key[1])
+            except Exception as e:
+                self.logger.warning(f"Failed to sort posts: {e}")
+                sort_key = None
+        
+        spill.seek(0, 2)
+        runs.append((spill.tell(), len(posts)))
+        for post in posts:
+            pickle.dump(post, spill, protocol=pickle.HIGHEST_PROTOCOL)
+        return sort_key
+    
+    @staticmethod
+    def _read_run(spill: BinaryIO, start: int, count: int) -> Iterator[Dict[str, Any]]:
+        """Read back one spilled run; runs share the file, so each read seeks first."""
+        position = start
+        for _ in range(count):
+            spill.seek(position)
+            post = pickle.load(spill)
+            position = spill.tell()
+            yield post
+    
+    def _write_document(self, f: TextIO, posts: List[Dict[str, Any]],
+                        data: Dict[str, Any], config: Dict[str, Any]) -> int:
+        """
+        Write the document, formatting each post section straight to the file.
         
-        # Posts content
+        Statistics, grouping and the table of contents headings are gathered
+        in a single pass over the posts before anything is rendered, so no
+        section has to be kept in memory and re-scanned.
+        
+        Returns:
+            Number of top-level sections written
+        """
         group_by = config.get('group_by', 'subreddit')
+        statistics = _PostStatistics()
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for post in posts:
+            statistics.add(post)
+            if group_by != 'none':
+                groups.setdefault(self._group_key(post, group_by), []).append(post)
+        
+        # Groups are ordered by size, largest first
+        sorted_groups = sorted(groups.items(), key=lambda x: len(x[1]), reverse=True)
         if group_by == 'none':
-            sections.append(self._generate_posts_section(posts, config))
+            post_sections = [("## Posts\n", None, posts)]
         else:
-            sections.extend(self._generate_grouped_posts(posts, group_by, config))
+            post_sections = [(self._group_title(name, group_by), len(group_posts), group_posts)
+                             for name, group_posts in sorted_groups]
         
-        # Metadata section
-        if config.get('include_metadata', True):
-            sections.append(self._generate_metadata_section(data, config))
-        
-        # Generate and insert table of contents
+        sections = [self._generate_header(config)]
         if config.get('include_toc', True):
-            toc = self._generate_toc(sections)
-            for i, section in enumerate(sections):
-                if "<!-- TOC_PLACEHOLDER -->" in section:
-                    sections[i] = toc
-                    break
+            headings: List[Tuple[int, str]] = []
+            if config.get('include_statistics', True):
+                headings.extend(statistics.headings())
+            for title, _, section_posts in post_sections:
+                headings.append((2, title[3:].strip()))
+                headings.extend((3, self._post_heading(post)) for post in section_posts)
+            if config.get('include_metadata', True):
+                headings.append((2, "Export Information"))
+            sections.append(self._render_toc(headings))
+        if config.get('include_statistics', True):
+            sections.append(statistics.render())
+        
+        f.write('\n\n'.join(sections))
+        for title, count, section_posts in post_sections:
+            f.write('\n\n' + title)
+            if count is not None:
+                f.write(f"\n\n*{count} posts*\n")
+            for post in section_posts:
+                f.write('\n' + self._format_post(post, config))
         
-        return sections
+        if config.get('include_metadata', True):
+            f.write('\n\n' + self._generate_metadata_section(data, config))
+        
+        return len(sections) + len(post_sections) + (1 if config.get('include_metadata', True) else 0)
+    
+    def _group_key(self, post: Dict[str, Any], group_by: str) -> str:
+        """Get the group a post belongs to."""
+        if group_by == 'subreddit':
+            return post.get('subreddit', 'Unknown')
+        if group_by == 'author':
+            return post.get('author', 'Unknown')
+        if group_by == 'post_type':
+            return post.get('post_type', 'unknown').title()
+        if group_by == 'date':
+            created_utc = post.get('created_utc', 0)
+            if created_utc:
+                try:
+                    return datetime.fromtimestamp(created_utc).strftime('%Y-%m-%d')
+                except (ValueError, OSError):
+                    pass
+            return 'Unknown Date'
+        return 'Unknown'
+    
+    def _group_title(self, group_name: str, group_by: str) -> str:
+        """Heading for a group of posts."""
+        if group_by == 'subreddit':
+            return f"## r/{group_name}"
+        return f"## {group_name}"
+    
+    def _post_heading(self, post: Dict[str, Any]) -> str:
+        """Heading text of a formatted post, as it appears in the document."""
+        return self._escape_markdown(post.get('title', 'Untitled')).split('\n')[0].strip()
     
     def _generate_header(self, config: Dict[str, Any]) -> str:
         """Generate document header."""
@@ -291,121 +884,10 @@ class MarkdownExporter(BaseExporter):
     
     def _generate_statistics(self, posts: List[Dict[str, Any]], config: Dict[str, Any]) -> str:
         """Generate statistics summary."""
-        if not posts:
-            return "## Statistics\n\nNo posts to analyze.\n"
-        
-        # Calculate statistics
-        total_posts = len(posts)
-        total_score = sum(post.get('score', 0) for post in posts)
-        total_comments = sum(post.get('num_comments', 0) for post in posts)
-        
-        subreddits = set(post.get('subreddit', '') for post in posts if post.get('subreddit'))
-        authors = set(post.get('author', '') for post in posts if post.get('author'))
-        
-        post_types = {}
+        statistics = _PostStatistics()
         for post in posts:
-            post_type = post.get('post_type', 'unknown')
-            post_types[post_type] = post_types.get(post_type, 0) + 1
-        
-        nsfw_count = sum(1 for post in posts if post.get('is_nsfw', False))
-        
-        # Format statistics
-        stats = f"""## Statistics
-
-| Metric | Value |
-|--------|--------|
-| Total Posts | {total_posts:,} |
-| Total Score | {total_score:,} |
-| Total Comments | {total_comments:,} |
-| Unique Subreddits | {len(subreddits):,} |
-| Unique Authors | {len(authors):,} |
-| NSFW Posts | {nsfw_count:,} ({nsfw_count/total_posts*100:.1f}%) |
-
-### Post Types
-
-| Type | Count | Percentage |
-|------|-------|-----------|"""
-        
-        for post_type, count in sorted(post_types.items(), key=lambda x: x[1], reverse=True):
-            percentage = count / total_posts * 100
-            stats += f"\n| {post_type.title()} | {count:,} | {percentage:.1f}% |"
-        
-        # Top subreddits
-        if len(subreddits) > 1:
-            subreddit_counts = {}
-            for post in posts:
-                sub = post.get('subreddit', '')
-                if sub:
-                    subreddit_counts[sub] = subreddit_counts.get(sub, 0) + 1
-            
-            stats += "\n\n### Top Subreddits\n\n| Subreddit | Posts |\n|-----------|-------|\n"
-            for sub, count in sorted(subreddit_counts.items(), key=lambda x: x[1], reverse=True)[:10]:
-                stats += f"| r/{sub} | {count:,} |\n"
-        
-        stats += "\n"
-        return stats
-    
-    def _generate_grouped_posts(self, posts: List[Dict[str, Any]], 
-                               group_by: str, config: Dict[str, Any]) -> List[str]:
-        """Generate posts grouped by specified field."""
-        groups = {}
-        
-        for post in posts:
-            if group_by == 'subreddit':
-                key = post.get('subreddit', 'Unknown')
-            elif group_by == 'author':
-                key = post.get('author', 'Unknown')
-            elif group_by == 'post_type':
-                key = post.get('post_type', 'unknown').title()
-            elif group_by == 'date':
-                created_utc = post.get('created_utc', 0)
-                if created_utc:
-                    try:
-                        dt = datetime.fromtimestamp(created_utc)
-                        key = dt.strftime('%Y-%m-%d')
-                    except (ValueError, OSError):
-                        key = 'Unknown Date'
-                else:
-                    key = 'Unknown Date'
-            else:
-                key = 'Unknown'
-            
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(post)
-        
-        sections = []
-        
-        # Sort groups by size or name
-        sorted_groups = sorted(groups.items(), key=lambda x: len(x[1]), reverse=True)
-        
-        for group_name, group_posts in sorted_groups:
-            if group_by == 'subreddit':
-                section_title = f"## r/{group_name}"
-            elif group_by == 'date':
-                section_title = f"## {group_name}"
-            else:
-                section_title = f"## {group_name}"
-            
-            section_content = [section_title]
-            section_content.append(f"\n*{len(group_posts)} posts*\n")
-            
-            # Generate posts for this group
-            for post in group_posts:
-                section_content.append(self._format_post(post, config))
-            
-            sections.append('\n'.join(section_content))
-        
-        return sections
-    
-    def _generate_posts_section(self, posts: List[Dict[str, Any]], config: Dict[str, Any]) -> str:
-        """Generate posts section without grouping."""
-        content = ["## Posts\n"]
-        
-        for post in posts:
-            content.append(self._format_post(post, config))
-        
-        return '\n'.join(content)
+            statistics.add(post)
+        return statistics.render()
     
     def _format_post(self, post: Dict[str, Any], config: Dict[str, Any]) -> str:
         """Format a single post for Markdown output."""
@@ -533,9 +1015,12 @@ class MarkdownExporter(BaseExporter):
         
         return text
     
-    def _generate_metadata_section(self, data: Dict[str, Any], config: Dict[str, Any]) -> str:
+    def _generate_metadata_section(self, data: Dict[str, Any], config: Dict[str, Any],
+                                   post_count: Optional[int] = None) -> str:
         """Generate export metadata section."""
         export_info = data.get('export_info', {})
+        if post_count is None:
+            post_count = len(data.get('posts', []))
         
         metadata = f"""## Export Information
 
@@ -543,7 +1028,7 @@ class MarkdownExporter(BaseExporter):
 |-------|-------|
 | Export Format | Markdown |
 | Export Date | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} |
-| Posts Exported | {len(data.get('posts', []))} |
+| Posts Exported | {post_count} |
 | Template | {config.get('template', 'report')} |
 """
         
@@ -554,44 +1039,43 @@ class MarkdownExporter(BaseExporter):
         metadata += "\n"
         return metadata
     
-    def _generate_toc(self, sections: List[str]) -> str:
-        """Generate table of contents from sections."""
+    def _render_toc(self, headings: Iterable[Tuple[int, str]]) -> str:
+        """Render a table of contents from (level, title) headings."""
         toc_lines = ["## Table of Contents\n"]
         
-        for section in sections:
-            lines = section.split('\n')
-            for line in lines:
-                line = line.strip()
-                if line.startswith('## '):
-                    title = line[3:].strip()
-                    anchor = title.lower().replace(' ', '-').replace('/', '').replace('\\', '')
-                    toc_lines.append(f"- [{title}](#{anchor})")
-                elif line.startswith('### '):
-                    title = line[4:].strip()
-                    anchor = title.lower().replace(' ', '-').replace('/', '').replace('\\', '')
-                    toc_lines.append(f"  - [{title}](#{anchor})")
+        for level, title in headings:
+            indent = "  " if level > 2 else ""
+            toc_lines.append(f"{indent}- [{title}](#{self._heading_anchor(title)})")
         
         toc_lines.append("")
         return '\n'.join(toc_lines)
     
-    def _write_markdown_file(self, sections: List[str], output_file: Path,
-                            config: Dict[str, Any], result: ExportResult) -> None:
-        """Write markdown content to file."""
-        content = '\n\n'.join(sections)
-        encoding = config.get('encoding', 'utf-8')
-        
-        if config.get('compress', False):
+    @staticmethod
+    def _heading_anchor(title: str) -> str:
+        """Anchor generated for a heading."""
+        return title.lower().replace(' ', '-').replace('/', '').replace('\\', '')
+    
+    def _write_markdown_file(self, posts: List[Dict[str, Any]], data: Dict[str, Any],
+                             output_file: Path, config: Dict[str, Any], result: ExportResult) -> Path:
+        """Write the markdown document to file and return the path written."""
+        compress = config.get('compress', False)
+        if compress:
             output_file = output_file.with_suffix(output_file.suffix + '.gz')
-            with gzip.open(output_file, 'wt', encoding=encoding) as f:
-                f.write(content)
-            result.metadata['compressed'] = True
-        else:
-            with open(output_file, 'w', encoding=encoding) as f:
-                f.write(content)
-            result.metadata['compressed'] = False
         
-        result.metadata['sections'] = len(sections)
+        with self._open_text(output_file, config) as f:
+            sections = self._write_document(f, posts, data, config)
+        
+        result.metadata['compressed'] = compress
+        result.metadata['sections'] = sections
         result.metadata['template'] = config.get('template', 'report')
+        return output_file
+    
+    def _open_text(self, path: Path, config: Dict[str, Any], mode: str = 'w') -> TextIO:
+        """Open a Markdown output file, gzip-compressed when ``compress`` is set."""
+        encoding = config.get('encoding', 'utf-8')
+        if config.get('compress', False):
+            return gzip.open(path, mode + 't', encoding=encoding)
+        return open(path, mode, encoding=encoding)
     
     def _write_empty_document(self, output_file: Path, config: Dict[str, Any]) -> None:
         """Write empty markdown document."""
@@ -7,13 +7,16 @@ and data analysis optimization for Reddit post metadata.
 
 import sqlite3
 import json
+import os
 import time
 import gzip
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from datetime import datetime
 
 from .base import BaseExporter, ExportResult, FormatInfo
+from .incremental import POST_NEW, POST_CHANGED, POST_UNCHANGED, post_fingerprint, post_key
 
 
 class SqliteExporter(BaseExporter):
@@ -27,6 +30,7 @@ class SqliteExporter(BaseExporter):
     - Full-text search capabilities
     - Data integrity constraints
     - Incremental updates support
+    - Bulk-load mode for very large exports streamed from a generator
     - Query optimization suggestions
     """
     
@@ -38,7 +42,7 @@ class SqliteExporter(BaseExporter):
             description="SQLite database with automatic schema generation",
             mime_type="application/x-sqlite3",
             supports_compression=False,
-            supports_streaming=False,
+            supports_streaming=True,
             supports_incremental=True,
             max_records=None,  # No practical limit
             schema_required=False
@@ -75,6 +79,25 @@ class SqliteExporter(BaseExporter):
                 'maximum': 10000,
                 'description': 'Number of records per batch insert'
             },
+            'bulk_load': {
+                'type': 'boolean',
+                'default': False,
+                'description': 'Build a fresh database with journaling off and deferred indexes'
+            },
+            'bulk_batch_size': {
+                'type': 'integer',
+                'default': 50000,
+                'minimum': 1000,
+                'maximum': 1000000,
+                'description': 'Number of records per transaction in bulk-load mode'
+            },
+            'schema_sample_size': {
+                'type': 'integer',
+                'default': 100,
+                'minimum': 1,
+                'maximum': 100000,
+                'description': 'Number of posts sampled to infer schema mode and column types'
+            },
             'journal_mode': {
                 'type': 'string',
                 'default': 'WAL',
@@ -113,6 +136,11 @@ class SqliteExporter(BaseExporter):
                 'default': True,
                 'description': 'Analyze tables for query optimization'
             },
+            'incremental': {
+                'type': 'boolean',
+                'default': False,
+                'description': 'Update an existing database in place, writing only new or changed posts'
+            },
             'backup_existing': {
                 'type': 'boolean',
                 'default': True,
@@ -136,8 +164,10 @@ class SqliteExporter(BaseExporter):
             # Prepare output path
             output_file = self.prepare_output_path(output_path, config)
             
-            # Backup existing database if requested
-            if output_file.exists() and config.get('backup_existing', True):
+            incremental = config.get('incremental', False)
+            
+            # Backup existing database if requested (incremental runs update in place)
+            if output_file.exists() and config.get('backup_existing', True) and not incremental:
                 self._backup_database(output_file)
             
             # Extract posts data
@@ -145,29 +175,48 @@ class SqliteExporter(BaseExporter):
             if not posts:
                 result.add_warning("No posts to export")
                 # Create empty database with schema
-                self._create_empty_database(output_file, config)
+                if not (incremental and output_file.exists()):
+                    self._create_empty_database(output_file, config)
                 result.output_path = str(output_file)
                 return result
             
+            if config.get('bulk_load', False) and not incremental:
+                schema_mode, count = self._bulk_load(posts, data, output_file, config, result)
+                self._finish_result(result, output_file, schema_mode, count, start_time)
+                return result
+            
             # Create database and schema
             with sqlite3.connect(str(output_file)) as conn:
                 self._configure_database(conn, config)
                 
                 # Determine schema mode and create tables
                 schema_mode = config.get('schema_mode', 'auto')
+                if incremental:
+                    schema_mode = self._detect_existing_schema(conn, config) or schema_mode
                 if schema_mode == 'auto':
-                    schema_mode = self._determine_optimal_schema(posts)
+                    schema_mode = self._determine_optimal_schema(
+                        self._sample_posts(posts, config.get('schema_sample_size', 100))
+                    )
+                
+                if incremental:
+                    posts, fingerprints, counts = self._select_incremental_posts(conn, posts, config)
                 
+                sample = self._sample_posts(posts, config.get('schema_sample_size', 100))
                 if schema_mode == 'normalized':
-                    self._create_normalized_schema(conn, posts, config)
+                    self._create_normalized_schema(conn, sample, config)
                     self._insert_normalized_data(conn, posts, data, config, result)
                 elif schema_mode == 'denormalized':
-                    self._create_denormalized_schema(conn, posts, config)
+                    self._create_denormalized_schema(conn, sample, config)
                     self._insert_denormalized_data(conn, posts, data, config, result)
                 else:  # flat
-                    self._create_flat_schema(conn, posts, config)
+                    self._create_flat_schema(conn, sample, config)
+                    self._add_missing_columns(conn, posts, config)
                     self._insert_flat_data(conn, posts, data, config, result)
                 
+                if incremental:
+                    self._record_incremental_state(conn, fingerprints, config)
+                    result.metadata['incremental'] = self._incremental_summary(conn, counts, config)
+                
                 # Create indexes
                 if config.get('create_indexes', True):
                     self._create_indexes(conn, config)
@@ -180,22 +229,46 @@ class SqliteExporter(BaseExporter):
                 if config.get('analyze', True):
                     self._analyze_database(conn)
                 
-                if config.get('vacuum', True):
+                # VACUUM rewrites the whole file, which defeats incremental updates
+                if config.get('vacuum', True) and not incremental:
                     self._vacuum_database(conn)
             
-            result.output_path = str(output_file)
-            result.records_exported = len(posts)
-            result.execution_time = time.time() - start_time
+            self._finish_result(result, output_file, schema_mode, len(posts), start_time)
             
-            # Get file size
-            if output_file.exists():
-                result.file_size = output_file.stat().st_size
+        except Exception as e:
+            result.add_error(f"SQLite export failed: {e}")
+            self.logger.error(f"SQLite export error: {e}")
+        
+        return result
+    
+    def export_stream(self, posts: Iterable[Dict[str, Any]], metadata: Dict[str, Any],
+                      output_path: str, config: Dict[str, Any]) -> ExportResult:
+        """
+        Export posts from an iterator.
+        
+        In bulk-load mode posts are consumed lazily in chunked transactions,
+        so memory stays bounded by ``bulk_batch_size``; otherwise the
+        iterator is materialized and handled by ``export``.
+        """
+        if not config.get('bulk_load', False) or config.get('incremental', False):
+            return super().export_stream(posts, metadata, output_path, config)
+        
+        start_time = time.time()
+        result = ExportResult(format_name="sqlite")
+        
+        try:
+            if 'export_info' not in metadata:
+                result.add_error("Data missing export_info")
+                return result
             
-            # Add metadata
-            result.metadata['schema_mode'] = schema_mode
-            result.metadata['database_path'] = str(output_file)
+            output_file = self.prepare_output_path(output_path, config)
+            if output_file.exists() and config.get('backup_existing', True):
+                self._backup_database(output_file)
             
-            self.logger.info(f"SQLite export completed: {result.records_exported} records to {output_file}")
+            schema_mode, count = self._bulk_load(posts, metadata, output_file, config, result)
+            if count == 0:
+                result.add_warning("No posts to export")
+            self._finish_result(result, output_file, schema_mode, count, start_time)
             
         except Exception as e:
             result.add_error(f"SQLite export failed: {e}")
@@ -203,6 +276,253 @@ class SqliteExporter(BaseExporter):
         
         return result
     
+    def _finish_result(self, result: ExportResult, output_file: Path, schema_mode: str,
+                       count: int, start_time: float) -> None:
+        """Fill in the common fields of a successful export result."""
+        result.output_path = str(output_file)
+        result.records_exported = count
+        result.execution_time = time.time() - start_time
+        
+        # Get file size
+        if output_file.exists():
+            result.file_size = output_file.stat().st_size
+        
+        # Add metadata
+        result.metadata['schema_mode'] = schema_mode
+        result.metadata['database_path'] = str(output_file)
+        
+        self.logger.info(f"SQLite export completed: {result.records_exported} records to {output_file}")
+    
+    def _bulk_load(self, posts: Iterable[Dict[str, Any]], data: Dict[str, Any], output_file: Path,
+                   config: Dict[str, Any], result: ExportResult) -> Tuple[str, int]:
+        """
+        Build a fresh database as fast as SQLite allows.
+        
+        The database is written to a temporary file with journaling and
+        syncing off, in large chunked transactions, with foreign keys, indexes
+        and FTS deferred until every row is in. Indexes are then built once
+        and the FTS table rebuilt in a single pass before the file atomically
+        replaces ``output_file``. A crash mid-load therefore leaves any
+        previous database untouched, which is what makes ``journal_mode=OFF``
+        safe here. Schema and column types are inferred from the first
+        ``schema_sample_size`` posts; flat-schema fields that only appear
+        later are not added as columns.
+        
+        Returns:
+            Tuple of (schema mode, number of posts written)
+        """
+        sample_size = config.get('schema_sample_size', 100)
+        posts = iter(posts)
+        sample = list(islice(posts, sample_size))
+        stream = chain(sample, posts)
+        
+        schema_mode = config.get('schema_mode', 'auto')
+        if schema_mode == 'auto':
+            schema_mode = self._determine_optimal_schema(sample)
+        
+        load_config = dict(config, batch_size=config.get('bulk_batch_size', 50000))
+        temp_file = output_file.with_name(output_file.name + '.loading')
+        if temp_file.exists():
+            temp_file.unlink()
+        
+        # Each insert batch runs in its own transaction and is committed by
+        # the _insert_* helpers, so a batch is the unit of work
+        conn = sqlite3.connect(str(temp_file))
+        try:
+            self._configure_bulk_load(conn)
+            
+            if schema_mode == 'normalized':
+                self._create_normalized_schema(conn, sample, load_config)
+                count = self._insert_normalized_data(conn, stream, data, load_config, result)
+            elif schema_mode == 'denormalized':
+                self._create_denormalized_schema(conn, sample, load_config)
+                count = self._insert_denormalized_data(conn, stream, data, load_config, result)
+            else:  # flat
+                self._create_flat_schema(conn, sample, load_config)
+                count = self._insert_flat_data(conn, stream, data, load_config, result)
+            
+            conn.commit()
+            
+            # Deferred index and FTS creation, once over the full table
+            if config.get('create_indexes', True):
+                self._create_indexes(conn, config)
+            if config.get('enable_fts', True):
+                self._create_fts_tables(conn, config)
+            if config.get('analyze', True):
+                self._analyze_database(conn)
+            
+            # Restore durable settings for the finished database; the file is
+            # written sequentially so VACUUM would reclaim nothing
+            conn.execute(f"PRAGMA journal_mode = {config.get('journal_mode', 'WAL')}")
+            conn.execute(f"PRAGMA synchronous = {config.get('synchronous', 'NORMAL')}")
+        finally:
+            conn.close()
+        
+        os.replace(temp_file, output_file)
+        result.metadata['bulk_load'] = True
+        return schema_mode, count
+    
+    def _configure_bulk_load(self, conn: sqlite3.Connection) -> None:
+        """Apply pragmas that trade durability for load speed on a scratch database."""
+        conn.execute("PRAGMA page_size = 4096")
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA locking_mode = EXCLUSIVE")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA foreign_keys = OFF")
+        conn.execute("PRAGMA cache_size = -262144")  # 256MB cache
+    
+    def _iter_batches(self, posts: Iterable[Dict[str, Any]], batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """Yield lists of up to ``batch_size`` posts from any iterable."""
+        posts = iter(posts)
+        while True:
+            batch = list(islice(posts, batch_size))
+            if not batch:
+                return
+            yield batch
+    
+    def _sample_posts(self, posts: List[Dict[str, Any]], sample_size: int) -> List[Dict[str, Any]]:
+        """
+        Pick posts for schema and type inference.
+        
+        Samples are spread evenly across the list so fields that only appear
+        in later posts still have a chance to be seen.
+        """
+        if len(posts) <= sample_size:
+            return list(posts)
+        step = len(posts) / sample_size
+        return [posts[int(i * step)] for i in range(sample_size)]
+    
+    def _detect_existing_schema(self, conn: sqlite3.Connection, config: Dict[str, Any]) -> Optional[str]:
+        """Determine the schema mode of a database written by a previous export."""
+        table_prefix = config.get('table_prefix', 'reddit_')
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        
+        if f"{table_prefix}posts" not in tables:
+            return None
+        if f"{table_prefix}awards" in tables:
+            return 'normalized'
+        
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table_prefix}posts)")}
+        return 'denormalized' if 'awards_json' in columns else 'flat'
+    
+    def _select_incremental_posts(self, conn: sqlite3.Connection, posts: List[Dict[str, Any]],
+                                  config: Dict[str, Any]) -> Tuple[List[Dict[str, Any]],
+                                                                   Dict[str, str], Dict[str, int]]:
+        """
+        Keep only posts that are new or changed since the previous export.
+        
+        Fingerprints of exported posts live in the ``export_state`` table of
+        the database itself, so the database stays self-describing.
+        
+        Returns:
+            Tuple of (posts to write, key -> fingerprint for those posts,
+            counts by status)
+        """
+        cursor = conn.cursor()
+        table_prefix = config.get('table_prefix', 'reddit_')
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table_prefix}export_state (
+                post_id TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                exported_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        keyed = []
+        for post in posts:
+            fingerprint = post_fingerprint(post)
+            keyed.append((post_key(post, fingerprint), fingerprint, post))
+        
+        known: Dict[str, str] = {}
+        chunk_size = 500
+        for i in range(0, len(keyed), chunk_size):
+            keys = [key for key, _, _ in keyed[i:i + chunk_size]]
+            placeholders = ', '.join('?' for _ in keys)
+            cursor.execute(
+                f"SELECT post_id, fingerprint FROM {table_prefix}export_state "
+                f"WHERE post_id IN ({placeholders})", keys
+            )
+            known.update(cursor.fetchall())
+        
+        counts = {POST_NEW: 0, POST_CHANGED: 0, POST_UNCHANGED: 0}
+        selected = []
+        fingerprints: Dict[str, str] = {}
+        for key, fingerprint, post in keyed:
+            previous = known.get(key)
+            if previous is None:
+                counts[POST_NEW] += 1
+            elif previous != fingerprint:
+                counts[POST_CHANGED] += 1
+            else:
+                counts[POST_UNCHANGED] += 1
+                continue
+            selected.append(post)
+            fingerprints[key] = fingerprint
+        
+        return selected, fingerprints, counts
+    
+    def _record_incremental_state(self, conn: sqlite3.Connection, fingerprints: Dict[str, str],
+                                  config: Dict[str, Any]) -> None:
+        """Store fingerprints of written posts and refresh the export metadata row."""
+        cursor = conn.cursor()
+        table_prefix = config.get('table_prefix', 'reddit_')
+        
+        cursor.executemany(f"""
+            INSERT OR REPLACE INTO {table_prefix}export_state (post_id, fingerprint, exported_at)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+        """, list(fingerprints.items()))
+        
+        # The row added by this run reports the size of the whole database
+        cursor.execute(f"""
+            UPDATE {table_prefix}export_info
+            SET post_count = (SELECT COUNT(*) FROM {table_prefix}posts)
+            WHERE id = (SELECT MAX(id) FROM {table_prefix}export_info)
+        """)
+        conn.commit()
+    
+    def _incremental_summary(self, conn: sqlite3.Connection, counts: Dict[str, int],
+                             config: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the ``incremental`` block reported in ExportResult metadata."""
+        table_prefix = config.get('table_prefix', 'reddit_')
+        total, high_water_mark = conn.execute(
+            f"SELECT COUNT(*), MAX(created_utc) FROM {table_prefix}posts"
+        ).fetchone()
+        return {
+            'added': counts[POST_NEW],
+            'updated': counts[POST_CHANGED],
+            'unchanged': counts[POST_UNCHANGED],
+            'total': total,
+            'high_water_mark': float(high_water_mark or 0.0),
+        }
+    
+    def _add_missing_columns(self, conn: sqlite3.Connection, posts: List[Dict[str, Any]],
+                             config: Dict[str, Any]) -> None:
+        """Add flat-schema columns for fields that appear only in newer posts."""
+        cursor = conn.cursor()
+        table_prefix = config.get('table_prefix', 'reddit_')
+        
+        cursor.execute(f"PRAGMA table_info({table_prefix}posts)")
+        existing = {row[1] for row in cursor.fetchall()}
+        
+        sample = self._sample_posts(posts, config.get('schema_sample_size', 100))
+        new_fields = set()
+        for post in sample:
+            new_fields.update(key for key in post.keys() if key not in existing)
+        if not new_fields:
+            return
+        
+        field_types = self._analyze_field_types(sample, new_fields)
+        for field in sorted(new_fields):
+            cursor.execute(f"ALTER TABLE {table_prefix}posts "
+                           f"ADD COLUMN {self._quote_identifier(field)} {field_types.get(field, 'TEXT')}")
+        conn.commit()
+    
+    @staticmethod
+    def _quote_identifier(name: str) -> str:
+        """Quote a post field name for use as an SQLite column identifier."""
+        return '"' + name.replace('"', '""') + '"'
+    
     def _configure_database(self, conn: sqlite3.Connection, config: Dict[str, Any]) -> None:
         """Configure SQLite database settings."""
         cursor = conn.cursor()
@@ -219,6 +539,9 @@ class SqliteExporter(BaseExporter):
         if config.get('foreign_keys', True):
             cursor.execute("PRAGMA foreign_keys = ON")
         
+        # INSERT OR REPLACE only fires the FTS delete trigger with this on
+        cursor.execute("PRAGMA recursive_triggers = ON")
+        
         # Set page size for performance
         cursor.execute("PRAGMA page_size = 4096")
         
@@ -232,12 +555,11 @@ class SqliteExporter(BaseExporter):
         if not posts:
             return 'flat'
         
-        # Analyze data complexity
-        sample_size = min(100, len(posts))
+        # Analyze data complexity (callers pass a sample, see _sample_posts)
         nested_fields = set()
         array_fields = set()
         
-        for post in posts[:sample_size]:
+        for post in posts:
             for key, value in post.items():
                 if isinstance(value, dict):
                     nested_fields.add(key)
@@ -410,9 +732,9 @@ class SqliteExporter(BaseExporter):
         cursor = conn.cursor()
         table_prefix = config.get('table_prefix', 'reddit_')
         
-        # Analyze all fields in posts to create comprehensive schema
+        # Analyze all fields in the sampled posts to create comprehensive schema
         all_fields = set()
-        for post in posts[:100]:  # Sample first 100 posts
+        for post in posts:
             all_fields.update(post.keys())
         
         # Build CREATE TABLE statement dynamically
@@ -424,7 +746,7 @@ class SqliteExporter(BaseExporter):
         for field in sorted(all_fields):
             if field != 'id':  # Already added as primary key
                 field_type = field_types.get(field, 'TEXT')
-                columns.append(f"{field} {field_type}")
+                columns.append(f"{self._quote_identifier(field)} {field_type}")
         
         columns.append('created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP')
         
@@ -453,12 +775,11 @@ class SqliteExporter(BaseExporter):
     def _analyze_field_types(self, posts: List[Dict[str, Any]], fields: Set[str]) -> Dict[str, str]:
         """Analyze field types from post data."""
         field_types = {}
-        sample_size = min(100, len(posts))
         
         for field in fields:
             type_counts = {'TEXT': 0, 'INTEGER': 0, 'REAL': 0, 'BOOLEAN': 0}
             
-            for post in posts[:sample_size]:
+            for post in posts:
                 value = post.get(field)
                 if value is not None:
                     if isinstance(value, bool):
@@ -475,17 +796,18 @@ class SqliteExporter(BaseExporter):
         
         return field_types
     
-    def _insert_normalized_data(self, conn: sqlite3.Connection, posts: List[Dict[str, Any]],
+    def _insert_normalized_data(self, conn: sqlite3.Connection, posts: Iterable[Dict[str, Any]],
                                data: Dict[str, Any], config: Dict[str, Any], 
-                               result: ExportResult) -> None:
+                               result: ExportResult) -> int:
         """Insert data into normalized schema."""
         cursor = conn.cursor()
         table_prefix = config.get('table_prefix', 'reddit_')
         batch_size = config.get('batch_size', 1000)
         
         # Insert posts in batches
-        for i in range(0, len(posts), batch_size):
-            batch = posts[i:i + batch_size]
+        count = 0
+        for batch in self._iter_batches(posts, batch_size):
+            count += len(batch)
             
             # Insert main post data
             post_rows = []
@@ -502,6 +824,16 @@ class SqliteExporter(BaseExporter):
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, post_rows)
             
+            # Replace related rows of posts that are being re-exported
+            batch_ids = [post.get('id') for post in batch if post.get('id')]
+            if batch_ids:
+                placeholders = ', '.join('?' for _ in batch_ids)
+                for related_table in ('awards', 'gallery_images', 'poll_options', 'media'):
+                    cursor.execute(
+                        f"DELETE FROM {table_prefix}{related_table} WHERE post_id IN ({placeholders})",
+                        batch_ids
+                    )
+            
             # Insert related data
             for post in batch:
                 post_id = post.get('id')
@@ -556,19 +888,21 @@ class SqliteExporter(BaseExporter):
             conn.commit()
         
         # Insert export metadata
-        self._insert_export_metadata(conn, data, config, len(posts))
+        self._insert_export_metadata(conn, data, config, count)
+        return count
     
-    def _insert_denormalized_data(self, conn: sqlite3.Connection, posts: List[Dict[str, Any]],
+    def _insert_denormalized_data(self, conn: sqlite3.Connection, posts: Iterable[Dict[str, Any]],
                                  data: Dict[str, Any], config: Dict[str, Any],
-                                 result: ExportResult) -> None:
+                                 result: ExportResult) -> int:
         """Insert data into denormalized schema."""
         cursor = conn.cursor()
         table_prefix = config.get('table_prefix', 'reddit_')
         batch_size = config.get('batch_size', 1000)
         
         # Insert posts in batches
-        for i in range(0, len(posts), batch_size):
-            batch = posts[i:i + batch_size]
+        count = 0
+        for batch in self._iter_batches(posts, batch_size):
+            count += len(batch)
             post_rows = []
             
             for post in batch:
@@ -596,11 +930,12 @@ class SqliteExporter(BaseExporter):
             conn.commit()
         
         # Insert export metadata
-        self._insert_export_metadata(conn, data, config, len(posts))
+        self._insert_export_metadata(conn, data, config, count)
+        return count
     
-    def _insert_flat_data(self, conn: sqlite3.Connection, posts: List[Dict[str, Any]],
+    def _insert_flat_data(self, conn: sqlite3.Connection, posts: Iterable[Dict[str, Any]],
                          data: Dict[str, Any], config: Dict[str, Any],
-                         result: ExportResult) -> None:
+                         result: ExportResult) -> int:
         """Insert data into flat schema."""
         cursor = conn.cursor()
         table_prefix = config.get('table_prefix', 'reddit_')
@@ -611,8 +946,9 @@ class SqliteExporter(BaseExporter):
         columns = [row[1] for row in cursor.fetchall() if row[1] != 'created_at']
         
         # Insert posts in batches
-        for i in range(0, len(posts), batch_size):
-            batch = posts[i:i + batch_size]
+        count = 0
+        for batch in self._iter_batches(posts, batch_size):
+            count += len(batch)
             post_rows = []
             
             for post in batch:
@@ -633,7 +969,7 @@ class SqliteExporter(BaseExporter):
                 post_rows.append(row)
             
             placeholders = ', '.join(['?' for _ in columns])
-            column_list = ', '.join(columns)
+            column_list = ', '.join(self._quote_identifier(column) for column in columns)
             
             cursor.executemany(f"""
                 INSERT OR REPLACE INTO {table_prefix}posts ({column_list})
@@ -643,7 +979,8 @@ class SqliteExporter(BaseExporter):
             conn.commit()
         
         # Insert export metadata
-        self._insert_export_metadata(conn, data, config, len(posts))
+        self._insert_export_metadata(conn, data, config, count)
+        return count
     
     def _extract_main_post_fields(self, post: Dict[str, Any], config: Dict[str, Any]) -> List[Any]:
         """Extract main post fields for database insertion."""
@@ -727,22 +1064,60 @@ class SqliteExporter(BaseExporter):
         conn.commit()
     
     def _create_fts_tables(self, conn: sqlite3.Connection, config: Dict[str, Any]) -> None:
-        """Create full-text search tables."""
+        """
+        Create full-text search tables.
+        
+        The index is populated once when it is created. Triggers on the posts
+        table then keep it in sync row by row, so later exports into the same
+        database (incremental or not) never re-index the whole table.
+        """
         cursor = conn.cursor()
         table_prefix = config.get('table_prefix', 'reddit_')
+        posts_table = f"{table_prefix}posts"
+        fts_table = f"{table_prefix}posts_fts"
+        fts_columns = ('id', 'title', 'selftext', 'author', 'subreddit')
         
         try:
+            columns = {row[1] for row in cursor.execute(f"PRAGMA table_info({posts_table})")}
+            missing = [column for column in fts_columns if column not in columns]
+            if missing:
+                self.logger.warning(f"Skipping FTS tables, posts table lacks columns: {missing}")
+                return
+            
+            # Already set up and maintained by triggers
+            synced = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = ?", (f"{fts_table}_ai",)
+            ).fetchone()
+            if synced:
+                return
+            
+            column_list = ', '.join(fts_columns)
+            old_values = ', '.join(f"old.{column}" for column in fts_columns)
+            new_values = ', '.join(f"new.{column}" for column in fts_columns)
+            
             # Create FTS table for post content
             cursor.execute(f"""
-                CREATE VIRTUAL TABLE IF NOT EXISTS {table_prefix}posts_fts 
-                USING fts5(id, title, selftext, author, subreddit, 
-                          content='{table_prefix}posts', content_rowid='rowid')
+                CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table}
+                USING fts5({column_list}, content='{posts_table}', content_rowid='rowid')
             """)
             
-            # Populate FTS table
-            cursor.execute(f"""
-                INSERT INTO {table_prefix}posts_fts(id, title, selftext, author, subreddit)
-                SELECT id, title, selftext, author, subreddit FROM {table_prefix}posts
+            # Populate FTS table (also repairs indexes created without triggers)
+            cursor.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES('rebuild')")
+            
+            # Keep it in sync with later inserts, updates and replacements
+            cursor.executescript(f"""
+                CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {posts_table} BEGIN
+                    INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.rowid, {new_values});
+                END;
+                CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {posts_table} BEGIN
+                    INSERT INTO {fts_table}({fts_table}, rowid, {column_list})
+                    VALUES ('delete', old.rowid, {old_values});
+                END;
+                CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE ON {posts_table} BEGIN
+                    INSERT INTO {fts_table}({fts_table}, rowid, {column_list})
+                    VALUES ('delete', old.rowid, {old_values});
+                    INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.rowid, {new_values});
+                END;
             """)
             
             conn.commit()
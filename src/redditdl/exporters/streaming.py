@@ -0,0 +1,123 @@
+"""
+Streaming Export Utilities
+
+Helpers shared by exporters that write output incrementally from a post
+iterator instead of materializing the full export in memory.
+"""
+
+import gzip
+import io
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, TextIO, Tuple
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+
+COMPRESSION_SUFFIXES = {
+    'none': '',
+    'gzip': '.gz',
+    'zstd': '.zst',
+}
+
+
+def resolve_compression(config: dict) -> str:
+    """
+    Resolve the compression codec requested by an exporter configuration.
+
+    The legacy boolean ``compress`` option maps to gzip; ``compression``
+    takes precedence when both are present.
+
+    Args:
+        config: Exporter configuration
+
+    Returns:
+        One of 'none', 'gzip' or 'zstd'
+
+    Raises:
+        ValueError: If the codec is unknown or unavailable
+    """
+    compression = config.get('compression')
+    if compression is None:
+        compression = 'gzip' if config.get('compress', False) else 'none'
+
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unknown compression '{compression}'. "
+                         f"Valid options: {list(COMPRESSION_SUFFIXES)}")
+    if compression == 'zstd' and not ZSTD_AVAILABLE:
+        raise ValueError("zstd compression requires the 'zstandard' package")
+
+    return compression
+
+
+def compressed_path(output_file: Path, compression: str) -> Path:
+    """Append the suffix for a compression codec to an output path."""
+    suffix = COMPRESSION_SUFFIXES[compression]
+    if not suffix:
+        return output_file
+    return output_file.with_suffix(output_file.suffix + suffix)
+
+
+@contextmanager
+def open_text_output(output_file: Path, compression: str = 'none',
+                     buffer_size: int = 1024 * 1024, append: bool = False) -> Iterator[TextIO]:
+    """
+    Open a text stream for writing, compressing on the fly if requested.
+
+    Appending to a compressed file adds a new gzip member or zstd frame;
+    both formats decode concatenated members as one stream.
+
+    Args:
+        output_file: Final output path (including any compression suffix)
+        compression: 'none', 'gzip' or 'zstd'
+        buffer_size: Write buffer size in bytes
+        append: Append to an existing file instead of truncating it
+
+    Yields:
+        Text stream encoded as UTF-8
+    """
+    if compression == 'gzip':
+        with gzip.open(output_file, 'at' if append else 'wt', encoding='utf-8') as f:
+            yield f
+    elif compression == 'zstd':
+        with open(output_file, 'ab' if append else 'wb') as raw:
+            compressor = zstandard.ZstdCompressor()
+            with compressor.stream_writer(raw) as binary:
+                text = io.TextIOWrapper(binary, encoding='utf-8', write_through=False)
+                try:
+                    yield text
+                finally:
+                    text.flush()
+                    text.detach()
+    else:
+        with open(output_file, 'a' if append else 'w', encoding='utf-8', buffering=buffer_size) as f:
+            yield f
+
+
+def indent_block(text: str, indent: Optional[int], level: int) -> str:
+    """
+    Re-indent a pretty-printed JSON fragment to sit at a nesting level.
+
+    JSON strings never contain raw newlines, so shifting every line is safe.
+
+    Args:
+        text: Output of ``json.dumps`` for a nested value
+        indent: Indentation width (None for compact output)
+        level: Nesting level the fragment is written at
+
+    Returns:
+        Re-indented fragment
+    """
+    if not indent or level <= 0:
+        return text
+    return text.replace('\n', '\n' + ' ' * (indent * level))
+
+
+def json_separators(indent: Optional[int]) -> Tuple[str, str]:
+    """Item and key separators matching ``json.dumps`` for an indent setting."""
+    return (',', ': ') if indent else (',', ':')
@@ -6,9 +6,10 @@ Supports flexible date parsing and timezone handling.
 """
 
 import time
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timezone
 from dateutil import parser as date_parser
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from redditdl.filters.base import Filter, FilterResult
 from redditdl.scrapers import PostMetadata
 
@@ -28,6 +29,12 @@ class DateFilter(Filter):
     - Date only: "2023-01-01"
     - Human readable: "January 1, 2023"
     - Relative: "1 week ago", "2 days ago"
+    
+    The configured bounds are parsed once and stored as UTC epoch floats so
+    that per-post evaluation is a plain numeric comparison against
+    ``PostMetadata.created_utc``. Inputs already sorted by creation time can
+    use ``select_sorted`` to binary-search the matching window instead of
+    evaluating every post.
     """
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
@@ -44,6 +51,21 @@ class DateFilter(Filter):
         self.date_before = self._parse_date(self.config.get('date_before'))
         self.date_from = self._parse_date(self.config.get('date_from'))
         self.date_to = self._parse_date(self.config.get('date_to'))
+        
+        # Precompute bounds as epoch seconds for numeric comparisons
+        self._after_ts = self._to_timestamp(self.date_after)
+        self._before_ts = self._to_timestamp(self.date_before)
+        self._from_ts = self._to_timestamp(self.date_from)
+        self._to_ts = self._to_timestamp(self.date_to)
+        self._has_bounds = any(
+            ts is not None for ts in (self._after_ts, self._before_ts, self._from_ts, self._to_ts)
+        )
+        
+        # Bound labels are constant, so format them once
+        self._after_label = self._format_date(self.date_after)
+        self._before_label = self._format_date(self.date_before)
+        self._from_label = self._format_date(self.date_from)
+        self._to_label = self._format_date(self.date_to)
     
     @property
     def name(self) -> str:
@@ -82,82 +104,84 @@ class DateFilter(Filter):
         start_time = time.time()
         
         try:
-            # Get the post creation date
-            post_date = self._get_post_date(post)
+            # Get the post creation time as epoch seconds
+            post_ts = self._get_post_timestamp(post)
             
-            if post_date is None:
+            if post_ts is None:
                 self.logger.warning(f"Could not determine creation date for post {getattr(post, 'id', 'unknown')}")
                 return FilterResult(
                     passed=True,  # Pass posts with unknown dates to be safe
                     reason="Post date unknown, passing by default",
                     metadata={
                         "post_date": None,
-                        "date_after": self._format_date(self.date_after),
-                        "date_before": self._format_date(self.date_before),
-                        "date_from": self._format_date(self.date_from),
-                        "date_to": self._format_date(self.date_to)
+                        "date_after": self._after_label,
+                        "date_before": self._before_label,
+                        "date_from": self._from_label,
+                        "date_to": self._to_label
                     },
                     execution_time=time.time() - start_time
                 )
             
+            post_label = self._format_timestamp(post_ts)
+            
             # If no date filtering is configured, pass all posts
-            if not any([self.date_after, self.date_before, self.date_from, self.date_to]):
+            if not self._has_bounds:
                 return FilterResult(
                     passed=True,
                     reason="No date filter configured",
                     metadata={
-                        "post_date": self._format_date(post_date)
+                        "post_date": post_label
                     },
                     execution_time=time.time() - start_time
                 )
             
             # Apply date_after filter (exclusive)
-            if self.date_after and post_date <= self.date_after:
+            if self._after_ts is not None and post_ts <= self._after_ts:
                 return FilterResult(
                     passed=False,
-                    reason=f"Post date {self._format_date(post_date)} not after {self._format_date(self.date_after)}",
+                    reason=f"Post date {post_label} not after {self._after_label}",
                     metadata={
-                        "post_date": self._format_date(post_date),
-                        "date_after": self._format_date(self.date_after),
+                        "post_date": post_label,
+                        "date_after": self._after_label,
                         "failed_criteria": "date_after"
                     },
                     execution_time=time.time() - start_time
                 )
             
             # Apply date_before filter (exclusive)
-            if self.date_before and post_date >= self.date_before:
+            if self._before_ts is not None and post_ts >= self._before_ts:
                 return FilterResult(
                     passed=False,
-                    reason=f"Post date {self._format_date(post_date)} not before {self._format_date(self.date_before)}",
+                    reason=f"Post date {post_label} not before {self._before_label}",
                     metadata={
-                        "post_date": self._format_date(post_date),
-                        "date_before": self._format_date(self.date_before),
+                        "post_date": post_label,
+                        "date_before": self._before_label,
                         "failed_criteria": "date_before"
                     },
                     execution_time=time.time() - start_time
                 )
             
             # Apply date_from filter (inclusive)
-            if self.date_from and post_date < self.date_from:
+            if self._from_ts is not None and post_ts < self._from_ts:
                 return FilterResult(
                     passed=False,
-                    reason=f"Post date {self._format_date(post_date)} before {self._format_date(self.date_from)}",
+                    reason=f"Post date {post_label} before {self._from_label}",
                     metadata={
-                        "post_date": self._format_date(post_date),
-                        "date_from": self._format_date(self.date_from),
+                        "post_date": post_label,
+                        "date_from": self._from_label,
                         "failed_criteria": "date_from"
                     },
                     execution_time=time.time() - start_time
                 )
             
             # Apply date_to filter (inclusive)
-            if self.date_to and post_date > self.date_to:
+            if self._to_ts is not None and post_ts > self._to_ts:
                 return FilterResult(
                     passed=False,
-                    reason=f"Post date {self._format_date(post_date)} after {self._format_date(self.date_to)}",
+                    reason=f"Post date {post_label} after {self._to_label}",
                     metadata={
-                        "post_date": self._format_date(post_date),
-                        "date_to": self._format_date(self.date_to),
+                        "post_date": post_label,
+                        "date_to": self._to_label,
                         "failed_criteria": "date_to"
                     },
                     execution_time=time.time() - start_time
@@ -166,13 +190,13 @@ class DateFilter(Filter):
             # Post passed all date criteria
             return FilterResult(
                 passed=True,
-                reason=f"Post date {self._format_date(post_date)} within date range",
+                reason=f"Post date {post_label} within date range",
                 metadata={
-                    "post_date": self._format_date(post_date),
-                    "date_after": self._format_date(self.date_after),
-                    "date_before": self._format_date(self.date_before),
-                    "date_from": self._format_date(self.date_from),
-                    "date_to": self._format_date(self.date_to)
+                    "post_date": post_label,
+                    "date_after": self._after_label,
+                    "date_before": self._before_label,
+                    "date_from": self._from_label,
+                    "date_to": self._to_label
                 },
                 execution_time=time.time() - start_time
             )
@@ -186,6 +210,78 @@ class DateFilter(Filter):
                 execution_time=time.time() - start_time
             )
     
+    def matches_timestamp(self, timestamp: float) -> bool:
+        """
+        Check whether an epoch timestamp falls inside the configured window.
+        
+        Args:
+            timestamp: UTC epoch seconds
+            
+        Returns:
+            True if the timestamp satisfies every configured bound
+        """
+        if self._after_ts is not None and timestamp <= self._after_ts:
+            return False
+        if self._before_ts is not None and timestamp >= self._before_ts:
+            return False
+        if self._from_ts is not None and timestamp < self._from_ts:
+            return False
+        if self._to_ts is not None and timestamp > self._to_ts:
+            return False
+        return True
+    
+    def select_sorted(self, posts: Sequence[PostMetadata],
+                      descending: bool = False) -> Tuple[int, int]:
+        """
+        Binary-search the date window in posts already sorted by creation time.
+        
+        Posts must be ordered by ``created_utc`` (ascending, or descending as
+        returned by Reddit's ``new`` listings) and carry numeric timestamps.
+        Only O(log n) timestamps are inspected.
+        
+        Args:
+            posts: Posts sorted by creation time
+            descending: True if posts are ordered newest first
+            
+        Returns:
+            Half-open ``(start, end)`` index range of posts inside the window
+        """
+        if not self._has_bounds:
+            return 0, len(posts)
+        
+        # Combine exclusive/inclusive bounds into one lower and one upper bound.
+        # When both kinds are given the tighter one wins; ties favour exclusive.
+        lower, lower_inclusive = self._from_ts, True
+        if self._after_ts is not None and (lower is None or self._after_ts >= lower):
+            lower, lower_inclusive = self._after_ts, False
+        upper, upper_inclusive = self._to_ts, True
+        if self._before_ts is not None and (upper is None or self._before_ts <= upper):
+            upper, upper_inclusive = self._before_ts, False
+        
+        if descending:
+            # Negate keys so the sequence is ascending for bisect
+            key = lambda p: -p.created_utc
+            start = 0
+            if upper is not None:
+                bisect_fn = bisect_left if upper_inclusive else bisect_right
+                start = bisect_fn(posts, -upper, key=key)
+            end = len(posts)
+            if lower is not None:
+                bisect_fn = bisect_right if lower_inclusive else bisect_left
+                end = bisect_fn(posts, -lower, key=key)
+        else:
+            key = lambda p: p.created_utc
+            start = 0
+            if lower is not None:
+                bisect_fn = bisect_left if lower_inclusive else bisect_right
+                start = bisect_fn(posts, lower, key=key)
+            end = len(posts)
+            if upper is not None:
+                bisect_fn = bisect_right if upper_inclusive else bisect_left
+                end = bisect_fn(posts, upper, key=key)
+        
+        return start, max(start, end)
+    
     def _parse_date(self, date_input: Union[str, datetime, None]) -> Optional[datetime]:
         """
         Parse a date from various input formats.
@@ -256,6 +352,54 @@ class DateFilter(Filter):
         
         return None
     
+    def _get_post_timestamp(self, post: PostMetadata) -> Optional[float]:
+        """
+        Extract the creation time of a post as UTC epoch seconds.
+        
+        Numeric ``created_utc`` values (the normal case for PostMetadata) are
+        returned directly; other representations fall back to
+        ``_get_post_date``.
+        
+        Args:
+            post: Reddit post metadata
+            
+        Returns:
+            Epoch seconds or None if the date cannot be determined
+        """
+        created_utc = getattr(post, 'created_utc', None)
+        if isinstance(created_utc, (int, float)) and not isinstance(created_utc, bool):
+            return float(created_utc)
+        
+        return self._to_timestamp(self._get_post_date(post))
+    
+    @staticmethod
+    def _to_timestamp(date_obj: Optional[datetime]) -> Optional[float]:
+        """
+        Convert a timezone-aware datetime to epoch seconds.
+        
+        Args:
+            date_obj: Datetime to convert
+            
+        Returns:
+            Epoch seconds or None
+        """
+        if date_obj is None:
+            return None
+        return date_obj.timestamp()
+    
+    @staticmethod
+    def _format_timestamp(timestamp: float) -> str:
+        """
+        Format epoch seconds for display without building a datetime.
+        
+        Args:
+            timestamp: UTC epoch seconds
+            
+        Returns:
+            Formatted date string
+        """
+        return time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(timestamp))
+    
     def _format_date(self, date_obj: Optional[datetime]) -> Optional[str]:
         """
         Format a datetime object for display.
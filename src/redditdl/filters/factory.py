@@ -6,7 +6,7 @@ based on configuration dictionaries or CLI arguments.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 from redditdl.filters.base import Filter, FilterChain, FilterComposition
 from redditdl.filters.score import ScoreFilter
 from redditdl.filters.date import DateFilter
@@ -33,6 +33,9 @@ class FilterFactory:
         'nsfw': NSFWFilter,
     }
     
+    # Plugin filters whose classes are imported the first time they are created
+    LAZY_FILTERS: Dict[str, Callable[[], Type[Filter]]] = {}
+    
     def __init__(self):
         """Initialize the filter factory."""
         self.logger = logging.getLogger(__name__)
@@ -52,13 +55,26 @@ class FilterFactory:
         Raises:
             ValueError: If filter type is unknown
         """
+        if filter_type not in cls.FILTER_REGISTRY and filter_type in cls.LAZY_FILTERS:
+            cls._resolve_lazy_filter(filter_type)
+        
         if filter_type not in cls.FILTER_REGISTRY:
-            available_types = ', '.join(sorted(cls.FILTER_REGISTRY.keys()))
+            available_types = ', '.join(sorted(set(cls.FILTER_REGISTRY) | set(cls.LAZY_FILTERS)))
             raise ValueError(f"Unknown filter type '{filter_type}'. Available types: {available_types}")
         
         filter_class = cls.FILTER_REGISTRY[filter_type]
         return filter_class(config)
     
+    @classmethod
+    def _resolve_lazy_filter(cls, filter_type: str) -> None:
+        """Import a lazily registered filter class and register it."""
+        loader = cls.LAZY_FILTERS.pop(filter_type)
+        try:
+            filter_class = loader()
+        except Exception as e:
+            raise ValueError(f"Failed to load filter type '{filter_type}': {e}") from e
+        cls.register_filter(filter_type, filter_class)
+    
     @classmethod
     def create_filter_chain(
         cls, 
@@ -243,7 +259,7 @@ class FilterFactory:
         
         # Extract individual filter configurations
         for filter_type, filter_params in filters_config.items():
-            if filter_type in cls.FILTER_REGISTRY and filter_params:
+            if (filter_type in cls.FILTER_REGISTRY or filter_type in cls.LAZY_FILTERS) and filter_params:
                 filter_configs.append({
                     'type': filter_type,
                     'config': filter_params
@@ -266,6 +282,14 @@ class FilterFactory:
         """
         filter_info = {}
         
+        # Plugin filters are listed without importing them
+        for filter_type in cls.LAZY_FILTERS:
+            filter_info[filter_type] = {
+                'name': filter_type,
+                'description': "Plugin filter (loaded on first use)",
+                'schema': {}
+            }
+        
         for filter_type, filter_class in cls.FILTER_REGISTRY.items():
             # Create a temporary instance to get schema and description
             try:
@@ -316,6 +340,23 @@ class FilterFactory:
         
         cls.FILTER_REGISTRY[filter_type] = filter_class
     
+    @classmethod
+    def register_lazy_filter(cls, filter_type: str, loader: Callable[[], Type[Filter]]) -> bool:
+        """
+        Register a filter type whose class is imported on first use.
+        
+        Args:
+            filter_type: Name of the filter type
+            loader: Callable that imports and returns the filter class
+            
+        Returns:
+            False if the filter type is already registered
+        """
+        if filter_type in cls.FILTER_REGISTRY or filter_type in cls.LAZY_FILTERS:
+            return False
+        cls.LAZY_FILTERS[filter_type] = loader
+        return True
+    
     @classmethod
     def unregister_filter(cls, filter_type: str) -> None:
         """
@@ -325,4 +366,5 @@ class FilterFactory:
             filter_type: Name of the filter type to remove
         """
         if filter_type in cls.FILTER_REGISTRY:
-            del cls.FILTER_REGISTRY[filter_type]
\ No newline at end of file
+            del cls.FILTER_REGISTRY[filter_type]
+        cls.LAZY_FILTERS.pop(filter_type, None)
\ No newline at end of file
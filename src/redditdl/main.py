@@ -9,42 +9,58 @@ with rich formatting, multi-command structure, and better error messages.
 """
 
 import argparse
+import importlib
+import importlib.util
 import os
 import sys
 import logging
-import asyncio
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from urllib.parse import urlparse
 
-# Legacy imports
-from redditdl.scrapers import PrawScraper, YarsScraper, PostMetadata
-from redditdl.metadata import MetadataEmbedder
-from redditdl.downloader import MediaDownloader
-from redditdl.utils import sanitize_filename
-
-# New pipeline imports
-from redditdl.core.pipeline.interfaces import PipelineContext
-from redditdl.core.pipeline.executor import PipelineExecutor
-from redditdl.pipeline.stages.acquisition import AcquisitionStage
-from redditdl.pipeline.stages.filter import FilterStage
-from redditdl.pipeline.stages.processing import ProcessingStage
-from redditdl.pipeline.stages.organization import OrganizationStage
-from redditdl.pipeline.stages.export import ExportStage
-
-# New CLI imports
-try:
-    from redditdl.cli.main import app as typer_app
-    TYPER_AVAILABLE = True
-except ImportError:
-    TYPER_AVAILABLE = False
-
-# Configuration system imports
-try:
+# Scrapers, downloaders and pipeline stages pull in PRAW, Pillow, pydantic
+# and the plugin system. They are imported where they are used so that the
+# console script starts quickly (e.g. for --version or shell completion).
+if TYPE_CHECKING:
+    from redditdl.scrapers import PostMetadata
+    from redditdl.downloader import MediaDownloader
     from redditdl.core.config import AppConfig
-    CONFIG_AVAILABLE = True
-except ImportError:
-    CONFIG_AVAILABLE = False
+
+# Names previously imported at module level, resolved on first access
+_LAZY_ATTRIBUTES = {
+    'PrawScraper': 'redditdl.scrapers',
+    'YarsScraper': 'redditdl.scrapers',
+    'PostMetadata': 'redditdl.scrapers',
+    'MetadataEmbedder': 'redditdl.metadata',
+    'MediaDownloader': 'redditdl.downloader',
+    'sanitize_filename': 'redditdl.utils',
+    'PipelineContext': 'redditdl.core.pipeline.interfaces',
+    'PipelineExecutor': 'redditdl.core.pipeline.executor',
+    'AcquisitionStage': 'redditdl.pipeline.stages.acquisition',
+    'FilterStage': 'redditdl.pipeline.stages.filter',
+    'ProcessingStage': 'redditdl.pipeline.stages.processing',
+    'OrganizationStage': 'redditdl.pipeline.stages.organization',
+    'ExportStage': 'redditdl.pipeline.stages.export',
+    'AppConfig': 'redditdl.core.config',
+    'typer_app': 'redditdl.cli.main',
+}
+
+# New CLI availability (checked without importing it)
+TYPER_AVAILABLE = importlib.util.find_spec("typer") is not None
+
+# Configuration system availability
+CONFIG_AVAILABLE = importlib.util.find_spec("pydantic") is not None
+
+
+def __getattr__(name: str):
+    """Resolve lazily imported module attributes (PEP 562)."""
+    module_path = _LAZY_ATTRIBUTES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attribute = 'app' if name == 'typer_app' else name
+    value = getattr(importlib.import_module(module_path), attribute)
+    globals()[name] = value
+    return value
 
 
 def load_credentials_from_dotenv(dotenv_path_str: str = ".env") -> None:
@@ -272,7 +288,7 @@ def _validate_arguments(args: argparse.Namespace) -> None:
     # so we no longer need to check for this manually
 
 
-def construct_filename(post: PostMetadata, media_url: str) -> str:
+def construct_filename(post: 'PostMetadata', media_url: str) -> str:
     """
     Construct a safe filename for the downloaded media.
     
@@ -304,11 +320,12 @@ def construct_filename(post: PostMetadata, media_url: str) -> str:
     base_filename = f"{post.date_iso}_{post.id}_{title_part}"
     
     # Sanitize and add extension
+    from redditdl.utils import sanitize_filename
     safe_base = sanitize_filename(base_filename)
     return f"{safe_base}{extension}"
 
 
-def process_posts(posts: list[PostMetadata], downloader: MediaDownloader) -> None:
+def process_posts(posts: list['PostMetadata'], downloader: 'MediaDownloader') -> None:
     """
     Process a list of posts and download their media.
     
@@ -409,6 +426,15 @@ async def process_posts_pipeline_config(config: 'AppConfig', target_user: str) -
         config: Application configuration
         target_user: Reddit username to scrape
     """
+    from redditdl.core.pipeline.interfaces import PipelineContext
+    from redditdl.core.pipeline.executor import PipelineExecutor
+    from redditdl.pipeline.stages.acquisition import AcquisitionStage
+    from redditdl.pipeline.stages.filter import FilterStage
+    from redditdl.pipeline.stages.processing import ProcessingStage
+    from redditdl.pipeline.stages.organization import OrganizationStage
+    from redditdl.pipeline.stages.export import ExportStage
+    
+    plugin_manager = None
     try:
         # Create pipeline context with configuration
         context = PipelineContext()
@@ -476,6 +502,12 @@ async def process_posts_pipeline_config(config: 'AppConfig', target_user: str) -
         context.set_config("export_formats", config.output.export_formats)
         context.set_config("dry_run", config.dry_run)
         
+        # Drop posts archived by earlier runs, including existing JSON sidecars
+        if config.skip_archived and context.state_manager is not None:
+            context.state_manager.index_sidecars([config.output.output_dir],
+                                                 exclude=[config.get_export_dir()])
+            context.set_config("skip_archived", True)
+        
         # API authentication configuration
         if config.scraping.api_mode:
             context.set_config("client_id", config.scraping.client_id)
@@ -485,6 +517,14 @@ async def process_posts_pipeline_config(config: 'AppConfig', target_user: str) -
                 context.set_config("username", config.scraping.username)
                 context.set_config("password", config.scraping.password)
         
+        # Register plugins once for the run; their components load on first use
+        if config.enable_plugins:
+            from redditdl.core.plugins.manager import PluginManager
+            
+            plugin_manager = PluginManager(plugin_dirs=[str(d) for d in config.plugin_dirs],
+                                           index_path=config.get_plugin_index_path())
+            plugin_manager.load_all_plugins(lazy=True)
+        
         # Create pipeline executor
         executor = PipelineExecutor(error_handling="continue")
         
@@ -530,7 +570,7 @@ async def process_posts_pipeline_config(config: 'AppConfig', target_user: str) -
         
         # Skip processing stage in dry-run mode
         if not config.dry_run:
-            executor.add_stage(ProcessingStage(processing_config))
+            executor.add_stage(ProcessingStage(processing_config, plugin_manager=plugin_manager))
         else:
             logging.info("Dry-run mode: Skipping content processing/download")
         
@@ -608,6 +648,9 @@ async def process_posts_pipeline_config(config: 'AppConfig', target_user: str) -
                 context.state_manager.close()
             except Exception as e:
                 logging.warning(f"Error closing state manager: {e}")
+        
+        if plugin_manager is not None:
+            plugin_manager.cleanup()
 
 
 async def process_posts_pipeline(args: argparse.Namespace) -> None:
@@ -620,6 +663,14 @@ async def process_posts_pipeline(args: argparse.Namespace) -> None:
     Args:
         args: Parsed command line arguments
     """
+    from redditdl.core.pipeline.interfaces import PipelineContext
+    from redditdl.core.pipeline.executor import PipelineExecutor
+    from redditdl.pipeline.stages.acquisition import AcquisitionStage
+    from redditdl.pipeline.stages.filter import FilterStage
+    from redditdl.pipeline.stages.processing import ProcessingStage
+    from redditdl.pipeline.stages.organization import OrganizationStage
+    from redditdl.pipeline.stages.export import ExportStage
+    
     try:
         # Create pipeline context with configuration
         context = PipelineContext()
@@ -753,6 +804,7 @@ def main() -> None:
     # Check if we should use the new Typer CLI
     if TYPER_AVAILABLE and _should_use_typer_cli():
         # Use new Typer-based CLI
+        from redditdl.cli.main import app as typer_app
         typer_app()
         return
     
@@ -802,6 +854,8 @@ def _run_legacy_cli() -> None:
     """
     Run the legacy argparse-based CLI for backward compatibility.
     """
+    import asyncio
+    
     setup_logging()
     load_credentials_from_dotenv() # Load .env before parsing args
     
@@ -881,6 +935,10 @@ def _run_legacy_cli() -> None:
             if args.export_formats:
                 logging.warning("--export-formats option is only supported in pipeline mode")
             
+            from redditdl.scrapers import PrawScraper, YarsScraper
+            from redditdl.metadata import MetadataEmbedder
+            from redditdl.downloader import MediaDownloader
+            
             # Initialize components based on configuration
             embedder = MetadataEmbedder()
             outdir = Path(args.outdir)
@@ -20,6 +20,7 @@ from redditdl.core.exceptions import (
 )
 from redditdl.core.error_recovery import get_recovery_manager
 from redditdl.core.error_context import report_error
+from redditdl.core.monitoring.tracing import get_tracer
 
 # Import enhanced target system
 from redditdl.targets.resolver import TargetResolver, TargetInfo, TargetType
@@ -61,6 +62,8 @@ class AcquisitionStage(PipelineStage):
     - password: Reddit password for authenticated requests
     - sleep_interval: Time to sleep between requests
     - post_limit: Maximum number of posts to fetch per target
+    - skip_archived: Drop posts already archived in any session or sidecar,
+      checked through the state manager's archive Bloom filter
     """
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
@@ -169,13 +172,21 @@ class AcquisitionStage(PipelineStage):
             total_posts = 0
             successful_targets = 0
             processed_targets = []
+            skipped_archived = 0
+            skip_archived = context.get_config("skip_archived", self.get_config("skip_archived", False))
             
             for processing_result in processing_results:
                 if processing_result.success:
+                    if skip_archived and processing_result.posts:
+                        before_count = len(processing_result.posts)
+                        processing_result.posts = self._drop_archived_posts(context, processing_result.posts)
+                        skipped_archived += before_count - len(processing_result.posts)
+                    
                     # Add posts to context
                     if processing_result.posts:
                         context.add_posts(processing_result.posts)
                         total_posts += len(processing_result.posts)
+                        self._trace_fetch(processing_result)
                         
                         # Emit post discovery event
                         await self._emit_post_discovered_event(context, processing_result.target_info, processing_result.posts)
@@ -219,6 +230,10 @@ class AcquisitionStage(PipelineStage):
             result.set_data("targets_failed", len(target_infos) - successful_targets)
             result.set_data("processed_targets", processed_targets)
             result.set_data("batch_processing_enabled", True)
+            result.set_data("posts_skipped_archived", skipped_archived)
+            
+            if skipped_archived:
+                self.logger.info(f"Skipped {skipped_archived} already archived posts")
             
             # Log summary
             if total_posts > 0:
@@ -241,6 +256,47 @@ class AcquisitionStage(PipelineStage):
         result.execution_time = time.time() - start_time
         return result
     
+    def _trace_fetch(self, processing_result: TargetProcessingResult) -> None:
+        """Start each sampled post's trace with the listing fetch it arrived in."""
+        tracer = get_tracer()
+        if not tracer.enabled:
+            return
+        
+        fetch_end = processing_result.started_at + processing_result.processing_time
+        for post in processing_result.posts:
+            tracer.record_post_span(
+                getattr(post, 'id', ''), "scraper.fetch",
+                processing_result.started_at, fetch_end,
+                target=processing_result.target_info.target_value,
+                scraper=processing_result.metadata.get('scraper_type'),
+                posts=len(processing_result.posts)
+            )
+    
+    def _drop_archived_posts(self, context: PipelineContext, posts: List[PostMetadata]) -> List[PostMetadata]:
+        """
+        Remove posts that were already archived by earlier sessions.
+        
+        Args:
+            context: Pipeline context holding the state manager
+            posts: Freshly acquired posts
+            
+        Returns:
+            Posts that have not been archived yet
+        """
+        state_manager = context.state_manager
+        if state_manager is None or not hasattr(state_manager, 'filter_archived'):
+            return posts
+        
+        try:
+            archived = state_manager.filter_archived([post.id for post in posts])
+        except Exception as e:
+            self.logger.warning(f"Archived post check failed, keeping all posts: {e}")
+            return posts
+        
+        if not archived:
+            return posts
+        return [post for post in posts if post.id not in archived]
+    
     def _build_scraping_config(self, context: PipelineContext) -> ScrapingConfig:
         """
         Build scraping configuration from context and stage config.
@@ -260,7 +316,9 @@ class AcquisitionStage(PipelineStage):
             client_id=context.get_config("client_id", self.get_config("client_id")),
             client_secret=context.get_config("client_secret", self.get_config("client_secret")),
             username=context.get_config("username", self.get_config("username")),
-            password=context.get_config("password", self.get_config("password"))
+            password=context.get_config("password", self.get_config("password")),
+            http_cache_dir=context.get_config("http_cache_dir", self.get_config("http_cache_dir")),
+            http_cache_size_mb=context.get_config("http_cache_size_mb", self.get_config("http_cache_size_mb", 200))
         )
     
     def _build_batch_config(self, context: PipelineContext) -> BatchProcessingConfig:
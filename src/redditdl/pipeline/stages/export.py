@@ -6,17 +6,124 @@ a pluggable exporter system. Supports multiple output formats with full
 configuration control and plugin integration.
 """
 
+import asyncio
+import functools
+import multiprocessing
+import pickle
+import queue
+import threading
 import time
 import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
 from datetime import datetime
 
 from redditdl.core.pipeline.interfaces import PipelineStage, PipelineContext, PipelineResult
-from redditdl.exporters.base import registry, register_core_exporters, ExportResult
+from redditdl.exporters.base import BaseExporter, registry, register_core_exporters, ExportResult
 from redditdl.scrapers import PostMetadata
 
 
+class _PostFanout:
+    """
+    Serialize posts once and hand the same chunks to several consumers.
+    
+    A producer pushes chunks of posts into one bounded queue per consumer, so
+    memory stays at a few chunks per exporter and a slow exporter applies
+    backpressure instead of the run being buffered. A consumer that stops
+    early is detached and no longer holds up the others.
+    
+    Thread consumers share the chunk lists directly (exporters only read post
+    dictionaries); for process consumers each chunk is pickled once by
+    ``encode`` and the same bytes go to every queue.
+    """
+    
+    def __init__(self, posts: Iterator[Dict[str, Any]], queues: List[Any],
+                 chunk_size: int = 256, encode: Optional[Callable[[List[Dict[str, Any]]], Any]] = None):
+        self._posts = posts
+        self._queues = queues
+        self._chunk_size = max(1, chunk_size)
+        self._encode = encode
+        self._closed = [threading.Event() for _ in queues]
+        self.produced = 0
+    
+    def produce(self) -> int:
+        """Serialize all posts and publish them to every consumer."""
+        chunk = []
+        end_marker = None
+        try:
+            for post in self._posts:
+                chunk.append(post)
+                if len(chunk) >= self._chunk_size:
+                    self._publish(chunk)
+                    chunk = []
+            if chunk:
+                self._publish(chunk)
+        except Exception as e:
+            end_marker = RuntimeError(f"Post serialization failed: {e}")
+        finally:
+            self._put_all(end_marker)
+        return self.produced
+    
+    def _publish(self, chunk: List[Dict[str, Any]]) -> None:
+        self._put_all(self._encode(chunk) if self._encode else chunk)
+        self.produced += len(chunk)
+    
+    def _put_all(self, item: Any) -> None:
+        for consumer_queue, closed in zip(self._queues, self._closed, strict=True):
+            while not closed.is_set():
+                try:
+                    consumer_queue.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+    
+    def close(self, index: int) -> None:
+        """Detach a consumer so the producer stops waiting on it."""
+        self._closed[index].set()
+
+
+def _iter_fanout_queue(chunk_queue: Any, decode: Optional[Callable[[Any], List[Dict[str, Any]]]] = None
+                       ) -> Iterator[Dict[str, Any]]:
+    """Iterate over the posts a _PostFanout publishes to one queue."""
+    while True:
+        item = chunk_queue.get()
+        if item is None:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield from (decode(item) if decode else item)
+
+
+def _build_export_data(export_metadata: Dict[str, Any],
+                       posts: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Assemble the data dictionary passed to a non-streaming exporter."""
+    export_data = {"export_info": export_metadata["export_info"]}
+    if posts:
+        export_data["posts"] = posts
+    if "pipeline_metadata" in export_metadata:
+        export_data["pipeline_metadata"] = export_metadata["pipeline_metadata"]
+    return export_data
+
+
+def _run_exporter(exporter: BaseExporter, posts: Iterator[Dict[str, Any]],
+                  export_metadata: Dict[str, Any], output_path: str,
+                  format_config: Dict[str, Any], use_streaming: bool) -> ExportResult:
+    """Run an exporter over a post iterator, materializing it only when required."""
+    if use_streaming and exporter.supports_streaming():
+        return exporter.export_stream(posts, export_metadata, output_path, format_config)
+    return exporter.export(_build_export_data(export_metadata, list(posts)), output_path, format_config)
+
+
+def _run_exporter_process(exporter_class: Type[BaseExporter], chunk_queue: Any,
+                          export_metadata: Dict[str, Any], output_path: str,
+                          format_config: Dict[str, Any], use_streaming: bool) -> ExportResult:
+    """Worker process entry point for parallel export."""
+    posts = _iter_fanout_queue(chunk_queue, decode=pickle.loads)
+    return _run_exporter(exporter_class(), posts, export_metadata, output_path,
+                         format_config, use_streaming)
+
+
 class ExportStage(PipelineStage):
     """
     Enhanced pipeline stage for exporting metadata and results to multiple formats.
@@ -32,6 +139,30 @@ class ExportStage(PipelineStage):
     - Export validation and error handling
     - Plugin exporter support
     - Incremental export capabilities
+    - Streaming export: exporters that support it receive posts lazily,
+      serialized one at a time, instead of a fully materialized list
+    - Parallel fan-out: multiple formats share a single serialization pass
+      and export concurrently
+    
+    Configuration options:
+    - export_formats: List of format names to export (default: ["json"])
+    - export_dir: Directory for export files (default: "exports")
+    - export_streaming: Use streaming exporters when available; streamed
+      CSV fixes its columns from a leading sample, so this is opt-in
+      (default: False)
+    - export_incremental: Append new and changed posts to a stable
+      per-format export across runs, for formats that support it (NDJSON,
+      SQLite and Markdown); other formats are written in full with
+      timestamped names (default: False)
+    - export_incremental_name: Base file name for incremental exports
+      (default: "redditdl_export")
+    - export_parallel: With several formats, serialize posts once and run
+      all exporters concurrently on the shared stream (default: False)
+    - export_parallel_mode: "thread" or "process" workers for parallel
+      export; process mode needs importable exporter classes and picklable
+      pipeline metadata (default: "thread")
+    - export_fanout_chunk_size: Posts per chunk handed to parallel
+      exporters (default: 256)
     """
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
@@ -64,11 +195,19 @@ class ExportStage(PipelineStage):
         try:
             posts_count = len(context.posts)
             self.logger.info(f"Exporting data for {posts_count} posts")
+            if posts_count == 0:
+                result.add_warning("No posts to export")
             
             # Get export configuration
             export_formats = context.get_config("export_formats", self.get_config("export_formats", ["json"]))
             export_dir = context.get_config("export_dir", self.get_config("export_dir", "exports"))
             
+            # Repeated formats would write the same target twice
+            unique_formats = list(dict.fromkeys(export_formats))
+            if len(unique_formats) != len(export_formats):
+                result.add_warning(f"Ignoring repeated export formats in {export_formats}")
+                export_formats = unique_formats
+            
             if not export_formats:
                 self.logger.info("No export formats configured")
                 result.processed_count = posts_count
@@ -79,8 +218,8 @@ class ExportStage(PipelineStage):
             export_path = Path(export_dir)
             export_path.mkdir(parents=True, exist_ok=True)
             
-            # Prepare export data
-            export_data = self._prepare_export_data(context)
+            export_metadata = self._prepare_export_metadata(context)
+            use_streaming = context.get_config("export_streaming", self.get_config("export_streaming", False))
             
             # Validate available exporters
             available_formats = registry.list_formats()
@@ -97,27 +236,29 @@ class ExportStage(PipelineStage):
             export_files = []
             export_results = {}
             
-            # Process each export format
-            for export_format in export_formats:
-                try:
-                    export_result = await self._export_format(
-                        export_format, export_data, export_path, context
-                    )
-                    
-                    if export_result and export_result.success:
-                        export_files.append(export_result.output_path)
-                        exports_created += 1
-                        export_results[export_format] = export_result
-                        self.logger.info(f"Created {export_format} export: {export_result.output_path}")
-                    else:
-                        error_msg = f"Failed to create {export_format} export"
-                        if export_result and export_result.errors:
-                            error_msg += f": {'; '.join(export_result.errors)}"
-                        result.add_warning(error_msg)
-                        
-                except Exception as e:
-                    self.logger.error(f"Error creating {export_format} export: {e}")
-                    result.add_error(f"Export format '{export_format}' failed: {e}")
+            if self._use_parallel_export(export_formats, context):
+                outcomes = await self._export_formats_parallel(
+                    export_formats, export_metadata, export_path, context, use_streaming
+                )
+            else:
+                outcomes = await self._export_formats_sequential(
+                    export_formats, export_metadata, export_path, context, use_streaming
+                )
+            
+            for export_format, export_result, error in outcomes:
+                if error is not None:
+                    self.logger.error(f"Error creating {export_format} export: {error}")
+                    result.add_error(f"Export format '{export_format}' failed: {error}")
+                elif export_result and export_result.success:
+                    export_files.append(export_result.output_path)
+                    exports_created += 1
+                    export_results[export_format] = export_result
+                    self.logger.info(f"Created {export_format} export: {export_result.output_path}")
+                else:
+                    error_msg = f"Failed to create {export_format} export"
+                    if export_result and export_result.errors:
+                        error_msg += f": {'; '.join(export_result.errors)}"
+                    result.add_warning(error_msg)
             
             # Store results
             result.processed_count = posts_count
@@ -149,17 +290,159 @@ class ExportStage(PipelineStage):
         result.execution_time = time.time() - start_time
         return result
     
-    def _prepare_export_data(self, context: PipelineContext) -> Dict[str, Any]:
+    async def _export_formats_sequential(self, export_formats: List[str], export_metadata: Dict[str, Any],
+                                         export_path: Path, context: PipelineContext,
+                                         use_streaming: bool) -> List[Tuple[str, Optional[ExportResult], Optional[Exception]]]:
+        """
+        Run exporters one after another, each serializing posts for itself.
+        
+        Returns:
+            List of (format, ExportResult or None, exception or None) tuples
+        """
+        outcomes = []
+        export_data = None
+        
+        for export_format in export_formats:
+            try:
+                exporter = registry.get_exporter(export_format)
+                if use_streaming and exporter and exporter.supports_streaming():
+                    export_result = await self._export_format_streaming(
+                        export_format, export_metadata, export_path, context
+                    )
+                else:
+                    # Export data is materialized only if a non-streaming exporter needs it
+                    if export_data is None:
+                        export_data = self._prepare_export_data(context, export_metadata)
+                    export_result = await self._export_format(
+                        export_format, export_data, export_path, context
+                    )
+                outcomes.append((export_format, export_result, None))
+            except Exception as e:
+                outcomes.append((export_format, None, e))
+        
+        return outcomes
+    
+    async def _export_formats_parallel(self, export_formats: List[str], export_metadata: Dict[str, Any],
+                                       export_path: Path, context: PipelineContext,
+                                       use_streaming: bool) -> List[Tuple[str, Optional[ExportResult], Optional[Exception]]]:
+        """
+        Fan posts out to all exporters at once.
+        
+        Posts are serialized a single time by a producer and the same chunks
+        are handed to every exporter. Exporters run in worker threads by
+        default; process mode sidesteps the GIL for CPU-bound formatting at
+        the cost of pickling each chunk once. Every exporter gets its own
+        worker because they all consume the shared stream in lockstep.
+        
+        Returns:
+            List of (format, ExportResult or None, exception or None) tuples
+        """
+        chunk_size = context.get_config("export_fanout_chunk_size",
+                                        self.get_config("export_fanout_chunk_size", 256))
+        mode = context.get_config("export_parallel_mode", self.get_config("export_parallel_mode", "thread"))
+        use_processes = mode == "process"
+        
+        jobs = []
+        for slot, export_format in enumerate(export_formats):
+            exporter = registry.get_exporter(export_format)
+            if not exporter:
+                self.logger.error(f"No exporter available for format: {export_format}")
+                continue
+            format_config = self._get_format_config(export_format, context)
+            config_errors = exporter.validate_config(format_config)
+            if config_errors:
+                self.logger.warning(f"Configuration errors for {export_format}: {config_errors}")
+            output_path = self._build_output_path(exporter, export_path, context, format_config)
+            jobs.append((slot, export_format, exporter, str(output_path), format_config))
+        
+        # One slot per requested target, so repeated formats keep separate results
+        outcomes = [(export_format, None, None) for export_format in export_formats]
+        if not jobs:
+            return outcomes
+        
+        self.logger.debug(f"Exporting {len(jobs)} formats in parallel ({mode} workers)")
+        loop = asyncio.get_running_loop()
+        
+        if use_processes:
+            manager = multiprocessing.Manager()
+            queues = [manager.Queue(maxsize=8) for _ in jobs]
+            executor = ProcessPoolExecutor(max_workers=len(jobs))
+            encode = functools.partial(pickle.dumps, protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            manager = None
+            queues = [queue.Queue(maxsize=8) for _ in jobs]
+            executor = ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix="redditdl-export")
+            encode = None
+        
+        fanout = _PostFanout(self._iter_export_posts(context), queues, chunk_size=chunk_size, encode=encode)
+        try:
+            futures = []
+            for index, (_, _export_format, exporter, output_path, format_config) in enumerate(jobs):
+                if use_processes:
+                    future = executor.submit(_run_exporter_process, type(exporter), queues[index],
+                                             export_metadata, output_path, format_config, use_streaming)
+                else:
+                    posts = _iter_fanout_queue(queues[index])
+                    future = executor.submit(_run_exporter, exporter, posts, export_metadata,
+                                             output_path, format_config, use_streaming)
+                future.add_done_callback(lambda _, index=index: fanout.close(index))
+                futures.append(asyncio.wrap_future(future))
+            
+            # Serialization stays in this process; producing on a thread keeps the loop free
+            await loop.run_in_executor(None, fanout.produce)
+            results = await asyncio.gather(*futures, return_exceptions=True)
+        finally:
+            executor.shutdown(wait=True)
+            if manager is not None:
+                manager.shutdown()
+        
+        for (slot, export_format, _, _, _), outcome in zip(jobs, results, strict=True):
+            if isinstance(outcome, Exception):
+                outcomes[slot] = (export_format, None, outcome)
+            else:
+                if outcome.warnings:
+                    for warning in outcome.warnings:
+                        self.logger.warning(f"{export_format} export warning: {warning}")
+                outcomes[slot] = (export_format, outcome, None)
+        
+        return outcomes
+    
+    def _use_parallel_export(self, export_formats: List[str], context: PipelineContext) -> bool:
+        """Check whether exporters should share one serialization pass concurrently."""
+        enabled = context.get_config("export_parallel", self.get_config("export_parallel", False))
+        return bool(enabled) and len(export_formats) > 1
+    
+    def _prepare_export_data(self, context: PipelineContext,
+                             export_metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Prepare data for export from pipeline context.
         
         Args:
             context: Pipeline context with posts and metadata
+            export_metadata: Previously prepared non-post data to reuse
             
         Returns:
             Dictionary containing structured export data
         """
-        export_data = {
+        if export_metadata is None:
+            export_metadata = self._prepare_export_metadata(context)
+        
+        # Include posts data
+        posts = list(self._iter_export_posts(context)) if context.posts else None
+        
+        return _build_export_data(export_metadata, posts)
+    
+    def _prepare_export_metadata(self, context: PipelineContext) -> Dict[str, Any]:
+        """
+        Prepare the non-post portion of the export data.
+        
+        Args:
+            context: Pipeline context with posts and metadata
+            
+        Returns:
+            Dictionary with export_info and optional pipeline_metadata
+        """
+        export_metadata = {
             "export_info": {
                 "timestamp": datetime.now().isoformat(),
                 "format": "redditdl",
@@ -169,37 +452,106 @@ class ExportStage(PipelineStage):
             }
         }
         
-        # Include posts data
-        if context.posts:
-            posts_data = []
-            for post in context.posts:
-                try:
-                    if hasattr(post, 'to_dict'):
-                        post_data = post.to_dict()
-                    else:
-                        # Fallback for non-PostMetadata objects
-                        post_data = dict(post) if isinstance(post, dict) else str(post)
-                    posts_data.append(post_data)
-                except Exception as e:
-                    self.logger.warning(f"Error serializing post {getattr(post, 'id', 'unknown')}: {e}")
-                    # Include basic post info even if full serialization fails
-                    posts_data.append({
-                        "id": getattr(post, 'id', 'unknown'),
-                        "title": getattr(post, 'title', 'Unknown'),
-                        "error": f"Serialization failed: {e}"
-                    })
-            
-            export_data["posts"] = posts_data
-        
-        # Include pipeline metadata
         if context.metadata:
-            export_data["pipeline_metadata"] = {
+            export_metadata["pipeline_metadata"] = {
                 "session_metadata": context.metadata,
                 "stage_results": getattr(context, 'stage_results', {}),
                 "config": context.config
             }
         
-        return export_data
+        return export_metadata
+    
+    def _iter_export_posts(self, context: PipelineContext) -> Iterator[Dict[str, Any]]:
+        """
+        Serialize posts for export one at a time.
+        
+        Args:
+            context: Pipeline context with posts
+            
+        Yields:
+            Post dictionaries ready for an exporter
+        """
+        for post in context.posts:
+            try:
+                if hasattr(post, 'to_dict'):
+                    yield post.to_dict()
+                else:
+                    # Fallback for non-PostMetadata objects
+                    yield dict(post) if isinstance(post, dict) else str(post)
+            except Exception as e:
+                self.logger.warning(f"Error serializing post {getattr(post, 'id', 'unknown')}: {e}")
+                # Include basic post info even if full serialization fails
+                yield {
+                    "id": getattr(post, 'id', 'unknown'),
+                    "title": getattr(post, 'title', 'Unknown'),
+                    "error": f"Serialization failed: {e}"
+                }
+    
+    async def _export_format_streaming(self, format_name: str, export_metadata: Dict[str, Any],
+                                       export_path: Path, context: PipelineContext) -> Optional[ExportResult]:
+        """
+        Export posts with a streaming exporter, serializing posts lazily.
+        
+        Args:
+            format_name: Name of the export format
+            export_metadata: Non-post export data
+            export_path: Directory for export files
+            context: Pipeline context for posts and configuration
+            
+        Returns:
+            ExportResult or None if export failed
+        """
+        try:
+            exporter = registry.get_exporter(format_name)
+            if not exporter:
+                self.logger.error(f"No exporter available for format: {format_name}")
+                return None
+            
+            format_config = self._get_format_config(format_name, context)
+            config_errors = exporter.validate_config(format_config)
+            if config_errors:
+                self.logger.warning(f"Configuration errors for {format_name}: {config_errors}")
+            
+            output_path = self._build_output_path(exporter, export_path, context, format_config)
+            
+            self.logger.debug(f"Starting streaming {format_name} export to {output_path}")
+            export_result = exporter.export_stream(
+                self._iter_export_posts(context), export_metadata, str(output_path), format_config
+            )
+            
+            if export_result.warnings:
+                for warning in export_result.warnings:
+                    self.logger.warning(f"{format_name} export warning: {warning}")
+            
+            return export_result
+            
+        except Exception as e:
+            self.logger.error(f"Failed to export {format_name}: {e}")
+            return None
+    
+    def _build_output_path(self, exporter, export_path: Path,
+                           context: Optional[PipelineContext] = None,
+                           format_config: Optional[Dict[str, Any]] = None) -> Path:
+        """
+        Generate the output path for an exporter.
+        
+        Incremental exports reuse a stable file name so later runs can append
+        to it; everything else gets a timestamped name.
+        """
+        format_info = exporter.get_format_info()
+        if context is not None and self._use_incremental(exporter, context, format_config):
+            name = context.get_config("export_incremental_name",
+                                      self.get_config("export_incremental_name", "redditdl_export"))
+            return export_path / f"{name}{format_info.extension}"
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return export_path / f"redditdl_export_{timestamp}{format_info.extension}"
+    
+    def _use_incremental(self, exporter, context: PipelineContext,
+                         format_config: Optional[Dict[str, Any]] = None) -> bool:
+        """Check whether incremental export is requested and supported by an exporter's configuration."""
+        enabled = context.get_config("export_incremental", self.get_config("export_incremental", False))
+        return bool(enabled) and exporter.supports_incremental(format_config)
     
     async def _export_format(self, format_name: str, data: Dict[str, Any], 
                            export_path: Path, context: PipelineContext) -> Optional[ExportResult]:
@@ -232,10 +584,7 @@ class ExportStage(PipelineStage):
                 # Continue with defaults for invalid options
             
             # Generate output filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            format_info = exporter.get_format_info()
-            output_filename = f"redditdl_export_{timestamp}{format_info.extension}"
-            output_path = export_path / output_filename
+            output_path = self._build_output_path(exporter, export_path, context, format_config)
             
             # Perform export
             self.logger.debug(f"Starting {format_name} export to {output_path}")
@@ -282,6 +631,10 @@ class ExportStage(PipelineStage):
         if stage_config:
             base_config.update(stage_config)
         
+        exporter = registry.get_exporter(format_name)
+        if exporter and self._use_incremental(exporter, context, base_config):
+            base_config.setdefault("incremental", True)
+        
         return base_config
     
     def validate_config(self) -> List[str]:
@@ -10,7 +10,7 @@ import time
 from typing import Dict, Any, List, Optional
 from redditdl.core.pipeline.interfaces import PipelineStage, PipelineContext, PipelineResult
 from redditdl.scrapers import PostMetadata
-from redditdl.filters import FilterFactory, FilterChain, FilterComposition
+from redditdl.filters import FilterFactory, FilterChain, FilterComposition, DateFilter
 
 # Import enhanced error handling
 from redditdl.core.exceptions import (
@@ -19,6 +19,7 @@ from redditdl.core.exceptions import (
 )
 from redditdl.core.error_recovery import get_recovery_manager
 from redditdl.core.error_context import report_error
+from redditdl.core.monitoring.tracing import trace_post
 
 
 class FilterStage(PipelineStage):
@@ -44,6 +45,8 @@ class FilterStage(PipelineStage):
     - exclude_file_extensions: Excluded file extensions
     - nsfw_filter/nsfw_mode: NSFW filtering mode ("include", "exclude", "only")
     - filter_composition: How to combine filters ("and" or "or", default: "and")
+    - date_sorted_input: Declare posts pre-sorted by creation time ("asc" or "desc")
+      so the date window is binary-searched before the chain runs (AND only)
     
     Plus all advanced options for each filter type (case sensitivity, regex mode, etc.)
     """
@@ -119,7 +122,10 @@ class FilterStage(PipelineStage):
             filter_results = []
             filter_errors = 0
             
-            for post in context.posts:
+            candidate_posts = self._narrow_sorted_date_window(filter_chain, context)
+            filtered_out_count += len(context.posts) - len(candidate_posts)
+            
+            for post in candidate_posts:
                 post_id = getattr(post, 'id', 'unknown')
                 post_error_context = ErrorContext(
                     operation="apply_filter_chain",
@@ -130,7 +136,9 @@ class FilterStage(PipelineStage):
                 
                 try:
                     # Apply filter chain to post
-                    chain_result = filter_chain.apply(post)
+                    with trace_post(post_id, "filter.chain") as span:
+                        chain_result = filter_chain.apply(post)
+                        span.set_attribute("passed", chain_result.passed)
                     filter_results.append({
                         "post_id": post_id,
                         "passed": chain_result.passed,
@@ -241,6 +249,38 @@ class FilterStage(PipelineStage):
         result.execution_time = time.time() - start_time
         return result
     
+    def _narrow_sorted_date_window(self, filter_chain: FilterChain,
+                                   context: PipelineContext) -> List[PostMetadata]:
+        """
+        Binary-search the date window when posts are declared sorted by date.
+        
+        Only applies to AND chains containing a DateFilter; posts outside the
+        window can never pass, so they are dropped without running the chain.
+        
+        Args:
+            filter_chain: Chain that will be applied to the posts
+            context: Pipeline context with posts and configuration
+            
+        Returns:
+            Posts that still need to be evaluated by the filter chain
+        """
+        posts = context.posts
+        sort_order = context.get_config('date_sorted_input', self.get_config('date_sorted_input'))
+        if sort_order not in ('asc', 'desc') or filter_chain.composition != FilterComposition.AND:
+            return posts
+        
+        date_filters = [f for f in filter_chain.filters if isinstance(f, DateFilter)]
+        if not date_filters:
+            return posts
+        
+        if not all(isinstance(getattr(p, 'created_utc', None), (int, float)) for p in posts):
+            self.logger.debug("Sorted date fast path skipped: posts lack numeric created_utc")
+            return posts
+        
+        start, end = date_filters[0].select_sorted(posts, descending=(sort_order == 'desc'))
+        self.logger.debug(f"Sorted date window selected posts [{start}:{end}] of {len(posts)}")
+        return posts[start:end]
+    
     def _build_filter_chain(self, context: PipelineContext) -> Optional[FilterChain]:
         """
         Build a filter chain based on configuration from context and stage config.
@@ -259,7 +299,7 @@ class FilterStage(PipelineStage):
             for key in ['min_score', 'max_score', 'date_from', 'date_to', 'date_after', 'date_before',
                        'keywords_include', 'keywords_exclude', 'domains_allow', 'domains_block',
                        'media_types', 'exclude_media_types', 'file_extensions', 'exclude_file_extensions',
-                       'nsfw_filter', 'nsfw_mode', 'filter_composition']:
+                       'nsfw_filter', 'nsfw_mode', 'filter_composition', 'date_sorted_input']:
                 context_value = context.get_config(key)
                 if context_value is not None:
                     merged_config[key] = context_value
@@ -21,6 +21,8 @@ from redditdl.core.exceptions import (
 )
 from redditdl.core.error_recovery import get_recovery_manager
 from redditdl.core.error_context import report_error
+from redditdl.core.monitoring.profiler import sampling_scope
+from redditdl.core.monitoring.tracing import trace_post, url_host, total_bytes
 
 # Import content handler system
 from redditdl.content_handlers.base import (
@@ -57,13 +59,17 @@ class ProcessingStage(PipelineStage):
     - filename_template: Template for generating filenames
     - handler_config: Configuration specific to handlers
     - enable_plugins: Whether to load plugin handlers
+    
+    Plugins are loaded once at startup; pass that PluginManager in rather
+    than having each stage discover them again.
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None,
+                 plugin_manager: Optional[PluginManager] = None):
         super().__init__("processing", config)
         self._registry: ContentHandlerRegistry = handler_registry
         self._detector: ContentTypeDetector = ContentTypeDetector()
-        self._plugin_manager: Optional[PluginManager] = None
+        self._plugin_manager: Optional[PluginManager] = plugin_manager
         self._handlers_initialized = False
     
     async def process(self, context: PipelineContext) -> PipelineResult:
@@ -211,7 +217,17 @@ class ProcessingStage(PipelineStage):
                     # Process the post with error recovery
                     try:
                         handler_config = self._build_handler_config(context, content_type)
-                        handler_result = await handler.process(post, output_dir, handler_config)
+                        with sampling_scope(handler=handler_name), \
+                                trace_post(post_id, "handler.process", handler=handler_name,
+                                           content_type=content_type) as span:
+                            handler_result = await handler.process(post, output_dir, handler_config)
+                            if span.is_recording:
+                                span.set_attributes(
+                                    host=url_host(getattr(post, 'url', None)),
+                                    success=handler_result.success,
+                                    files=len(handler_result.files_created),
+                                    bytes=total_bytes(handler_result.files_created)
+                                )
                         
                         # Emit PostProcessedEvent
                         await self._emit_post_processed_event(context, post, handler_result, content_type)
@@ -383,15 +399,18 @@ class ProcessingStage(PipelineStage):
     
     async def _load_plugin_handlers(self, context: PipelineContext) -> None:
         """
-        Load content handlers from plugins.
+        Load content handlers from the plugin manager given at construction.
+        
+        Lazily registered plugin handlers are already in the handler registry
+        and are created on first use.
         
         Args:
             context: Pipeline context with configuration
         """
+        if self._plugin_manager is None:
+            return
+        
         try:
-            if not self._plugin_manager:
-                self._plugin_manager = PluginManager()
-            
             # Get plugin handlers
             plugin_handlers = self._plugin_manager.get_content_handlers()
             
@@ -7,6 +7,7 @@ conversion, quality adjustment, thumbnail generation, and metadata preservation.
 This module provides:
 - ImageProcessor: PIL/Pillow-based image processing
 - VideoProcessor: FFmpeg-based video processing  
+- VideoJobRunner: Concurrent asyncio FFmpeg/ffprobe job runner
 - ProcessorFactory: Automatic processor selection based on content type
 - Processing exceptions and error handling
 
@@ -35,7 +36,8 @@ from redditdl.processing.exceptions import (
     UnsupportedFormatError
 )
 
-from redditdl.processing.image_processor import ImageProcessor
+from redditdl.processing.image_processor import ImageProcessor, ImageOutput
+from redditdl.processing.video_runner import VideoJobRunner, VideoOutput, get_video_runner
 
 try:
     from redditdl.processing.video_processor import VideoProcessor
@@ -56,7 +58,11 @@ __all__ = [
     'FFmpegNotFoundError',
     'UnsupportedFormatError',
     'ImageProcessor',
+    'ImageOutput',
     'VideoProcessor',
+    'VideoJobRunner',
+    'VideoOutput',
+    'get_video_runner',
     'ProcessorFactory',
     'VIDEO_PROCESSING_AVAILABLE',
     'PROCESSING_AVAILABLE'
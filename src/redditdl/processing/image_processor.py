@@ -6,8 +6,9 @@ resizing, and thumbnail generation with EXIF metadata preservation.
 """
 
 import logging
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from PIL import Image, ImageOps
 from PIL.ExifTags import TAGS
 import piexif
@@ -15,6 +16,27 @@ import piexif
 from .exceptions import ImageProcessingError, UnsupportedFormatError
 
 
+@dataclass
+class ImageOutput:
+    """
+    One output file to render from a decoded source image.
+    
+    Attributes:
+        path: Where to write the output
+        format: Output format; derived from the path suffix when None
+        quality: Quality for lossy formats; processor default when None
+        max_dimension: Downscale so the longest side fits (aspect preserved)
+        preserve_metadata: Copy the source EXIF block when the format allows
+        auto_orient: Apply the EXIF orientation to the pixels (thumbnails)
+    """
+    path: Path
+    format: Optional[str] = None
+    quality: Optional[int] = None
+    max_dimension: Optional[int] = None
+    preserve_metadata: bool = True
+    auto_orient: bool = False
+
+
 class ImageProcessor:
     """
     Comprehensive image processing using PIL/Pillow.
@@ -295,6 +317,101 @@ class ImageProcessor:
             self.logger.error(f"Thumbnail generation failed: {e}")
             raise ImageProcessingError(f"Failed to generate thumbnail: {e}") from e
     
+    def render_outputs(self, input_path: Path, outputs: List[ImageOutput]) -> List[Path]:
+        """
+        Decode an image once and write every requested output from it.
+        
+        The image is decoded a single time; downscaled outputs are derived
+        in memory from the nearest larger rendition, and each output is
+        encoded straight from pixels, never from another encoded output.
+        When the source is a JPEG and no output needs full resolution the
+        decoder is asked (via ``Image.draft``) to decode at a reduced scale.
+        
+        Args:
+            input_path: Path to input image file
+            outputs: Outputs to write, in order
+            
+        Returns:
+            Paths of the written files, in the order of ``outputs``
+            
+        Raises:
+            ImageProcessingError: If decoding or writing any output fails
+            UnsupportedFormatError: If an output format is not supported
+        """
+        specs = [(output, self._output_format(output)) for output in outputs]
+        for _, output_format in specs:
+            if output_format not in self.SUPPORTED_FORMATS:
+                raise UnsupportedFormatError(output_format, self.SUPPORTED_FORMATS)
+        
+        self.logger.info(f"Rendering {len(outputs)} outputs from {input_path}")
+        
+        try:
+            with Image.open(input_path) as img:
+                exif_data = self._extract_exif(img) if self.preserve_exif else None
+                
+                # Decode at reduced scale when every output is a downscale
+                if img.format == 'JPEG' and outputs and all(o.max_dimension for o in outputs):
+                    draft_size = max(
+                        (self._fit_size(img.size, o.max_dimension) for o in outputs),
+                        key=lambda size: size[0] * size[1]
+                    )
+                    img.draft(img.mode, draft_size)
+                img.load()
+                
+                # One rendition per distinct size, largest first, each derived
+                # from the previous (larger) one
+                renditions: Dict[Optional[int], Image.Image] = {None: img}
+                current = img
+                dimensions = {o.max_dimension for o in outputs if o.max_dimension}
+                for dimension in sorted(dimensions, reverse=True):
+                    if max(current.size) > dimension:
+                        current = current.copy()
+                        current.thumbnail((dimension, dimension), Image.Resampling.LANCZOS)
+                    renditions[dimension] = current
+                
+                written: List[Path] = []
+                created_dirs = set()
+                for output, output_format in specs:
+                    rendered = renditions[output.max_dimension]
+                    if output.auto_orient:
+                        rendered = ImageOps.exif_transpose(rendered)
+                    rendered = self._prepare_image_for_format(rendered, output_format)
+                    
+                    # Prepare save parameters
+                    save_kwargs = {}
+                    if output_format in self.QUALITY_FORMATS:
+                        quality = self.default_quality if output.quality is None else output.quality
+                        save_kwargs['quality'] = max(1, min(100, quality))
+                        save_kwargs['optimize'] = True
+                    if output.preserve_metadata and exif_data and output_format in self.EXIF_FORMATS:
+                        save_kwargs['exif'] = exif_data
+                    
+                    if output.path.parent not in created_dirs:
+                        output.path.parent.mkdir(parents=True, exist_ok=True)
+                        created_dirs.add(output.path.parent)
+                    
+                    rendered.save(output.path, format=output_format.upper(), **save_kwargs)
+                    written.append(output.path)
+                
+                self.logger.info(f"Successfully rendered {len(written)} outputs from {input_path}")
+                return written
+        
+        except Exception as e:
+            self.logger.error(f"Image rendering failed: {e}")
+            raise ImageProcessingError(f"Failed to render image outputs: {e}") from e
+    
+    def _output_format(self, output: ImageOutput) -> str:
+        """Resolve the format for an output, normalizing jpg to jpeg."""
+        output_format = (output.format or output.path.suffix[1:] or 'jpeg').lower()
+        return 'jpeg' if output_format == 'jpg' else output_format
+    
+    @staticmethod
+    def _fit_size(size: Tuple[int, int], max_dimension: int) -> Tuple[int, int]:
+        """Size of an image after fitting its longest side to max_dimension."""
+        width, height = size
+        scale = min(1.0, max_dimension / max(width, height))
+        return (max(1, round(width * scale)), max(1, round(height * scale)))
+    
     def _prepare_image_for_format(self, img: Image.Image, target_format: str) -> Image.Image:
         """
         Prepare image for specific output format (handle color modes).
@@ -399,4 +516,29 @@ class ImageProcessor:
                 
         except Exception as e:
             self.logger.error(f"Failed to get image info: {e}")
-            raise ImageProcessingError(f"Failed to read image information: {e}") from e
\ No newline at end of file
+            raise ImageProcessingError(f"Failed to read image information: {e}") from e
+
+
+def render_image_outputs(
+    config: Dict[str, Any],
+    input_path: Path,
+    outputs: List[ImageOutput]
+) -> Dict[str, Any]:
+    """
+    Render all outputs for one image with a single decode.
+    
+    Module-level so it can be pickled and executed in a worker process.
+    
+    Args:
+        config: Processing configuration for the ImageProcessor
+        input_path: Path to input image file
+        outputs: Outputs to write
+        
+    Returns:
+        Dictionary with 'outputs' (paths written, in order) and 'error'
+        (failure message, or None)
+    """
+    try:
+        return {'outputs': ImageProcessor(config).render_outputs(input_path, outputs), 'error': None}
+    except Exception as e:
+        return {'outputs': [], 'error': str(e)}
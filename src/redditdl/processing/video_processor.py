@@ -8,8 +8,9 @@ resolution limiting, and thumbnail extraction with metadata preservation.
 import logging
 import shutil
 import subprocess
+from fractions import Fraction
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Tuple, List, Union
 
 try:
     import ffmpeg
@@ -21,6 +22,65 @@ except ImportError:
 from redditdl.processing.exceptions import VideoProcessingError, FFmpegNotFoundError, UnsupportedFormatError
 
 
+# Common resolution names
+RESOLUTION_MAP = {
+    '4k': (3840, 2160),
+    '1080p': (1920, 1080),
+    '720p': (1280, 720),
+    '480p': (854, 480),
+    '360p': (640, 360),
+    '240p': (426, 240)
+}
+
+
+def parse_probe(probe: Dict[str, Any], input_path: Path) -> Dict[str, Any]:
+    """
+    Convert ffprobe JSON output into the video info dictionary.
+
+    Args:
+        probe: Parsed ``ffprobe -show_format -show_streams`` output
+        input_path: Probed file
+
+    Returns:
+        Dictionary with video information
+    """
+    streams = probe.get('streams', [])
+    video_stream = next((s for s in streams if s.get('codec_type') == 'video'), None)
+    audio_stream = next((s for s in streams if s.get('codec_type') == 'audio'), None)
+    
+    info = {
+        'format': probe['format']['format_name'],
+        'duration': float(probe['format'].get('duration', 0)),
+        'size': int(probe['format'].get('size', 0)),
+        'bit_rate': int(probe['format'].get('bit_rate', 0)),
+        'filename': input_path.name,
+        'file_size': input_path.stat().st_size if input_path.exists() else 0
+    }
+    
+    if video_stream:
+        try:
+            fps = float(Fraction(video_stream.get('r_frame_rate', '0/1')))
+        except (ValueError, ZeroDivisionError):
+            fps = 0.0
+        info.update({
+            'video_codec': video_stream.get('codec_name'),
+            'width': int(video_stream.get('width', 0)),
+            'height': int(video_stream.get('height', 0)),
+            'fps': fps,
+            'video_bit_rate': int(video_stream.get('bit_rate', 0))
+        })
+    
+    if audio_stream:
+        info.update({
+            'audio_codec': audio_stream.get('codec_name'),
+            'sample_rate': int(audio_stream.get('sample_rate', 0)),
+            'channels': int(audio_stream.get('channels', 0)),
+            'audio_bit_rate': int(audio_stream.get('bit_rate', 0))
+        })
+    
+    return info
+
+
 class VideoProcessor:
     """
     Comprehensive video processing using FFmpeg.
@@ -285,6 +345,9 @@ class VideoProcessor:
         """
         Get detailed information about a video file.
         
+        Probes through the shared video job runner, so results are cached
+        by file content across calls and shared with async callers.
+        
         Args:
             input_path: Path to video file
             
@@ -294,52 +357,15 @@ class VideoProcessor:
         Raises:
             VideoProcessingError: If video cannot be read
         """
+        # Imported here: the runner module imports this one
+        from redditdl.processing.video_runner import get_video_runner
+        
         try:
-            # Use ffprobe to get video information
-            probe = ffmpeg.probe(str(input_path))
-            
-            # Extract video stream information
-            video_stream = next(
-                (stream for stream in probe['streams'] if stream['codec_type'] == 'video'),
-                None
-            )
-            
-            # Extract audio stream information
-            audio_stream = next(
-                (stream for stream in probe['streams'] if stream['codec_type'] == 'audio'),
-                None
-            )
-            
-            info = {
-                'format': probe['format']['format_name'],
-                'duration': float(probe['format'].get('duration', 0)),
-                'size': int(probe['format'].get('size', 0)),
-                'bit_rate': int(probe['format'].get('bit_rate', 0)),
-                'filename': input_path.name,
-                'file_size': input_path.stat().st_size if input_path.exists() else 0
-            }
-            
-            # Add video stream info
-            if video_stream:
-                info.update({
-                    'video_codec': video_stream.get('codec_name'),
-                    'width': int(video_stream.get('width', 0)),
-                    'height': int(video_stream.get('height', 0)),
-                    'fps': eval(video_stream.get('r_frame_rate', '0/1')),
-                    'video_bit_rate': int(video_stream.get('bit_rate', 0))
-                })
-            
-            # Add audio stream info
-            if audio_stream:
-                info.update({
-                    'audio_codec': audio_stream.get('codec_name'),
-                    'sample_rate': int(audio_stream.get('sample_rate', 0)),
-                    'channels': int(audio_stream.get('channels', 0)),
-                    'audio_bit_rate': int(audio_stream.get('bit_rate', 0))
-                })
-            
-            return info
+            return get_video_runner(self.config).probe_sync(input_path)
             
+        except VideoProcessingError as e:
+            self.logger.error(f"Failed to get video info: {e}")
+            raise
         except Exception as e:
             self.logger.error(f"Failed to get video info: {e}")
             raise VideoProcessingError(f"Failed to read video information: {e}") from e
@@ -397,30 +423,26 @@ class VideoProcessor:
         
         return kwargs
     
-    def _parse_resolution(self, resolution_str: str) -> Tuple[int, int]:
+    @staticmethod
+    def _parse_resolution(resolution: Union[str, int]) -> Tuple[int, int]:
         """
         Parse resolution string into width and height.
         
         Args:
-            resolution_str: Resolution string (e.g., '1920x1080', '720p')
+            resolution: Resolution string (e.g., '1920x1080', '720p'), or an
+                int for a square box
             
         Returns:
             Tuple of (width, height)
         """
-        resolution_str = resolution_str.lower()
+        if isinstance(resolution, int):
+            return resolution, resolution
         
-        # Handle common resolution names
-        resolution_map = {
-            '4k': (3840, 2160),
-            '1080p': (1920, 1080),
-            '720p': (1280, 720),
-            '480p': (854, 480),
-            '360p': (640, 360),
-            '240p': (426, 240)
-        }
+        resolution_str = str(resolution).lower()
         
-        if resolution_str in resolution_map:
-            return resolution_map[resolution_str]
+        # Handle common resolution names
+        if resolution_str in RESOLUTION_MAP:
+            return RESOLUTION_MAP[resolution_str]
         
         # Parse WIDTHxHEIGHT format
         if 'x' in resolution_str:
@@ -429,6 +451,8 @@ class VideoProcessor:
                 return int(width), int(height)
             except ValueError:
                 pass
+        elif resolution_str.isdigit():
+            return int(resolution_str), int(resolution_str)
         
         # Default fallback
         raise ValueError(f"Invalid resolution format: {resolution_str}")
@@ -0,0 +1,385 @@
+"""
+Video Job Runner
+
+Runs ffmpeg and ffprobe as asyncio subprocesses so video processing never
+blocks the event loop. All outputs requested for one input (transcodes,
+resized copies, thumbnails) are produced by a single ffmpeg invocation, the
+number of concurrent ffmpeg processes is capped according to available
+cores, and probe results are cached by file content hash.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, List, Union
+
+from redditdl.processing.exceptions import VideoProcessingError, FFmpegNotFoundError, UnsupportedFormatError
+from redditdl.processing.video_processor import VideoProcessor, parse_probe
+
+
+# Bytes hashed from each end of a file for the probe cache key
+PROBE_HASH_SAMPLE = 1024 * 1024
+
+@dataclass
+class VideoOutput:
+    """
+    One output to produce from an input video.
+
+    Attributes:
+        path: Where to write the output
+        kind: 'video' for a transcoded copy, 'thumbnail' for a still frame
+        format: Container format; derived from the path suffix when None
+        quality_crf: CRF for video outputs; runner default when None
+        max_resolution: Fit video/thumbnail within this size ('720p',
+            '1280x720', or an int for a square box)
+        timestamp: Frame position for thumbnails (HH:MM:SS)
+        preserve_metadata: Copy container metadata from the input
+    """
+    path: Path
+    kind: str = 'video'
+    format: Optional[str] = None
+    quality_crf: Optional[int] = None
+    max_resolution: Optional[Union[str, int]] = None
+    timestamp: str = "00:00:01"
+    preserve_metadata: bool = True
+
+
+class VideoJobRunner:
+    """
+    Concurrent ffmpeg/ffprobe runner using asyncio subprocesses.
+
+    Features:
+    - At most ``max_concurrent`` ffmpeg/ffprobe processes at a time, each
+      given an equal share of the cores via ``-threads``
+    - One ffmpeg invocation per input writing every requested output
+    - LRU cache of probe results keyed by file content hash
+    """
+    
+    # Supported video formats
+    SUPPORTED_FORMATS = {
+        'mp4', 'avi', 'mkv', 'webm', 'mov', 'flv', 'wmv', 'ogv'
+    }
+    
+    # Formats that support quality (CRF) settings
+    QUALITY_FORMATS = {'mp4', 'mkv', 'webm', 'mov'}
+    
+    # Video codec mapping
+    CODEC_MAP = {
+        'mp4': 'libx264',
+        'webm': 'libvpx-vp9',
+        'mkv': 'libx264',
+        'avi': 'libx264',
+        'mov': 'libx264'
+    }
+    
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        max_concurrent: Optional[int] = None,
+        ffmpeg_path: Optional[str] = None,
+        ffprobe_path: Optional[str] = None,
+        probe_cache_size: int = 512
+    ):
+        """
+        Initialize the video job runner.
+
+        Args:
+            config: Processing configuration options
+            max_concurrent: Concurrent ffmpeg processes (default: half the
+                cores, at least one)
+            ffmpeg_path: ffmpeg executable (default: found on PATH)
+            ffprobe_path: ffprobe executable (default: found on PATH)
+            probe_cache_size: Number of probe results to keep
+        """
+        self.config = config or {}
+        self.logger = logging.getLogger("redditdl.processing.video")
+        
+        cores = os.cpu_count() or 1
+        self.max_concurrent = max_concurrent or self.config.get('video_jobs') or max(1, cores // 2)
+        self.threads_per_job = max(1, cores // self.max_concurrent)
+        self.default_crf = self.config.get('video_quality_crf', 23)
+        self.preserve_metadata = self.config.get('preserve_original_metadata', True)
+        
+        self.ffmpeg_path = ffmpeg_path or shutil.which('ffmpeg')
+        self.ffprobe_path = ffprobe_path or shutil.which('ffprobe')
+        
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._probe_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._probe_cache_size = probe_cache_size
+        self.probe_cache_hits = 0
+        self.probe_cache_misses = 0
+    
+    @property
+    def available(self) -> bool:
+        """Whether the ffmpeg executable was found."""
+        return self.ffmpeg_path is not None
+    
+    async def process(self, input_path: Path, outputs: List[VideoOutput]) -> List[Path]:
+        """
+        Produce every output for an input video with one ffmpeg run.
+
+        Args:
+            input_path: Path to input video file
+            outputs: Outputs to write
+
+        Returns:
+            Paths of the written files, in the order of ``outputs``. An
+            output ffmpeg did not produce (e.g. a thumbnail timestamp past
+            the end of a short clip) is removed and left out, and the others
+            are kept.
+
+        Raises:
+            FFmpegNotFoundError: If ffmpeg is not available
+            VideoProcessingError: If ffmpeg fails or produces no output
+            UnsupportedFormatError: If an output format is not supported
+        """
+        if not outputs:
+            return []
+        if not self.ffmpeg_path:
+            raise FFmpegNotFoundError()
+        
+        args = [self.ffmpeg_path, '-hide_banner', '-loglevel', 'error', '-nostdin', '-y',
+                '-i', str(input_path)]
+        for output in outputs:
+            args.extend(self._output_args(output))
+            output.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self.logger.info(f"Processing {input_path} into {len(outputs)} outputs")
+        returncode, _, stderr = await self._run(args)
+        
+        # A failed run may leave any output truncated; otherwise only the
+        # outputs ffmpeg skipped are bad
+        failed = [o.path for o in outputs
+                  if returncode != 0 or not o.path.exists() or o.path.stat().st_size == 0]
+        for path in failed:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        
+        if len(failed) == len(outputs):
+            error_msg = stderr.decode('utf-8', errors='replace').strip() or "Unknown FFmpeg error"
+            if returncode == 0:
+                error_msg = f"FFmpeg did not produce valid output file: {failed[0]}"
+            raise VideoProcessingError(f"FFmpeg error: {error_msg}")
+        
+        for path in failed:
+            self.logger.warning(f"FFmpeg did not produce valid output file: {path}")
+        self.logger.info(f"Successfully processed {input_path}")
+        return [o.path for o in outputs if o.path not in failed]
+    
+    async def process_many(self, jobs: List[Tuple[Path, List[VideoOutput]]]) -> List[Union[List[Path], Exception]]:
+        """
+        Run several jobs concurrently within the process cap.
+
+        Args:
+            jobs: (input path, outputs) pairs
+
+        Returns:
+            Written paths for each job, or the exception it raised
+        """
+        return await asyncio.gather(
+            *(self.process(input_path, outputs) for input_path, outputs in jobs),
+            return_exceptions=True
+        )
+    
+    async def probe(self, input_path: Path) -> Dict[str, Any]:
+        """
+        Get video information, using the cache when the file is unchanged.
+
+        Args:
+            input_path: Path to video file
+
+        Returns:
+            Dictionary with video information
+
+        Raises:
+            VideoProcessingError: If the file cannot be probed
+        """
+        try:
+            key = await asyncio.get_running_loop().run_in_executor(None, self._file_hash, input_path)
+        except OSError as e:
+            raise VideoProcessingError(f"Failed to read video information: {e}") from e
+        
+        cached = self._cached_probe(key, input_path)
+        if cached is not None:
+            return cached
+        
+        returncode, stdout, stderr = await self._run(self._probe_args(input_path))
+        return self._store_probe(key, input_path, returncode, stdout, stderr)
+    
+    def probe_sync(self, input_path: Path) -> Dict[str, Any]:
+        """
+        Blocking variant of ``probe`` for synchronous callers.
+
+        Shares the probe cache with ``probe``; async code should await
+        ``probe`` instead so ffprobe does not block the event loop.
+
+        Args:
+            input_path: Path to video file
+
+        Returns:
+            Dictionary with video information
+
+        Raises:
+            VideoProcessingError: If the file cannot be probed
+        """
+        try:
+            key = self._file_hash(input_path)
+        except OSError as e:
+            raise VideoProcessingError(f"Failed to read video information: {e}") from e
+        
+        cached = self._cached_probe(key, input_path)
+        if cached is not None:
+            return cached
+        
+        try:
+            proc = subprocess.run(self._probe_args(input_path), stdin=subprocess.DEVNULL,
+                                  capture_output=True)
+        except FileNotFoundError as e:
+            raise FFmpegNotFoundError() from e
+        return self._store_probe(key, input_path, proc.returncode, proc.stdout, proc.stderr)
+    
+    def _probe_args(self, input_path: Path) -> List[str]:
+        """Build the ffprobe command line for a file."""
+        if not self.ffprobe_path:
+            raise FFmpegNotFoundError()
+        return [self.ffprobe_path, '-v', 'error', '-print_format', 'json',
+                '-show_format', '-show_streams', str(input_path)]
+    
+    def _cached_probe(self, key: str, input_path: Path) -> Optional[Dict[str, Any]]:
+        """Look up a probe result by file hash, counting hits and misses."""
+        cached = self._probe_cache.get(key)
+        if cached is None:
+            self.probe_cache_misses += 1
+            return None
+        self._probe_cache.move_to_end(key)
+        self.probe_cache_hits += 1
+        return dict(cached, filename=input_path.name)
+    
+    def _store_probe(self, key: str, input_path: Path, returncode: int,
+                     stdout: bytes, stderr: bytes) -> Dict[str, Any]:
+        """Parse ffprobe output and cache the result."""
+        if returncode != 0:
+            error_msg = stderr.decode('utf-8', errors='replace').strip()
+            raise VideoProcessingError(f"Failed to read video information: {error_msg}")
+        
+        try:
+            info = parse_probe(json.loads(stdout), input_path)
+        except (ValueError, KeyError) as e:
+            raise VideoProcessingError(f"Failed to read video information: {e}") from e
+        
+        self._probe_cache[key] = info
+        if len(self._probe_cache) > self._probe_cache_size:
+            self._probe_cache.popitem(last=False)
+        return dict(info)
+    
+    def _output_args(self, output: VideoOutput) -> List[str]:
+        """Build the ffmpeg arguments for one output."""
+        if output.kind == 'thumbnail':
+            args = ['-map', '0:v:0', '-ss', output.timestamp, '-frames:v', '1']
+            if output.max_resolution:
+                width, height = VideoProcessor._parse_resolution(output.max_resolution)
+                args.extend(['-vf', f"scale=w='min({width},iw)':h='min({height},ih)'"
+                                    f":force_original_aspect_ratio=decrease"])
+            return args + ['-f', 'image2', str(output.path)]
+        
+        output_format = (output.format or output.path.suffix[1:] or 'mp4').lower()
+        if output_format not in self.SUPPORTED_FORMATS:
+            raise UnsupportedFormatError(output_format, self.SUPPORTED_FORMATS)
+        
+        args = ['-map', '0:v:0', '-map', '0:a?']
+        if output_format in self.CODEC_MAP:
+            args.extend(['-c:v', self.CODEC_MAP[output_format]])
+        if output_format in self.QUALITY_FORMATS:
+            crf = self.default_crf if output.quality_crf is None else output.quality_crf
+            args.extend(['-crf', str(max(0, min(51, crf)))])
+        if output.max_resolution:
+            width, height = VideoProcessor._parse_resolution(output.max_resolution)
+            # Fit within bounds, keep aspect ratio and even dimensions for the encoder
+            args.extend(['-vf', f"scale=w='min({width},iw)':h='min({height},ih)'"
+                                f":force_original_aspect_ratio=decrease:force_divisible_by=2"])
+        if output.preserve_metadata and self.preserve_metadata:
+            args.extend(['-map_metadata', '0'])
+        return args + ['-threads', str(self.threads_per_job), str(output.path)]
+    
+    async def _run(self, args: List[str]) -> Tuple[int, bytes, bytes]:
+        """Run a subprocess within the concurrency cap."""
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_concurrent)
+            self._slots_loop = loop
+        
+        async with self._slots:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *args,
+                    stdin=asyncio.subprocess.DEVNULL,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+            except FileNotFoundError as e:
+                raise FFmpegNotFoundError() from e
+            
+            try:
+                stdout, stderr = await proc.communicate()
+            except asyncio.CancelledError:
+                proc.kill()
+                await proc.wait()
+                raise
+            return proc.returncode, stdout, stderr
+    
+    @staticmethod
+    def _file_hash(input_path: Path) -> str:
+        """
+        Hash a file for the probe cache.
+
+        Videos can be large, so the key covers the size and the first and
+        last PROBE_HASH_SAMPLE bytes rather than the whole file.
+        """
+        size = input_path.stat().st_size
+        digest = hashlib.blake2b(str(size).encode(), digest_size=20)
+        with open(input_path, 'rb') as f:
+            digest.update(f.read(PROBE_HASH_SAMPLE))
+            if size > PROBE_HASH_SAMPLE * 2:
+                f.seek(-PROBE_HASH_SAMPLE, os.SEEK_END)
+                digest.update(f.read(PROBE_HASH_SAMPLE))
+        return digest.hexdigest()
+
+
+# Shared runner instances, one per distinct runner configuration
+_video_runners: Dict[Tuple[Any, ...], VideoJobRunner] = {}
+
+
+def get_video_runner(config: Optional[Dict[str, Any]] = None) -> VideoJobRunner:
+    """
+    Get the shared video job runner for a configuration.
+
+    Runners are reused across calls with the same runner settings
+    (``video_jobs``, ``video_quality_crf``, ``preserve_original_metadata``),
+    so their probe cache and process cap are shared.
+
+    Args:
+        config: Processing configuration
+
+    Returns:
+        Shared VideoJobRunner
+    """
+    config = config or {}
+    key = (
+        config.get('video_jobs'),
+        config.get('video_quality_crf', 23),
+        config.get('preserve_original_metadata', True),
+    )
+    runner = _video_runners.get(key)
+    if runner is None:
+        runner = _video_runners[key] = VideoJobRunner(config)
+    return runner
@@ -8,6 +8,7 @@ consistent behavior and plugin compatibility.
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional, Union
 from dataclasses import dataclass
+from pathlib import Path
 import logging
 
 # Import existing PostMetadata class
@@ -36,6 +37,10 @@ class ScrapingConfig:
     client_secret: Optional[str] = None
     username: Optional[str] = None
     password: Optional[str] = None
+    
+    # Persistent cache for listing responses (disabled if unset)
+    http_cache_dir: Optional[str] = None
+    http_cache_size_mb: int = 200
 
 
 # Enhanced exceptions for scraping operations
@@ -111,6 +116,33 @@ class BaseScraper(ABC):
         """
         self.config = config
         self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.http_cache = None
+    
+    def _install_http_cache(self, session: Any) -> bool:
+        """
+        Cache listing responses fetched through a requests session.
+        
+        Args:
+            session: requests.Session used for Reddit API calls
+            
+        Returns:
+            True if the HTTP cache was installed, False if it is disabled
+        """
+        if not self.config.http_cache_dir:
+            return False
+        
+        import requests
+        from ..core.cache.http import get_http_cache, install_http_cache
+        
+        if not isinstance(session, requests.Session):
+            self.logger.debug(f"HTTP cache not installed: unsupported session type {type(session).__name__}")
+            return False
+        
+        cache = get_http_cache(Path(self.config.http_cache_dir), self.config.http_cache_size_mb)
+        # Listings such as saved and upvoted differ per logged-in account
+        identity = self.config.username if self.config.username and self.config.password else None
+        self.http_cache = install_http_cache(session, cache, identity=identity)
+        return True
     
     @abstractmethod
     def can_handle_target(self, target_info: TargetInfo) -> bool:
@@ -9,7 +9,7 @@ import asyncio
 import time
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional, Union, AsyncGenerator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import logging
 
@@ -17,6 +17,13 @@ from .resolver import TargetInfo, TargetType
 from .base_scraper import BaseScraper, ScrapingConfig
 from .scrapers import ScraperFactory, ScrapingError, AuthenticationError, TargetNotFoundError
 from ..scrapers import PostMetadata
+from ..core.cache.manager import get_cache_manager
+
+
+# How long user and subreddit profile metadata is cached, and how much
+# longer a stale copy may be served while it is refreshed
+METADATA_CACHE_TTL = 3600.0
+METADATA_STALE_TTL = 86400.0
 
 
 class ListingType(Enum):
@@ -50,6 +57,7 @@ class TargetProcessingResult:
         error_message: Error message if processing failed
         processing_time: Time taken to process the target in seconds
         metadata: Additional metadata about the processing
+        started_at: Wall-clock time processing started
     """
     target_info: TargetInfo
     posts: List[PostMetadata]
@@ -57,6 +65,7 @@ class TargetProcessingResult:
     error_message: Optional[str] = None
     processing_time: float = 0.0
     metadata: Dict[str, Any] = None
+    started_at: float = field(default_factory=time.time)
     
     def __post_init__(self):
         if self.metadata is None:
@@ -91,6 +100,7 @@ class BaseTargetHandler(ABC):
         """
         self.config = config
         self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.cache = get_cache_manager()
     
     @abstractmethod
     def can_handle_target(self, target_info: TargetInfo) -> bool:
@@ -222,18 +232,30 @@ class UserTargetHandler(BaseTargetHandler):
         # Add scraper-specific metadata if available
         try:
             if hasattr(scraper, 'reddit') and scraper.reddit:
-                # PRAW-specific user metadata
-                user = scraper.reddit.redditor(target_info.target_value)
-                metadata.update({
-                    'account_created': getattr(user, 'created_utc', None),
-                    'comment_karma': getattr(user, 'comment_karma', None),
-                    'link_karma': getattr(user, 'link_karma', None),
-                    'is_verified': getattr(user, 'verified', None)
-                })
+                # PRAW-specific user metadata, fetched once for concurrent targets
+                username = target_info.target_value
+                metadata.update(await self.cache.get_or_compute_async(
+                    f"targets:user_metadata:{username.lower()}",
+                    lambda: asyncio.to_thread(self._fetch_user_metadata, scraper.reddit, username),
+                    ttl=METADATA_CACHE_TTL,
+                    stale_ttl=METADATA_STALE_TTL,
+                    negative_errors=(TargetNotFoundError,)
+                ))
         except Exception as e:
             self.logger.debug(f"Could not gather extended user metadata: {e}")
         
         return metadata
+    
+    @staticmethod
+    def _fetch_user_metadata(reddit: Any, username: str) -> Dict[str, Any]:
+        """Load a user's profile through PRAW (blocking)."""
+        user = reddit.redditor(username)
+        return {
+            'account_created': getattr(user, 'created_utc', None),
+            'comment_karma': getattr(user, 'comment_karma', None),
+            'link_karma': getattr(user, 'link_karma', None),
+            'is_verified': getattr(user, 'verified', None)
+        }
 
 
 class SubredditTargetHandler(BaseTargetHandler):
@@ -434,21 +456,33 @@ class SubredditTargetHandler(BaseTargetHandler):
         # Add scraper-specific metadata if available
         try:
             if hasattr(scraper, 'reddit') and scraper.reddit:
-                # PRAW-specific subreddit metadata
-                subreddit = scraper.reddit.subreddit(target_info.target_value)
-                metadata.update({
-                    'display_name': getattr(subreddit, 'display_name', None),
-                    'title': getattr(subreddit, 'title', None),
-                    'description': getattr(subreddit, 'description', None),
-                    'subscribers': getattr(subreddit, 'subscribers', None),
-                    'created_utc': getattr(subreddit, 'created_utc', None),
-                    'over18': getattr(subreddit, 'over18', None),
-                    'subreddit_type': getattr(subreddit, 'subreddit_type', None)
-                })
+                # PRAW-specific subreddit metadata, fetched once for concurrent targets
+                name = target_info.target_value
+                metadata.update(await self.cache.get_or_compute_async(
+                    f"targets:subreddit_metadata:{name.lower()}",
+                    lambda: asyncio.to_thread(self._fetch_subreddit_metadata, scraper.reddit, name),
+                    ttl=METADATA_CACHE_TTL,
+                    stale_ttl=METADATA_STALE_TTL,
+                    negative_errors=(TargetNotFoundError,)
+                ))
         except Exception as e:
             self.logger.debug(f"Could not gather extended subreddit metadata: {e}")
         
         return metadata
+    
+    @staticmethod
+    def _fetch_subreddit_metadata(reddit: Any, name: str) -> Dict[str, Any]:
+        """Load a subreddit's about data through PRAW (blocking)."""
+        subreddit = reddit.subreddit(name)
+        return {
+            'display_name': getattr(subreddit, 'display_name', None),
+            'title': getattr(subreddit, 'title', None),
+            'description': getattr(subreddit, 'description', None),
+            'subscribers': getattr(subreddit, 'subscribers', None),
+            'created_utc': getattr(subreddit, 'created_utc', None),
+            'over18': getattr(subreddit, 'over18', None),
+            'subreddit_type': getattr(subreddit, 'subreddit_type', None)
+        }
 
 
 class SavedPostsHandler(BaseTargetHandler):
@@ -8,9 +8,10 @@ for consistent behavior and plugin compatibility.
 import sys
 import time
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Type
 import praw
 import prawcore
+import requests
 from yars.yars import YARS
 
 from .base_scraper import (
@@ -44,6 +45,13 @@ class EnhancedPrawScraper(BaseScraper):
         if not self.config.client_id or not self.config.client_secret:
             raise AuthenticationError("PRAW scraper requires client_id and client_secret")
         
+        # Route PRAW traffic through a session carrying the HTTP cache
+        extra_kwargs = {}
+        if self.config.http_cache_dir:
+            session = requests.Session()
+            if self._install_http_cache(session):
+                extra_kwargs["requestor_kwargs"] = {"session": session}
+        
         try:
             if self.config.username and self.config.password:
                 # Authenticated user session
@@ -52,7 +60,8 @@ class EnhancedPrawScraper(BaseScraper):
                     client_secret=self.config.client_secret,
                     username=self.config.username,
                     password=self.config.password,
-                    user_agent=self.config.user_agent
+                    user_agent=self.config.user_agent,
+                    **extra_kwargs
                 )
                 self._authenticated = True
             else:
@@ -60,7 +69,8 @@ class EnhancedPrawScraper(BaseScraper):
                 self.reddit = praw.Reddit(
                     client_id=self.config.client_id,
                     client_secret=self.config.client_secret,
-                    user_agent=self.config.user_agent
+                    user_agent=self.config.user_agent,
+                    **extra_kwargs
                 )
                 self._authenticated = False
             
@@ -237,6 +247,7 @@ class EnhancedYarsScraper(BaseScraper):
     def __init__(self, config: ScrapingConfig):
         super().__init__(config)
         self.yars = YARS()
+        self._install_http_cache(getattr(self.yars, 'session', None))
     
     @property
     def scraper_type(self) -> str:
@@ -320,6 +331,68 @@ class EnhancedYarsScraper(BaseScraper):
 class ScraperFactory:
     """Factory for creating appropriate scrapers based on configuration and target requirements."""
     
+    # Plugin scrapers, imported the first time a target of a declared type needs one
+    _plugin_scrapers: List[Dict[str, Any]] = []
+    
+    @classmethod
+    def register_lazy_scraper(cls, name: str, source_types: List[str],
+                              loader: Callable[[], Type[BaseScraper]], priority: int = 100) -> bool:
+        """
+        Register a plugin scraper whose class is imported on first use.
+        
+        Plugin scrapers are tried after the built-in PRAW and YARS scrapers,
+        in priority order (lower = higher priority).
+        
+        Args:
+            name: Scraper name for logging
+            source_types: Target types the scraper declares (TargetType values)
+            loader: Callable that imports and returns the scraper class
+            priority: Scraper priority
+            
+        Returns:
+            False if a plugin scraper with this name is already registered
+        """
+        if any(entry['name'] == name for entry in cls._plugin_scrapers):
+            return False
+        cls._plugin_scrapers.append({
+            'name': name,
+            'source_types': set(source_types),
+            'loader': loader,
+            'class': None,
+            'priority': priority
+        })
+        cls._plugin_scrapers.sort(key=lambda entry: entry['priority'])
+        return True
+    
+    @classmethod
+    def unregister_scraper(cls, name: str) -> None:
+        """
+        Unregister a plugin scraper.
+        
+        Args:
+            name: Scraper name given at registration
+        """
+        cls._plugin_scrapers = [entry for entry in cls._plugin_scrapers if entry['name'] != name]
+    
+    @classmethod
+    def _create_plugin_scraper(cls, config: ScrapingConfig, target_info: TargetInfo) -> Optional[BaseScraper]:
+        """Create the first plugin scraper declaring and accepting the target type."""
+        source_type = target_info.target_type.value
+        for entry in list(cls._plugin_scrapers):
+            if source_type not in entry['source_types']:
+                continue
+            if entry['class'] is None:
+                try:
+                    entry['class'] = entry['loader']()
+                except Exception as e:
+                    logging.getLogger(__name__).error(f"Failed to load scraper {entry['name']}: {e}")
+                    cls._plugin_scrapers.remove(entry)
+                    continue
+            scraper = entry['class'](config)
+            if scraper.can_handle_target(target_info):
+                return scraper
+        return None
+    
     @staticmethod
     def create_scraper(config: ScrapingConfig, target_info: TargetInfo) -> BaseScraper:
         """
@@ -355,6 +428,11 @@ class ScraperFactory:
         if scraper.can_handle_target(target_info):
             return scraper
         
+        # Then plugin scrapers declaring this target type
+        scraper = ScraperFactory._create_plugin_scraper(config, target_info)
+        if scraper is not None:
+            return scraper
+        
         # No suitable scraper found
         raise ScrapingError(
             f"No scraper available for target type '{target_info.target_type.value}'. "
@@ -0,0 +1,99 @@
+"""
+CLI Startup Performance Tests
+
+Guards the import cost of the console script. Subcommands are imported on
+first use, so `redditdl --version`, top-level help and shell completion
+must not pull in PRAW, Pillow, pydantic or the pipeline.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+# Cumulative import budget for the CLI entry modules, in milliseconds
+IMPORT_BUDGET_MS = float(os.environ.get("REDDITDL_IMPORT_BUDGET_MS", "200"))
+
+# Modules that only subcommands may import
+HEAVY_MODULES = [
+    "praw",
+    "PIL",
+    "pydantic",
+    "jinja2",
+    "ffmpeg",
+    "redditdl.scrapers",
+    "redditdl.core.plugins.manager",
+    "redditdl.content_handlers",
+    "redditdl.pipeline",
+    "redditdl.cli.commands.scrape",
+    "redditdl.cli.commands.audit",
+    "redditdl.cli.commands.interactive",
+    "redditdl.cli.commands.bench",
+]
+
+
+def _run_python(code, *flags):
+    """Run code in a fresh interpreter with the test import path."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True, text=True, env=env, timeout=60
+    )
+
+
+def _import_time_ms(module):
+    """Cumulative import time of a module as reported by -X importtime."""
+    result = _run_python(f"import {module}", "-X", "importtime")
+    assert result.returncode == 0, result.stderr
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise AssertionError(f"{module} not found in importtime output")
+
+
+class TestCliStartup:
+    """Startup cost of the command-line entry points."""
+    
+    @pytest.mark.parametrize("module", ["redditdl.main", "redditdl.cli.main"])
+    def test_entry_point_defers_heavy_imports(self, module):
+        """Importing an entry point must not import subcommand dependencies."""
+        result = _run_python(
+            f"import sys, json, {module}; print(json.dumps(sorted(sys.modules)))"
+        )
+        assert result.returncode == 0, result.stderr
+        
+        loaded = set(json.loads(result.stdout))
+        leaked = [name for name in HEAVY_MODULES if name in loaded]
+        assert not leaked, f"{module} imports {leaked} at startup"
+    
+    @pytest.mark.performance
+    @pytest.mark.parametrize("module", ["redditdl.main", "redditdl.cli.main"])
+    def test_import_time_budget(self, module):
+        """Entry point import time stays within budget (best of three runs)."""
+        best = min(_import_time_ms(module) for _ in range(3))
+        
+        assert best < IMPORT_BUDGET_MS, (
+            f"Importing {module} took {best:.1f}ms (budget {IMPORT_BUDGET_MS:.0f}ms)"
+        )
+    
+    def test_version_without_loading_commands(self):
+        """`redditdl --version` answers without importing any subcommand."""
+        result = _run_python(
+            "import sys\n"
+            "sys.argv = ['redditdl', '--version']\n"
+            "from redditdl.main import main\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('commands loaded:', any(m.startswith('redditdl.cli.commands.') for m in sys.modules))\n"
+        )
+        
+        assert result.returncode == 0, result.stderr
+        assert "RedditDL version" in result.stdout
+        assert "commands loaded: False" in result.stdout
@@ -277,6 +277,14 @@ class TestCLIArgsNormalization:
         assert 'client_id' not in normalized['scraping']
         assert normalized['scraping']['post_limit'] == 30
         assert 'output_dir' not in normalized.get('output', {})
+    
+    def test_skip_archived_from_cli_and_env(self):
+        """Test skip_archived is a top-level setting from CLI and environment."""
+        manager = ConfigManager()
+        
+        assert manager._normalize_cli_args({'skip_archived': True}) == {'skip_archived': True}
+        with patch.dict(os.environ, {'REDDITDL_SKIP_ARCHIVED': 'true'}):
+            assert manager._load_env_config("REDDITDL_")["skip_archived"] is True
 
 
 class TestConfigurationHierarchy:
@@ -499,6 +499,40 @@ class TestMediaContentHandler:
             assert 'processing_result' in result
             assert result['processing_result']['operations'] == ['resize', 'quality_adjust']
     
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('backend', ['process', 'inline'])
+    async def test_apply_processing_backends(self, backend, tmp_path):
+        """Test image processing gives the same results in the worker pool and inline."""
+        from PIL import Image
+        from redditdl.core.concurrency.pools import get_pool_manager
+        
+        image_path = tmp_path / 'abc123.jpg'
+        Image.new('RGB', (800, 600), color='blue').save(image_path, 'JPEG')
+        
+        config = {
+            'processing': {
+                'enabled': True,
+                'worker_backend': backend,
+                'processing_workers': 1,
+                'max_image_resolution': 400,
+                'generate_thumbnails': True,
+                'thumbnail_size': 128
+            }
+        }
+        
+        try:
+            result = await self.handler._apply_processing(image_path, config)
+        finally:
+            await get_pool_manager().stop()
+        
+        assert result['operations'] == ['image_resize', 'thumbnail_generation']
+        assert result['processed_files'] == [
+            tmp_path / 'abc123_resized.jpg',
+            tmp_path / 'abc123_thumb.jpg'
+        ]
+        with Image.open(tmp_path / 'abc123_resized.jpg') as img:
+            assert img.size == (400, 300)
+    
     def test_content_type_classification(self):
         """Test content type classification based on post data."""
         # Image post
@@ -6,8 +6,10 @@ and backward compatibility with simple {variable} templates.
 """
 
 import pytest
+import time
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 from redditdl.core.templates import FilenameTemplateEngine
 from jinja2 import TemplateSyntaxError, UndefinedError
@@ -272,6 +274,102 @@ class TestFilenameTemplateEngine:
             assert "unnamed" in result.lower() or "fallback" in result.lower()
 
 
+class TestTemplateCompilationCache:
+    """Test compiled template caching and the plain {variable} fast path."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.engine = FilenameTemplateEngine()
+        self.variables = {
+            'subreddit': 'python',
+            'post_id': 'abc123',
+            'title': '  Amazing Python Tutorial!  ',
+            'author': 'python_guru',
+            'ext': 'jpg',
+            'score': 150,
+            'is_video': False,
+        }
+    
+    def test_template_compiled_once(self):
+        """Test repeated renders reuse the compiled Jinja2 template."""
+        template = "{{ subreddit }}/{{ post_id }}-{{ title|slugify }}.{{ ext }}"
+        
+        with patch.object(self.engine.env, 'from_string', wraps=self.engine.env.from_string) as from_string:
+            results = {self.engine.render(template, dict(self.variables, post_id=f"p{i}")) for i in range(50)}
+        
+        assert from_string.call_count == 1
+        assert len(results) == 50
+    
+    def test_plain_templates_skip_jinja(self):
+        """Test plain {variable} templates never reach Jinja2."""
+        with patch.object(self.engine.env, 'from_string') as from_string:
+            result = self.engine.render("{subreddit}/{ post_id }-{score}.{ext}", self.variables)
+        
+        from_string.assert_not_called()
+        assert result == "python_abc123-150.jpg"
+    
+    @pytest.mark.parametrize('template', [
+        "{subreddit}/{post_id}.{ext}",
+        "{ subreddit }_{author}_{score}_{is_video}.{ext}",
+        "{title}.{ext}",
+        "static-name.{ext}\n",
+        "{post_id}{post_id}{ext}",
+        "{title|slugify}.{ext}",
+        "{{ subreddit }}/{post_id}.{ext}",
+    ])
+    def test_fast_path_matches_jinja(self, template):
+        """Test compiled templates render exactly like uncached Jinja2 rendering."""
+        template_vars = self.engine._prepare_template_variables(self.variables)
+        expected = self.engine.env.from_string(
+            self.engine._convert_simple_template(template)
+        ).render(**template_vars)
+        
+        assert self.engine._get_compiled_template(template)(template_vars) == expected
+    
+    @pytest.mark.parametrize('template', ["{title}.{ext}", "{ author }/{title}_{score}.{ext}"])
+    def test_fast_path_escapes_like_jinja(self, template):
+        """Test the fast path applies the environment's autoescaping to values."""
+        template_vars = dict(self.variables, title='Tom & "Jerry" <3', author="O'Brien>")
+        expected = self.engine.env.from_string(
+            self.engine._convert_simple_template(template)
+        ).render(**template_vars)
+        
+        assert '&amp;' in expected or '&gt;' in expected
+        assert self.engine._get_compiled_template(template)(template_vars) == expected
+    
+    def test_fast_path_missing_variable(self):
+        """Test the fast path reports missing variables like Jinja2."""
+        with pytest.raises(UndefinedError):
+            self.engine.render("{missing_var}/{post_id}.{ext}", self.variables)
+    
+    def test_cache_is_bounded(self):
+        """Test the compiled template cache evicts least recently used entries."""
+        for i in range(FilenameTemplateEngine.TEMPLATE_CACHE_SIZE + 10):
+            self.engine.render(f"{{post_id}}-{i}.{{ext}}", self.variables)
+        
+        assert len(self.engine._template_cache) == FilenameTemplateEngine.TEMPLATE_CACHE_SIZE
+        assert "{post_id}-0.{ext}" not in self.engine._template_cache
+    
+    @pytest.mark.performance
+    @pytest.mark.parametrize('template', [
+        "{subreddit}/{post_id}.{ext}",
+        "{{ subreddit }}/{{ post_id }}-{{ title|slugify }}.{{ ext }}",
+    ])
+    def test_render_throughput(self, template):
+        """Benchmark 100k renders of a cached template."""
+        renders = 100_000
+        variables = dict(self.variables)
+        
+        start_time = time.perf_counter()
+        for i in range(renders):
+            variables['post_id'] = f"post{i}"
+            self.engine.render(template, variables)
+        elapsed = time.perf_counter() - start_time
+        
+        # Recompiling per render managed roughly 1-2k renders/sec
+        assert renders / elapsed > 10_000, f"Only {renders / elapsed:.0f} renders/sec"
+
+
 class TestTemplateEngineIntegration:
     """Integration tests for template engine with various scenarios."""
     
@@ -0,0 +1,178 @@
+"""
+Test suite for CacheManager computed values.
+
+Tests single-flight get_or_compute and get_or_compute_async,
+stale-while-revalidate and negative caching of not-found errors.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+
+from redditdl.core.cache.manager import CacheConfig, CacheManager, is_not_found_error
+
+
+@pytest.fixture
+def cache():
+    """Memory-only cache manager."""
+    return CacheManager(CacheConfig(enable_disk_cache=False, metrics_enabled=False))
+
+
+def _http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status} error", response=response)
+
+
+class TestGetOrCompute:
+    """Test synchronous single-flight computation."""
+    
+    def test_concurrent_callers_share_one_computation(self, cache):
+        """Test threads missing the same key wait for a single compute call."""
+        calls = []
+        started = threading.Event()
+        
+        def compute():
+            calls.append(1)
+            started.set()
+            time.sleep(0.1)
+            return {"subscribers": 100}
+        
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute("r/pics", compute)))
+                   for _ in range(5)]
+        threads[0].start()
+        started.wait()
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(calls) == 1
+        assert results == [{"subscribers": 100}] * 5
+        assert cache.stats.coalesced == 4
+        assert cache.get_or_compute("r/pics", lambda: pytest.fail("recomputed")) == {"subscribers": 100}
+    
+    def test_errors_reach_waiters_and_are_not_cached(self, cache):
+        """Test a failed computation raises for every caller and is retried later."""
+        with pytest.raises(RuntimeError):
+            cache.get_or_compute("key", lambda: (_ for _ in ()).throw(RuntimeError("boom")))
+        
+        assert cache.get_or_compute("key", lambda: 42) == 42
+    
+    def test_stale_while_revalidate(self, cache):
+        """Test a stale value is served while one background refresh runs."""
+        cache.get_or_compute("key", lambda: "old", ttl=0.01, stale_ttl=60)
+        time.sleep(0.02)
+        refreshed = threading.Event()
+        
+        def refresh():
+            refreshed.set()
+            return "new"
+        
+        assert cache.get_or_compute("key", refresh, ttl=60) == "old"
+        assert refreshed.wait(5)
+        for _ in range(100):
+            if cache.get_or_compute("key", lambda: "newer") == "new":
+                break
+            time.sleep(0.01)
+        assert cache.get_or_compute("key", lambda: "newer") == "new"
+        assert cache.stats.stale_hits >= 1
+    
+    def test_negative_caching(self, cache):
+        """Test 404s are cached and re-raised without recomputing."""
+        calls = []
+        
+        def compute():
+            calls.append(1)
+            raise _http_error(404)
+        
+        for _ in range(3):
+            with pytest.raises(requests.HTTPError):
+                cache.get_or_compute("u/deleted", compute)
+        
+        assert len(calls) == 1
+        assert cache.stats.negative_hits == 2
+        
+        with pytest.raises(requests.HTTPError):
+            cache.get_or_compute("u/other", compute, negative_ttl=0)
+        with pytest.raises(requests.HTTPError):
+            cache.get_or_compute("u/other", compute, negative_ttl=0)
+        assert len(calls) == 3
+    
+    def test_negative_errors_and_detection(self, cache):
+        """Test custom not-found types and HTTP status detection."""
+        assert is_not_found_error(_http_error(404))
+        assert not is_not_found_error(_http_error(503))
+        
+        class MissingError(Exception):
+            pass
+        
+        with pytest.raises(MissingError):
+            cache.get_or_compute("key", lambda: (_ for _ in ()).throw(MissingError()),
+                                 negative_errors=(MissingError,))
+        with pytest.raises(MissingError):
+            cache.get_or_compute("key", lambda: 1)
+
+
+class TestGetOrComputeAsync:
+    """Test asynchronous single-flight computation."""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_share_one_computation(self, cache):
+        """Test tasks missing the same key await a single computation."""
+        calls = []
+        
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "metadata"
+        
+        results = await asyncio.gather(*(cache.get_or_compute_async("key", compute) for _ in range(10)))
+        
+        assert results == ["metadata"] * 10
+        assert len(calls) == 1
+        assert cache.stats.coalesced == 9
+    
+    @pytest.mark.asyncio
+    async def test_plain_values_and_threads(self, cache):
+        """Test compute may return a value directly or via asyncio.to_thread."""
+        assert await cache.get_or_compute_async("a", lambda: 1) == 1
+        assert await cache.get_or_compute_async("b", lambda: asyncio.to_thread(lambda: 2)) == 2
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_hands_over(self, cache):
+        """Test waiters compute themselves when the computing task is cancelled."""
+        async def slow():
+            await asyncio.sleep(10)
+        
+        leader = asyncio.ensure_future(cache.get_or_compute_async("key", slow))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.ensure_future(cache.get_or_compute_async("key", lambda: "computed by waiter"))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        
+        assert await waiter == "computed by waiter"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+    
+    @pytest.mark.asyncio
+    async def test_stale_refresh_and_negative_caching(self, cache):
+        """Test async stale-while-revalidate and cached 404s."""
+        await cache.get_or_compute_async("key", lambda: "old", ttl=0.01, stale_ttl=60)
+        await asyncio.sleep(0.02)
+        
+        assert await cache.get_or_compute_async("key", lambda: "new") == "old"
+        await asyncio.sleep(0.01)
+        assert await cache.get_or_compute_async("key", lambda: "newer") == "new"
+        
+        async def missing():
+            raise _http_error(404)
+        
+        for _ in range(2):
+            with pytest.raises(requests.HTTPError):
+                await cache.get_or_compute_async("gone", missing)
+        assert cache.stats.negative_hits == 1
@@ -0,0 +1,280 @@
+"""
+Test suite for the disk cache tier.
+
+Tests byte-accounted segmented LRU eviction, serialization and compression
+of entry files, the startup index and CacheManager integration.
+"""
+
+import json
+import os
+import pickle
+import subprocess
+import sys
+import time
+from collections import OrderedDict
+
+import pytest
+
+from redditdl.core.cache.disk import (
+    CODEC_NONE, DiskCache, ENTRY_SUFFIX, INDEX_FILENAME, LOCK_FILENAME,
+    SERIALIZER_JSON, SERIALIZER_PICKLE, _HEADER, is_plain_data
+)
+from redditdl.core.cache.manager import CacheConfig, CacheManager
+
+
+def _key(n):
+    return f"{n:064x}"
+
+
+def _header(cache, key):
+    return _HEADER.unpack_from(cache.path_for(key).read_bytes())
+
+
+class TestSerialization:
+    """Test how values are encoded in entry files."""
+    
+    def test_plain_data_detection(self):
+        """Test only values that survive a JSON round trip count as plain."""
+        assert is_plain_data({"a": [1, 2.5, "x", None, True], "b": {"c": []}})
+        assert not is_plain_data((1, 2))
+        assert not is_plain_data({1: "a"})
+        assert not is_plain_data(OrderedDict(a=1))
+        assert not is_plain_data({"when": time})
+    
+    def test_json_for_plain_data_and_pickle_otherwise(self, tmp_path):
+        """Test plain data is stored as JSON and other objects are pickled."""
+        cache = DiskCache(tmp_path, max_bytes=1024 * 1024, compression=False)
+        cache.set(_key(1), {"title": "post", "score": 10})
+        cache.set(_key(2), ("tuple", 1))
+        
+        assert _header(cache, _key(1))[1] == SERIALIZER_JSON
+        assert _header(cache, _key(2))[1] == SERIALIZER_PICKLE
+        assert cache.get(_key(1)) == {"title": "post", "score": 10}
+        assert cache.get(_key(2)) == ("tuple", 1)
+    
+    def test_compression_above_threshold(self, tmp_path):
+        """Test large payloads are compressed and small ones are not."""
+        cache = DiskCache(tmp_path, max_bytes=1024 * 1024, compression=True)
+        large = {"selftext": "lorem ipsum " * 1000}
+        cache.set(_key(1), large)
+        cache.set(_key(2), "short")
+        
+        assert _header(cache, _key(1))[2] != CODEC_NONE
+        assert cache.path_for(_key(1)).stat().st_size < len(json.dumps(large)) / 10
+        assert _header(cache, _key(2))[2] == CODEC_NONE
+        assert cache.get(_key(1)) == large
+    
+    def test_corrupt_entry_is_discarded(self, tmp_path):
+        """Test an unreadable entry file is treated as a miss and removed."""
+        cache = DiskCache(tmp_path, max_bytes=1024 * 1024)
+        cache.set(_key(1), "value")
+        cache.path_for(_key(1)).write_bytes(b"garbage")
+        
+        assert cache.get(_key(1), "missing") == "missing"
+        assert len(cache) == 0
+        assert not cache.path_for(_key(1)).exists()
+
+
+class TestEviction:
+    """Test byte-accounted segmented LRU eviction."""
+    
+    def test_size_bound(self, tmp_path):
+        """Test total entry size stays within max_bytes."""
+        cache = DiskCache(tmp_path, max_bytes=10000, compression=False)
+        for i in range(50):
+            cache.set(_key(i), "x" * 1000)
+        
+        assert cache.size_bytes <= 10000
+        assert cache.evictions == 50 - len(cache)
+        assert sum(path.stat().st_size for path in tmp_path.glob("*/*.cache")) == cache.size_bytes
+    
+    def test_hit_entries_survive_scans(self, tmp_path):
+        """Test entries read once are protected from a stream of new writes."""
+        cache = DiskCache(tmp_path, max_bytes=10000, compression=False)
+        cache.set(_key(0), "hot" * 300)
+        assert cache.get(_key(0)) is not None
+        
+        for i in range(1, 100):
+            cache.set(_key(i), "x" * 1000)
+        
+        assert cache.get(_key(0)) == "hot" * 300
+        assert cache.get(_key(1)) is None
+    
+    def test_oversized_value_not_stored(self, tmp_path):
+        """Test a value larger than the whole cache is rejected."""
+        cache = DiskCache(tmp_path, max_bytes=1000, compression=False)
+        
+        assert not cache.set(_key(1), "x" * 2000)
+        assert len(cache) == 0
+    
+    def test_expired_entries(self, tmp_path):
+        """Test expired entries are misses and are removed by cleanup."""
+        cache = DiskCache(tmp_path, max_bytes=100000)
+        cache.set(_key(1), "a", ttl=0.01)
+        cache.set(_key(2), "b", ttl=0.01)
+        cache.set(_key(3), "c")
+        time.sleep(0.02)
+        
+        assert cache.get(_key(1)) is None
+        assert cache.cleanup_expired() == 1
+        assert cache.get(_key(3)) == "c"
+        assert len(cache) == 1
+
+
+class TestIndex:
+    """Test the startup index."""
+    
+    def test_reopen_uses_index(self, tmp_path, monkeypatch):
+        """Test a reopened cache restores entries from the index without listing files."""
+        cache = DiskCache(tmp_path, max_bytes=100000)
+        for i in range(10):
+            cache.set(_key(i), {"n": i})
+        cache.delete(_key(3))
+        assert cache.get(_key(5)) == {"n": 5}
+        size = cache.size_bytes
+        cache.close()
+        
+        monkeypatch.setattr(DiskCache, "_rebuild_index", lambda self: pytest.fail("directory scanned"))
+        reopened = DiskCache(tmp_path, max_bytes=100000)
+        
+        assert len(reopened) == 9
+        assert reopened.size_bytes == size
+        assert reopened.get(_key(3)) is None
+        assert reopened.get(_key(7)) == {"n": 7}
+        assert reopened.info()["protected_count"] == 2
+    
+    def test_torn_index_line_is_ignored(self, tmp_path):
+        """Test a partially written final index line does not break startup."""
+        cache = DiskCache(tmp_path, max_bytes=100000)
+        cache.set(_key(1), "a")
+        cache.close()
+        with open(tmp_path / INDEX_FILENAME, "a") as f:
+            f.write('{"k":"ab')
+        
+        assert DiskCache(tmp_path, max_bytes=100000).get(_key(1)) == "a"
+    
+    def test_rebuild_without_index(self, tmp_path):
+        """Test a missing index is rebuilt from entry files and legacy files are removed."""
+        cache = DiskCache(tmp_path, max_bytes=100000)
+        cache.set(_key(1), "a")
+        cache.close()
+        (tmp_path / INDEX_FILENAME).unlink()
+        legacy = tmp_path / "ff" / f"{_key(255)}.cache"
+        legacy.parent.mkdir()
+        legacy.write_bytes(pickle.dumps({"data": "old", "expires_at": None}))
+        
+        rebuilt = DiskCache(tmp_path, max_bytes=100000)
+        
+        assert rebuilt.get(_key(1)) == "a"
+        assert not legacy.exists()
+        assert (tmp_path / INDEX_FILENAME).exists()
+    
+    def test_unclean_shutdown_reconciles_files(self, tmp_path):
+        """Test entry files missing from the index are found and evicted after a crash."""
+        cache = DiskCache(tmp_path, max_bytes=50000)
+        for i in range(40):
+            cache.set(_key(i), "x" * 1000)
+        # Files written without an index record, as by a crashed writer
+        for i in range(100, 160):
+            cache._write_file(_key(i), cache._encode("y" * 1000, None))
+        cache.delete(_key(0))
+        cache._write_file(_key(0), cache._encode("z", None))
+        cache.path_for(_key(1)).unlink()
+        cache._lock_file.close()
+        
+        reopened = DiskCache(tmp_path, max_bytes=50000)
+        
+        on_disk = list(tmp_path.glob(f"*/*{ENTRY_SUFFIX}"))
+        assert len(on_disk) == len(reopened)
+        assert reopened.size_bytes == sum(path.stat().st_size for path in on_disk) <= 50000
+        assert reopened.get(_key(1)) is None
+        assert reopened.get(_key(39)) == "x" * 1000
+    
+    def test_index_compaction(self, tmp_path, monkeypatch):
+        """Test the index is rewritten once it is mostly superseded lines."""
+        monkeypatch.setattr("redditdl.core.cache.disk.COMPACT_MIN_LINES", 10)
+        cache = DiskCache(tmp_path, max_bytes=100000)
+        for _ in range(20):
+            cache.set(_key(1), "a")
+        
+        lines = (tmp_path / INDEX_FILENAME).read_text().splitlines()
+        assert len(lines) < 12
+
+
+class TestSharedDirectory:
+    """Test several processes opening one cache directory."""
+    
+    def test_locked_directory_falls_back_to_private(self, tmp_path):
+        """Test a second writer gets its own directory, reclaimed after it closes."""
+        owner = DiskCache(tmp_path, max_bytes=50000)
+        other = DiskCache(tmp_path, max_bytes=50000)
+        
+        assert owner.directory == tmp_path
+        assert other.directory.parent == tmp_path
+        assert other.directory.name.startswith("proc-")
+        other.set(_key(1), "private")
+        owner.set(_key(2), "shared")
+        assert owner.get(_key(1)) is None
+        
+        # The private directory survives while its owner has it open
+        owner.close()
+        reopened = DiskCache(tmp_path, max_bytes=50000)
+        assert other.directory.exists()
+        reopened.close()
+        
+        other.close()
+        reclaimed = DiskCache(tmp_path, max_bytes=50000)
+        assert not other.directory.exists()
+        assert reclaimed.get(_key(2)) == "shared"
+        reclaimed.clear()
+        assert (tmp_path / LOCK_FILENAME).exists()
+
+
+class TestCacheManagerDiskTier:
+    """Test CacheManager on top of the disk cache."""
+    
+    def test_disk_tier_round_trip_and_limits(self, tmp_path):
+        """Test values come back from disk and disk_cache_size_mb is enforced."""
+        config = CacheConfig(memory_cache_size=2, disk_cache_size_mb=0.01, cache_dir=tmp_path,
+                             compression_enabled=False, metrics_enabled=False)
+        cache = CacheManager(config)
+        for i in range(20):
+            cache.set(f"key{i}", "x" * 1000)
+        
+        assert cache.get("key19") == "x" * 1000
+        info = cache.get_cache_info()
+        assert info["disk_cache"]["total_size_mb"] <= 0.01
+        assert cache.stats.evictions > 0
+        assert cache.stats.evictions == info["disk_cache"]["evictions"]
+        assert cache.delete("key19")
+        assert not cache.delete("key19")
+        
+        cache.close()
+        reopened = CacheManager(config)
+        assert reopened.get("key18") == "x" * 1000
+    
+    def test_process_exit_closes_index(self, tmp_path, monkeypatch):
+        """Test a run that never calls close() still lets the next start skip the rebuild."""
+        script = (
+            "import sys\n"
+            "from pathlib import Path\n"
+            "from redditdl.core.cache.manager import CacheConfig, CacheManager\n"
+            "cache = CacheManager(CacheConfig(cache_dir=Path(sys.argv[1]), metrics_enabled=False))\n"
+            "cache.set('key', 'value')\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        subprocess.run([sys.executable, "-c", script, str(tmp_path)], env=env, check=True)
+        
+        monkeypatch.setattr(DiskCache, "_rebuild_index", lambda self: pytest.fail("directory scanned"))
+        reopened = CacheManager(CacheConfig(cache_dir=tmp_path, metrics_enabled=False))
+        
+        assert reopened.get("key") == "value"
+        reopened.close()
+    
+    def test_disk_paths_are_not_created_on_lookup(self, tmp_path):
+        """Test looking up keys does not create directories."""
+        cache = CacheManager(CacheConfig(cache_dir=tmp_path, metrics_enabled=False))
+        for i in range(20):
+            cache.get(f"missing{i}")
+        
+        assert sorted(path.name for path in tmp_path.iterdir()) == sorted([INDEX_FILENAME, LOCK_FILENAME])
@@ -0,0 +1,210 @@
+"""
+Test suite for the HTTP response cache.
+
+Tests listing classification and TTLs, cache hits across restarts,
+conditional revalidation and scraper session wiring.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from redditdl.core.cache.http import (
+    CACHE_STATUS_HEADER, LISTING_TTLS, PERIOD_TTLS, CachingHTTPAdapter, install_http_cache, listing_type
+)
+from redditdl.core.cache.manager import CacheConfig, CacheManager
+
+
+class _ListingHandler(BaseHTTPRequestHandler):
+    """Serves a fixed listing with an ETag and records request headers."""
+    
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+        if "missing" in self.path:
+            self.send_response(404)
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        
+        body = json.dumps({"kind": "Listing", "data": {"children": [], "after": None}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-Ratelimit-Remaining", "99")
+        if self.path.startswith("/r/private"):
+            self.send_header("Cache-Control", "private, no-store")
+        else:
+            self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(body)
+    
+    do_POST = do_GET
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Start a local listing server."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _ListingHandler)
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _cache(tmp_path):
+    return CacheManager(CacheConfig(cache_dir=tmp_path, metrics_enabled=False))
+
+
+def _session(cache, **adapter_kwargs):
+    session = requests.Session()
+    return session, install_http_cache(session, cache, **adapter_kwargs)
+
+
+class TestListingPolicy:
+    """Test URL classification and TTL selection."""
+    
+    def test_listing_type(self):
+        """Test subreddit and user listings are recognized with and without .json."""
+        assert listing_type("https://www.reddit.com/r/pics/new.json?limit=100") == "new"
+        assert listing_type("https://oauth.reddit.com/r/pics/top?t=all") == "top"
+        assert listing_type("https://www.reddit.com/r/pics/.json") == "hot"
+        assert listing_type("https://www.reddit.com/user/alice/submitted.json") == "submitted"
+        assert listing_type("https://oauth.reddit.com/user/alice/about") == "about"
+        assert listing_type("https://oauth.reddit.com/r/pics/comments/abc/title") is None
+        assert listing_type("https://www.reddit.com/api/v1/access_token") is None
+        assert listing_type("https://i.redd.it/abc.jpg") is None
+    
+    def test_ttls(self, tmp_path):
+        """Test short TTLs for new listings and long ones for all-time top."""
+        adapter = CachingHTTPAdapter(_cache(tmp_path), ttls={"rising": 0})
+        
+        assert adapter.ttl_for("https://www.reddit.com/r/pics/new.json") == LISTING_TTLS["new"]
+        assert adapter.ttl_for("https://www.reddit.com/r/pics/top.json?t=all") == PERIOD_TTLS["all"]
+        assert adapter.ttl_for("https://www.reddit.com/r/pics/top.json") == PERIOD_TTLS["day"]
+        assert adapter.ttl_for("https://www.reddit.com/r/pics/rising.json") == 0
+        assert adapter.ttl_for("https://i.redd.it/abc.jpg") == 0
+
+
+class TestCachingHTTPAdapter:
+    """Test serving, storing and revalidating listing responses."""
+    
+    def test_hits_survive_restart(self, server, tmp_path):
+        """Test a repeated listing request is served from disk by a new cache."""
+        session, adapter = _session(_cache(tmp_path))
+        first = session.get(f"{server.url}/r/pics/new.json", params={"limit": 100, "after": "t3_a"})
+        session.close()
+        adapter.cache.close()
+        
+        session, adapter = _session(_cache(tmp_path))
+        second = session.get(f"{server.url}/r/pics/new.json", params={"after": "t3_a", "limit": 100})
+        
+        assert len(server.requests) == 1
+        assert second.headers[CACHE_STATUS_HEADER] == "HIT"
+        assert second.json() == first.json()
+        assert "X-Ratelimit-Remaining" not in second.headers
+        assert adapter.stats.hits == 1
+        assert adapter.stats.hit_rate == 1.0
+    
+    def test_conditional_revalidation(self, server, tmp_path):
+        """Test an expired entry with an ETag is revalidated with If-None-Match."""
+        session, adapter = _session(_cache(tmp_path), ttls={"new": 0.05})
+        session.get(f"{server.url}/r/pics/new.json")
+        time.sleep(0.1)
+        
+        response = session.get(f"{server.url}/r/pics/new.json")
+        
+        assert server.requests[1]["If-None-Match"] == '"v1"'
+        assert response.status_code == 200
+        assert response.headers[CACHE_STATUS_HEADER] == "REVALIDATED"
+        assert response.json()["kind"] == "Listing"
+        assert adapter.stats.revalidated == 1
+        assert adapter.stats.misses == 1
+        
+        session.get(f"{server.url}/r/pics/new.json")
+        assert len(server.requests) == 2
+    
+    def test_uncacheable_requests_pass_through(self, server, tmp_path):
+        """Test POSTs, non-listing URLs, errors and no-store responses are not cached."""
+        session, adapter = _session(_cache(tmp_path))
+        
+        for _ in range(2):
+            session.post(f"{server.url}/r/pics/new.json")
+            session.get(f"{server.url}/api/info.json")
+            session.get(f"{server.url}/missing/r/x")
+            session.get(f"{server.url}/r/missing")
+            session.get(f"{server.url}/r/private/new.json")
+        
+        assert len(server.requests) == 10
+        assert adapter.stats.hits == 0
+        assert adapter.stats.stores == 0
+
+
+    def test_accounts_do_not_share_entries(self, server, tmp_path):
+        """Test logged-in accounts get separate entries for the same listing."""
+        cache = _cache(tmp_path)
+        alice, _ = _session(cache, identity="alice")
+        bob, _ = _session(cache, identity="bob")
+        
+        alice.get(f"{server.url}/user/alice/saved.json")
+        response = bob.get(f"{server.url}/user/alice/saved.json")
+        assert CACHE_STATUS_HEADER not in response.headers
+        
+        response = alice.get(f"{server.url}/user/alice/saved.json")
+        assert response.headers[CACHE_STATUS_HEADER] == "HIT"
+        assert len(server.requests) == 2
+    
+    def test_cached_responses_can_be_streamed(self, server, tmp_path):
+        """Test cached responses are marked consumed like downloaded ones."""
+        session, _ = _session(_cache(tmp_path))
+        session.get(f"{server.url}/r/pics/new.json")
+        
+        response = session.get(f"{server.url}/r/pics/new.json")
+        
+        assert response.headers[CACHE_STATUS_HEADER] == "HIT"
+        assert b"".join(response.iter_content(16)) == response.content
+    
+    def test_existing_adapter_settings_are_kept(self, tmp_path):
+        """Test retries and pool settings of the replaced adapter carry over."""
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(max_retries=5, pool_maxsize=7))
+        
+        adapter = install_http_cache(session, _cache(tmp_path))
+        
+        assert session.get_adapter("https://www.reddit.com/r/pics") is adapter
+        assert adapter.max_retries.total == 5
+        assert adapter._pool_maxsize == 7
+
+
+class TestScraperIntegration:
+    """Test scrapers route their traffic through the cache."""
+    
+    def test_praw_scraper_uses_cached_session(self, tmp_path):
+        """Test PRAW receives a session with the caching adapter when enabled."""
+        from redditdl.targets.base_scraper import ScrapingConfig
+        from redditdl.targets.scrapers import EnhancedPrawScraper
+        
+        config = ScrapingConfig(client_id="id", client_secret="secret", http_cache_dir=str(tmp_path))
+        with patch('redditdl.targets.scrapers.praw.Reddit') as reddit:
+            scraper = EnhancedPrawScraper(config)
+        
+        session = reddit.call_args.kwargs["requestor_kwargs"]["session"]
+        assert session.get_adapter("https://oauth.reddit.com/r/pics/new") is scraper.http_cache
+        
+        with patch('redditdl.targets.scrapers.praw.Reddit') as reddit:
+            EnhancedPrawScraper(ScrapingConfig(client_id="id", client_secret="secret"))
+        assert "requestor_kwargs" not in reddit.call_args.kwargs
@@ -0,0 +1,266 @@
+"""
+Test suite for performance metrics collection.
+
+Tests the streaming histogram sketch used for distribution metrics
+(quantile accuracy, merging, concurrent recording, Metric summaries) and
+the OpenMetrics exposition endpoint.
+"""
+
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from redditdl.core.cache.manager import CacheManager, CacheConfig
+from redditdl.core.concurrency.pools import PoolMetrics
+from redditdl.core.monitoring.metrics import (
+    Metric, MetricType, MetricsCollector, StreamingHistogram
+)
+from redditdl.core.monitoring.openmetrics import (
+    CONTENT_TYPE, MetricsHTTPServer, OpenMetricsExporter, metrics_endpoint
+)
+
+
+def _exact_quantile(values, quantile):
+    ordered = sorted(values)
+    return ordered[int(round(quantile * (len(ordered) - 1)))]
+
+
+class TestStreamingHistogram:
+    """Test StreamingHistogram accuracy and behaviour."""
+    
+    @pytest.mark.parametrize("quantile", [0.5, 0.9, 0.95, 0.99, 0.999])
+    def test_quantiles_within_relative_accuracy(self, quantile):
+        """Test quantiles of a long-tailed distribution stay within tolerance."""
+        rng = random.Random(42)
+        values = [rng.lognormvariate(0, 2) for _ in range(50000)]
+        histogram = StreamingHistogram(relative_accuracy=0.01)
+        for value in values:
+            histogram.record(value)
+        
+        expected = _exact_quantile(values, quantile)
+        assert histogram.quantile(quantile) == pytest.approx(expected, rel=0.03)
+    
+    def test_exact_count_sum_and_extremes(self):
+        """Test count, sum, min and max are tracked exactly."""
+        histogram = StreamingHistogram()
+        for value in [0.0, 2.5, -1.0, 1000.0, 3.0]:
+            histogram.record(value)
+        
+        summary = histogram.summary()
+        assert summary.count == 5
+        assert summary.sum == pytest.approx(1004.5)
+        assert summary.min == -1.0
+        assert summary.max == 1000.0
+        assert histogram.quantile(0.0) == -1.0
+        assert histogram.quantile(1.0) == 1000.0
+        assert histogram.quantile(0.5) == pytest.approx(2.5, rel=0.01)
+    
+    def test_empty_histogram(self):
+        """Test an empty histogram reports zeros."""
+        histogram = StreamingHistogram()
+        
+        assert histogram.count == 0
+        assert histogram.quantiles([0.5, 0.99]) == [0.0, 0.0]
+        assert histogram.summary().count == 0
+    
+    def test_merge(self):
+        """Test merged sketches answer like a single sketch over all values."""
+        first, second, combined = StreamingHistogram(), StreamingHistogram(), StreamingHistogram()
+        for value in range(1, 1001):
+            (first if value % 2 else second).record(value)
+            combined.record(value)
+        
+        first.merge(second)
+        
+        assert first.count == 1000
+        assert first.quantiles([0.5, 0.95]) == combined.quantiles([0.5, 0.95])
+        with pytest.raises(ValueError):
+            first.merge(StreamingHistogram(relative_accuracy=0.05))
+    
+    def test_concurrent_recording(self):
+        """Test recording from many threads loses no samples."""
+        histogram = StreamingHistogram(stripes=4)
+        
+        def worker():
+            for value in range(1, 5001):
+                histogram.record(value)
+        
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert histogram.count == 40000
+        assert histogram.summary().sum == pytest.approx(8 * 5000 * 5001 / 2)
+        assert histogram.quantile(0.5) == pytest.approx(2500, rel=0.02)
+    
+    def test_buckets_are_cumulative(self):
+        """Test exported buckets ascend and end at the total count."""
+        histogram = StreamingHistogram()
+        for value in [0.1, 0.1, 1, 10, 100]:
+            histogram.record(value)
+        
+        buckets = histogram.buckets()
+        bounds = [bound for bound, _ in buckets]
+        assert bounds == sorted(bounds)
+        assert buckets[-1][1] == 5
+        assert all(b[1] <= a[1] for b, a in zip(buckets, buckets[1:]))
+    
+    def test_invalid_accuracy(self):
+        """Test relative accuracy outside (0, 1) is rejected."""
+        with pytest.raises(ValueError):
+            StreamingHistogram(relative_accuracy=0)
+
+
+class TestMetricHistogramIntegration:
+    """Test HISTOGRAM and TIMER metrics summarize through the sketch."""
+    
+    def test_summary_covers_all_samples(self):
+        """Test percentiles include samples evicted from the recent-values deque."""
+        metric = Metric("download.size", MetricType.HISTOGRAM, max_samples=100)
+        for value in range(1, 10001):
+            metric.record(value)
+        
+        summary = metric.get_summary()
+        assert summary.count == 10000
+        assert summary.max == 10000
+        assert summary.p99 == pytest.approx(9900, rel=0.02)
+        assert len(metric.get_recent_values(1000)) == 100
+    
+    def test_summary_refreshes_after_record(self):
+        """Test cached summaries are invalidated by new samples."""
+        metric = Metric("download.duration", MetricType.TIMER)
+        metric.record(1.0)
+        assert metric.get_summary().count == 1
+        
+        metric.record(2.0)
+        assert metric.get_summary().count == 2
+        
+        metric.clear()
+        assert metric.get_summary().count == 0
+        assert metric.histogram.count == 0
+    
+    def test_gauges_keep_exact_summaries(self):
+        """Test non-distribution metrics do not use a sketch."""
+        collector = MetricsCollector()
+        gauge = collector.gauge("test.gauge")
+        
+        assert gauge.histogram is None
+        gauge.set(5.0)
+        assert collector.get_all_summaries()["test.gauge"].p50 == 5.0
+    
+    @pytest.mark.performance
+    def test_summary_cost_independent_of_sample_count(self):
+        """Test refreshing a summary does not sort every sample."""
+        metric = Metric("download.duration", MetricType.TIMER, max_samples=200000)
+        for value in range(200000):
+            metric.record(value / 1000)
+        
+        start = time.perf_counter()
+        for _ in range(100):
+            metric.get_summary(force_refresh=True)
+        elapsed = time.perf_counter() - start
+        
+        assert elapsed < 1.0, f"100 summaries over 200k samples took {elapsed:.2f}s"
+
+
+class _FakePoolManager:
+    def get_all_metrics(self):
+        return {"async": PoolMetrics(active_workers=2, completed_tasks=7, failed_tasks=1)}
+
+
+class TestOpenMetricsExporter:
+    """Test OpenMetrics rendering and the HTTP endpoint."""
+    
+    @pytest.fixture
+    def exporter(self, tmp_path):
+        collector = MetricsCollector()
+        collector.counter("downloads.completed", "Completed downloads")
+        collector.increment("downloads.completed", 3)
+        collector.gauge("queue.depth").set(4)
+        timer = collector.timer("download.duration", "Download duration")
+        for value in (0.5, 1.0, 2.0):
+            timer.record(value)
+        
+        cache = CacheManager(CacheConfig(enable_disk_cache=False, cache_dir=tmp_path))
+        cache.stats.hits, cache.stats.misses = 3, 1
+        return OpenMetricsExporter(
+            collector=collector,
+            pool_manager=_FakePoolManager(),
+            cache_managers={"listings": cache}
+        )
+    
+    def _samples(self, text):
+        samples = {}
+        for line in text.splitlines():
+            if line and not line.startswith("#"):
+                name, value = line.rsplit(" ", 1)
+                samples[name] = float(value)
+        return samples
+    
+    def test_render_covers_all_sources(self, exporter):
+        """Test counters, gauges, histograms, pools, limiters and caches are exported."""
+        text = exporter.render()
+        samples = self._samples(text)
+        
+        assert text.endswith("# EOF\n")
+        assert "# TYPE redditdl_downloads_completed counter" in text
+        assert samples["redditdl_downloads_completed_total"] == 3
+        assert samples["redditdl_queue_depth"] == 4
+        assert "# TYPE redditdl_download_duration histogram" in text
+        assert samples['redditdl_download_duration_bucket{le="+Inf"}'] == 3
+        assert samples["redditdl_download_duration_count"] == 3
+        assert samples["redditdl_download_duration_sum"] == pytest.approx(3.5)
+        assert samples['redditdl_pool_active_workers{pool="async"}'] == 2
+        assert samples['redditdl_pool_completed_tasks_total{pool="async"}'] == 7
+        assert 'redditdl_rate_limit_requests_total{limiter="api"}' in samples
+        assert samples['redditdl_cache_manager_hit_ratio{cache="listings"}'] == 0.75
+    
+    def test_histogram_buckets_are_cumulative(self, exporter):
+        """Test histogram buckets ascend and never decrease."""
+        samples = self._samples(exporter.render())
+        buckets = [value for name, value in samples.items()
+                   if name.startswith("redditdl_download_duration_bucket")]
+        
+        assert buckets == sorted(buckets)
+    
+    def test_families_are_unique(self, exporter):
+        """Test every metric family is declared exactly once."""
+        type_lines = [line for line in exporter.render().splitlines() if line.startswith("# TYPE")]
+        
+        assert len(type_lines) == len(set(type_lines))
+    
+    def test_http_endpoint(self, exporter):
+        """Test the endpoint serves the exposition to a local HTTP client."""
+        server = MetricsHTTPServer(exporter, port=0)
+        server.start()
+        try:
+            with urllib.request.urlopen(server.url, timeout=5) as response:
+                assert response.status == 200
+                assert response.headers["Content-Type"] == CONTENT_TYPE
+                body = response.read().decode("utf-8")
+            assert "redditdl_downloads_completed_total 3" in body
+            
+            with pytest.raises(urllib.error.HTTPError) as excinfo:
+                urllib.request.urlopen(server.url.replace("/metrics", "/other"), timeout=5)
+            assert excinfo.value.code == 404
+        finally:
+            server.stop()
+        
+        assert not server.running
+    
+    def test_endpoint_disabled_without_port(self):
+        """Test metrics_endpoint does nothing unless a port is configured."""
+        with metrics_endpoint(None) as server:
+            assert server is None
+        
+        with metrics_endpoint(0) as server:
+            assert server.running
+            port = server.port
+        assert port > 0
+        assert not server.running
@@ -0,0 +1,165 @@
+"""
+Test suite for the statistical sampling profiler.
+
+Tests stack sampling in thread and signal modes, attribution of samples
+to sampling scopes across interleaved coroutines, and collapsed-stack
+export alongside the JSON profile report.
+"""
+
+import asyncio
+import json
+import signal
+import sys
+import threading
+import time
+
+import pytest
+
+from redditdl.core.monitoring.profiler import (
+    ResourceProfiler, SamplingProfiler, sampling_scope, _scope_frames
+)
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += 1
+    return total
+
+
+def busy_download():
+    return _busy(0.002)
+
+
+def busy_resize():
+    return _busy(0.002)
+
+
+class TestSamplingProfiler:
+    """Test SamplingProfiler sampling and attribution."""
+    
+    def test_scope_registers_and_releases_frame(self):
+        """Test sampling_scope leaves no frames behind."""
+        with sampling_scope(stage="processing"):
+            frame = sys._getframe()
+            assert _scope_frames[frame] == [{"stage": "processing"}]
+            with sampling_scope(handler="media"):
+                assert len(_scope_frames[frame]) == 2
+        
+        assert frame not in _scope_frames
+    
+    @pytest.mark.skipif(not hasattr(signal, "setitimer"), reason="requires setitimer")
+    def test_attribution_follows_running_coroutine(self):
+        """Test interleaved tasks on one thread are attributed to their own scopes."""
+        if threading.current_thread() is not threading.main_thread():
+            pytest.skip("signal sampling needs the main thread")
+        
+        async def stage(name, work):
+            with sampling_scope(stage=name):
+                for _ in range(60):
+                    work()
+                    await asyncio.sleep(0)
+        
+        async def run():
+            await asyncio.gather(stage("download", busy_download), stage("resize", busy_resize))
+        
+        sampler = SamplingProfiler(interval=0.001, mode="signal")
+        with sampler:
+            asyncio.run(run())
+        
+        attribution = sampler.get_attribution()["stage"]
+        assert attribution.get("download", 0) > 0
+        assert attribution.get("resize", 0) > 0
+        
+        for line in sampler.collapsed_stacks():
+            if "busy_download" in line:
+                assert line.startswith("stage=download;")
+            if "busy_resize" in line:
+                assert line.startswith("stage=resize;")
+    
+    def test_stage_and_handler_labels_nest(self):
+        """Test handler scopes nest under the enclosing stage in collapsed output."""
+        sampler = SamplingProfiler(interval=0.001, mode="thread")
+        with sampler:
+            with sampling_scope(stage="processing"):
+                with sampling_scope(handler="media"):
+                    _busy(0.2)
+        
+        lines = [line for line in sampler.collapsed_stacks() if "_busy" in line]
+        assert lines
+        assert all(line.startswith("stage=processing;handler=media;") for line in lines)
+        assert sampler.get_attribution()["handler"]["media"] > 0
+    
+    def test_idle_threads_skipped(self):
+        """Test threads parked in stdlib waits do not produce samples."""
+        stop = threading.Event()
+        waiter = threading.Thread(target=stop.wait, name="idle-waiter")
+        waiter.start()
+        try:
+            sampler = SamplingProfiler(interval=0.001, mode="thread")
+            with sampler:
+                _busy(0.1)
+        finally:
+            stop.set()
+            waiter.join()
+        
+        assert sampler.sample_count > 0
+        assert not any("Event.wait" in line for line in sampler.collapsed_stacks())
+    
+    @pytest.mark.skipif(not hasattr(signal, "setitimer"), reason="requires setitimer")
+    def test_signal_mode(self):
+        """Test SIGPROF sampling of the main thread."""
+        if threading.current_thread() is not threading.main_thread():
+            pytest.skip("signal sampling needs the main thread")
+        
+        sampler = SamplingProfiler(interval=0.005, mode="signal")
+        with sampler:
+            with sampling_scope(stage="acquisition"):
+                _busy(0.3)
+        
+        assert sampler.sample_count > 0
+        assert sampler.get_attribution()["stage"]["acquisition"] > 0
+        assert signal.getsignal(signal.SIGPROF) in (signal.SIG_DFL, None)
+    
+    def test_invalid_mode(self):
+        """Test unknown sampling modes are rejected."""
+        with pytest.raises(ValueError):
+            SamplingProfiler(mode="perf")
+
+
+class TestProfileReportSampling:
+    """Test sampling output in ResourceProfiler reports."""
+    
+    def test_report_includes_collapsed_stacks(self, tmp_path):
+        """Test export_profile_report writes collapsed stacks next to the report."""
+        profiler = ResourceProfiler()
+        profiler.start_sampling(interval=0.001)
+        with sampling_scope(stage="export"):
+            _busy(0.1)
+        profiler.stop_sampling()
+        
+        report_file = tmp_path / "profile.json"
+        profiler.export_profile_report(report_file)
+        
+        report = json.loads(report_file.read_text())
+        collapsed_file = tmp_path / "profile.collapsed"
+        assert report["sampling"]["collapsed_stacks_file"] == str(collapsed_file)
+        assert report["sampling"]["samples"] > 0
+        
+        lines = collapsed_file.read_text().splitlines()
+        assert lines
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            assert int(count) > 0
+            assert stack
+        assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == report["sampling"]["samples"]
+    
+    def test_report_without_sampling(self, tmp_path):
+        """Test reports are unchanged when sampling never ran."""
+        profiler = ResourceProfiler()
+        report_file = tmp_path / "profile.json"
+        profiler.export_profile_report(report_file)
+        
+        assert "sampling" not in json.loads(report_file.read_text())
+        assert not (tmp_path / "profile.collapsed").exists()
@@ -0,0 +1,212 @@
+"""
+Test suite for pipeline tracing.
+
+Tests per-post sampling, span tree construction, OTLP JSON export and the
+trace summary PipelineExecutor adds to ExecutionMetrics.
+"""
+
+import json
+
+import pytest
+
+from redditdl.core.monitoring.tracing import (
+    NOOP_SPAN, STATUS_ERROR, Tracer, current_span, set_tracer, trace_post,
+    trace_span, tracing_session
+)
+from redditdl.core.pipeline.executor import PipelineExecutor
+from redditdl.core.pipeline.interfaces import PipelineContext, PipelineResult, PipelineStage
+
+
+@pytest.fixture
+def tracer():
+    """Install a tracer that samples every post."""
+    tracer = Tracer(sample_rate=1.0)
+    previous = set_tracer(tracer)
+    yield tracer
+    set_tracer(previous)
+
+
+class _Post:
+    def __init__(self, post_id):
+        self.id = post_id
+
+
+class _HandlerStage(PipelineStage):
+    """Stage that handles each post inside a post span."""
+    
+    async def process(self, context: PipelineContext) -> PipelineResult:
+        result = PipelineResult(stage_name=self.name)
+        for post in context.posts:
+            with trace_post(post.id, "handler.process", handler="media"):
+                with trace_span("download", host="i.redd.it") as span:
+                    span.set_attribute("bytes", 2048)
+            result.processed_count += 1
+        return result
+
+
+class TestTracer:
+    """Test span recording and sampling."""
+    
+    def test_disabled_tracer_records_nothing(self):
+        """Test a zero sample rate hands out the shared no-op span."""
+        tracer = Tracer(sample_rate=0.0)
+        
+        assert tracer.post_span("abc", "handler.process") is NOOP_SPAN
+        assert tracer.start_trace("pipeline.execute") is NOOP_SPAN
+        assert trace_span("download") is NOOP_SPAN
+        assert tracer.get_spans() == []
+    
+    def test_sampling_is_per_post_and_deterministic(self):
+        """Test the sampled fraction tracks the rate and decisions are stable."""
+        tracer = Tracer(sample_rate=0.1)
+        post_ids = [f"post{i}" for i in range(20000)]
+        sampled = [post_id for post_id in post_ids if tracer.is_sampled(post_id)]
+        
+        assert 0.08 < len(sampled) / len(post_ids) < 0.12
+        assert all(tracer.is_sampled(post_id) for post_id in sampled)
+    
+    def test_span_tree(self, tracer):
+        """Test post spans hang off a per-post root and nest through the context."""
+        marker = tracer.start_run()
+        with tracer.start_trace("pipeline.execute"):
+            with tracer.span("stage.processing", **{'pipeline.stage': 'processing'}):
+                with trace_post("abc", "handler.process", handler="media") as handler_span:
+                    with trace_span("download", host="i.redd.it") as download_span:
+                        assert current_span() is download_span
+                    assert current_span() is handler_span
+        tracer.finish_run(marker)
+        
+        spans = {span.name: span for span in tracer.get_spans()}
+        root = spans["post"]
+        assert root.attributes["post_id"] == "abc"
+        assert not root.parent_span_id
+        assert spans["handler.process"].parent_span_id == root.span_id
+        assert spans["handler.process"].attributes["pipeline.stage"] == "processing"
+        assert spans["download"].parent_span_id == spans["handler.process"].span_id
+        assert spans["download"].trace_id == root.trace_id
+        assert spans["stage.processing"].trace_id != root.trace_id
+        assert root.start_time_ns <= spans["handler.process"].start_time_ns
+        assert root.end_time_ns >= spans["download"].end_time_ns
+        assert current_span() is None
+    
+    def test_unsampled_post_suppresses_nested_spans(self):
+        """Test work under an unsampled post is not recorded in another trace."""
+        tracer = Tracer(sample_rate=0.5)
+        unsampled = next(f"post{i}" for i in range(100) if not tracer.is_sampled(f"post{i}"))
+        
+        with tracer.start_trace("pipeline.execute"):
+            with tracer.post_span(unsampled, "handler.process"):
+                assert trace_span("download") is NOOP_SPAN
+        
+        assert [span.name for span in tracer.get_spans()] == ["pipeline.execute"]
+    
+    def test_record_post_span(self, tracer):
+        """Test spans can be recorded after the fact with explicit times."""
+        tracer.record_post_span("abc", "scraper.fetch", 100.0, 101.5, target="r/pics")
+        summary = tracer.finish_run()
+        
+        fetch = next(span for span in tracer.get_spans() if span.name == "scraper.fetch")
+        assert fetch.duration == pytest.approx(1.5)
+        assert fetch.attributes["target"] == "r/pics"
+        assert summary['slowest_posts'][0]['duration'] == pytest.approx(1.5)
+    
+    def test_max_spans(self):
+        """Test spans beyond the cap are counted as dropped."""
+        tracer = Tracer(sample_rate=1.0, max_spans=2)
+        with tracer.start_trace("pipeline.execute"):
+            for _ in range(3):
+                with tracer.span("step"):
+                    pass
+        
+        assert len(tracer.get_spans()) == 2
+        assert tracer.dropped_spans == 2
+    
+    def test_invalid_sample_rate(self):
+        """Test sample rates outside [0, 1] are rejected."""
+        with pytest.raises(ValueError):
+            Tracer(sample_rate=1.5)
+
+
+class TestOtlpExport:
+    """Test OTLP JSON export."""
+    
+    def test_export_document_shape(self, tracer, tmp_path):
+        """Test the exported file follows the OTLP/JSON trace encoding."""
+        with pytest.raises(RuntimeError):
+            with trace_post("abc", "handler.process", handler="media") as span:
+                span.set_attributes(bytes=2048, ratio=0.5, cached=False)
+                raise RuntimeError("disk full")
+        tracer.finish_run()
+        
+        output_file = tmp_path / "traces" / "trace.json"
+        assert tracer.export_otlp_json(output_file) == 2
+        
+        document = json.loads(output_file.read_text())
+        resource_spans = document["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"][0] == {
+            "key": "service.name", "value": {"stringValue": "redditdl"}
+        }
+        spans = {span["name"]: span for span in resource_spans["scopeSpans"][0]["spans"]}
+        handler_span = spans["handler.process"]
+        assert len(handler_span["traceId"]) == 32
+        assert len(handler_span["spanId"]) == 16
+        assert handler_span["parentSpanId"] == spans["post"]["spanId"]
+        assert int(handler_span["endTimeUnixNano"]) >= int(handler_span["startTimeUnixNano"])
+        assert handler_span["status"] == {"code": STATUS_ERROR, "message": "disk full"}
+        
+        attributes = {attr["key"]: attr["value"] for attr in handler_span["attributes"]}
+        assert attributes["handler"] == {"stringValue": "media"}
+        assert attributes["bytes"] == {"intValue": "2048"}
+        assert attributes["ratio"] == {"doubleValue": 0.5}
+        assert attributes["cached"] == {"boolValue": False}
+    
+    def test_tracing_session(self, tmp_path):
+        """Test a session installs a tracer and writes its spans on exit."""
+        output_file = tmp_path / "trace.json"
+        
+        with tracing_session(None, sample_rate=0.0) as disabled:
+            assert disabled is None
+        
+        with tracing_session(output_file, sample_rate=1.0) as session_tracer:
+            with trace_post("abc", "handler.process"):
+                pass
+            session_tracer.finish_run()
+        
+        assert not trace_post("abc", "handler.process").is_recording
+        spans = json.loads(output_file.read_text())["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        assert sorted(span["name"] for span in spans) == ["handler.process", "post"]
+
+
+class TestExecutorTracing:
+    """Test PipelineExecutor stage spans and trace summaries."""
+    
+    @pytest.mark.asyncio
+    async def test_execution_metrics_trace_summary(self, tracer):
+        """Test the executor summarizes where sampled posts spent their time."""
+        context = PipelineContext()
+        context.posts = [_Post(f"post{i}") for i in range(5)]
+        executor = PipelineExecutor([_HandlerStage("processing")])
+        
+        metrics = await executor.execute(context)
+        
+        summary = metrics.trace_summary
+        assert summary['traced_posts'] == 5
+        assert summary['operations']['stage.processing']['count'] == 1
+        assert summary['operations']['download']['count'] == 5
+        assert summary['operations']['handler.process']['p95_time'] >= 0
+        assert len(summary['slowest_posts']) == 5
+        assert set(summary['slowest_posts'][0]['breakdown']) == {"handler.process", "download"}
+        
+        stage_span = next(span for span in tracer.get_spans() if span.name == "stage.processing")
+        assert stage_span.attributes["posts"] == 5
+    
+    @pytest.mark.asyncio
+    async def test_tracing_off_by_default(self):
+        """Test executions leave the summary empty when tracing is disabled."""
+        context = PipelineContext()
+        context.posts = [_Post("abc")]
+        executor = PipelineExecutor([_HandlerStage("processing")], tracer=Tracer(sample_rate=0.0))
+        
+        metrics = await executor.execute(context)
+        
+        assert metrics.trace_summary == {}
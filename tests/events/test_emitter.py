@@ -17,7 +17,10 @@ import sys
 sys.path.insert(0, '.')
 
 from redditdl.core.events.emitter import EventEmitter
-from redditdl.core.events.types import BaseEvent, PostDiscoveredEvent, DownloadStartedEvent
+from redditdl.core.events.types import (
+    BaseEvent, PostDiscoveredEvent, DownloadStartedEvent,
+    DownloadProgressEvent, DownloadCompletedEvent
+)
 
 
 class TestEventEmitterBasic:
@@ -525,5 +528,189 @@ class TestEventEmitterCleanup:
         assert stats['history_size'] == 0
 
 
+
+class TestEventEmitterFastPath:
+    """Test suite for unsubscribed-type skipping, coalescing and batching."""
+    
+    def _progress(self, url, downloaded, total=1000):
+        return DownloadProgressEvent(post_id="p1", url=url, bytes_downloaded=downloaded, total_bytes=total)
+    
+    def test_unsubscribed_type_is_not_dispatched(self):
+        """Test events nobody listens to never reach the thread pool."""
+        emitter = EventEmitter()
+        emitter._thread_pool = Mock()
+        emitter.subscribe('PostDiscoveredEvent', Mock(), weak=False)
+        
+        assert emitter.has_subscribers(PostDiscoveredEvent)
+        assert not emitter.has_subscribers(DownloadProgressEvent)
+        assert emitter.emit(DownloadProgressEvent()) is True
+        
+        emitter._thread_pool.submit.assert_not_called()
+        stats = emitter.get_statistics()
+        assert stats['events_skipped'] == 1
+        assert stats['history_size'] == 1
+    
+    def test_wildcard_and_unsubscribe_update_fast_path(self):
+        """Test the subscribed-type snapshot follows subscription changes."""
+        emitter = EventEmitter()
+        observer = Mock()
+        
+        emitter.subscribe('*', observer, weak=False)
+        assert emitter.has_subscribers('AnyEvent')
+        emitter.unsubscribe('*', observer)
+        assert not emitter.has_subscribers('AnyEvent')
+    
+    def test_progress_events_coalesced_per_download(self):
+        """Test only the latest progress update per download is delivered."""
+        emitter = EventEmitter(coalesce_interval=60)
+        observer = Mock()
+        emitter.subscribe('DownloadProgressEvent', observer, weak=False)
+        emitter.subscribe('DownloadCompletedEvent', observer, weak=False)
+        
+        for downloaded in (100, 200, 300):
+            emitter.emit(self._progress("https://a", downloaded))
+        emitter.emit(self._progress("https://b", 100))
+        emitter.emit(DownloadCompletedEvent(post_id="p1", url="https://a", success=True))
+        emitter._thread_pool.shutdown(wait=True)
+        
+        delivered = [(e.event_type, e.url, getattr(e, 'bytes_downloaded', None))
+                     for e in (c.args[0] for c in observer.call_args_list)]
+        # First update per download goes out at once; the completion
+        # releases the newest pending update for its download only
+        assert ('DownloadProgressEvent', 'https://a', 100) in delivered
+        assert ('DownloadProgressEvent', 'https://a', 300) in delivered
+        assert ('DownloadProgressEvent', 'https://a', 200) not in delivered
+        assert ('DownloadCompletedEvent', 'https://a', None) in delivered
+        assert len(delivered) == 4
+        assert emitter.get_statistics()['events_coalesced'] == 1
+    
+    def test_coalescing_state_released_per_download(self):
+        """Test finished or failed downloads leave no coalescing state behind."""
+        emitter = EventEmitter(coalesce_interval=60)
+        emitter._thread_pool = Mock()
+        emitter.subscribe('DownloadProgressEvent', Mock(), weak=False)
+        
+        for i in range(1000):
+            url = f"https://example.com/{i}"
+            emitter.emit(self._progress(url, 100, total=None))
+            emitter.emit(self._progress(url, 200, total=None))
+            emitter.emit(DownloadCompletedEvent(post_id="p1", url=url, success=i % 2 == 0,
+                                                error_message="" if i % 2 == 0 else "timeout"))
+        
+        assert emitter._last_delivered == {}
+        assert emitter._pending_coalesced == {}
+        # Each download's held-back update went out before its (unobserved) completion
+        assert emitter._thread_pool.submit.call_count == 2000
+    
+    def test_final_progress_event_not_held_back(self):
+        """Test a progress event at 100% is delivered immediately."""
+        emitter = EventEmitter(coalesce_interval=60)
+        observer = Mock()
+        emitter.subscribe('DownloadProgressEvent', observer, weak=False)
+        
+        emitter.emit(self._progress("https://a", 10))
+        emitter.emit(self._progress("https://a", 1000))
+        emitter._thread_pool.shutdown(wait=True)
+        
+        assert [c.args[0].bytes_downloaded for c in observer.call_args_list] == [10, 1000]
+    
+    def test_flush_delivers_pending_progress(self):
+        """Test flush() releases coalesced events synchronously."""
+        emitter = EventEmitter(coalesce_interval=60)
+        observer = Mock()
+        emitter.subscribe('DownloadProgressEvent', observer, weak=False)
+        
+        emitter.emit(self._progress("https://a", 10))
+        emitter.emit(self._progress("https://a", 20))
+        emitter._thread_pool.shutdown(wait=True)
+        assert observer.call_count == 1
+        
+        emitter.flush()
+        assert observer.call_args.args[0].bytes_downloaded == 20
+    
+    def test_coalescing_disabled(self):
+        """Test coalesce_interval=0 delivers every progress event."""
+        emitter = EventEmitter(coalesce_interval=0)
+        observer = Mock()
+        emitter.subscribe('DownloadProgressEvent', observer, weak=False)
+        
+        for downloaded in range(5):
+            emitter.emit(self._progress("https://a", downloaded))
+        emitter._thread_pool.shutdown(wait=True)
+        
+        assert observer.call_count == 5
+    
+    def test_batch_observer_receives_lists(self):
+        """Test batch observers get events in full batches plus a flushed remainder."""
+        emitter = EventEmitter()
+        batches = []
+        emitter.subscribe_batch('PostDiscoveredEvent', batches.append, max_batch_size=3, max_delay=60, weak=False)
+        
+        events = [PostDiscoveredEvent(post_count=i) for i in range(7)]
+        for event in events:
+            emitter.emit(event)
+        emitter._thread_pool.shutdown(wait=True)
+        assert [len(batch) for batch in batches] == [3, 3]
+        
+        emitter.flush()
+        assert [len(batch) for batch in batches] == [3, 3, 1]
+        assert [e for batch in batches for e in batch] == events
+        assert emitter.get_statistics()['batches_delivered'] == 3
+    
+    def test_batch_observer_uses_handle_batch(self):
+        """Test objects with handle_batch are called through it."""
+        emitter = EventEmitter()
+        
+        class Collector:
+            def __init__(self):
+                self.received = []
+            
+            def handle_batch(self, events):
+                self.received.append(list(events))
+        
+        collector = Collector()
+        emitter.subscribe_batch('*', collector, max_batch_size=2)
+        emitter.emit(BaseEvent())
+        emitter.emit(PostDiscoveredEvent())
+        emitter._thread_pool.shutdown(wait=True)
+        
+        assert len(collector.received) == 1
+        assert [e.event_type for e in collector.received[0]] == ['BaseEvent', 'PostDiscoveredEvent']
+        
+        assert emitter.unsubscribe_batch('*', collector)
+        assert not emitter.has_subscribers('BaseEvent')
+    
+    @pytest.mark.asyncio
+    async def test_emit_async_batches_and_coalescing(self):
+        """Test emit_async applies coalescing and batch delivery."""
+        emitter = EventEmitter(coalesce_interval=60)
+        batches = []
+        
+        async def batch_observer(events):
+            batches.append(events)
+        
+        emitter.subscribe_batch('DownloadProgressEvent', batch_observer, max_batch_size=2, weak=False)
+        for downloaded in (1, 2, 3):
+            await emitter.emit_async(self._progress("https://a", downloaded))
+        await emitter.emit_async(self._progress("https://b", 1))
+        assert [[e.url for e in batch] for batch in batches] == [["https://a", "https://b"]]
+        
+        await emitter.flush_async()
+        assert batches[-1][0].bytes_downloaded == 3
+    
+    @pytest.mark.performance
+    def test_unsubscribed_emit_throughput(self):
+        """Test emitting unsubscribed events stays cheap."""
+        emitter = EventEmitter(enable_history=False)
+        emitter.subscribe('PostDiscoveredEvent', Mock(), weak=False)
+        event = DownloadProgressEvent()
+        
+        start = time.perf_counter()
+        for _ in range(100000):
+            emitter.emit(event)
+        elapsed = time.perf_counter() - start
+        
+        assert elapsed < 1.0, f"100k unsubscribed emits took {elapsed:.2f}s"
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
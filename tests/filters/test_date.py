@@ -268,5 +268,65 @@ class TestDateFilter:
         assert filter_obj.validate_config() == []
 
 
+class TestDateFilterEpochFastPath:
+    """Test epoch-based comparisons and the sorted-input window search."""
+    
+    def create_posts(self, count: int) -> list:
+        """Create posts spaced 100 seconds apart in ascending order."""
+        return [
+            PostMetadata(
+                id=f"post_{i}",
+                title="Test Post",
+                url="https://example.com/test",
+                author="testuser",
+                subreddit="testsubreddit",
+                created_utc=float(i * 100)
+            )
+            for i in range(count)
+        ]
+    
+    def test_bounds_precomputed_as_epoch(self):
+        """Test configured bounds are stored as epoch floats."""
+        filter_obj = DateFilter({'date_from': '1970-01-01T00:10:00Z'})
+        
+        assert filter_obj._from_ts == 600.0
+        assert filter_obj.matches_timestamp(600.0) is True
+        assert filter_obj.matches_timestamp(599.0) is False
+    
+    def test_exclusive_and_inclusive_boundaries(self):
+        """Test boundary semantics are preserved by numeric comparisons."""
+        post = self.create_posts(7)[6]  # created_utc == 600
+        
+        assert DateFilter({'date_after': '1970-01-01T00:10:00Z'}).apply(post).passed is False
+        assert DateFilter({'date_from': '1970-01-01T00:10:00Z'}).apply(post).passed is True
+        assert DateFilter({'date_before': '1970-01-01T00:10:00Z'}).apply(post).passed is False
+        assert DateFilter({'date_to': '1970-01-01T00:10:00Z'}).apply(post).passed is True
+    
+    @pytest.mark.parametrize("config", [
+        {'date_after': '1970-01-01T00:10:00Z'},
+        {'date_before': '1970-01-01T00:10:00Z'},
+        {'date_from': '1970-01-01T00:10:00Z', 'date_to': '1970-01-01T00:20:00Z'},
+        {'date_after': '1970-01-01T00:05:00Z', 'date_before': '1970-01-01T00:20:00Z'},
+    ])
+    def test_select_sorted_matches_apply(self, config):
+        """Test the binary-searched window equals per-post evaluation."""
+        posts = self.create_posts(100)
+        filter_obj = DateFilter(config)
+        expected = [p.id for p in posts if filter_obj.apply(p).passed]
+        
+        start, end = filter_obj.select_sorted(posts)
+        assert [p.id for p in posts[start:end]] == expected
+        
+        newest_first = list(reversed(posts))
+        start, end = filter_obj.select_sorted(newest_first, descending=True)
+        assert [p.id for p in newest_first[start:end]] == list(reversed(expected))
+    
+    def test_select_sorted_without_bounds(self):
+        """Test an unconfigured filter selects the whole input."""
+        posts = self.create_posts(10)
+        
+        assert DateFilter().select_sorted(posts) == (0, 10)
+
+
 if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
+    pytest.main([__file__])
@@ -0,0 +1,149 @@
+"""
+Tests for the PluginIndex discovery cache
+
+Tests fingerprint validation, persistence, and reuse of plugin info and
+security scan results for unchanged plugin files.
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from redditdl.core.plugins.index import INDEX_VERSION, PluginIndex
+from redditdl.core.plugins.manager import PluginManager
+from redditdl.core.security.plugin_security import PluginSecurityScanner
+
+
+PLUGIN_SOURCE = '''"""Example plugin."""
+__plugin_info__ = {"name": "example", "version": "2.0.0"}
+'''
+
+
+@pytest.fixture
+def plugin_file(tmp_path):
+    """Write a plugin file with an mtime safely in the past."""
+    path = tmp_path / "plugins" / "example.py"
+    path.parent.mkdir()
+    path.write_text(PLUGIN_SOURCE)
+    past = time.time_ns() - 10_000_000_000
+    os.utime(path, ns=(past, past))
+    return path
+
+
+def _put(index, path, kind, value):
+    return index.put(path, kind, value, index.fingerprint(path))
+
+
+class TestPluginIndex:
+    """Test fingerprinting and persistence."""
+    
+    def test_round_trip_and_persistence(self, plugin_file, tmp_path):
+        """Test cached values survive a save and reload."""
+        index_path = tmp_path / "cache" / "plugin_index.json"
+        index = PluginIndex(index_path)
+        assert index.get(plugin_file, "info") is None
+        assert _put(index, plugin_file, "info", {"name": "example"})
+        index.save()
+        
+        reloaded = PluginIndex(index_path)
+        
+        assert reloaded.get(plugin_file, "info") == {"name": "example"}
+        assert reloaded.get(plugin_file, "other") is None
+        assert json.loads(index_path.read_text())["version"] == INDEX_VERSION
+    
+    def test_content_change_invalidates(self, plugin_file):
+        """Test a same-size edit with a preserved mtime is detected by hash."""
+        index = PluginIndex()
+        _put(index, plugin_file, "info", {"name": "example"})
+        stat = plugin_file.stat()
+        
+        plugin_file.write_text(PLUGIN_SOURCE.replace("2.0.0", "3.0.0"))
+        os.utime(plugin_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        
+        # Stat still matches, so force the racy path by re-recording near the mtime
+        index._entries[str(plugin_file.resolve())]["recorded_ns"] = stat.st_mtime_ns
+        assert index.get(plugin_file, "info") is None
+        
+        plugin_file.write_text(PLUGIN_SOURCE + "# more\n")
+        _put(index, plugin_file, "info", {"name": "v4"})
+        plugin_file.write_text(PLUGIN_SOURCE + "# changed size\n")
+        assert index.get(plugin_file, "info") is None
+    
+    def test_touch_without_change_is_a_hit(self, plugin_file):
+        """Test a new mtime with unchanged content still hits."""
+        index = PluginIndex()
+        _put(index, plugin_file, "info", {"name": "example"})
+        plugin_file.touch()
+        
+        assert index.get(plugin_file, "info") == {"name": "example"}
+    
+    def test_non_plain_values_and_deleted_files(self, plugin_file, tmp_path):
+        """Test values that are not JSON data are skipped and deleted files are pruned."""
+        index = PluginIndex(tmp_path / "plugin_index.json")
+        
+        assert not _put(index, plugin_file, "info", {"when": time})
+        assert _put(index, plugin_file, "info", {"ok": True})
+        plugin_file.unlink()
+        index.save()
+        
+        assert len(PluginIndex(tmp_path / "plugin_index.json")) == 0
+    
+    def test_corrupt_index_starts_empty(self, tmp_path):
+        """Test an unreadable index file is ignored."""
+        index_path = tmp_path / "plugin_index.json"
+        index_path.write_text("{not json")
+        
+        assert len(PluginIndex(index_path)) == 0
+
+
+class TestDiscoveryCache:
+    """Test PluginManager and PluginSecurityScanner reuse cached results."""
+    
+    def test_discovery_skips_module_execution(self, plugin_file, tmp_path, monkeypatch):
+        """Test a second manager reads plugin info from the index."""
+        index_path = tmp_path / "plugin_index.json"
+        first = PluginManager(plugin_dirs=[str(plugin_file.parent)], index_path=index_path)
+        discovered = first._discover_from_directory(str(plugin_file.parent))
+        first.index.save()
+        
+        monkeypatch.setattr("importlib.util.spec_from_file_location",
+                            lambda *args, **kwargs: pytest.fail("plugin module executed"))
+        second = PluginManager(plugin_dirs=[str(plugin_file.parent)], index_path=index_path)
+        
+        assert second.discover_plugins()[:1] == discovered
+        assert discovered[0]["version"] == "2.0.0"
+        assert second.index.hits == 1
+    
+    def test_index_persists_between_managers(self, plugin_file, tmp_path, monkeypatch):
+        """Test managers share a persistent index of plugin info and scan verdicts."""
+        index_path = tmp_path / "session" / "plugin_index.json"
+        first = PluginManager(plugin_dirs=[str(plugin_file.parent)], index_path=index_path)
+        assert first.security_scanner.scan_plugin_file(plugin_file)["allowed"]
+        assert first.load_all_plugins() == 1
+        assert index_path.exists()
+        
+        monkeypatch.setattr(PluginManager, "_read_static_plugin_info",
+                            lambda *args, **kwargs: pytest.fail("plugin info re-read"))
+        monkeypatch.setattr(PluginSecurityScanner, "_analyze_ast",
+                            lambda *args, **kwargs: pytest.fail("plugin re-scanned"))
+        second = PluginManager(plugin_dirs=[str(plugin_file.parent)], index_path=index_path)
+        
+        assert second.security_scanner.index is second.index
+        assert second.load_all_plugins() == 1
+        assert second.security_scanner.scan_plugin_file(plugin_file)["allowed"]
+        assert second.index.hits == 2
+    
+    def test_scan_results_are_cached_per_rule_set(self, plugin_file, monkeypatch):
+        """Test unchanged files reuse their verdict until the scan rules change."""
+        scanner = PluginSecurityScanner(index=PluginIndex())
+        first = scanner.scan_plugin_file(plugin_file)
+        
+        monkeypatch.setattr("ast.parse", lambda *args, **kwargs: pytest.fail("plugin re-parsed"))
+        assert scanner.scan_plugin_file(plugin_file) == first
+        
+        monkeypatch.undo()
+        scanner.allowed_modules.add("sqlite3")
+        assert scanner.scan_plugin_file(plugin_file) == first
+        assert scanner.index.misses == 2
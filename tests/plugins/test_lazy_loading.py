@@ -0,0 +1,248 @@
+"""
+Tests for lazy plugin loading
+
+Tests that plugins declaring "provides" metadata are registered as stubs
+with the application registries and imported only on first use.
+"""
+
+import pytest
+
+import redditdl.content_handlers.base as content_handlers_base
+import redditdl.exporters.base as exporters_base
+from redditdl.content_handlers.base import ContentHandlerRegistry
+from redditdl.core.pipeline.interfaces import PipelineContext
+from redditdl.core.plugins.manager import PluginManager
+from redditdl.exporters.base import ExporterRegistry
+from redditdl.exporters.json import JsonExporter
+from redditdl.filters.factory import FilterFactory
+from redditdl.pipeline.stages.processing import ProcessingStage
+from redditdl.scrapers import PostMetadata
+from redditdl.targets.resolver import TargetInfo, TargetType
+from redditdl.targets.scrapers import ScraperFactory
+from redditdl.targets.base_scraper import ScrapingConfig
+
+
+PLUGIN_SOURCE = '''"""Lazy test plugin."""
+from redditdl.content_handlers.base import BaseContentHandler, HandlerResult
+from redditdl.exporters.base import BaseExporter, ExportResult, FormatInfo
+from redditdl.filters.base import Filter, FilterResult
+from redditdl.targets.base_scraper import BaseScraper
+
+__plugin_info__ = {
+    "name": "lazy_plugin",
+    "provides": {
+        "content_handlers": [{"class": "PdfHandler", "content_types": ["pdf"]}],
+        "filters": [{"class": "FlairFilter", "type": "flair"}],
+        "exporters": [{"class": "XmlExporter", "format": "xml", "aliases": ["x"]}],
+        "scrapers": [{"class": "UrlScraper", "sources": ["url"]}],
+    },
+}
+
+
+class PdfHandler(BaseContentHandler):
+    def __init__(self):
+        super().__init__("pdf", priority=10)
+
+    @property
+    def supported_content_types(self):
+        return {"pdf"}
+
+    def can_handle(self, post, content_type):
+        return content_type == "pdf"
+
+    async def process(self, post, output_dir, config):
+        return HandlerResult(success=True)
+
+
+class FlairFilter(Filter):
+    name = "flair"
+    description = "Match post flair"
+
+    def apply(self, post):
+        return FilterResult(passed=True)
+
+
+class XmlExporter(BaseExporter):
+    def export(self, data, output_path, config):
+        return ExportResult(success=True)
+
+    def _create_format_info(self):
+        return FormatInfo(name="xml", extension=".xml", description="XML")
+
+    def _create_config_schema(self):
+        return {}
+
+
+class UrlScraper(BaseScraper):
+    def can_handle_target(self, target_info):
+        return True
+
+    def fetch_posts(self, target_info):
+        return []
+
+    def validate_authentication(self):
+        return True
+
+    @property
+    def scraper_type(self):
+        return "url"
+
+    @property
+    def requires_authentication(self):
+        return False
+'''
+
+
+@pytest.fixture
+def registries(monkeypatch):
+    """Replace the global registries with empty ones."""
+    handlers = ContentHandlerRegistry()
+    exporters = ExporterRegistry()
+    monkeypatch.setattr(content_handlers_base, "handler_registry", handlers)
+    monkeypatch.setattr(exporters_base, "registry", exporters)
+    monkeypatch.setattr(FilterFactory, "FILTER_REGISTRY", dict(FilterFactory.FILTER_REGISTRY))
+    monkeypatch.setattr(FilterFactory, "LAZY_FILTERS", {})
+    monkeypatch.setattr(ScraperFactory, "_plugin_scrapers", [])
+    return handlers, exporters
+
+
+@pytest.fixture
+def manager(tmp_path, registries):
+    """Plugin manager with the lazy test plugin registered as stubs."""
+    (tmp_path / "lazy_plugin.py").write_text(PLUGIN_SOURCE)
+    manager = PluginManager(plugin_dirs=[str(tmp_path)])
+    manager._sandbox_enabled = False
+    assert manager.load_all_plugins(lazy=True) == 1
+    return manager
+
+
+class TestLazyRegistration:
+    """Test stubs are registered without importing the plugin."""
+    
+    def test_discovery_reads_metadata_without_import(self, manager):
+        """Test discovery and lazy registration leave the module unimported."""
+        assert manager._plugin_modules == {}
+        status = manager.get_plugin_status()["lazy_plugin"]
+        assert status["loaded"] is False
+        assert status["exporters"] == 1
+    
+    def test_exporter_loads_on_first_request(self, manager, registries):
+        """Test listing formats does not import and get_exporter does."""
+        _, exporters = registries
+        assert "xml" in exporters.list_formats()
+        assert exporters.is_format_supported("x")
+        assert manager._plugin_modules == {}
+        
+        exporter = exporters.get_exporter("x")
+        
+        assert exporter.get_format_info().name == "xml"
+        assert "lazy_plugin" in manager._plugin_modules
+        assert exporters.get_exporter("xml") is exporter
+    
+    def test_content_handler_loads_for_declared_type(self, manager, registries):
+        """Test handlers are created only when a post of a declared type needs one."""
+        handlers, _ = registries
+        post = PostMetadata.from_raw({"id": "abc", "url": "https://example.com/doc.pdf"})
+        
+        assert handlers.get_handler_for_post(post, "image") is None
+        assert manager._plugin_modules == {}
+        
+        handler = handlers.get_handler_for_post(post, "pdf")
+        assert handler.name == "pdf"
+        assert "lazy_plugin" in manager._plugin_modules
+    
+    def test_filter_and_scraper_factories(self, manager):
+        """Test the filter and scraper factories import the plugin on demand."""
+        assert FilterFactory.create_filter("flair").name == "flair"
+        assert "lazy_plugin" in manager._plugin_modules
+        
+        target = TargetInfo(TargetType.URL, "https://example.com", "https://example.com")
+        scraper = ScraperFactory.create_scraper(ScrapingConfig(), target)
+        assert scraper.scraper_type == "url"
+    
+    def test_broken_plugin_is_reported_once(self, tmp_path, registries):
+        """Test a plugin that fails to import is reported as a missing component."""
+        (tmp_path / "lazy_plugin.py").write_text(PLUGIN_SOURCE + "\nraise RuntimeError('broken')\n")
+        manager = PluginManager(plugin_dirs=[str(tmp_path)])
+        manager._sandbox_enabled = False
+        manager.load_all_plugins(lazy=True)
+        _, exporters = registries
+        
+        assert exporters.get_exporter("xml") is None
+        with pytest.raises(ValueError, match="Failed to load filter type 'flair'"):
+            FilterFactory.create_filter("flair")
+        assert manager._plugin_modules == {}
+    
+    def test_available_filters_does_not_import(self, manager):
+        """Test listing filters reports plugin filters without importing them."""
+        available = FilterFactory.get_available_filters()
+        
+        assert available["flair"]["name"] == "flair"
+        assert "flair" in FilterFactory.LAZY_FILTERS
+        assert manager._plugin_modules == {}
+    
+    @pytest.mark.asyncio
+    async def test_processing_stage_uses_given_manager(self, manager, registries):
+        """Test processing stages reuse the startup manager instead of loading plugins again."""
+        handlers, _ = registries
+        stages = [ProcessingStage(plugin_manager=manager) for _ in range(2)]
+        
+        for stage in stages:
+            stage._registry = handlers
+            await stage._load_plugin_handlers(PipelineContext())
+        
+        assert [stub.name for stub in handlers._lazy_handlers] == ["lazy_plugin.PdfHandler"]
+        assert all(stage._plugin_manager is manager for stage in stages)
+        assert manager._plugin_modules == {}
+    
+    def test_taken_names_are_not_overwritten(self, tmp_path, registries):
+        """Test a plugin reusing a built-in name neither replaces nor removes it."""
+        source = PLUGIN_SOURCE.replace('"type": "flair"', '"type": "score"')
+        source = source.replace('"format": "xml", "aliases": ["x"]', '"format": "json", "aliases": ["x"]')
+        (tmp_path / "lazy_plugin.py").write_text(source)
+        _, exporters = registries
+        exporters.register_exporter(JsonExporter)
+        score_filter = FilterFactory.FILTER_REGISTRY["score"]
+        manager = PluginManager(plugin_dirs=[str(tmp_path)])
+        manager._sandbox_enabled = False
+        manager.load_all_plugins(lazy=True)
+        
+        assert "score" not in FilterFactory.LAZY_FILTERS
+        assert not exporters.is_format_supported("x")
+        
+        manager.cleanup()
+        
+        assert FilterFactory.FILTER_REGISTRY["score"] is score_filter
+        assert exporters.is_format_supported("json")
+
+
+class TestLazyCleanup:
+    """Test cleanup removes stubs from the application registries."""
+    
+    def _assert_unregistered(self, registries):
+        handlers, exporters = registries
+        assert handlers._lazy_handlers == []
+        assert handlers.list_all_handlers() == []
+        assert not exporters.is_format_supported("xml")
+        assert not exporters.is_format_supported("x")
+        assert "flair" not in FilterFactory.LAZY_FILTERS
+        assert "flair" not in FilterFactory.FILTER_REGISTRY
+        assert ScraperFactory._plugin_scrapers == []
+    
+    def test_cleanup_removes_deferred_stubs(self, manager, registries):
+        """Test stubs of a plugin that was never imported are removed."""
+        manager.cleanup()
+        
+        self._assert_unregistered(registries)
+    
+    def test_cleanup_removes_loaded_components(self, manager, registries):
+        """Test components created from stubs are removed with their plugin."""
+        handlers, exporters = registries
+        post = PostMetadata.from_raw({"id": "abc", "url": "https://example.com/doc.pdf"})
+        assert handlers.get_handler_for_post(post, "pdf") is not None
+        assert exporters.get_exporter("xml") is not None
+        FilterFactory.create_filter("flair")
+        
+        manager.cleanup()
+        
+        self._assert_unregistered(registries)
@@ -10,9 +10,13 @@ import tempfile
 import shutil
 from pathlib import Path
 from PIL import Image
+from PIL.JpegImagePlugin import JpegImageFile
 import io
+from unittest.mock import patch
 
-from redditdl.processing.image_processor import ImageProcessor
+from redditdl.processing.image_processor import (
+    ImageProcessor, ImageOutput, render_image_outputs
+)
 from redditdl.processing.exceptions import ImageProcessingError, UnsupportedFormatError
 
 
@@ -319,4 +323,68 @@ class TestImageProcessor:
         assert 'jpeg' in ImageProcessor.EXIF_FORMATS
         assert 'jpg' in ImageProcessor.EXIF_FORMATS
         assert 'tiff' in ImageProcessor.EXIF_FORMATS
-        assert 'png' not in ImageProcessor.EXIF_FORMATS  # PNG doesn't support EXIF
\ No newline at end of file
+        assert 'png' not in ImageProcessor.EXIF_FORMATS  # PNG doesn't support EXIF
+    
+    def test_render_outputs_single_decode(self, processor, temp_dir):
+        """Test all outputs are rendered from one decode of the source."""
+        source = temp_dir / "large.jpg"
+        Image.new('RGB', (1600, 1200), color='red').save(source, 'JPEG', quality=95)
+        outputs = [
+            ImageOutput(temp_dir / "large.webp", format='webp', quality=80),
+            ImageOutput(temp_dir / "large_resized.jpg", max_dimension=800),
+            ImageOutput(temp_dir / "large_thumb.jpg", max_dimension=128, auto_orient=True),
+        ]
+        
+        with patch('redditdl.processing.image_processor.Image.open', wraps=Image.open) as mock_open:
+            written = processor.render_outputs(source, outputs)
+        
+        assert mock_open.call_count == 1
+        assert written == [o.path for o in outputs]
+        with Image.open(outputs[0].path) as img:
+            assert img.format == 'WEBP'
+            assert img.size == (1600, 1200)
+        with Image.open(outputs[1].path) as img:
+            assert img.size == (800, 600)
+        with Image.open(outputs[2].path) as img:
+            assert img.size == (128, 96)
+    
+    def test_render_outputs_uses_jpeg_draft_for_downscales(self, processor, temp_dir):
+        """Test JPEG sources are decoded at reduced scale when only downscales are requested."""
+        source = temp_dir / "large.jpg"
+        Image.new('RGB', (2000, 1000), color='blue').save(source, 'JPEG')
+        outputs = [
+            ImageOutput(temp_dir / "resized.jpg", max_dimension=500),
+            ImageOutput(temp_dir / "thumb.png", max_dimension=100),
+        ]
+        
+        with patch.object(JpegImageFile, 'draft', autospec=True, side_effect=JpegImageFile.draft) as mock_draft:
+            processor.render_outputs(source, outputs)
+        
+        # Asked for the largest output size; the decoder may scale down to it
+        assert mock_draft.call_count == 1
+        assert mock_draft.call_args[0][2] == (500, 250)
+        with Image.open(outputs[0].path) as img:
+            assert img.size == (500, 250)
+        with Image.open(outputs[1].path) as img:
+            assert img.format == 'PNG'
+            assert img.size == (100, 50)
+        
+        # A full-resolution output disables the reduced decode
+        with patch.object(JpegImageFile, 'draft', autospec=True) as mock_draft:
+            processor.render_outputs(source, [ImageOutput(temp_dir / "copy.jpg", quality=70)] + outputs)
+        mock_draft.assert_not_called()
+    
+    def test_render_outputs_flattens_transparency_for_jpeg(self, processor, sample_png_image, temp_dir):
+        """Test RGBA sources are prepared for formats without alpha."""
+        written = render_image_outputs({}, sample_png_image, [
+            ImageOutput(temp_dir / "flat.jpg", max_dimension=200),
+        ])
+        
+        assert written['error'] is None
+        with Image.open(written['outputs'][0]) as img:
+            assert img.mode == 'RGB'
+            assert img.size == (200, 150)
+        
+        failed = render_image_outputs({}, temp_dir / "missing.jpg", [ImageOutput(temp_dir / "x.jpg")])
+        assert failed['outputs'] == []
+        assert failed['error']
@@ -14,7 +14,7 @@ import shutil
 from pathlib import Path
 from unittest.mock import patch, Mock, MagicMock
 
-from redditdl.processing.video_processor import VideoProcessor
+from redditdl.processing.video_processor import VideoProcessor, parse_probe
 from redditdl.processing.exceptions import VideoProcessingError, FFmpegNotFoundError, UnsupportedFormatError
 
 
@@ -242,9 +242,9 @@ class TestVideoProcessor:
         # Verify filter was applied for sizing
         mock_input.filter.assert_called_once_with('scale', 256, 256)
     
-    @patch('redditdl.processing.video_processor.ffmpeg')
-    def test_get_video_info(self, mock_ffmpeg, processor, sample_video_path):
-        """Test getting video information."""
+    @patch('redditdl.processing.video_runner.get_video_runner')
+    def test_get_video_info(self, mock_get_runner, processor, sample_video_path):
+        """Test getting video information through the shared runner's probe cache."""
         # Mock ffprobe response
         mock_probe_data = {
             'format': {
@@ -272,10 +272,13 @@ class TestVideoProcessor:
             ]
         }
         
-        mock_ffmpeg.probe.return_value = mock_probe_data
+        mock_get_runner.return_value.probe_sync.side_effect = lambda path: parse_probe(mock_probe_data, path)
         
         info = processor.get_video_info(sample_video_path)
         
+        mock_get_runner.assert_called_once_with(processor.config)
+        mock_get_runner.return_value.probe_sync.assert_called_once_with(sample_video_path)
+        
         assert info['format'] == 'mov,mp4,m4a,3gp,3g2,mj2'
         assert info['duration'] == 10.5
         assert info['width'] == 1920
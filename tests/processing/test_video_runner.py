@@ -0,0 +1,239 @@
+"""
+Tests for VideoJobRunner.
+
+Runs the real asyncio subprocess code against small stand-in ffmpeg/ffprobe
+scripts, so no FFmpeg installation is needed.
+"""
+
+import json
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+import redditdl.content_handlers.media as media_module
+from redditdl.content_handlers.media import MediaContentHandler
+from redditdl.processing.video_processor import VideoProcessor
+from redditdl.processing.video_runner import VideoJobRunner, VideoOutput, get_video_runner
+from redditdl.processing.exceptions import VideoProcessingError, FFmpegNotFoundError
+
+
+FAKE_FFMPEG = '''
+import os, sys, time
+log_dir = os.environ['FAKE_FFMPEG_LOG']
+marker = os.path.join(log_dir, 'running-%d' % os.getpid())
+open(marker, 'w').close()
+running = len([n for n in os.listdir(log_dir) if n.startswith('running-')])
+with open(os.path.join(log_dir, 'calls.jsonl'), 'a') as f:
+    f.write(json.dumps({'args': sys.argv[1:], 'running': running}) + '\\n')
+time.sleep(0.2)
+os.remove(marker)
+if os.environ.get('FAKE_FFMPEG_FAIL'):
+    sys.stderr.write('Invalid data found when processing input')
+    sys.exit(1)
+args = sys.argv[1:]
+input_path = args[args.index('-i') + 1]
+skip = os.environ.get('FAKE_FFMPEG_SKIP')
+for arg in args:
+    extension = os.path.splitext(arg)[1]
+    if arg != input_path and extension in ('.mp4', '.webm', '.jpg') and extension != skip:
+        with open(arg, 'wb') as out:
+            out.write(b'data')
+'''
+
+FAKE_FFPROBE = '''
+import os, sys
+with open(os.path.join(os.environ['FAKE_FFMPEG_LOG'], 'probes.log'), 'a') as f:
+    f.write(sys.argv[-1] + '\\n')
+print(json.dumps({
+    'format': {'format_name': 'mov,mp4', 'duration': '12.5', 'size': '2048', 'bit_rate': '1000'},
+    'streams': [
+        {'codec_type': 'video', 'codec_name': 'h264', 'width': 1920, 'height': 1080,
+         'r_frame_rate': '30000/1001', 'bit_rate': '900'},
+        {'codec_type': 'audio', 'codec_name': 'aac', 'sample_rate': '44100', 'channels': 2}
+    ]
+}))
+'''
+
+
+def _write_script(path: Path, body: str) -> str:
+    path.write_text(f"#!{sys.executable}\nimport json\n" + textwrap.dedent(body))
+    path.chmod(0o755)
+    return str(path)
+
+
+class TestVideoJobRunner:
+    """Test cases for VideoJobRunner functionality."""
+    
+    @pytest.fixture
+    def fake_tools(self, tmp_path, monkeypatch):
+        """Create stand-in ffmpeg/ffprobe executables."""
+        log_dir = tmp_path / 'log'
+        log_dir.mkdir()
+        monkeypatch.setenv('FAKE_FFMPEG_LOG', str(log_dir))
+        ffmpeg = _write_script(tmp_path / 'ffmpeg', FAKE_FFMPEG)
+        ffprobe = _write_script(tmp_path / 'ffprobe', FAKE_FFPROBE)
+        return ffmpeg, ffprobe, log_dir
+    
+    @pytest.fixture
+    def sample_video(self, tmp_path):
+        """Create a fake input video."""
+        video_path = tmp_path / 'clip.mp4'
+        video_path.write_bytes(b'fake video content')
+        return video_path
+    
+    def _calls(self, log_dir):
+        with open(log_dir / 'calls.jsonl') as f:
+            return [json.loads(line) for line in f]
+    
+    @pytest.mark.asyncio
+    async def test_all_outputs_in_one_invocation(self, fake_tools, sample_video, tmp_path):
+        """Test transcode, resize and thumbnail share a single ffmpeg run."""
+        ffmpeg, ffprobe, log_dir = fake_tools
+        runner = VideoJobRunner(max_concurrent=1, ffmpeg_path=ffmpeg, ffprobe_path=ffprobe)
+        outputs = [
+            VideoOutput(tmp_path / 'clip.webm', format='webm', quality_crf=30),
+            VideoOutput(tmp_path / 'clip_resized.mp4', max_resolution='720p'),
+            VideoOutput(tmp_path / 'clip_thumb.jpg', kind='thumbnail', timestamp='00:00:02', max_resolution=256),
+        ]
+        
+        written = await runner.process(sample_video, outputs)
+        
+        assert written == [o.path for o in outputs]
+        calls = self._calls(log_dir)
+        assert len(calls) == 1
+        args = calls[0]['args']
+        assert args.count('-i') == 1
+        assert args[-1] == str(tmp_path / 'clip_thumb.jpg')
+        assert ['-c:v', 'libvpx-vp9', '-crf', '30'] == args[args.index('-c:v'):args.index('-c:v') + 4]
+        assert "scale=w='min(1280,iw)':h='min(720,ih)'" in ' '.join(args)
+        assert ['-ss', '00:00:02', '-frames:v', '1'] == args[args.index('-ss'):args.index('-ss') + 4]
+    
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self, fake_tools, tmp_path):
+        """Test no more than max_concurrent ffmpeg processes run at once."""
+        ffmpeg, ffprobe, log_dir = fake_tools
+        runner = VideoJobRunner(max_concurrent=2, ffmpeg_path=ffmpeg, ffprobe_path=ffprobe)
+        jobs = []
+        for i in range(5):
+            video = tmp_path / f'in_{i}.mp4'
+            video.write_bytes(b'video')
+            jobs.append((video, [VideoOutput(tmp_path / f'in_{i}_thumb.jpg', kind='thumbnail')]))
+        
+        results = await runner.process_many(jobs)
+        
+        assert all(isinstance(r, list) for r in results)
+        calls = self._calls(log_dir)
+        assert len(calls) == 5
+        assert max(call['running'] for call in calls) <= 2
+    
+    @pytest.mark.asyncio
+    async def test_failure_cleans_up_outputs(self, fake_tools, sample_video, tmp_path, monkeypatch):
+        """Test ffmpeg errors surface stderr and remove partial outputs."""
+        ffmpeg, ffprobe, _ = fake_tools
+        monkeypatch.setenv('FAKE_FFMPEG_FAIL', '1')
+        runner = VideoJobRunner(ffmpeg_path=ffmpeg, ffprobe_path=ffprobe)
+        partial = tmp_path / 'clip_resized.mp4'
+        partial.write_bytes(b'partial')
+        
+        with pytest.raises(VideoProcessingError, match='Invalid data found'):
+            await runner.process(sample_video, [VideoOutput(partial, max_resolution='480p')])
+        assert not partial.exists()
+    
+    @pytest.mark.asyncio
+    async def test_missing_output_keeps_others(self, fake_tools, sample_video, tmp_path, monkeypatch):
+        """Test a thumbnail ffmpeg skips (clip shorter than its timestamp) spares the other outputs."""
+        ffmpeg, ffprobe, _ = fake_tools
+        monkeypatch.setenv('FAKE_FFMPEG_SKIP', '.jpg')
+        runner = VideoJobRunner(ffmpeg_path=ffmpeg, ffprobe_path=ffprobe)
+        resized = VideoOutput(tmp_path / 'clip_resized.mp4', max_resolution='480p')
+        thumb = VideoOutput(tmp_path / 'clip_thumb.jpg', kind='thumbnail')
+        thumb.path.write_bytes(b'')
+        
+        written = await runner.process(sample_video, [resized, thumb])
+        
+        assert written == [resized.path]
+        assert resized.path.read_bytes() == b'data'
+        assert not thumb.path.exists()
+        
+        with pytest.raises(VideoProcessingError, match='did not produce'):
+            await runner.process(sample_video, [thumb])
+    
+    @pytest.mark.asyncio
+    async def test_probe_cached_by_content(self, fake_tools, sample_video, tmp_path):
+        """Test probe results are reused for identical file content."""
+        ffmpeg, ffprobe, log_dir = fake_tools
+        runner = VideoJobRunner(ffmpeg_path=ffmpeg, ffprobe_path=ffprobe)
+        
+        info = await runner.probe(sample_video)
+        assert info['width'] == 1920
+        assert info['fps'] == pytest.approx(29.97, rel=1e-3)
+        assert info['audio_codec'] == 'aac'
+        
+        copy = tmp_path / 'copy.mp4'
+        copy.write_bytes(sample_video.read_bytes())
+        assert (await runner.probe(copy))['filename'] == 'copy.mp4'
+        assert runner.probe_cache_hits == 1
+        
+        sample_video.write_bytes(b'different content')
+        await runner.probe(sample_video)
+        assert (log_dir / 'probes.log').read_text().count('\n') == 2
+    
+    @pytest.mark.asyncio
+    async def test_probe_sync_shares_cache(self, fake_tools, sample_video, monkeypatch):
+        """Test get_video_info probes through the runner and shares its cache with probe."""
+        ffmpeg, ffprobe, log_dir = fake_tools
+        runner = VideoJobRunner(ffmpeg_path=ffmpeg, ffprobe_path=ffprobe)
+        monkeypatch.setattr('redditdl.processing.video_runner.get_video_runner', lambda config=None: runner)
+        monkeypatch.setattr(VideoProcessor, '_check_ffmpeg_available', lambda self: True)
+        
+        info = VideoProcessor().get_video_info(sample_video)
+        assert (info['width'], info['height']) == (1920, 1080)
+        assert (await runner.probe(sample_video))['duration'] == 12.5
+        
+        assert runner.probe_cache_hits == 1
+        assert (log_dir / 'probes.log').read_text().count('\n') == 1
+    
+    @pytest.mark.asyncio
+    async def test_media_handler_plans_from_probe(self, fake_tools, sample_video, monkeypatch):
+        """Test the media handler skips resizing videos within the limit and clamps thumbnails."""
+        ffmpeg, ffprobe, log_dir = fake_tools
+        runner = VideoJobRunner(ffmpeg_path=ffmpeg, ffprobe_path=ffprobe)
+        monkeypatch.setattr(media_module, 'get_video_runner', lambda config=None: runner)
+        config = {'max_video_resolution': '1080p', 'generate_thumbnails': True,
+                  'thumbnail_timestamp': '00:00:30'}
+        
+        results = await MediaContentHandler()._process_video(sample_video, config)
+        
+        assert results['operations'] == ['video_thumbnail_extraction']
+        args = self._calls(log_dir)[0]['args']
+        assert args[args.index('-ss') + 1] == '6.250'
+        assert not any(arg.endswith('_resized.mp4') for arg in args)
+        
+        await MediaContentHandler()._process_video(sample_video, dict(config, max_video_resolution='720p'))
+        assert runner.probe_cache_hits == 1
+        assert any(arg.endswith('_resized.mp4') for arg in self._calls(log_dir)[1]['args'])
+    
+    @pytest.mark.asyncio
+    async def test_missing_ffmpeg(self, sample_video, tmp_path):
+        """Test a clear error when ffmpeg is not installed."""
+        runner = VideoJobRunner(ffmpeg_path=str(tmp_path / 'no-ffmpeg'))
+        
+        with pytest.raises(FFmpegNotFoundError):
+            await runner.process(sample_video, [VideoOutput(tmp_path / 'out.mp4')])
+    
+    def test_square_thumbnail_box(self, tmp_path):
+        """Test an int thumbnail size fits the frame in a square box."""
+        runner = VideoJobRunner(ffmpeg_path='ffmpeg')
+        args = runner._output_args(VideoOutput(tmp_path / 'thumb.jpg', kind='thumbnail', max_resolution=256))
+        assert "scale=w='min(256,iw)':h='min(256,ih)'" in ' '.join(args)
+    
+    def test_get_video_runner_per_config(self):
+        """Test the shared runner is reused per configuration, not frozen by the first call."""
+        default = get_video_runner({})
+        assert get_video_runner(None) is default
+        tuned = get_video_runner({'video_jobs': 3, 'video_quality_crf': 28})
+        assert tuned is not default
+        assert (tuned.max_concurrent, tuned.default_crf) == (3, 28)
+        assert get_video_runner({'video_jobs': 3, 'video_quality_crf': 28}) is tuned
@@ -0,0 +1,150 @@
+"""
+Tests for ArchiveBloomFilter
+
+Tests the persistent archive Bloom filter and the StateManager
+archived-post checks built on top of it.
+"""
+
+import json
+import os
+import pytest
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+from redditdl.core.state.bloom import ArchiveBloomFilter
+from redditdl.core.state.manager import StateManager
+
+
+class TestArchiveBloomFilter:
+    """Test ArchiveBloomFilter functionality."""
+    
+    @pytest.fixture
+    def filter_path(self):
+        """Create temporary directory for filter files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield Path(temp_dir) / "archive.bloom"
+    
+    def test_no_false_negatives(self, filter_path):
+        """Test every added item is reported as present."""
+        with ArchiveBloomFilter(filter_path, capacity=1000) as archive_filter:
+            ids = [f"post_{i}" for i in range(1000)]
+            archive_filter.update(ids)
+            
+            assert all(post_id in archive_filter for post_id in ids)
+            assert len(archive_filter) == 1000
+    
+    def test_false_positive_rate(self, filter_path):
+        """Test unseen items are rejected at roughly the configured rate."""
+        with ArchiveBloomFilter(filter_path, capacity=5000, error_rate=0.01) as archive_filter:
+            archive_filter.update(f"seen_{i}" for i in range(5000))
+            
+            false_positives = sum(1 for i in range(5000) if f"unseen_{i}" in archive_filter)
+            assert false_positives < 5000 * 0.03
+    
+    def test_persistence(self, filter_path):
+        """Test the filter reopens from disk with its contents."""
+        with ArchiveBloomFilter(filter_path, capacity=100) as archive_filter:
+            archive_filter.add("abc123")
+        
+        with ArchiveBloomFilter(filter_path) as reopened:
+            assert "abc123" in reopened
+            assert reopened.count == 1
+            assert reopened.capacity == 100
+    
+    def test_rejects_foreign_file(self, filter_path):
+        """Test opening a file that is not a filter fails."""
+        filter_path.write_bytes(b"x" * 64)
+        
+        with pytest.raises(ValueError):
+            ArchiveBloomFilter(filter_path)
+
+
+class TestStateManagerArchiveChecks:
+    """Test StateManager archived-post lookups."""
+    
+    @pytest.fixture
+    def state_manager(self):
+        """Create StateManager instance with temporary database."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = StateManager(Path(temp_dir) / "state.db")
+            yield manager
+            manager.close()
+    
+    def _save(self, state_manager, post_id):
+        with state_manager._transaction() as conn:
+            conn.execute(
+                "INSERT INTO sessions (id, config_hash, target_type, target_value) "
+                "VALUES ('s1', 'hash', 'user', 'u') ON CONFLICT DO NOTHING"
+            )
+        state_manager.save_post('s1', {'id': post_id})
+    
+    def test_filter_built_from_existing_posts(self, state_manager):
+        """Test the filter is populated from the posts table on first use."""
+        self._save(state_manager, 'existing')
+        
+        assert state_manager.filter_archived(['existing', 'new']) == {'existing'}
+        assert state_manager.archive_filter_path.exists()
+    
+    def test_save_post_updates_filter(self, state_manager):
+        """Test posts saved after the filter exists are found."""
+        state_manager.get_archive_filter()
+        self._save(state_manager, 'later')
+        
+        assert state_manager.is_archived('later') is True
+        assert state_manager.is_archived('missing') is False
+    
+    def test_index_sidecars(self, state_manager, tmp_path):
+        """Test IDs from JSON sidecars are treated as archived."""
+        (tmp_path / "post.json").write_text(json.dumps({'id': 'sidecar_post'}))
+        (tmp_path / "broken.json").write_text("not json")
+        
+        assert state_manager.index_sidecars([tmp_path]) == 1
+        assert state_manager.is_archived('sidecar_post') is True
+    
+    def test_index_sidecars_skips_unchanged_and_excluded(self, state_manager, tmp_path):
+        """Test repeat scans only read new or changed sidecars and skip excluded directories."""
+        sidecar = tmp_path / "post.json"
+        sidecar.write_text(json.dumps({'id': 'first'}))
+        exports = tmp_path / "exports"
+        exports.mkdir()
+        (exports / "export.json").write_text(json.dumps({'id': 'exported'}))
+        assert state_manager.index_sidecars([tmp_path], exclude=[exports]) == 1
+        assert state_manager.is_archived('exported') is False
+        
+        # Same size and mtime: the file is not read again
+        stat = sidecar.stat()
+        sidecar.write_text(json.dumps({'id': 'other'}))
+        os.utime(sidecar, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        (tmp_path / "second.json").write_text(json.dumps({'id': 'second'}))
+        
+        assert state_manager.index_sidecars([tmp_path], exclude=[exports]) == 1
+        assert state_manager.is_archived('second') is True
+        assert state_manager.is_archived('other') is False
+    
+    def test_rebuild_archive_filter(self, state_manager, tmp_path):
+        """Test rebuilding keeps database and sidecar IDs."""
+        self._save(state_manager, 'db_post')
+        (tmp_path / "post.json").write_text(json.dumps({'id': 'sidecar_post'}))
+        
+        count = state_manager.rebuild_archive_filter(sidecar_dirs=[tmp_path], capacity=1000)
+        
+        assert count == 2
+        assert state_manager.filter_archived(['db_post', 'sidecar_post', 'x']) == {'db_post', 'sidecar_post'}
+    
+    def test_filter_sized_from_archive(self, state_manager):
+        """Test a new filter is sized from the archive instead of a fixed large capacity."""
+        archive_filter = state_manager.get_archive_filter()
+        
+        assert archive_filter.capacity == StateManager.ARCHIVE_FILTER_MIN_CAPACITY
+        assert state_manager.archive_filter_path.stat().st_size < 256 * 1024
+    
+    def test_save_post_adds_to_filter_before_commit(self, state_manager):
+        """Test a failed commit leaves a false positive rather than a false negative."""
+        state_manager.get_archive_filter()
+        
+        with patch.object(state_manager, '_transaction', side_effect=RuntimeError("crash")):
+            with pytest.raises(RuntimeError):
+                state_manager.save_post('s1', {'id': 'crashed'})
+        
+        assert 'crashed' in state_manager.get_archive_filter()
+        assert state_manager.is_archived('crashed') is False
@@ -0,0 +1,159 @@
+"""
+Test suite for the benchmark suite.
+
+Tests the fake Reddit listing server and media CDN, small-scale scenario
+runs, baseline comparison and the `redditdl bench` command.
+"""
+
+import json
+
+import pytest
+import requests
+from typer.testing import CliRunner
+
+from redditdl.bench import (
+    BenchmarkRunner, FakeRedditServer, STANDARD_SCENARIOS, Scenario, ServerProfile,
+    compare_reports
+)
+from redditdl.bench.runner import ListingClient, populate_catalog
+from redditdl.cli.commands.bench import app
+from redditdl.targets.resolver import TargetType
+
+
+@pytest.fixture
+def server():
+    """Start a fake Reddit server with no simulated latency."""
+    with FakeRedditServer() as server:
+        yield server
+
+
+class TestFakeRedditServer:
+    """Test listing pagination, media serving and fault injection."""
+    
+    def test_listing_pagination(self, server):
+        """Test listings page with limit/after like the Reddit JSON API."""
+        scenario = Scenario(name="t", description="", targets=["r/pics"], posts_per_target=250)
+        populate_catalog(scenario, server)
+        
+        first = requests.get(server.url("/r/pics/new.json"), params={"limit": 500}).json()
+        assert first["data"]["dist"] == 100
+        
+        client = ListingClient(server.base_url)
+        posts = client.fetch(TargetType.SUBREDDIT, "pics", 1000)
+        client.close()
+        
+        assert len(posts) == 250
+        assert len({post.id for post in posts}) == 250
+        assert server.stats.listing_requests == 4
+    
+    def test_media_and_not_found(self, server):
+        """Test media files are served at their configured size and unknown paths 404."""
+        server.catalog.add_media("/media/a.jpg", 100000)
+        
+        response = requests.get(server.url("/media/a.jpg"))
+        assert response.status_code == 200
+        assert response.headers["Content-Type"] == "image/jpeg"
+        assert len(response.content) == 100000
+        assert requests.get(server.url("/media/missing.jpg")).status_code == 404
+        assert requests.get(server.url("/r/missing/new.json")).status_code == 404
+        assert server.stats.media_bytes == 100000
+        assert server.stats.not_found == 2
+    
+    def test_error_injection_is_seeded(self):
+        """Test the error rate injects 503s in a repeatable sequence."""
+        statuses = []
+        for _ in range(2):
+            with FakeRedditServer(ServerProfile(error_rate=0.5, seed=7)) as server:
+                server.catalog.add_media("/media/a.jpg", 10)
+                statuses.append([requests.get(server.url("/media/a.jpg")).status_code for _ in range(20)])
+        
+        assert statuses[0] == statuses[1]
+        assert 503 in statuses[0] and 200 in statuses[0]
+    
+    def test_listing_client_retries_server_errors(self):
+        """Test the listing client retries 503s until a page succeeds."""
+        with FakeRedditServer(ServerProfile(error_rate=0.3, seed=3)) as server:
+            populate_catalog(Scenario(name="t", description="", targets=["u/alice"], posts_per_target=300), server)
+            client = ListingClient(server.base_url, retries=10, retry_delay=0.0)
+            posts = client.fetch(TargetType.USER, "alice", 300)
+            client.close()
+        
+        assert len(posts) == 300
+        assert client.failed_requests == server.stats.errors_injected
+
+
+class TestBenchmarkRunner:
+    """Test scenario runs and report comparison."""
+    
+    def test_scenario_report(self, tmp_path):
+        """Test a scaled-down run downloads every file and reports metrics."""
+        runner = BenchmarkRunner(scale=0.05, work_dir=tmp_path)
+        report = runner.run([STANDARD_SCENARIOS["multi-target"], STANDARD_SCENARIOS["large-galleries"]])
+        
+        assert report["schema"] == 1
+        json.dumps(report)
+        
+        multi_target, galleries = report["scenarios"]
+        assert multi_target["posts"] == 100
+        assert multi_target["targets"] == 10
+        assert galleries["bytes_downloaded"] == 5 * 25 * 64 * 1024
+        for result in (multi_target, galleries):
+            assert result["errors"] == 0
+            assert result["posts_per_sec"] > 0
+            assert result["mb_per_sec"] > 0
+            assert 0 < result["latency_p50"] <= result["latency_p95"]
+            assert result["peak_rss_mb"] > 0
+            assert {"acquisition", "processing", "export"} <= set(result["stage_times"])
+        assert list(tmp_path.iterdir()) == []
+    
+    def test_invalid_scale(self):
+        """Test non-positive scales are rejected."""
+        with pytest.raises(ValueError):
+            BenchmarkRunner(scale=0)
+    
+    def test_compare_reports(self):
+        """Test regressions beyond the tolerance are reported per metric."""
+        baseline = {"scenarios": [{"name": "a", "posts_per_sec": 100.0, "mb_per_sec": 10.0,
+                                   "latency_p95": 0.1, "peak_rss_mb": 100.0}]}
+        current = {"scenarios": [{"name": "a", "posts_per_sec": 80.0, "mb_per_sec": 9.5,
+                                  "latency_p95": 0.2, "peak_rss_mb": 90.0},
+                                 {"name": "new", "posts_per_sec": 1.0}]}
+        
+        regressions = compare_reports(baseline, current, tolerance=0.15)
+        
+        assert len(regressions) == 2
+        assert regressions[0].startswith("a: posts_per_sec")
+        assert regressions[1].startswith("a: latency_p95")
+        assert compare_reports(baseline, baseline) == []
+
+
+class TestBenchCommand:
+    """Test the `redditdl bench` command."""
+    
+    def test_run_json_and_baseline(self, tmp_path):
+        """Test --json prints the report and --baseline fails on regressions."""
+        runner = CliRunner()
+        output_file = tmp_path / "report.json"
+        
+        result = runner.invoke(app, ["run", "-s", "video-users", "--scale", "0.02",
+                                     "--json", "-o", str(output_file)])
+        
+        assert result.exit_code == 0, result.output
+        report = json.loads(result.stdout)
+        assert report["scenarios"][0]["name"] == "video-users"
+        assert json.loads(output_file.read_text())["scenarios"][0]["posts"] == 3
+        
+        report["scenarios"][0]["posts_per_sec"] *= 1000
+        baseline_file = tmp_path / "baseline.json"
+        baseline_file.write_text(json.dumps(report))
+        result = runner.invoke(app, ["run", "-s", "video-users", "--scale", "0.02",
+                                     "--baseline", str(baseline_file)])
+        assert result.exit_code == 1
+        assert "regression" in result.output
+    
+    def test_unknown_scenario(self):
+        """Test unknown scenario names are rejected."""
+        result = CliRunner().invoke(app, ["run", "-s", "nope"])
+        
+        assert result.exit_code == 1
+        assert "Unknown scenario" in result.output
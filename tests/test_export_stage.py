@@ -28,6 +28,7 @@ from redditdl.exporters.json import JsonExporter
 from redditdl.exporters.csv import CsvExporter
 from redditdl.exporters.sqlite import SqliteExporter
 from redditdl.exporters.markdown import MarkdownExporter
+from redditdl.exporters.parquet import ParquetExporter
 from redditdl.scrapers import PostMetadata
 
 
@@ -156,6 +157,92 @@ class TestExportStage:
         total_size = result.get_data("total_export_size")
         assert total_size > 0
     
+    @pytest.mark.asyncio
+    async def test_export_parallel_serializes_once(self, sample_context, temp_dir):
+        """Test parallel fan-out serializes each post once and matches sequential output."""
+        sample_context.posts = [
+            PostMetadata.from_raw({
+                'id': f'p{i}', 'title': f'Post {i}', 'author': f'user{i % 7}', 'subreddit': 'test',
+                'url': f'https://example.com/{i}', 'score': i, 'created_utc': 1640995200 + i
+            })
+            for i in range(1000)
+        ]
+        sample_context.config['export_formats'] = ['json', 'csv', 'sqlite', 'markdown']
+        sample_context.config['export_parallel'] = True
+        
+        stage = ExportStage()
+        with patch.object(PostMetadata, 'to_dict', autospec=True,
+                          side_effect=PostMetadata.to_dict) as to_dict:
+            parallel = await stage.process(sample_context)
+        assert to_dict.call_count == 1000
+        
+        sample_context.config['export_parallel'] = False
+        sequential = await stage.process(sample_context)
+        
+        assert parallel.get_data("exports_created") == 4
+        for fmt, export_result in parallel.get_data("export_results").items():
+            assert export_result.records_exported == 1000
+            assert export_result.records_exported == \
+                sequential.get_data("export_results")[fmt].records_exported
+    
+    @pytest.mark.asyncio
+    async def test_export_parallel_process_mode(self, sample_context, temp_dir):
+        """Test process workers receive the shared stream and write every format."""
+        sample_context.posts = self.sample_posts * 300
+        sample_context.config['export_formats'] = ['json', 'csv']
+        sample_context.config['export_parallel'] = True
+        sample_context.config['export_parallel_mode'] = 'process'
+        
+        stage = ExportStage()
+        result = await stage.process(sample_context)
+        
+        assert result.get_data("exports_created") == 2
+        for export_result in result.get_data("export_results").values():
+            assert export_result.records_exported == 600
+        with open(result.get_data("export_results")['csv'].output_path, newline='') as f:
+            assert len(list(csv.DictReader(f))) == 600
+    
+    @pytest.mark.asyncio
+    async def test_export_parallel_failing_exporter(self, sample_context, temp_dir):
+        """Test an exporter that fails without reading posts does not stall the others."""
+        class FailingExporter(JsonExporter):
+            def _create_format_info(self):
+                info = super()._create_format_info()
+                info.name = 'failing'
+                return info
+            
+            def export_stream(self, posts, metadata, output_path, config):
+                raise RuntimeError("disk full")
+        
+        registry.register_exporter(FailingExporter, 'failing')
+        sample_context.posts = self.sample_posts * 25
+        sample_context.config['export_formats'] = ['failing', 'json', 'csv']
+        sample_context.config['export_fanout_chunk_size'] = 1
+        sample_context.config['export_streaming'] = True
+        sample_context.config['export_parallel'] = True
+        
+        stage = ExportStage()
+        result = await asyncio.wait_for(stage.process(sample_context), timeout=10)
+        
+        assert result.get_data("exports_created") == 2
+        assert any('disk full' in error for error in result.errors)
+    
+    @pytest.mark.asyncio
+    async def test_export_parallel_repeated_format(self, sample_context, temp_dir):
+        """Test a repeated format is exported once and keeps its own result."""
+        sample_context.config['export_formats'] = ['json', 'csv', 'json']
+        sample_context.config['export_parallel'] = True
+        
+        stage = ExportStage()
+        assert stage._use_parallel_export(['json', 'csv'], PipelineContext(posts=[], config={})) is False
+        result = await stage.process(sample_context)
+        
+        assert result.get_data("exports_created") == 2
+        assert len(set(result.get_data("export_files"))) == 2
+        assert any('repeated export formats' in warning for warning in result.warnings)
+        with open(result.get_data("export_results")['json'].output_path) as f:
+            assert len(json.load(f)['posts']) == 2
+    
     @pytest.mark.asyncio
     async def test_export_no_posts(self, temp_dir):
         """Test export behavior with no posts."""
@@ -255,6 +342,123 @@ class TestExportStage:
         assert 'session_metadata' in data['pipeline_metadata']
         assert data['pipeline_metadata']['session_metadata']['session_id'] == 'test_session'
     
+    @pytest.mark.asyncio
+    async def test_export_incremental_across_runs(self, sample_context, temp_dir):
+        """Test incremental exports append to NDJSON and Markdown and upsert into SQLite across runs."""
+        sample_context.config['export_formats'] = ['json', 'sqlite', 'csv', 'markdown']
+        sample_context.config['export_json_config'] = {'json_format': 'ndjson'}
+        sample_context.config['export_incremental'] = True
+        
+        stage = ExportStage()
+        first = await stage.process(sample_context)
+        assert first.get_data("exports_created") == 4
+        
+        updated = PostMetadata.from_raw({
+            'id': 'test1', 'title': 'Renamed Post', 'author': 'testuser1', 'subreddit': 'test',
+            'url': 'https://example.com/1', 'score': 150, 'num_comments': 60,
+            'created_utc': 1640995200, 'post_type': 'link'
+        })
+        added = PostMetadata.from_raw({
+            'id': 'test3', 'title': 'Test Post 3', 'author': 'testuser3', 'subreddit': 'other',
+            'url': 'https://example.com/3', 'score': 5, 'num_comments': 0,
+            'created_utc': 1640995320, 'post_type': 'link'
+        })
+        sample_context.posts = [updated, self.sample_posts[1], added]
+        second = await stage.process(sample_context)
+        results = second.get_data("export_results")
+        
+        # NDJSON appends new posts and the current version of changed ones
+        ndjson_summary = results['json'].metadata['incremental']
+        assert (ndjson_summary['added'], ndjson_summary['updated'], ndjson_summary['unchanged']) == (1, 1, 1)
+        lines = [json.loads(line) for line in (temp_dir / 'redditdl_export.ndjson').read_text().splitlines()]
+        assert [post['id'] for post in lines] == ['test1', 'test2', 'test1', 'test3']
+        assert lines[2]['title'] == 'Renamed Post'
+        with open(temp_dir / 'redditdl_export.meta.json') as f:
+            assert json.load(f)['export_info']['post_count'] == 3
+        
+        # SQLite replaces changed rows and keeps the FTS index in sync per row
+        sqlite_summary = results['sqlite'].metadata['incremental']
+        assert (sqlite_summary['added'], sqlite_summary['updated'], sqlite_summary['unchanged']) == (1, 1, 1)
+        with sqlite3.connect(str(temp_dir / 'redditdl_export.db')) as conn:
+            assert conn.execute("SELECT score FROM reddit_posts WHERE id = 'test1'").fetchone() == (150,)
+            matches = conn.execute(
+                "SELECT rowid FROM reddit_posts_fts WHERE reddit_posts_fts MATCH 'Renamed'"
+            ).fetchall()
+            assert len(matches) == 1
+            stale = conn.execute(
+                "SELECT rowid FROM reddit_posts_fts WHERE reddit_posts_fts MATCH 'title:\"Post 1\"'"
+            ).fetchall()
+            assert stale == []
+        
+        # CSV cannot append, so it is always written in full to a fresh file
+        assert 'incremental' not in results['csv'].metadata
+        assert not (temp_dir / 'redditdl_export.csv').exists()
+        with open(results['csv'].output_path, newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert [(r['id'], r['score']) for r in rows] == [('test1', '150'), ('test2', '200'), ('test3', '5')]
+        
+        # Markdown adds an update page and refreshes the index statistics
+        markdown_summary = results['markdown'].metadata['incremental']
+        assert (markdown_summary['added'], markdown_summary['updated'], markdown_summary['unchanged']) == (1, 1, 1)
+        pages = temp_dir / 'redditdl_export_pages'
+        first_page = (pages / 'update-0001.md').read_text()
+        update_page = (pages / 'update-0002.md').read_text()
+        assert 'Test Post 1' in first_page and 'Renamed Post' not in first_page
+        assert '## New Posts' in update_page and 'Test Post 3' in update_page
+        assert '## Updated Posts' in update_page and 'Renamed Post' in update_page
+        assert 'Test Post 2' not in update_page
+        index = (temp_dir / 'redditdl_export.md').read_text()
+        assert '| Total Posts | 3 |' in index
+        assert '| Total Score | 355 |' in index
+        assert index.count('redditdl_export_pages/update-') == 2
+    
+    @pytest.mark.asyncio
+    async def test_export_incremental_unchanged_run(self, sample_context, temp_dir):
+        """Test rerunning an incremental export with the same posts writes nothing."""
+        sample_context.config['export_formats'] = ['json']
+        sample_context.config['export_json_config'] = {'json_format': 'ndjson'}
+        sample_context.config['export_incremental'] = True
+        
+        stage = ExportStage()
+        await stage.process(sample_context)
+        second = await stage.process(sample_context)
+        
+        export_result = second.get_data("export_results")['json']
+        assert export_result.records_exported == 0
+        assert export_result.metadata['incremental']['unchanged'] == 2
+        assert export_result.metadata['incremental']['high_water_mark'] == 1640995260
+        lines = (temp_dir / 'redditdl_export.ndjson').read_text().splitlines()
+        assert len(lines) == 2
+    
+    @pytest.mark.asyncio
+    async def test_export_streaming_is_opt_in(self, sample_context, temp_dir):
+        """Test default CSV output keeps every column while streaming spills late fields."""
+        posts = [dict(self.sample_posts[0].to_dict(), id=f"post{i}") for i in range(4)]
+        posts[3]['late_field'] = 'late'
+        sample_context.posts = posts
+        sample_context.config['export_formats'] = ['csv']
+        sample_context.config['export_csv_config'] = {'schema_sample_size': 2}
+        
+        default_result = (await ExportStage().process(sample_context)).get_data("export_results")['csv']
+        with open(default_result.output_path, newline='') as f:
+            default_rows = list(csv.DictReader(f))
+        Path(default_result.output_path).unlink()
+        
+        sample_context.config['export_streaming'] = True
+        streamed_result = (await ExportStage().process(sample_context)).get_data("export_results")['csv']
+        with open(streamed_result.output_path, newline='') as f:
+            streamed_rows = list(csv.DictReader(f))
+        
+        assert 'streamed' not in default_result.metadata
+        assert default_rows[3]['late_field'] == 'late'
+        assert '_extra' not in default_rows[0]
+        assert streamed_result.metadata['streamed'] is True
+        assert 'late_field' not in streamed_rows[0]
+        assert json.loads(streamed_rows[3]['_extra']) == {'late_field': 'late'}
+        for default_row, streamed_row in zip(default_rows, streamed_rows):
+            assert {k: v for k, v in default_row.items() if k != 'late_field'} == \
+                {k: v for k, v in streamed_row.items() if k != '_extra'}
+    
     def test_export_stage_validation(self):
         """Test export stage configuration validation."""
         # Valid configuration
@@ -416,6 +620,71 @@ class TestJsonExporter:
             # score should be filtered out (not in field_filter)
             # Note: the actual filtering logic may include essential fields
 
+    def test_json_exporter_streaming_matches_export(self, temp_dir, sample_data):
+        """Test streamed document output parses to the same data as export()."""
+        exporter = JsonExporter()
+        metadata = {k: v for k, v in sample_data.items() if k != 'posts'}
+
+        assert exporter.supports_streaming() is True
+
+        full = exporter.export(sample_data, str(temp_dir / "full.json"), {})
+        streamed = exporter.export_stream(
+            iter(sample_data['posts']), metadata, str(temp_dir / "streamed.json"), {}
+        )
+
+        assert streamed.success is True
+        assert streamed.records_exported == 2
+        with open(full.output_path) as f1, open(streamed.output_path) as f2:
+            assert json.load(f1) == json.load(f2)
+
+    def test_json_exporter_ndjson_gzip(self, temp_dir, sample_data):
+        """Test NDJSON mode writes one compressed post per line."""
+        exporter = JsonExporter()
+        config = {'json_format': 'ndjson', 'compression': 'gzip'}
+
+        result = exporter.export(sample_data, str(temp_dir / "test.json"), config)
+
+        assert result.success is True
+        assert result.output_path.endswith('.ndjson.gz')
+        with gzip.open(result.output_path, 'rt') as f:
+            lines = [json.loads(line) for line in f]
+        assert [post['id'] for post in lines] == ['test1', 'test2']
+
+        assert result.metadata['metadata_file'] == str(temp_dir / "test.meta.json")
+        with open(result.metadata['metadata_file']) as f:
+            assert json.load(f)['export_info']['post_count'] == 2
+
+    def test_json_exporter_ndjson_dotted_names(self, temp_dir, sample_data):
+        """Test dotted output names get distinct metadata companion files."""
+        exporter = JsonExporter()
+        config = {'json_format': 'ndjson'}
+
+        first = exporter.export(sample_data, str(temp_dir / "r.python.2024.json"), config)
+        second = exporter.export(sample_data, str(temp_dir / "r.python.2025.json"), config)
+
+        assert first.metadata['metadata_file'] == str(temp_dir / "r.python.2024.meta.json")
+        assert second.metadata['metadata_file'] == str(temp_dir / "r.python.2025.meta.json")
+
+    def test_json_exporter_ndjson_validates_input(self, temp_dir, sample_data):
+        """Test NDJSON mode rejects input the document mode rejects."""
+        exporter = JsonExporter()
+        malformed = {'export_info': sample_data['export_info'], 'posts': ['not a post']}
+
+        for config in ({}, {'json_format': 'ndjson'}):
+            result = exporter.export(malformed, str(temp_dir / "test.json"), config)
+            assert result.success is False
+            assert "Post 0 is not a dictionary" in result.errors
+
+        assert not (temp_dir / "test.ndjson").exists()
+
+    def test_json_exporter_unknown_compression(self, temp_dir, sample_data):
+        """Test an unknown compression codec fails the export."""
+        exporter = JsonExporter()
+
+        result = exporter.export(sample_data, str(temp_dir / "test.json"), {'compression': 'lz4'})
+
+        assert result.success is False
+
 
 class TestCsvExporter:
     """Test cases for CsvExporter."""
@@ -510,6 +779,55 @@ class TestCsvExporter:
         
         # Check that commas in titles are handled correctly
         assert rows[1]['title'] == 'Test Post 2 with, commas'
+    
+    def test_csv_exporter_streaming_matches_export(self, temp_dir, sample_data):
+        """Test streaming CSV output equals export() when posts fit in the sample."""
+        exporter = CsvExporter()
+        metadata = {'export_info': sample_data['export_info']}
+        
+        regular = exporter.export(sample_data, str(temp_dir / "regular.csv"), {})
+        streamed = exporter.export_stream(iter(sample_data['posts']), metadata,
+                                          str(temp_dir / "streamed.csv"), {})
+        
+        assert streamed.success is True
+        assert streamed.metadata['streamed'] is True
+        assert Path(streamed.output_path).read_bytes() == Path(regular.output_path).read_bytes()
+    
+    def test_csv_exporter_streaming_overflow_column(self, temp_dir, sample_data):
+        """Test fields first seen after the schema sample spill into the overflow column."""
+        exporter = CsvExporter()
+        posts = [dict(sample_data['posts'][0], id=f"post{i}") for i in range(5)]
+        posts[4]['late_field'] = 'late'
+        config = {'schema_sample_size': 2}
+        
+        result = exporter.export_stream(iter(posts), {'export_info': sample_data['export_info']},
+                                        str(temp_dir / "overflow.csv"), config)
+        
+        assert result.success is True
+        assert result.records_exported == 5
+        assert result.metadata['overflow_rows'] == 1
+        with open(result.output_path, newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert 'late_field' not in rows[0]
+        assert rows[0]['_extra'] == ''
+        assert json.loads(rows[4]['_extra']) == {'late_field': 'late'}
+    
+    def test_csv_exporter_streaming_declared_columns(self, temp_dir, sample_data):
+        """Test declared columns fix the header without buffering rows."""
+        exporter = CsvExporter()
+        config = {'columns': ['id', 'title', 'score'], 'field_mapping': {'score': 'points'}}
+        
+        result = exporter.export_stream(iter(sample_data['posts']),
+                                        {'export_info': sample_data['export_info']},
+                                        str(temp_dir / "declared.csv"), config)
+        
+        assert result.success is True
+        with open(result.output_path, newline='') as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+        assert reader.fieldnames == ['id', 'title', 'points', '_extra']
+        assert rows[1]['points'] == '200'
+        assert json.loads(rows[0]['_extra'])['author'] == 'user1'
 
 
 class TestSqliteExporter:
@@ -629,6 +947,71 @@ class TestSqliteExporter:
         assert len(fts_tables) > 0
         
         conn.close()
+    
+    def test_sqlite_exporter_bulk_load_stream(self, temp_dir, sample_data):
+        """Test bulk load consumes a generator in chunks and builds indexes and FTS once."""
+        exporter = SqliteExporter()
+        output_path = temp_dir / "bulk.db"
+        config = {'bulk_load': True, 'bulk_batch_size': 1000, 'schema_mode': 'denormalized'}
+        
+        def posts():
+            for i in range(2500):
+                post = dict(sample_data['posts'][i % 2])
+                post['id'] = f"bulk_{i}"
+                yield post
+        
+        result = exporter.export_stream(posts(), {'export_info': sample_data['export_info']},
+                                        str(output_path), config)
+        
+        assert result.success is True
+        assert result.records_exported == 2500
+        assert result.metadata['bulk_load'] is True
+        assert not (temp_dir / "bulk.db.loading").exists()
+        
+        with sqlite3.connect(result.output_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM reddit_posts").fetchone() == (2500,)
+            assert conn.execute("SELECT post_count FROM reddit_export_info").fetchone() == (2500,)
+            assert conn.execute("PRAGMA journal_mode").fetchone() == ('wal',)
+            indexes = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")]
+            assert 'idx_reddit_posts_subreddit' in indexes
+            fts_rows = conn.execute("SELECT COUNT(*) FROM reddit_posts_fts").fetchone()[0]
+            assert fts_rows == 2500
+    
+    def test_sqlite_exporter_sampled_type_inference(self, temp_dir):
+        """Test flat schema inference samples across the whole post list."""
+        exporter = SqliteExporter()
+        posts = [{'id': f"p{i}", 'title': f"Post {i}"} for i in range(1000)]
+        posts[500]['late_field'] = 42
+        data = {'export_info': {'timestamp': '2023-01-01T00:00:00'}, 'posts': posts}
+        config = {'schema_mode': 'flat', 'schema_sample_size': 10, 'vacuum': False}
+        
+        result = exporter.export(data, str(temp_dir / "sampled.db"), config)
+        
+        assert result.success is True
+        with sqlite3.connect(result.output_path) as conn:
+            columns = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(reddit_posts)")}
+        assert columns['late_field'] == 'INTEGER'
+        assert len(exporter._sample_posts(posts, 10)) == 10
+    
+    def test_sqlite_exporter_quotes_new_columns(self, temp_dir, sample_data):
+        """Test field names added to an existing flat table are quoted."""
+        exporter = SqliteExporter()
+        output_path = str(temp_dir / "quoted.db")
+        config = {'schema_mode': 'flat', 'vacuum': False}
+        assert exporter.export(sample_data, output_path, config).success is True
+        
+        field = 'x TEXT); DROP TABLE reddit_posts; --'
+        later = {'export_info': sample_data['export_info'],
+                 'posts': [{'id': 'test3', 'title': 'Later', field: 'value', 'flair text': 'news'}]}
+        result = exporter.export(later, output_path, config)
+        
+        assert result.success is True
+        with sqlite3.connect(output_path) as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(reddit_posts)")}
+            assert {field, 'flair text'} <= columns
+            row = conn.execute('SELECT "flair text" FROM reddit_posts WHERE id = ?', ('test3',)).fetchone()
+            assert row == ('news',)
+            assert conn.execute("SELECT COUNT(*) FROM reddit_posts").fetchone() == (3,)
 
 
 class TestMarkdownExporter:
@@ -738,6 +1121,207 @@ class TestMarkdownExporter:
             content = f.read()
         
         assert '## Table of Contents' in content
+    
+    def test_markdown_exporter_paginated_posts(self, temp_dir):
+        """Test streamed posts are split into linked pages with a single index."""
+        posts = [{'id': f'p{i}', 'title': f'Post {i}', 'score': i, 'subreddit': 'test',
+                  'author': f'user{i % 3}', 'num_comments': 1} for i in range(25)]
+        exporter = MarkdownExporter()
+        config = {'paginate': 'posts', 'page_size': 10}
+        
+        result = exporter.export_stream(iter(posts), {'export_info': {}},
+                                        str(temp_dir / "archive.md"), config)
+        
+        assert result.success is True
+        assert result.records_exported == 25
+        assert result.metadata['pages'] == 3
+        page_dir = temp_dir / "archive_pages"
+        assert sorted(p.name for p in page_dir.iterdir()) == [
+            'page-0001.md', 'page-0002.md', 'page-0003.md'
+        ]
+        
+        index = Path(result.output_path).read_text()
+        assert '| Total Posts | 25 |' in index
+        assert '- [Page 2](archive_pages/page-0002.md) - 10 posts' in index
+        assert '(archive_pages/page-0001.md#post-24)' in index
+        
+        page = (page_dir / 'page-0002.md').read_text()
+        assert '[Previous](page-0001.md) | [Next](page-0003.md)' in page
+        assert page.count('### Post ') == 10
+        assert page.index('### Post 14') < page.index('### Post 5')
+        assert '[Next]' not in (page_dir / 'page-0003.md').read_text()
+    
+    def test_markdown_exporter_paginated_global_sort(self, temp_dir):
+        """Test sort_by orders posts across pages, not just within each page."""
+        scores = [3, 9, 1, 7, 5, 8, 2, 6]
+        posts = [{'id': f'p{i}', 'title': f'Post {i}', 'score': score, 'subreddit': 'test',
+                  'author': 'user', 'num_comments': 0} for i, score in enumerate(scores)]
+        exporter = MarkdownExporter()
+        config = {'paginate': 'posts', 'page_size': 4, 'sort_by': 'score', 'sort_order': 'desc',
+                  'include_toc': False}
+        
+        result = exporter.export_stream(iter(posts), {'export_info': {}},
+                                        str(temp_dir / "sorted.md"), config)
+        
+        assert result.metadata['pages'] == 2
+        page_dir = temp_dir / "sorted_pages"
+        page_scores = []
+        for name in ('page-0001.md', 'page-0002.md'):
+            content = (page_dir / name).read_text()
+            page_scores.append([scores[int(line.split('Post ')[1])]
+                                for line in content.splitlines() if line.startswith('### Post ')])
+        assert page_scores == [[9, 8, 7, 6], [5, 3, 2, 1]]
+    
+    def test_markdown_exporter_incremental_unchanged_run(self, temp_dir, sample_data):
+        """Test an incremental rerun with the same posts adds no page and keeps the index."""
+        exporter = MarkdownExporter()
+        config = {'incremental': True}
+        output_path = str(temp_dir / "incremental.md")
+        
+        first = exporter.export_stream(iter(sample_data['posts']), {'export_info': {}}, output_path, config)
+        index = Path(first.output_path).read_text()
+        second = exporter.export_stream(iter(sample_data['posts']), {'export_info': {}}, output_path, config)
+        
+        assert first.records_exported == 2
+        assert second.records_exported == 0
+        assert second.metadata['incremental']['unchanged'] == 2
+        assert [p.name for p in (temp_dir / "incremental_pages").iterdir()] == ['update-0001.md']
+        assert Path(second.output_path).read_text() == index
+    
+    def test_markdown_exporter_paginated_groups(self, temp_dir, sample_data):
+        """Test per-group pages overflow into numbered continuation pages."""
+        posts = [dict(post, id=f'{post["id"]}_{n}') for n in range(3) for post in sample_data['posts']]
+        exporter = MarkdownExporter()
+        config = {'paginate': 'group', 'group_by': 'subreddit', 'page_size': 2}
+        
+        result = exporter.export(dict(sample_data, posts=posts), str(temp_dir / "groups.md"), config)
+        
+        assert result.success is True
+        page_dir = temp_dir / "groups_pages"
+        assert sorted(p.name for p in page_dir.iterdir()) == [
+            'programming-2.md', 'programming.md', 'test-2.md', 'test.md'
+        ]
+        assert '[Next](test-2.md)' in (page_dir / 'test.md').read_text()
+        index = Path(result.output_path).read_text()
+        assert '- [r/test](groups_pages/test.md) - 3 posts' in index
+        assert '| Posts Exported | 6 |' in index
+    
+    def test_markdown_exporter_toc_matches_headings(self, temp_dir, sample_data):
+        """Test the single-pass TOC lists every heading in document order."""
+        exporter = MarkdownExporter()
+        result = exporter.export(sample_data, str(temp_dir / "doc.md"), {})
+        
+        content = Path(result.output_path).read_text()
+        toc_start = content.index('## Table of Contents')
+        body_start = content.index('## Statistics')
+        toc_titles = [line.split('](')[0].lstrip(' -[')
+                      for line in content[toc_start:body_start].splitlines() if line.strip().startswith('- [')]
+        body_titles = [line.lstrip('#').strip() for line in content[body_start:].splitlines()
+                       if line.startswith('## ') or line.startswith('### ')]
+        assert toc_titles == body_titles
+        assert 'Export Information' in toc_titles
+
+
+class TestParquetExporter:
+    """Test cases for ParquetExporter."""
+    
+    @pytest.fixture(autouse=True)
+    def require_pyarrow(self):
+        """Skip when the optional pyarrow dependency is missing."""
+        pytest.importorskip("pyarrow")
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @pytest.fixture
+    def sample_posts(self):
+        """Create posts with nested awards, gallery and poll data."""
+        return [
+            {
+                'id': f'p{i}',
+                'title': f'Post {i}',
+                'score': i * 10,
+                'author': f'user{i % 3}',
+                'subreddit': ['pics', 'aww'][i % 2],
+                'domain': 'i.redd.it',
+                'post_type': 'image',
+                'created_utc': 1640995200 + (20 - i) * 60,
+                'is_nsfw': False,
+                'awards': [{'name': 'Gold', 'count': i, 'coin_price': 500, 'icon_url': 'x'}],
+                'gallery_image_urls': [f'https://i.redd.it/{i}.jpg'],
+                'poll_data': {'question': 'Q?', 'total_vote_count': 3,
+                              'options': [{'id': '1', 'text': 'A', 'vote_count': 3}]}
+                if i == 0 else None,
+                'custom_field': 'kept'
+            }
+            for i in range(20)
+        ]
+    
+    def test_parquet_exporter_typed_columns(self, temp_dir, sample_posts):
+        """Test categoricals, nested columns and per-row-group sorting."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        exporter = ParquetExporter()
+        result = exporter.export({'export_info': {'post_count': 20}, 'posts': sample_posts},
+                                 str(temp_dir / "posts.parquet"), {'row_group_size': 1000})
+        
+        assert result.success is True
+        assert result.records_exported == 20
+        
+        parquet_file = pq.ParquetFile(result.output_path)
+        assert parquet_file.metadata.num_rows == 20
+        assert b'redditdl.export_info' in parquet_file.schema_arrow.metadata
+        
+        table = parquet_file.read()
+        assert pa.types.is_dictionary(table.schema.field('subreddit').type)
+        assert pa.types.is_timestamp(table.schema.field('created_utc').type)
+        
+        rows = table.to_pylist()
+        assert [row['subreddit'] for row in rows] == ['aww'] * 10 + ['pics'] * 10
+        aww_times = [row['created_utc'] for row in rows[:10]]
+        assert aww_times == sorted(aww_times)
+        
+        first = next(row for row in rows if row['id'] == 'p0')
+        assert first['awards'][0]['name'] == 'Gold'
+        assert first['poll_data']['options'][0]['vote_count'] == 3
+        assert first['gallery_image_urls'] == ['https://i.redd.it/0.jpg']
+        assert json.loads(first['extra']) == {'custom_field': 'kept'}
+    
+    def test_parquet_exporter_streams_row_groups(self, temp_dir, sample_posts):
+        """Test one row group is written per batch of posts."""
+        import pyarrow.parquet as pq
+        
+        posts = [dict(post, id=f'{post["id"]}_{n}') for n in range(100) for post in sample_posts]
+        exporter = ParquetExporter()
+        result = exporter.export_stream(iter(posts), {}, str(temp_dir / "stream.parquet"),
+                                        {'row_group_size': 1000, 'sort_by': []})
+        
+        assert result.success is True
+        assert result.metadata['row_groups'] == 2
+        assert pq.ParquetFile(result.output_path).metadata.num_row_groups == 2
+        ids = pq.read_table(result.output_path, columns=['id']).column('id').to_pylist()
+        assert ids == [post['id'] for post in posts]
+    
+    def test_arrow_exporter_dictionary_deltas(self, temp_dir, sample_posts):
+        """Test Arrow IPC output keeps categoricals across batches."""
+        import pyarrow as pa
+        
+        posts = [dict(post, id=f'{post["id"]}_{n}', author=f'author{n}')
+                 for n in range(60) for post in sample_posts]
+        exporter = ParquetExporter()
+        result = exporter.export_stream(iter(posts), {}, str(temp_dir / "posts.parquet"),
+                                        {'file_format': 'arrow', 'row_group_size': 1000})
+        
+        assert result.success is True
+        assert result.output_path.endswith('.arrow')
+        with pa.memory_map(result.output_path) as source:
+            table = pa.ipc.open_file(source).read_all()
+        assert table.num_rows == 1200
+        assert set(table.column('author').to_pylist()) == {f'author{n}' for n in range(60)}
 
 
 class TestExporterRegistry:
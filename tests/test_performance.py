@@ -12,6 +12,7 @@ import psutil
 import pytest
 import tempfile
 import json
+import sqlite3
 from pathlib import Path
 from unittest.mock import Mock, patch, AsyncMock
 from memory_profiler import profile
@@ -23,7 +24,7 @@ from redditdl.core.events.emitter import EventEmitter
 from redditdl.core.state.manager import StateManager
 from redditdl.core.config.models import AppConfig
 from redditdl.core.concurrency.processor import ConcurrentProcessor, BatchProcessor, BatchConfig
-from redditdl.core.concurrency.pools import WorkerPoolManager, PoolType
+from redditdl.core.concurrency.pools import WorkerPoolManager, PoolType, PoolConfig, ProcessWorkerPool
 from redditdl.core.concurrency.limiters import MultiLimiter, LimiterType
 from redditdl.core.monitoring.metrics import MetricsCollector
 from redditdl.core.monitoring.profiler import ResourceProfiler
@@ -33,6 +34,11 @@ from redditdl.downloader import MediaDownloader
 from redditdl.metadata import MetadataEmbedder
 
 
+def _cpu_bound_task(n):
+    """Module-level CPU-bound helper so it can be sent to worker processes."""
+    return sum(i * i for i in range(n))
+
+
 class TestPerformanceBenchmarks:
     """Performance benchmark tests for core components."""
     
@@ -797,6 +803,54 @@ class TestScalabilityLimits:
         # Verify database size is reasonable
         db_size_mb = db_path.stat().st_size / 1024 / 1024
         assert db_size_mb < 500, f"Database too large: {db_size_mb:.2f}MB"
+    
+    @pytest.mark.slow
+    @pytest.mark.performance
+    def test_sqlite_bulk_load_million_rows(self):
+        """Benchmark SqliteExporter bulk load on 1M posts streamed from a generator."""
+        from redditdl.exporters.sqlite import SqliteExporter
+        
+        total_posts = 1_000_000
+        
+        def generate_posts():
+            for i in range(total_posts):
+                yield {
+                    'id': f'bulk_{i}',
+                    'title': f'Bulk Post {i}',
+                    'author': f'user_{i % 100}',
+                    'subreddit': f'sub_{i % 20}',
+                    'url': f'https://example.com/image_{i}.jpg',
+                    'selftext': 'benchmark body text',
+                    'score': i % 5000,
+                    'num_comments': i % 50,
+                    'created_utc': 1640995200 + i,
+                    'post_type': 'image',
+                    'awards': [{'name': 'gold', 'count': 1}] if i % 10 == 0 else [],
+                }
+        
+        output_path = self.temp_dir / 'bulk.db'
+        start_memory = psutil.Process().memory_info().rss / 1024 / 1024
+        start_time = time.time()
+        
+        result = SqliteExporter().export_stream(
+            generate_posts(), {'export_info': {'timestamp': 'benchmark'}},
+            str(output_path), {'bulk_load': True}
+        )
+        
+        processing_time = time.time() - start_time
+        memory_increase = psutil.Process().memory_info().rss / 1024 / 1024 - start_memory
+        rows_per_second = total_posts / processing_time
+        print(f"SQLite bulk load: {total_posts} rows in {processing_time:.1f}s "
+              f"({rows_per_second:,.0f} rows/s, +{memory_increase:.0f}MB RSS)")
+        
+        assert result.success, result.errors
+        assert result.records_exported == total_posts
+        assert rows_per_second > 10000, f"Bulk load too slow: {rows_per_second:,.0f} rows/s"
+        # Posts are streamed, so memory is bounded by the batch size and page cache
+        assert memory_increase < 600, f"Memory usage increased too much: {memory_increase:.2f}MB"
+        
+        with sqlite3.connect(str(output_path)) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM reddit_posts").fetchone()[0] == total_posts
 
 
 class TestConcurrencyPerformance:
@@ -934,6 +988,55 @@ class TestConcurrencyPerformance:
         finally:
             await pool_manager.stop()
     
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_process_pool_bounded_submission(self):
+        """Test process pool runs CPU-bound work with bounded in-flight tasks."""
+        pool = ProcessWorkerPool(PoolConfig(min_workers=1, max_workers=2, queue_size_limit=1))
+        peak_in_flight = 0
+        
+        async def tracked_submit(n):
+            nonlocal peak_in_flight
+            task = asyncio.ensure_future(pool.submit(_cpu_bound_task, n))
+            await asyncio.sleep(0)
+            peak_in_flight = max(peak_in_flight, pool.metrics.active_workers + pool.metrics.queued_tasks)
+            return await task
+        
+        try:
+            assert not pool.started
+            results = await asyncio.gather(*[tracked_submit(20000) for _ in range(12)])
+            
+            assert results == [_cpu_bound_task(20000)] * 12
+            assert pool.started
+            # Never more than max_workers + queue_size_limit tasks handed to the executor
+            assert 0 < peak_in_flight <= 3
+            
+            metrics = pool.get_metrics()
+            assert metrics.completed_tasks == 12
+            assert metrics.failed_tasks == 0
+            assert metrics.active_workers == 0
+            assert metrics.queued_tasks == 0
+        finally:
+            pool.shutdown()
+    
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_pool_manager_process_submission(self):
+        """Test WorkerPoolManager exposes the process pool and its metrics."""
+        pool_manager = WorkerPoolManager()
+        pool_manager.configure_process_pool(max_workers=2)
+        
+        try:
+            result = await pool_manager.submit_process(_cpu_bound_task, 1000)
+            assert result == _cpu_bound_task(1000)
+            
+            # Reconfiguring a running pool keeps the existing workers
+            pool_manager.configure_process_pool(max_workers=4)
+            assert pool_manager.get_pool_metrics(PoolType.CPU).completed_tasks == 1
+            assert 'cpu' in pool_manager.get_all_metrics()
+        finally:
+            await pool_manager.stop()
+    
     @pytest.mark.performance
     def test_rate_limiter_performance(self):
         """Test rate limiter performance under load."""